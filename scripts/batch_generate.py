@@ -12,9 +12,41 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
-async def generate_batch(topics_file: str, output_dir: str, parallel: int = 1):
-    """Generate videos in batch."""
+def _load_topics(topics_path: Path) -> list:
+    """Load topic entries from a JSON or plain text file."""
+    with open(topics_path, 'r', encoding='utf-8') as f:
+        if topics_path.suffix == '.json':
+            return json.load(f)
+        # Plain text, one topic per line
+        return [{"topic": line.strip()} for line in f if line.strip()]
+
+
+def _topic_fields(topic_info) -> tuple:
+    """Return (topic, category, style) from a topic entry."""
+    if isinstance(topic_info, dict):
+        return (
+            topic_info.get("topic"),
+            topic_info.get("category", "science"),
+            topic_info.get("style", "kurzgesagt"),
+        )
+    return topic_info, "science", "kurzgesagt"
+
+
+async def generate_batch(
+    topics_file: str,
+    output_dir: str,
+    parallel: int = 1,
+    render_workers: int = None,
+    resume: bool = True
+):
+    """Generate videos in batch.
+
+    Runs up to ``parallel`` projects concurrently on one event loop while
+    moviepy rendering runs in separate processes. Each finished topic is appended
+    to ``batch_results.jsonl`` so an interrupted batch can be resumed.
+    """
     from src.main import VideoGenerator, VideoCategory, VideoStyle, Language
+    from src.utils.atomic_io import append_jsonl, read_jsonl
 
     # Load topics
     topics_path = Path(topics_file)
@@ -22,57 +54,92 @@ async def generate_batch(topics_file: str, output_dir: str, parallel: int = 1):
         print(f"Error: Topics file not found: {topics_file}")
         return
 
-    with open(topics_path, 'r', encoding='utf-8') as f:
-        if topics_path.suffix == '.json':
-            topics_data = json.load(f)
-        else:
-            # Plain text, one topic per line
-            topics_data = [{"topic": line.strip()} for line in f if line.strip()]
-
+    topics_data = _load_topics(topics_path)
     print(f"Loaded {len(topics_data)} topics")
 
-    # Initialize generator
-    generator = VideoGenerator()
-
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
+    journal_file = output_path / "batch_results.jsonl"
+
+    # Skip topics that already succeeded in a previous run
+    done = {}
+    if resume:
+        for record in read_jsonl(journal_file):
+            if record.get("status") == "success":
+                done[record["topic"]] = record
+
+    pending = []
+    for i, topic_info in enumerate(topics_data):
+        topic, category, style = _topic_fields(topic_info)
+        if topic in done:
+            continue
+        pending.append((i, topic, category, style))
+
+    if done:
+        print(f"Resuming: {len(done)} topics already completed, {len(pending)} remaining")
+
+    parallel = max(1, parallel)
+    render_workers = max(1, render_workers or parallel)
+
+    # Initialize generator (shared: one set of API clients for all workers)
+    generator = VideoGenerator()
 
-    # Generate results
     results = []
     start_time = datetime.now()
 
-    for i, topic_info in enumerate(topics_data):
-        topic = topic_info.get("topic", topic_info) if isinstance(topic_info, dict) else topic_info
-        category = topic_info.get("category", "science") if isinstance(topic_info, dict) else "science"
-        style = topic_info.get("style", "kurzgesagt") if isinstance(topic_info, dict) else "kurzgesagt"
-
-        print(f"\n[{i+1}/{len(topics_data)}] Generating: {topic}")
-
-        try:
-            project = await generator.generate_video(
-                topic=topic,
-                category=VideoCategory(category),
-                style=VideoStyle(style),
-                language=Language.KOREAN
-            )
-
-            results.append({
-                "topic": topic,
-                "status": "success",
-                "project_id": project.id,
-                "video_path": project.video_path,
-                "thumbnail_path": project.thumbnail_path
-            })
-            print(f"  ✓ Success: {project.id}")
-
-        except Exception as e:
-            results.append({
-                "topic": topic,
-                "status": "failed",
-                "error": str(e)
-            })
-            print(f"  ✗ Failed: {e}")
+    queue = asyncio.Queue()
+    for item in pending:
+        queue.put_nowait(item)
+
+    async def worker():
+        while True:
+            try:
+                i, topic, category, style = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            print(f"\n[{i+1}/{len(topics_data)}] Generating: {topic}")
+
+            try:
+                project = await generator.generate_video(
+                    topic=topic,
+                    category=VideoCategory(category),
+                    style=VideoStyle(style),
+                    language=Language.KOREAN
+                )
+
+                result = {
+                    "topic": topic,
+                    "status": "success",
+                    "project_id": project.id,
+                    "video_path": project.video.main_video_path,
+                    "thumbnail_paths": project.thumbnail.paths
+                }
+                print(f"  ✓ Success: {project.id}")
+
+            except Exception as e:
+                result = {
+                    "topic": topic,
+                    "status": "failed",
+                    "error": str(e)
+                }
+                print(f"  ✗ Failed: {topic}: {e}")
+
+            result["finished_at"] = datetime.now().isoformat()
+            append_jsonl(journal_file, result)
+            results.append(result)
+
+    # Renders run in separate processes; cap how many run at once
+    generator.max_render_processes = render_workers
+    await asyncio.gather(*(worker() for _ in range(min(parallel, len(pending)))))
+
+    # Adaptive per-provider limits (imported the way src/main.py does, so it is the same registry)
+    from utils.adaptive_limiter import limiter_metrics
+
+    all_results = list(done.values()) + results
+    success = len([r for r in all_results if r["status"] == "success"])
+    failed = len([r for r in all_results if r["status"] == "failed"])
 
     # Save results
     end_time = datetime.now()
@@ -85,18 +152,25 @@ async def generate_batch(topics_file: str, output_dir: str, parallel: int = 1):
             "end_time": end_time.isoformat(),
             "duration_seconds": duration.total_seconds(),
             "total": len(topics_data),
-            "success": len([r for r in results if r["status"] == "success"]),
-            "failed": len([r for r in results if r["status"] == "failed"]),
-            "results": results
+            "success": success,
+            "failed": failed,
+            "skipped": len(done),
+            "limiters": limiter_metrics(),
+            "llm_hedging": generator.llm.hedge_metrics() if generator.llm else None,
+            "results": all_results
         }, f, ensure_ascii=False, indent=2)
 
     print(f"\n{'='*50}")
     print(f"Batch Generation Complete!")
     print(f"{'='*50}")
     print(f"Total: {len(topics_data)}")
-    print(f"Success: {len([r for r in results if r['status'] == 'success'])}")
-    print(f"Failed: {len([r for r in results if r['status'] == 'failed'])}")
+    print(f"Success: {success}")
+    print(f"Failed: {failed}")
+    print(f"Skipped (already done): {len(done)}")
     print(f"Duration: {duration}")
+    for metrics in limiter_metrics():
+        print(f"Concurrency {metrics['provider']}: {metrics['limit']}/{metrics['ceiling']} "
+              f"(throttled: {metrics['throttled']})")
     print(f"Results saved to: {results_file}")
 
 
@@ -105,10 +179,18 @@ def main():
     parser.add_argument("topics_file", help="Path to topics file (JSON or TXT)")
     parser.add_argument("--output", "-o", default="output/batch", help="Output directory")
     parser.add_argument("--parallel", "-p", type=int, default=1, help="Parallel generation count")
+    parser.add_argument("--render-workers", type=int, default=None,
+                        help="Render process count (default: same as --parallel)")
+    parser.add_argument("--no-resume", action="store_true",
+                        help="Regenerate topics already completed in batch_results.jsonl")
 
     args = parser.parse_args()
 
-    asyncio.run(generate_batch(args.topics_file, args.output, args.parallel))
+    asyncio.run(generate_batch(
+        args.topics_file, args.output, args.parallel,
+        render_workers=args.render_workers,
+        resume=not args.no_resume
+    ))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""Micro-benchmark for YouTubeSpeechPatterns sampling."""
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+# Add src to path so the script package imports the same way as the app
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from script.speech_patterns import YouTubeSpeechPatterns, get_style_prompt  # noqa: E402
+
+
+def legacy_choice(categories: dict) -> str:
+    """Previous behaviour: flatten every category on each call, then sample."""
+    flattened = []
+    for values in categories.values():
+        flattened.extend(values)
+    return random.choice(flattened)
+
+
+def legacy_humanize(text: str, intensity: float = 0.3) -> str:
+    """Previous humanize_text cost (filler list + flattened emotions per call)."""
+    patterns = YouTubeSpeechPatterns
+    if random.random() < intensity:
+        text = f"{random.choice(list(patterns.FILLERS))} {text}"
+    if random.random() < intensity * 0.5:
+        text = f"{legacy_choice(patterns.EMOTIONAL_EXPRESSIONS)} {text}"
+    return text
+
+
+def bench(label: str, func, number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5))
+    per_call = seconds / number * 1e6
+    print(f"  {label:<32} {per_call:10.2f} us/call")
+    return per_call
+
+
+def main():
+    """Compare flattened sampling with the precompiled index."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    args = parser.parse_args()
+
+    patterns = YouTubeSpeechPatterns
+    sentence = "양자역학은 미시세계의 물리법칙을 설명하는 이론입니다."
+
+    print("=" * 50)
+    print("Speech Pattern Sampling Benchmark")
+    print("=" * 50)
+    print(f"Patterns: {patterns.count_all_patterns()['total']}")
+
+    cases = [
+        ("get_transition", lambda: legacy_choice(patterns.TRANSITIONS), patterns.get_transition),
+        ("get_emotional_expression", lambda: legacy_choice(patterns.EMOTIONAL_EXPRESSIONS),
+         patterns.get_emotional_expression),
+        ("get_topic_expression", lambda: legacy_choice(patterns.TOPIC_SPECIFIC), patterns.get_topic_expression),
+        ("humanize_text", lambda: legacy_humanize(sentence, 1.0), lambda: patterns.humanize_text(sentence, 1.0)),
+    ]
+
+    for name, legacy, indexed in cases:
+        print(f"\n{name}")
+        before = bench("flatten per call", legacy, args.number)
+        after = bench("precompiled index", indexed, args.number)
+        print(f"  {'speedup':<32} {before / after:10.1f}x")
+
+    print("\nget_style_prompt")
+    bench("precompiled index", get_style_prompt, max(1, args.number // 10))
+
+
+if __name__ == "__main__":
+    main()
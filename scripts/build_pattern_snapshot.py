@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+"""Freeze src/script/patterns/*.py into a single snapshot for fast loading."""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add src to path so the script package imports the same way as the app
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from script.pattern_store import PATTERN_SOURCES, PatternStore, SNAPSHOT_PATH, build_snapshot  # noqa: E402
+
+
+def main():
+    """Build the pattern snapshot and verify it loads."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_PATH, help="snapshot path")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    path = build_snapshot(args.output)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    # Load it back the same way worker processes do
+    store = PatternStore(path)
+    total = sum(len(store.index(name)) for name in PATTERN_SOURCES)
+    if store.source != "snapshot":
+        print(f"✗ Snapshot at {path} could not be loaded")
+        sys.exit(1)
+
+    print(f"✓ {path} ({path.stat().st_size / 1024:.0f} KB, {total} patterns, {elapsed:.0f} ms)")
+
+
+if __name__ == "__main__":
+    main()
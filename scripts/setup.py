@@ -15,7 +15,7 @@ def main():
     project_root = Path(__file__).parent.parent
 
     # 1. Create directories
-    print("\n[1/4] Creating directories...")
+    print("\n[1/5] Creating directories...")
     directories = [
         "output/videos",
         "output/thumbnails",
@@ -34,7 +34,7 @@ def main():
         print(f"  ✓ {dir_path}")
 
     # 2. Create API keys file
-    print("\n[2/4] Setting up configuration...")
+    print("\n[2/5] Setting up configuration...")
     env_example = project_root / "config" / "api_keys.env.example"
     env_file = project_root / "config" / "api_keys.env"
 
@@ -48,7 +48,7 @@ def main():
         print("  ⚠ api_keys.env.example not found")
 
     # 3. Check Python dependencies
-    print("\n[3/4] Checking dependencies...")
+    print("\n[3/5] Checking dependencies...")
     try:
         import anthropic
         print("  ✓ anthropic installed")
@@ -74,7 +74,7 @@ def main():
         print("  ✗ Pillow not installed")
 
     # 4. Check FFmpeg
-    print("\n[4/4] Checking FFmpeg...")
+    print("\n[4/5] Checking FFmpeg...")
     ffmpeg_path = shutil.which("ffmpeg")
     if ffmpeg_path:
         print(f"  ✓ FFmpeg found: {ffmpeg_path}")
@@ -82,6 +82,16 @@ def main():
         print("  ✗ FFmpeg not found in PATH")
         print("  ⚠ Please install FFmpeg: https://ffmpeg.org/download.html")
 
+    # 5. Freeze speech patterns for fast worker start-up
+    print("\n[5/5] Building speech pattern snapshot...")
+    sys.path.insert(0, str(project_root / "src"))
+    try:
+        from script.pattern_store import build_snapshot
+        snapshot_path = build_snapshot()
+        print(f"  ✓ {snapshot_path.relative_to(project_root)}")
+    except (ImportError, OSError) as e:
+        print(f"  ✗ Pattern snapshot not built: {e}")
+
     # Summary
     print("\n" + "=" * 50)
     print("Setup Complete!")
@@ -0,0 +1,381 @@
+"""
+Audio Library Module
+====================
+BGM/효과음 라이브러리 색인
+
+폴더를 한 번 훑어 트랙별 길이, 통합 라우드니스, RMS 에너지 포락선, 추정 템포, 분위기 태그를
+JSON 색인으로 저장하고, 다음 로드부터는 크기/mtime이 바뀐 파일만 다시 분석한다.
+분석은 NumPy 벡터 연산으로 하고 파일이 많으면 프로세스 풀에서 병렬로 돌린다.
+이후 선택은 디스크 I/O 없이 메모리 색인 조회로 끝난다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import wave
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INDEX_FORMAT = 1
+ANALYZER_VERSION = 1         # 분석 방식이 바뀌면 올림 → 기존 항목 재분석
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".ogg", ".flac")
+
+ANALYSIS_RATE = 11025        # 분석용 다운샘플 목표 (Hz)
+HOP_SECONDS = 0.01           # RMS 프레임 간격
+LOUDNESS_BLOCK = 40          # 라우드니스 블록 (프레임 수 = 400ms)
+ENVELOPE_POINTS = 32
+TEMPO_RANGE = (60, 180)      # BPM
+MIN_TEMPO_CONFIDENCE = 0.1
+PARALLEL_THRESHOLD = 4       # 이 개수 이상 분석할 때만 프로세스 풀 사용
+
+
+@dataclass
+class LibraryTrack:
+    """색인된 트랙"""
+    path: str
+    name: str
+    category: str                       # 라이브러리 루트 아래 첫 폴더 이름
+    duration: float
+    sample_rate: int = 0
+    channels: int = 0
+    loudness: Optional[float] = None    # 통합 라우드니스 (LUFS 근사, K-가중 없음)
+    energy: Optional[float] = None      # 평균 RMS (0-1)
+    tempo: Optional[float] = None       # BPM (주기성이 약하면 None)
+    tempo_label: str = "medium"         # slow, medium, fast
+    moods: List[str] = field(default_factory=list)
+    envelope: List[float] = field(default_factory=list)   # 정규화한 RMS 포락선
+
+
+# ----- 분석 (프로세스 풀 워커에서 실행) -----
+
+def analyzer_id() -> str:
+    """색인 항목에 기록하는 분석기 식별자 - NumPy 유무를 포함해 헤더 정보만 있는 항목을 구분"""
+    return f"{ANALYZER_VERSION}+numpy" if np is not None else str(ANALYZER_VERSION)
+
+
+def _decode_mono(path: str):
+    """모노 float32 샘플과 샘플레이트 (분석용으로 다운샘플)"""
+    if Path(path).suffix.lower() in (".wav", ".wave"):
+        with wave.open(path, 'rb') as f:
+            width, channels, rate = f.getsampwidth(), f.getnchannels(), f.getframerate()
+            raw = f.readframes(f.getnframes())
+        dtypes = {1: np.uint8, 2: np.int16, 4: np.int32}
+        if width not in dtypes:
+            return None
+        samples = np.frombuffer(raw, dtype=dtypes[width]).astype(np.float32)
+        if width == 1:
+            samples -= 128
+        samples /= float(2 ** (8 * width - 1))
+    else:
+        try:
+            from pydub import AudioSegment
+        except ImportError:
+            return None
+        audio = AudioSegment.from_file(path)
+        channels, rate = audio.channels, audio.frame_rate
+        samples = np.asarray(audio.get_array_of_samples(), dtype=np.float32) / float(2 ** (8 * audio.sample_width - 1))
+
+    if channels > 1:
+        samples = samples[:len(samples) // channels * channels].reshape(-1, channels).mean(axis=1)
+
+    factor = max(1, rate // ANALYSIS_RATE)
+    if factor > 1:
+        samples = samples[:len(samples) // factor * factor].reshape(-1, factor).mean(axis=1)
+    return samples, rate / factor
+
+
+def _integrated_loudness(mean_square) -> float:
+    """400ms 블록 평균 제곱에 절대(-70)/상대(-10) 게이트 적용 (BS.1770 방식, K-가중 생략)"""
+    blocks = mean_square[:len(mean_square) // LOUDNESS_BLOCK * LOUDNESS_BLOCK].reshape(-1, LOUDNESS_BLOCK).mean(axis=1)
+    if not len(blocks):
+        blocks = np.asarray([mean_square.mean()])
+    with np.errstate(divide='ignore'):
+        levels = -0.691 + 10 * np.log10(blocks)
+    gated = blocks[levels > -70]
+    if not len(gated):
+        return -70.0
+    relative = -0.691 + 10 * np.log10(gated.mean()) - 10
+    gated = gated[levels[levels > -70] > relative]
+    return float(-0.691 + 10 * np.log10(gated.mean()))
+
+
+def _estimate_tempo(rms) -> Optional[float]:
+    """RMS 증가분(onset) 자기상관의 최대 지연으로 BPM 추정"""
+    onset = np.maximum(np.diff(rms), 0)
+    onset -= onset.mean()
+    if len(onset) < 4 or not onset.any():
+        return None
+
+    size = 1 << (2 * len(onset) - 1).bit_length()
+    spectrum = np.fft.rfft(onset, size)
+    autocorr = np.fft.irfft(spectrum * np.conj(spectrum), size)[:len(onset)]
+    if autocorr[0] <= 0:
+        return None
+
+    min_lag = int(60 / (TEMPO_RANGE[1] * HOP_SECONDS))
+    max_lag = min(int(60 / (TEMPO_RANGE[0] * HOP_SECONDS)), len(autocorr) - 1)
+    if max_lag <= min_lag:
+        return None
+    lag = min_lag + int(np.argmax(autocorr[min_lag:max_lag + 1]))
+    if autocorr[lag] / autocorr[0] < MIN_TEMPO_CONFIDENCE:
+        return None
+    return round(60 / (lag * HOP_SECONDS), 1)
+
+
+def tempo_label(tempo: Optional[float]) -> str:
+    if not tempo:
+        return "medium"
+    return "slow" if tempo < 90 else "fast" if tempo >= 130 else "medium"
+
+
+def mood_tags(category: str, energy: Optional[float], tempo: Optional[float]) -> List[str]:
+    """폴더 이름 + 에너지/템포로 추정한 분위기 태그"""
+    tags = [category] if category and category != "default" else []
+    label = tempo_label(tempo)
+    if tempo and label == "fast":
+        tags.append("upbeat")
+    elif tempo and label == "slow":
+        tags.append("calm")
+    if energy is not None:
+        if energy >= 0.2:
+            tags.append("energetic")
+        elif energy < 0.05:
+            tags.append("ambient")
+    return list(dict.fromkeys(tags))
+
+
+def analyze_file(path: str) -> Dict:
+    """트랙 특징 - 헤더 정보는 항상, 신호 특징은 NumPy가 있고 디코딩되면"""
+    from utils.media_probe import probe
+
+    info = probe(path)
+    features = {
+        "duration": info.duration if info else 0.0,
+        "sample_rate": info.sample_rate if info else 0,
+        "channels": info.channels if info else 0,
+        "loudness": None, "energy": None, "tempo": None, "envelope": [],
+    }
+    if np is None:
+        return features
+
+    try:
+        decoded = _decode_mono(path)
+    except Exception as e:
+        print(f"오디오 분석 실패 ({path}): {e}")
+        return features
+    if decoded is None:
+        return features
+
+    samples, rate = decoded
+    hop = max(1, int(rate * HOP_SECONDS))
+    frames = samples[:len(samples) // hop * hop].reshape(-1, hop)
+    if not len(frames):
+        return features
+
+    mean_square = (frames.astype(np.float64) ** 2).mean(axis=1)
+    rms = np.sqrt(mean_square)
+    peak = rms.max()
+    envelope = [float(chunk.mean()) for chunk in np.array_split(rms, min(ENVELOPE_POINTS, len(rms)))]
+
+    features.update({
+        "duration": features["duration"] or round(len(samples) / rate, 3),
+        "loudness": round(_integrated_loudness(mean_square), 2),
+        "energy": round(float(rms.mean()), 4),
+        "tempo": _estimate_tempo(rms),
+        "envelope": [round(v / peak, 3) if peak else 0.0 for v in envelope],
+    })
+    return features
+
+
+def _analyze_all(paths: List[str], workers: Optional[int]) -> List[Dict]:
+    if len(paths) < PARALLEL_THRESHOLD or workers == 1:
+        return [analyze_file(path) for path in paths]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(analyze_file, paths, chunksize=max(1, len(paths) // (4 * (workers or os.cpu_count() or 1)))))
+    except (OSError, NotImplementedError, RuntimeError) as e:
+        print(f"프로세스 풀 사용 불가 ({e}) - 순차 분석")
+        return [analyze_file(path) for path in paths]
+
+
+# ----- 색인 -----
+
+class AudioLibrary:
+    """폴더 단위 오디오 색인 (카테고리 = 루트 아래 첫 폴더)"""
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        index_path: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None
+    ):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else None
+        self.workers = workers
+        self._entries: Dict[str, Dict] = {}      # 상대 경로 → 특징 + size/mtime_ns
+        self._tracks: Dict[str, LibraryTrack] = {}
+        self._by_category: Dict[str, List[LibraryTrack]] = {}
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def _load_index(self):
+        if not self.index_path or not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"오디오 색인 로드 실패: {e}")
+            return
+        if isinstance(data, dict) and data.get("format") == INDEX_FORMAT:
+            self._entries = data.get("tracks", {})
+
+    def _save_index(self):
+        if not self.index_path:
+            return
+        from utils.atomic_io import atomic_write_json
+        try:
+            atomic_write_json(self.index_path, {"format": INDEX_FORMAT, "root": str(self.root), "tracks": self._entries})
+        except OSError as e:
+            print(f"오디오 색인 저장 실패: {e}")
+
+    def _scan(self) -> Dict[str, os.stat_result]:
+        if not self.root.exists():
+            return {}
+        found = {}
+        for path in self.root.rglob("*"):
+            if path.suffix.lower() in AUDIO_EXTENSIONS and path.is_file():
+                found[path.relative_to(self.root).as_posix()] = path.stat()
+        return found
+
+    def refresh(self) -> int:
+        """폴더를 훑어 새로 생기거나 바뀐 파일만 분석, 분석한 파일 수 반환"""
+        with self._lock:
+            if not self._entries:
+                self._load_index()
+
+            # 파일이 바뀌었거나 다른 분석기(이전 버전, NumPy 없이 헤더만)로 만든 항목은 재분석
+            current = analyzer_id()
+            files = self._scan()
+            changed = [
+                rel for rel, stat in files.items()
+                if (self._entries.get(rel, {}).get("size"), self._entries.get(rel, {}).get("mtime_ns"),
+                    self._entries.get(rel, {}).get("analyzer")) != (stat.st_size, stat.st_mtime_ns, current)
+            ]
+            removed = [rel for rel in self._entries if rel not in files]
+
+            for rel in removed:
+                del self._entries[rel]
+            if changed:
+                results = _analyze_all([str(self.root / rel) for rel in changed], self.workers)
+                for rel, features in zip(changed, results):
+                    stat = files[rel]
+                    self._entries[rel] = {
+                        **features, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                        "analyzer": current, "signal": features.get("loudness") is not None,
+                    }
+            if changed or removed:
+                self._save_index()
+
+            self._build()
+            self._ready = True
+            return len(changed)
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    def ensure_ready(self):
+        """처음 한 번만 색인 로드/갱신"""
+        if not self._ready:
+            self.refresh()
+
+    def _build(self):
+        tracks: Dict[str, LibraryTrack] = {}
+        by_category: Dict[str, List[LibraryTrack]] = {}
+        for rel in sorted(self._entries):
+            entry = self._entries[rel]
+            category = rel.split("/", 1)[0] if "/" in rel else ""
+            track = LibraryTrack(
+                path=str(self.root / rel),
+                name=Path(rel).stem,
+                category=category,
+                duration=entry.get("duration", 0.0),
+                sample_rate=entry.get("sample_rate", 0),
+                channels=entry.get("channels", 0),
+                loudness=entry.get("loudness"),
+                energy=entry.get("energy"),
+                tempo=entry.get("tempo"),
+                tempo_label=tempo_label(entry.get("tempo")),
+                moods=mood_tags(category, entry.get("energy"), entry.get("tempo")),
+                envelope=entry.get("envelope", []),
+            )
+            tracks[track.path] = track
+            by_category.setdefault(category, []).append(track)
+        self._tracks = tracks
+        self._by_category = by_category
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def categories(self) -> List[str]:
+        return list(self._by_category)
+
+    def tracks(self, category: Optional[str] = None) -> List[LibraryTrack]:
+        """카테고리 폴더의 트랙 (이름순), 카테고리가 없으면 전체"""
+        if category is None:
+            return list(self._tracks.values())
+        return self._by_category.get(category, [])
+
+    def get(self, path: Union[str, Path]) -> Optional[LibraryTrack]:
+        return self._tracks.get(str(path))
+
+    def query(
+        self,
+        categories: Iterable[str] = (),
+        mood: Optional[str] = None,
+        min_duration: Optional[float] = None
+    ) -> List[LibraryTrack]:
+        """카테고리 폴더 합집합(없으면 분위기 태그) 중 길이 조건을 만족하는 트랙"""
+        seen = set()
+        results = []
+        for category in categories:
+            for track in self._by_category.get(category, []):
+                if track.path not in seen:
+                    seen.add(track.path)
+                    results.append(track)
+        if not results and mood:
+            results = [track for track in self._tracks.values() if mood in track.moods]
+        if min_duration:
+            long_enough = [track for track in results if track.duration >= min_duration]
+            if long_enough:
+                results = long_enough
+        return results
+
+
+_libraries: Dict[str, AudioLibrary] = {}
+_libraries_lock = threading.Lock()
+
+
+def get_audio_library(root: Union[str, Path], config: Dict) -> AudioLibrary:
+    """라이브러리 루트별 공유 색인 (project.cache_dir/audio_library 아래 저장)"""
+    resolved = str(Path(root).resolve())
+    with _libraries_lock:
+        library = _libraries.get(resolved)
+        if library is None:
+            cache_dir = Path(config.get('project', {}).get('cache_dir', './data/cache')) / "audio_library"
+            digest = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:10]
+            library = AudioLibrary(
+                root,
+                index_path=cache_dir / f"{Path(root).name}-{digest}.json",
+                workers=config.get('audio', {}).get('library', {}).get('workers'),
+            )
+            _libraries[resolved] = library
+    return library
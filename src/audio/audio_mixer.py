@@ -4,10 +4,13 @@ Audio Mixer Module
 Mix multiple audio tracks together
 """
 
+import asyncio
 from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 
+from .mix_engine import BGMLayer, SFXLayer, mix_to_file, volume_to_db
+
 
 @dataclass
 class MixResult:
@@ -47,60 +50,28 @@ class AudioMixer:
         if not output_path:
             output_path = str(Path(narration_path).parent / "mixed_audio.mp3")
 
-        try:
-            from pydub import AudioSegment
-
-            # 나레이션 로드
-            narration = AudioSegment.from_file(narration_path)
-            total_duration = len(narration)
-
-            tracks_used = [narration_path]
-
-            # BGM 추가
-            if bgm_path and Path(bgm_path).exists():
-                bgm = AudioSegment.from_file(bgm_path)
-
-                # BGM 볼륨 조절
-                volume = self.bgm_config.get('volume', 0.15)
-                volume_db = 20 * (volume - 1)  # dB 변환
-                bgm = bgm + volume_db
-
-                # BGM 길이 조절
-                if len(bgm) < total_duration:
-                    loops_needed = (total_duration // len(bgm)) + 1
-                    bgm = bgm * loops_needed
-                bgm = bgm[:total_duration]
-
-                # 페이드 인/아웃
-                fade_in_ms = int(self.bgm_config.get('fade_in', 2.0) * 1000)
-                fade_out_ms = int(self.bgm_config.get('fade_out', 3.0) * 1000)
-                bgm = bgm.fade_in(fade_in_ms).fade_out(fade_out_ms)
-
-                # 믹싱
-                narration = narration.overlay(bgm)
-                tracks_used.append(bgm_path)
-
-            # 효과음 추가
-            if sfx_list:
-                for sfx in sfx_list:
-                    sfx_path = sfx.get('path')
-                    position_ms = int(sfx.get('position', 0) * 1000)
-
-                    if sfx_path and Path(sfx_path).exists():
-                        sfx_audio = AudioSegment.from_file(sfx_path)
-                        sfx_volume = sfx.get('volume', 0.3)
-                        sfx_audio = sfx_audio + (20 * (sfx_volume - 1))
-
-                        if position_ms < total_duration:
-                            narration = narration.overlay(sfx_audio, position=position_ms)
-                            tracks_used.append(sfx_path)
+        bgm = None
+        if bgm_path and Path(bgm_path).exists():
+            bgm = BGMLayer(
+                path=bgm_path,
+                gain_db=volume_to_db(self.bgm_config.get('volume', 0.15)),
+                fade_in=self.bgm_config.get('fade_in', 2.0),
+                fade_out=self.bgm_config.get('fade_out', 3.0),
+            )
+        sfx_layers = [
+            SFXLayer(path=sfx['path'], position=sfx.get('position', 0), gain_db=volume_to_db(sfx.get('volume', 0.3)))
+            for sfx in sfx_list or [] if sfx.get('path') and Path(sfx['path']).exists()
+        ]
 
-            # 저장
-            narration.export(output_path, format="mp3")
+        try:
+            # 소스는 한 번씩만 디코딩하고 하나의 버퍼에 누산 (NumPy 없으면 pydub)
+            duration, tracks_used = await asyncio.to_thread(
+                mix_to_file, narration_path, output_path, bgm, sfx_layers
+            )
 
             return MixResult(
                 output_path=output_path,
-                duration=total_duration / 1000,
+                duration=duration,
                 tracks_used=tracks_used,
                 settings={
                     "bgm_volume": self.bgm_config.get('volume', 0.15),
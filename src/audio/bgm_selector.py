@@ -7,6 +7,7 @@ Select appropriate background music
 from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
+import asyncio
 import random
 
 
@@ -38,6 +39,15 @@ class BGMSelector:
         self.config = config
         self.bgm_config = config.get('audio', {}).get('bgm', {})
         self.library_path = Path("assets/music/background")
+        self._library = None
+
+    @property
+    def library(self):
+        """라이브러리 색인 (같은 폴더면 프로세스 안에서 공유)"""
+        if self._library is None:
+            from .audio_library import get_audio_library
+            self._library = get_audio_library(self.library_path, self.config)
+        return self._library
 
     async def select_bgm(
         self,
@@ -46,7 +56,7 @@ class BGMSelector:
         duration_needed: float = None
     ) -> Optional[BGMTrack]:
         """
-        BGM 선택
+        BGM 선택 - 메모리 색인 조회 (색인은 처음 한 번만 로드/갱신)
 
         Args:
             category: 카테고리
@@ -62,7 +72,7 @@ class BGMSelector:
             mood = random.choice(moods)
 
         # 라이브러리에서 검색
-        tracks = await self._search_library(category, mood)
+        tracks = await self._search_library(category, mood, duration_needed)
 
         if not tracks:
             # 폴백: 기본 트랙
@@ -71,89 +81,71 @@ class BGMSelector:
         if not tracks:
             return None
 
-        # 길이 조건에 맞는 트랙 필터링
-        if duration_needed:
-            suitable_tracks = [t for t in tracks if t.duration >= duration_needed]
-            if suitable_tracks:
-                tracks = suitable_tracks
-
         # 랜덤 선택
         return random.choice(tracks)
 
     async def _search_library(
         self,
         category: str,
-        mood: str
+        mood: str,
+        duration_needed: float = None
     ) -> List[BGMTrack]:
-        """라이브러리 검색"""
-        tracks = []
-
-        # 카테고리별 폴더 검색
-        category_path = self.library_path / category
-        if category_path.exists():
-            for file_path in category_path.glob("*.mp3"):
-                tracks.append(BGMTrack(
-                    path=str(file_path),
-                    name=file_path.stem,
-                    category=category,
-                    mood=mood,
-                    duration=await self._get_duration(file_path),
-                    tempo="medium",
-                    license="royalty_free"
-                ))
-
-        # 분위기별 폴더 검색
-        mood_path = self.library_path / mood
-        if mood_path.exists():
-            for file_path in mood_path.glob("*.mp3"):
-                tracks.append(BGMTrack(
-                    path=str(file_path),
-                    name=file_path.stem,
-                    category=category,
-                    mood=mood,
-                    duration=await self._get_duration(file_path),
-                    tempo="medium",
-                    license="royalty_free"
-                ))
-
-        return tracks
-
-    async def _get_default_tracks(self) -> List[BGMTrack]:
-        """기본 트랙"""
-        default_path = self.library_path / "default"
-        if not default_path.exists():
-            return []
-
+        """라이브러리 검색 - 카테고리/분위기 폴더, 없으면 분위기 태그 (길이 조건 우선)"""
+        await self._ensure_library()
         return [
-            BGMTrack(
-                path=str(file_path),
-                name=file_path.stem,
-                category="default",
-                mood="neutral",
-                duration=await self._get_duration(file_path),
-                tempo="medium",
-                license="royalty_free"
-            )
-            for file_path in default_path.glob("*.mp3")
+            self._to_bgm_track(track, category, mood)
+            for track in self.library.query((category, mood), mood=mood, min_duration=duration_needed)
         ]
 
-    async def _get_duration(self, file_path: Path) -> float:
-        """오디오 길이"""
-        try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(str(file_path))
-            return len(audio) / 1000
-        except Exception:
-            return 180.0  # 기본값 3분
+    async def _get_default_tracks(self) -> List[BGMTrack]:
+        """기본 트랙"""
+        await self._ensure_library()
+        return [self._to_bgm_track(track, "default", "neutral") for track in self.library.tracks("default")]
+
+    async def _ensure_library(self):
+        if not self.library.ready:
+            await asyncio.to_thread(self.library.ensure_ready)
+
+    @staticmethod
+    def _to_bgm_track(track, category: str, mood: str) -> BGMTrack:
+        return BGMTrack(
+            path=track.path,
+            name=track.name,
+            category=category,
+            mood=mood,
+            duration=track.duration or 180.0,  # 길이를 모르면 3분
+            tempo=track.tempo_label,
+            license="royalty_free"
+        )
 
     def get_available_moods(self, category: str) -> List[str]:
         """사용 가능한 분위기"""
         return self.CATEGORY_MOODS.get(category, ["ambient", "minimal"])
 
     async def analyze_track(self, track_path: str) -> Dict:
-        """트랙 분석"""
+        """트랙 분석 - 색인된 특징 (색인에 없으면 바로 분석)"""
+        await self._ensure_library()
+        track = self.library.get(track_path)
+        if track is None:
+            from .audio_library import analyze_file, mood_tags, tempo_label
+            features = await asyncio.to_thread(analyze_file, str(track_path))
+            moods = mood_tags(Path(track_path).parent.name, features["energy"], features["tempo"])
+            return {
+                "tempo": tempo_label(features["tempo"]),
+                "bpm": features["tempo"],
+                "energy": features["energy"] if features["energy"] is not None else 0.5,
+                "loudness": features["loudness"],
+                "duration": features["duration"],
+                "mood": moods[0] if moods else "neutral",
+                "moods": moods,
+            }
+
         return {
-            "tempo": "medium",
-            "energy": 0.5,
-            "mood": "neutral"
+            "tempo": track.tempo_label,
+            "bpm": track.tempo,
+            "energy": track.energy if track.energy is not None else 0.5,
+            "loudness": track.loudness,
+            "duration": track.duration,
+            "mood": track.moods[0] if track.moods else "neutral",
+            "moods": track.moods,
         }
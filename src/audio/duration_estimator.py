@@ -0,0 +1,190 @@
+"""
+Duration Estimator Module
+=========================
+TTS 전에 나레이션 길이 예측
+
+언어별 발화 단위(한국어 음절, 일본어/중국어 글자, 그 외 단어)와 초당 속도,
+문장/쉼표 쉼으로 길이를 계산하고, 실제 TTS 결과 길이로 음성별 속도를 보정한다.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 1.0배속 나레이션 기준 (단위, 초당 단위 수)
+DEFAULT_RATES: Dict[str, Tuple[str, float]] = {
+    "ko": ("syllable", 6.2),
+    "ja": ("char", 7.0),
+    "zh": ("char", 4.5),
+    "en": ("word", 2.6),
+    "es": ("word", 2.9),
+    "fr": ("word", 2.8),
+    "de": ("word", 2.3),
+    "pt": ("word", 2.7),
+    "ru": ("word", 2.2),
+    "ar": ("word", 2.2),
+}
+
+SENTENCE_PAUSE = 0.35   # 문장 끝 쉼 (초)
+CLAUSE_PAUSE = 0.15     # 쉼표 쉼 (초)
+
+HANGUL = re.compile(r'[가-힣]')
+CJK = re.compile(r'[぀-ヿ㐀-䶿一-鿿]')
+LATIN_WORD = re.compile(r'[A-Za-z]+')
+NUMBER = re.compile(r'\d+')
+WORD = re.compile(r'\w+')
+SENTENCE_END = re.compile(r'[.!?…。！？]+')
+CLAUSE = re.compile(r'[,、，;:]')
+
+# 보정 샘플로 인정하는 최소 길이
+MIN_CALIBRATION_SECONDS = 3.0
+MIN_CALIBRATION_UNITS = 20
+
+
+def count_units(text: str, unit: str) -> int:
+    """발화 단위 수 - 음절/글자 언어에서 숫자와 영단어는 읽는 길이만큼 가중"""
+    if unit == "word":
+        return len(WORD.findall(text))
+
+    pattern = HANGUL if unit == "syllable" else CJK
+    units = len(pattern.findall(text))
+    units += 2 * len(LATIN_WORD.findall(text))
+    units += sum(min(len(n), 6) for n in NUMBER.findall(text))
+    return units
+
+
+def pause_seconds(text: str) -> float:
+    """문장/쉼표 쉼 합계"""
+    return SENTENCE_PAUSE * len(SENTENCE_END.findall(text)) + CLAUSE_PAUSE * len(CLAUSE.findall(text))
+
+
+class DurationEstimator:
+    """언어/음성별 나레이션 길이 추정기 (실제 TTS 길이로 보정)"""
+
+    def __init__(self, calibration_path: Optional[str] = None):
+        self.calibration_path = Path(calibration_path) if calibration_path else None
+        # "언어:음성" → {"rate": 1.0배속 초당 단위 수, "samples": 보정 횟수}
+        self.calibration: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        if not self.calibration_path or not self.calibration_path.exists():
+            return
+        try:
+            data = json.loads(self.calibration_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            print(f"발화 속도 보정값 로드 실패: {e}")
+            return
+        if isinstance(data, dict):
+            self.calibration = data
+
+    def _save(self):
+        if not self.calibration_path:
+            return
+        from utils.atomic_io import atomic_write_json
+        try:
+            atomic_write_json(self.calibration_path, self.calibration)
+        except OSError as e:
+            print(f"발화 속도 보정값 저장 실패: {e}")
+
+    @staticmethod
+    def _key(language: str, voice_id: str) -> str:
+        return f"{language}:{voice_id or 'default'}"
+
+    def rate(self, language: str, voice_id: str = "") -> Tuple[str, float]:
+        """(단위, 1.0배속 초당 단위 수) - 보정값이 있으면 우선"""
+        unit, rate = DEFAULT_RATES.get(language, DEFAULT_RATES["en"])
+        calibrated = self.calibration.get(self._key(language, voice_id))
+        if calibrated and calibrated.get("rate", 0) > 0:
+            rate = calibrated["rate"]
+        return unit, rate
+
+    def estimate(self, text: str, language: str = "ko", voice_id: str = "", speed: float = 1.0) -> float:
+        """예상 나레이션 길이 (초)"""
+        if not text or not text.strip():
+            return 0.0
+        unit, rate = self.rate(language, voice_id)
+        speech = count_units(text, unit) / (rate * (speed or 1.0))
+        return round(speech + pause_seconds(text) / (speed or 1.0), 2)
+
+    def observe(
+        self,
+        text: str,
+        language: str,
+        voice_id: str,
+        actual_seconds: float,
+        speed: float = 1.0
+    ) -> Optional[float]:
+        """
+        실제 TTS 길이로 속도 보정 (지수 이동 평균, 초반 샘플은 더 크게 반영)
+
+        Returns:
+            보정된 초당 단위 수 (샘플이 너무 짧으면 None)
+        """
+        unit, _ = self.rate(language, voice_id)
+        units = count_units(text or "", unit)
+        speech_seconds = (actual_seconds or 0.0) * (speed or 1.0) - pause_seconds(text or "")
+        if actual_seconds < MIN_CALIBRATION_SECONDS or units < MIN_CALIBRATION_UNITS or speech_seconds <= 0:
+            return None
+
+        observed = units / speech_seconds
+        key = self._key(language, voice_id)
+        entry = self.calibration.get(key)
+        if entry is None:
+            entry = {"rate": DEFAULT_RATES.get(language, DEFAULT_RATES["en"])[1], "samples": 0}
+
+        alpha = max(0.2, 1.0 / (entry["samples"] + 1))
+        entry["rate"] = round(entry["rate"] + alpha * (observed - entry["rate"]), 4)
+        entry["samples"] += 1
+        self.calibration[key] = entry
+        self._save()
+        return entry["rate"]
+
+    def segment_targets(self, segments: List[Dict], target_seconds: float) -> List[float]:
+        """세그먼트별 목표 길이 - 선언된 duration 비율로 전체 목표를 나눔"""
+        declared = []
+        for segment in segments:
+            duration = segment.get('duration') if isinstance(segment, dict) else None
+            declared.append(duration if isinstance(duration, (int, float)) and duration > 0 else 0)
+
+        if not any(declared):
+            declared = [1] * len(segments)
+        total = sum(declared)
+        return [target_seconds * d / total for d in declared]
+
+    def plan_adjustments(
+        self,
+        segments: List[Dict],
+        target_seconds: float,
+        language: str = "ko",
+        voice_id: str = "",
+        speed: float = 1.0,
+        tolerance: float = 0.15
+    ) -> Dict[int, int]:
+        """
+        목표 길이에서 벗어난 세그먼트와 목표 단위 수
+
+        전체 예상 길이가 목표 ± tolerance 안이면 빈 dict.
+        아니면 전체와 같은 방향으로 tolerance 이상 벗어난 세그먼트 id → 목표 단위 수(음절/글자/단어).
+        """
+        estimates = [
+            self.estimate(s.get('text', '') if isinstance(s, dict) else '', language, voice_id, speed)
+            for s in segments
+        ]
+        total = sum(estimates)
+        if not target_seconds or abs(total - target_seconds) <= tolerance * target_seconds:
+            return {}
+
+        too_long = total > target_seconds
+        unit, rate = self.rate(language, voice_id)
+        plan = {}
+        for i, (segment, estimate, target) in enumerate(zip(segments, estimates, self.segment_targets(segments, target_seconds))):
+            if not isinstance(segment, dict) or target <= 0:
+                continue
+            ratio = estimate / target
+            if (too_long and ratio > 1 + tolerance) or (not too_long and ratio < 1 - tolerance):
+                text = segment.get('text', '')
+                speech = max(0.0, target - pause_seconds(text) / (speed or 1.0))
+                plan[segment.get('id', i + 1)] = max(1, int(speech * rate * (speed or 1.0)))
+        return plan
@@ -0,0 +1,275 @@
+"""
+Mix Engine Module
+=================
+단일 패스 오디오 믹싱 엔진
+
+소스마다 한 번만 float32 배열로 디코딩하고(같은 효과음은 재사용),
+나레이션 배열을 누산 버퍼로 삼아 루프 BGM(게인/페이드)과 위치 지정 효과음을
+제자리에서 더한 뒤 마지막에 한 번만 인코딩한다.
+BGM 루프 사본이나 overlay마다 생기는 전체 길이 사본이 없어
+메모리는 나레이션 길이에만, 시간은 실제로 더하는 샘플 수에만 비례한다.
+NumPy가 없으면 기존 pydub 체인으로 동작한다.
+"""
+
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BLOCK_FRAMES = 1 << 16       # BGM을 더할 때 임시 배열 최대 길이 (프레임)
+OUTPUT_SAMPLE_WIDTH = 2      # 16-bit PCM으로 인코딩
+
+
+@dataclass
+class BGMLayer:
+    """루프 BGM 레이어"""
+    path: str
+    gain_db: float = 0.0
+    fade_in: float = 0.0     # 초
+    fade_out: float = 0.0    # 초
+
+
+@dataclass
+class SFXLayer:
+    """위치 지정 효과음 레이어"""
+    path: str
+    position: float = 0.0    # 초
+    gain_db: float = 0.0
+
+
+def volume_to_db(volume: float) -> float:
+    """설정 볼륨(0~1) → 게인 dB (기존 믹싱과 같은 20 × (volume - 1) 규칙)"""
+    return 20 * (volume - 1)
+
+
+def db_to_gain(db: float) -> float:
+    return 10 ** (db / 20)
+
+
+def bgm_tiles(total_frames: int, loop_frames: int, block_frames: int = BLOCK_FRAMES) -> List[Tuple[int, int, int]]:
+    """
+    출력 구간을 BGM 루프 경계와 블록 크기로 나눈 (출력 시작, 출력 끝, BGM 시작) 목록
+
+    각 구간은 BGM 한 바퀴 안에 있으므로 루프 사본 없이 원본 배열 조각을 그대로 더할 수 있다.
+    """
+    tiles: List[Tuple[int, int, int]] = []
+    if total_frames <= 0 or loop_frames <= 0:
+        return tiles
+    start = 0
+    while start < total_frames:
+        source = start % loop_frames
+        end = min(total_frames, start + loop_frames - source, start + block_frames)
+        tiles.append((start, end, source))
+        start = end
+    return tiles
+
+
+def _fade_gain(start: int, end: int, total: int, fade_in: int, fade_out: int):
+    """[start, end) 구간의 페이드 게인 (선형 진폭, pydub fade와 같은 규칙) - 페이드 밖이면 None"""
+    if start >= fade_in and end <= total - fade_out:
+        return None
+    positions = np.arange(start, end, dtype=np.float32)
+    gain = np.ones(end - start, dtype=np.float32)
+    if fade_in > 0:
+        gain = np.minimum(gain, positions / fade_in)
+    if fade_out > 0:
+        gain = np.minimum(gain, (total - positions) / fade_out)
+    return np.clip(gain, 0.0, 1.0)[:, None]
+
+
+# ----- 디코딩 -----
+
+def _read_wav(path: str):
+    """WAV → (float32 [프레임, 채널], 샘플레이트), 지원하지 않는 샘플 폭이면 None"""
+    with wave.open(path, 'rb') as f:
+        width, channels, rate = f.getsampwidth(), f.getnchannels(), f.getframerate()
+        raw = f.readframes(f.getnframes())
+
+    if width == 3:
+        # 24-bit는 하위에 0바이트를 붙여 int32로 읽음
+        packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(packed), 4), dtype=np.uint8)
+        padded[:, 1:] = packed
+        samples = padded.view('<i4').reshape(-1).astype(np.float32) / float(2 ** 31)
+    elif width in (1, 2, 4):
+        samples = np.frombuffer(raw, dtype={1: np.uint8, 2: '<i2', 4: '<i4'}[width]).astype(np.float32)
+        if width == 1:
+            samples -= 128
+        samples /= float(2 ** (8 * width - 1))
+    else:
+        return None
+    return samples[:len(samples) // channels * channels].reshape(-1, channels), rate
+
+
+def _conform(samples, rate: int, target_rate: int, target_channels: int):
+    """채널 수와 샘플레이트를 출력에 맞춤 (선형 보간 리샘플)"""
+    channels = samples.shape[1]
+    if channels != target_channels:
+        mono = samples if channels == 1 else samples.mean(axis=1, keepdims=True)
+        samples = np.repeat(mono, target_channels, axis=1) if target_channels > 1 else mono
+    if rate != target_rate and len(samples):
+        frames = max(1, int(round(len(samples) * target_rate / rate)))
+        source_positions = np.arange(frames, dtype=np.float64) * (rate / target_rate)
+        original = np.arange(len(samples), dtype=np.float64)
+        samples = np.stack(
+            [np.interp(source_positions, original, samples[:, c]) for c in range(samples.shape[1])], axis=1
+        ).astype(np.float32)
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+
+def decode(path: str, rate: Optional[int] = None, channels: Optional[int] = None):
+    """
+    오디오 파일 → (float32 [프레임, 채널], 샘플레이트)
+
+    WAV는 wave 모듈로 직접 읽고, 그 외 형식은 pydub(ffmpeg)으로 디코딩한다.
+    rate/channels를 주면 그 형식으로 맞춘다.
+    """
+    decoded = _read_wav(path) if Path(path).suffix.lower() in (".wav", ".wave") else None
+    if decoded is None:
+        from pydub import AudioSegment
+
+        audio = AudioSegment.from_file(path)
+        if rate:
+            audio = audio.set_frame_rate(rate)
+        if channels:
+            audio = audio.set_channels(channels)
+        samples = np.asarray(audio.get_array_of_samples(), dtype=np.float32)
+        samples /= float(2 ** (8 * audio.sample_width - 1))
+        decoded = samples.reshape(-1, audio.channels), audio.frame_rate
+
+    samples, source_rate = decoded
+    if rate and channels and (source_rate != rate or samples.shape[1] != channels):
+        samples = _conform(samples, source_rate, rate, channels)
+        source_rate = rate
+    return samples, source_rate
+
+
+# ----- 인코딩 -----
+
+def encode(samples, rate: int, output_path: str) -> None:
+    """float32 버퍼 → 16-bit 파일 (WAV는 직접, 그 외는 pydub으로 내보냄)"""
+    # 디코딩과 같은 2^15 스케일로 되돌려 16-bit 입력은 그대로 보존, 넘치는 합은 포화
+    samples *= 32768
+    np.rint(samples, out=samples)
+    np.clip(samples, -32768, 32767, out=samples)
+    pcm = samples.astype('<i2')
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    suffix = Path(output_path).suffix.lower()
+    if suffix in (".wav", ".wave"):
+        with wave.open(str(output_path), 'wb') as f:
+            f.setnchannels(samples.shape[1])
+            f.setsampwidth(OUTPUT_SAMPLE_WIDTH)
+            f.setframerate(rate)
+            f.writeframes(pcm.tobytes())
+        return
+
+    from pydub import AudioSegment
+
+    audio = AudioSegment(data=pcm.tobytes(), sample_width=OUTPUT_SAMPLE_WIDTH,
+                         frame_rate=rate, channels=samples.shape[1])
+    audio.export(str(output_path), format=suffix.lstrip('.') or "mp3")
+
+
+# ----- 믹싱 -----
+
+def _mix_numpy(
+    narration_path: str,
+    output_path: str,
+    bgm: Optional[BGMLayer],
+    sfx: Sequence[SFXLayer]
+) -> Tuple[float, List[str]]:
+    buffer, rate = decode(narration_path)
+    total, channels = buffer.shape
+    tracks_used = [narration_path]
+
+    if bgm is not None:
+        loop, _ = decode(bgm.path, rate, channels)
+        if len(loop):
+            gain = db_to_gain(bgm.gain_db)
+            fade_in = int(bgm.fade_in * rate)
+            fade_out = int(bgm.fade_out * rate)
+            for start, end, source in bgm_tiles(total, len(loop)):
+                chunk = loop[source:source + end - start] * gain
+                envelope = _fade_gain(start, end, total, fade_in, fade_out)
+                if envelope is not None:
+                    chunk *= envelope
+                buffer[start:end] += chunk
+            tracks_used.append(bgm.path)
+
+    decoded: Dict[str, object] = {}
+    for layer in sfx:
+        start = max(0, int(layer.position * rate))
+        if start >= total:
+            continue
+        if layer.path not in decoded:
+            decoded[layer.path] = decode(layer.path, rate, channels)[0]
+        clip = decoded[layer.path]
+        end = min(total, start + len(clip))
+        buffer[start:end] += clip[:end - start] * db_to_gain(layer.gain_db)
+        tracks_used.append(layer.path)
+
+    encode(buffer, rate, output_path)
+    return total / rate, tracks_used
+
+
+def _mix_pydub(
+    narration_path: str,
+    output_path: str,
+    bgm: Optional[BGMLayer],
+    sfx: Sequence[SFXLayer]
+) -> Tuple[float, List[str]]:
+    """NumPy가 없을 때 - pydub overlay 체인"""
+    from pydub import AudioSegment
+
+    narration = AudioSegment.from_file(narration_path)
+    total = len(narration)
+    tracks_used = [narration_path]
+
+    if bgm is not None:
+        track = AudioSegment.from_file(bgm.path) + bgm.gain_db
+        if len(track):
+            if len(track) < total:
+                track = track * (total // len(track) + 1)
+            track = track[:total]
+            # pydub fade는 길이 0을 처리하지 못함
+            if int(bgm.fade_in * 1000) > 0:
+                track = track.fade_in(int(bgm.fade_in * 1000))
+            if int(bgm.fade_out * 1000) > 0:
+                track = track.fade_out(int(bgm.fade_out * 1000))
+            narration = narration.overlay(track)
+            tracks_used.append(bgm.path)
+
+    for layer in sfx:
+        position_ms = max(0, int(layer.position * 1000))
+        if position_ms < total:
+            narration = narration.overlay(AudioSegment.from_file(layer.path) + layer.gain_db, position=position_ms)
+            tracks_used.append(layer.path)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    narration.export(str(output_path), format=Path(output_path).suffix.lstrip('.') or "mp3")
+    return total / 1000, tracks_used
+
+
+def mix_to_file(
+    narration_path: str,
+    output_path: str,
+    bgm: Optional[BGMLayer] = None,
+    sfx: Sequence[SFXLayer] = ()
+) -> Tuple[float, List[str]]:
+    """
+    나레이션 + BGM + 효과음을 믹싱해 output_path에 저장 (블로킹)
+
+    출력 길이와 형식(샘플레이트, 채널)은 나레이션을 따르며, 나레이션 끝을 넘는 효과음은 잘린다.
+
+    Returns:
+        (출력 길이 초, 사용한 트랙 경로 목록)
+    """
+    if np is not None:
+        return _mix_numpy(narration_path, output_path, bgm, sfx)
+    return _mix_pydub(narration_path, output_path, bgm, sfx)
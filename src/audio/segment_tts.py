@@ -0,0 +1,121 @@
+"""
+Segment TTS Module
+==================
+세그먼트 단위 나레이션 합성과 이어 붙이기
+
+스크립트 세그먼트(긴 세그먼트는 문장 경계에서 분할)를 조각별로 따로 합성하고
+짧은 크로스페이드로 이어 붙이며, 세그먼트별 실제 시작/끝 시각을 계산한다.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_MAX_CHARS = 1200     # 요청 하나에 보내는 최대 글자 수
+DEFAULT_CROSSFADE_MS = 40
+
+
+@dataclass
+class NarrationPiece:
+    """TTS 요청 하나에 해당하는 조각"""
+    index: int
+    segment_id: object
+    segment_type: str
+    text: str
+
+
+def plan_pieces(
+    segments: Sequence[Dict],
+    full_script: str = "",
+    max_chars: int = DEFAULT_MAX_CHARS
+) -> List[NarrationPiece]:
+    """
+    세그먼트 → TTS 조각 목록 (순서 유지)
+
+    텍스트가 있는 세그먼트가 없으면 full_script 하나를 세그먼트로 본다.
+    max_chars보다 긴 세그먼트는 문장 경계에서 나눈다.
+    """
+    from utils.chunking import split_sentences
+
+    sources = [
+        (s.get('id', i + 1), s.get('type', ''), (s.get('text') or '').strip())
+        for i, s in enumerate(segments or []) if isinstance(s, dict)
+    ]
+    sources = [source for source in sources if source[2]]
+    if not sources and full_script.strip():
+        sources = [(1, '', full_script.strip())]
+
+    pieces: List[NarrationPiece] = []
+    for segment_id, segment_type, text in sources:
+        parts: List[str] = []
+        current = ""
+        for sentence in (split_sentences(text) if len(text) > max_chars else [text]):
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                parts.append(current)
+                current = ""
+            current = f"{current} {sentence}" if current else sentence
+        if current:
+            parts.append(current)
+        for part in parts:
+            pieces.append(NarrationPiece(len(pieces), segment_id, segment_type, part))
+    return pieces
+
+
+def plan_timing(
+    pieces: Sequence[NarrationPiece],
+    durations_ms: Sequence[int],
+    crossfade_ms: int = DEFAULT_CROSSFADE_MS
+) -> List[Dict]:
+    """
+    조각 길이와 크로스페이드로 세그먼트별 시작/끝 시각(초) 계산
+
+    조각 i(>0)는 앞 결과의 끝에서 크로스페이드만큼 겹쳐 시작한다 (pydub append와 같은 규칙).
+    """
+    timing: List[Dict] = []
+    position = 0
+    for i, (piece, duration) in enumerate(zip(pieces, durations_ms)):
+        overlap = min(crossfade_ms, position, duration) if i else 0
+        start = position - overlap
+        end = start + duration
+        position = end
+
+        if timing and timing[-1]['segment_id'] == piece.segment_id:
+            timing[-1]['end'] = round(end / 1000, 3)
+            timing[-1]['pieces'] += 1
+        else:
+            timing.append({
+                'segment_id': piece.segment_id,
+                'type': piece.segment_type,
+                'start': round(start / 1000, 3),
+                'end': round(end / 1000, 3),
+                'pieces': 1,
+            })
+    return timing
+
+
+def stitch_pieces(
+    pieces: Sequence[NarrationPiece],
+    piece_paths: Sequence[str],
+    output_path: str,
+    crossfade_ms: int = DEFAULT_CROSSFADE_MS
+) -> List[Dict]:
+    """
+    조각 오디오를 순서대로 크로스페이드로 이어 output_path에 저장 (블로킹)
+
+    Returns:
+        세그먼트별 타이밍 [{segment_id, type, start, end, pieces}]
+    """
+    from pydub import AudioSegment
+
+    audios = [AudioSegment.from_file(path) for path in piece_paths]
+    combined: Optional[AudioSegment] = None
+    for audio in audios:
+        if combined is None:
+            combined = audio
+        else:
+            combined = combined.append(audio, crossfade=min(crossfade_ms, len(combined), len(audio)))
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if combined is not None:
+        combined.export(str(output_path), format=Path(output_path).suffix.lstrip('.') or "mp3")
+    return plan_timing(pieces, [len(audio) for audio in audios], crossfade_ms)
@@ -7,6 +7,7 @@ Manage sound effects for videos
 from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
+import asyncio
 import random
 
 
@@ -40,6 +41,28 @@ class SFXManager:
         self.config = config
         self.sfx_config = config.get('audio', {}).get('sfx', {})
         self.library_path = Path("assets/sound_effects")
+        self._library = None
+
+    @property
+    def library(self):
+        """라이브러리 색인 (같은 폴더면 프로세스 안에서 공유)"""
+        if self._library is None:
+            from .audio_library import get_audio_library
+            self._library = get_audio_library(self.library_path, self.config)
+        return self._library
+
+    async def _ensure_library(self):
+        if not self.library.ready:
+            await asyncio.to_thread(self.library.ensure_ready)
+
+    def _to_sound_effect(self, track, category: str) -> SoundEffect:
+        return SoundEffect(
+            path=track.path,
+            name=track.name,
+            category=category,
+            duration=track.duration or 1.0,
+            volume_level=self.sfx_config.get('volume', 0.3)
+        )
 
     async def get_sfx(
         self,
@@ -47,36 +70,27 @@ class SFXManager:
         variant: int = None
     ) -> Optional[SoundEffect]:
         """
-        효과음 가져오기
+        효과음 가져오기 - 메모리 색인 조회
 
         Args:
             category: 카테고리
-            variant: 변형 번호
+            variant: 변형 번호 (이름순)
 
         Returns:
             효과음
         """
-        category_path = self.library_path / category
-        if not category_path.exists():
-            return None
-
-        files = list(category_path.glob("*.mp3")) + list(category_path.glob("*.wav"))
+        await self._ensure_library()
+        files = [t for t in self.library.tracks(category) if Path(t.path).suffix in (".mp3", ".wav")]
 
         if not files:
             return None
 
         if variant is not None and variant < len(files):
-            file_path = files[variant]
+            track = files[variant]
         else:
-            file_path = random.choice(files)
+            track = random.choice(files)
 
-        return SoundEffect(
-            path=str(file_path),
-            name=file_path.stem,
-            category=category,
-            duration=await self._get_duration(file_path),
-            volume_level=self.sfx_config.get('volume', 0.3)
-        )
+        return self._to_sound_effect(track, category)
 
     async def get_transition_sfx(self) -> Optional[SoundEffect]:
         """전환 효과음"""
@@ -90,55 +104,37 @@ class SFXManager:
         """알림 효과음"""
         return await self.get_sfx("notification")
 
-    async def _get_duration(self, file_path: Path) -> float:
-        """오디오 길이"""
-        try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(str(file_path))
-            return len(audio) / 1000
-        except Exception:
-            return 1.0
-
     def list_categories(self) -> Dict[str, str]:
         """카테고리 목록"""
         return self.CATEGORIES
 
     async def list_sfx_in_category(self, category: str) -> List[SoundEffect]:
         """카테고리 내 효과음 목록"""
-        category_path = self.library_path / category
-        if not category_path.exists():
-            return []
-
-        sfx_list = []
-        for file_path in category_path.glob("*.*"):
-            if file_path.suffix in [".mp3", ".wav"]:
-                sfx_list.append(SoundEffect(
-                    path=str(file_path),
-                    name=file_path.stem,
-                    category=category,
-                    duration=await self._get_duration(file_path),
-                    volume_level=self.sfx_config.get('volume', 0.3)
-                ))
-
-        return sfx_list
+        await self._ensure_library()
+        return [
+            self._to_sound_effect(track, category)
+            for track in self.library.tracks(category)
+            if Path(track.path).suffix in (".mp3", ".wav")
+        ]
 
     async def auto_suggest_sfx(
         self,
         script_segments: List[Dict]
     ) -> List[Dict]:
-        """스크립트 기반 효과음 자동 제안"""
+        """스크립트 기반 효과음 자동 제안 (전환 효과음 목록은 한 번만 조회)"""
         suggestions = []
+        transitions = await self.list_sfx_in_category("transition")
+        if not transitions:
+            return suggestions
 
         for i, segment in enumerate(script_segments):
             segment_type = segment.get('type', '')
 
             if segment_type == 'transition' or i > 0:
-                sfx = await self.get_transition_sfx()
-                if sfx:
-                    suggestions.append({
-                        "segment_index": i,
-                        "sfx": sfx,
-                        "position": "start"
-                    })
+                suggestions.append({
+                    "segment_index": i,
+                    "sfx": random.choice(transitions),
+                    "position": "start"
+                })
 
         return suggestions
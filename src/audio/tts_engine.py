@@ -7,6 +7,7 @@ Text-to-Speech generation using gTTS (Google Text-to-Speech) - Free
 from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
+import asyncio
 import os
 
 
@@ -49,7 +50,7 @@ class TTSEngine:
         provider: str = None
     ) -> TTSResult:
         """
-        TTS 생성 - gTTS 사용
+        TTS 생성 - gTTS 사용 (문단을 세그먼트로 보고 조각별 병렬 합성)
 
         Args:
             text: 변환할 텍스트
@@ -61,27 +62,88 @@ class TTSEngine:
         Returns:
             TTS 결과
         """
+        segments = [{"id": i + 1, "text": p} for i, p in enumerate(text.split("\n\n")) if p.strip()]
+        return await self.generate_segments(segments, language, voice_id, output_path, full_script=text)
+
+    async def generate_segments(
+        self,
+        segments: List[Dict],
+        language: str = "ko",
+        voice_id: str = None,
+        output_path: str = None,
+        full_script: str = ""
+    ) -> TTSResult:
+        """
+        세그먼트별 TTS 생성
+
+        세그먼트(긴 것은 문장 경계에서 분할)를 audio.tts.max_concurrent 안에서 동시에 합성하고
+        실패한 조각만 재시도한 뒤 짧은 크로스페이드로 이어 붙인다.
+
+        Returns:
+            TTS 결과 (segments_timing에 세그먼트별 start/end 초)
+        """
+        from .segment_tts import DEFAULT_CROSSFADE_MS, DEFAULT_MAX_CHARS, plan_pieces, stitch_pieces
+
         if not output_path:
             output_path = f"output/audio/tts_{language}.mp3"
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         lang_code = self.LANGUAGE_CODES.get(language, "en")
+        pieces = plan_pieces(segments, full_script, self.tts_config.get('segment_max_chars', DEFAULT_MAX_CHARS))
 
         try:
             from gtts import gTTS
-
-            tts = gTTS(text=text, lang=lang_code, slow=False)
-            tts.save(output_path)
-
-            duration = await self._get_audio_duration(output_path)
+            from utils.adaptive_limiter import get_limiter
+            from utils.resilience import retry_async
+            from utils.tts_cache import TTSCache, get_tts_cache
+
+            if not pieces:
+                raise ValueError("빈 텍스트")
+
+            stem = Path(output_path)
+            piece_paths = [str(stem.with_name(f"{stem.stem}_{piece.index:03d}.mp3")) for piece in pieces]
+            limiter = get_limiter("gtts", self.config)
+            cache = get_tts_cache(self.config)
+
+            def synthesize(text: str, path: str):
+                gTTS(text=text, lang=lang_code, slow=False).save(path)
+
+            async def synthesize_piece(piece, path: str):
+                key = TTSCache.make_key(piece.text, "gtts", lang_code, None, self.tts_config.get('settings'))
+                if cache and await asyncio.to_thread(cache.fetch, key, path):
+                    return
+                await retry_async(
+                    limiter.run, asyncio.to_thread, synthesize, piece.text, path,
+                    provider="gtts", config=self.config, use_timeout=False
+                )
+                if cache:
+                    await asyncio.to_thread(cache.put, key, path)
+
+            await asyncio.gather(*(synthesize_piece(piece, path) for piece, path in zip(pieces, piece_paths)))
+
+            if len(pieces) == 1:
+                os.replace(piece_paths[0], output_path)
+                duration = await self._get_audio_duration(output_path)
+                timing = [{
+                    'segment_id': pieces[0].segment_id, 'type': pieces[0].segment_type,
+                    'start': 0.0, 'end': duration, 'pieces': 1,
+                }] if duration else []
+            else:
+                timing = await asyncio.to_thread(
+                    stitch_pieces, pieces, piece_paths, output_path,
+                    self.tts_config.get('crossfade_ms', DEFAULT_CROSSFADE_MS)
+                )
+                for path in piece_paths:
+                    Path(path).unlink(missing_ok=True)
+                duration = timing[-1]['end'] if timing else 0.0
 
             return TTSResult(
                 audio_path=output_path,
                 duration=duration,
                 voice_id=lang_code,
                 provider="gtts",
-                segments_timing=[]
+                segments_timing=timing
             )
         except Exception as e:
             print(f"gTTS error: {e}")
@@ -96,13 +158,9 @@ class TTSEngine:
             )
 
     async def _get_audio_duration(self, audio_path: str) -> float:
-        """오디오 길이 계산"""
-        try:
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(audio_path)
-            return len(audio) / 1000  # ms to seconds
-        except Exception:
-            return 0.0
+        """오디오 길이 계산 - 헤더만 읽음"""
+        from utils.media_probe import probe_duration
+        return probe_duration(audio_path)
 
     def get_available_voices(self, language: str) -> List[Dict]:
         """사용 가능한 음성 목록"""
@@ -1,14 +1,13 @@
 """Comment Analyzer - Analyze comments for insights"""
 from typing import Dict, List
-import json
 
 class CommentAnalyzer:
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def analyze(self, comment: str) -> Dict:
@@ -17,10 +16,7 @@ class CommentAnalyzer:
         prompt = f"""댓글 분석: "{comment[:200]}"
 JSON: {{"sentiment": -1~1, "type": "positive/negative/question/suggestion/neutral", "is_question": bool}}"""
         try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=150, messages=[{"role": "user", "content": prompt}])
-            text = response.content[0].text
-            if "```" in text: text = text.split("```")[1].split("```")[0].replace("json", "")
-            return json.loads(text.strip())
+            return await self.client.generate_json(prompt, max_tokens=150)
         except:
             return {"sentiment": 0, "type": "neutral", "is_question": False}
 
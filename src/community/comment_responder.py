@@ -13,8 +13,8 @@ class CommentResponder:
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def respond(self, comment: str, analysis: Dict, video_context: Dict = None) -> str:
@@ -25,8 +25,8 @@ class CommentResponder:
 영상 주제: {video_context.get('topic', '') if video_context else ''}
 1-2문장으로:"""
             try:
-                response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=100, messages=[{"role": "user", "content": prompt}])
-                return response.content[0].text.strip()
+                response = await self.client.generate(prompt, max_tokens=100, use_cache=False)
+                return response.strip()
             except: pass
         if comment_type in TEMPLATES:
             return random.choice(TEMPLATES[comment_type]).format(answer="영상에서 확인해주세요!")
@@ -7,20 +7,28 @@ class CulturalAdapter:
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def adapt(self, text: str, source_culture: str, target_culture: str) -> str:
         if not self.client: return text
-        prompt = f"""다음 텍스트를 {target_culture} 문화에 맞게 적응시키세요.
-원본 ({source_culture}): {text[:2000]}
+        from utils.chunking import chunk_settings, chunk_text, context_block, map_chunks
+        max_tokens, overlap_tokens, concurrency = chunk_settings(self.config)
+
+        async def adapt_chunk(chunk):
+            prompt = f"""다음 텍스트를 {target_culture} 문화에 맞게 적응시키세요.
+{context_block(chunk)}원본 ({source_culture}): {chunk.text}
 문화적 맥락을 고려하여 비유, 예시, 유머 등을 현지화하세요.
 적응된 텍스트만 출력:"""
-        try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=len(text) * 2, messages=[{"role": "user", "content": prompt}])
-            return response.content[0].text.strip()
-        except: return text
+            try:
+                response = await self.client.generate(prompt, max_tokens=len(chunk.text) * 2)
+                return response.strip()
+            except: return chunk.text
+
+        chunks = chunk_text(text, max_tokens, overlap_tokens)
+        if not chunks: return text
+        return "\n\n".join(await map_chunks(chunks, adapt_chunk, concurrency))
 
     async def get_cultural_notes(self, text: str, target_culture: str) -> list:
         return ["Consider local references", "Adjust humor style"]
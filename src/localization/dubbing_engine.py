@@ -1,4 +1,5 @@
 """Dubbing Engine - Generate dubbed audio for different languages"""
+import asyncio
 from typing import Dict
 from pathlib import Path
 
@@ -12,13 +13,24 @@ class DubbingEngine:
             output_path = f"output/audio/dub_{language}.mp3"
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         try:
-            from elevenlabs import ElevenLabs, VoiceSettings
-            client = ElevenLabs()
+            from utils.tts_cache import TTSCache, get_tts_cache
             voice_id = self.tts_config.get('voices', {}).get(language, {}).get('male', '')
             if not voice_id: return ""
-            audio = client.text_to_speech.convert(voice_id=voice_id, text=text, model_id="eleven_multilingual_v2")
-            with open(output_path, 'wb') as f:
-                for chunk in audio: f.write(chunk)
+            model_id = "eleven_multilingual_v2"
+            # TTS 캐시 조회 - 같은 텍스트/음성/모델이면 합성 생략 (convert는 음성 설정을 쓰지 않으므로 키에서 제외)
+            cache = get_tts_cache(self.config)
+            key = TTSCache.make_key(text, "elevenlabs", voice_id, model_id)
+            if cache and await asyncio.to_thread(cache.fetch, key, output_path): return output_path
+
+            from elevenlabs import ElevenLabs, VoiceSettings
+            from utils.resilience import retry_async
+            client = ElevenLabs(timeout=self.config.get('api', {}).get('timeout', 120))
+            def convert():
+                audio = client.text_to_speech.convert(voice_id=voice_id, text=text, model_id=model_id)
+                with open(output_path, 'wb') as f:
+                    for chunk in audio: f.write(chunk)
+            await retry_async(asyncio.to_thread, convert, provider="elevenlabs", config=self.config, use_timeout=False)
+            if cache: await asyncio.to_thread(cache.put, key, output_path)
             return output_path
         except: return ""
 
@@ -15,22 +15,30 @@ class Translator:
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         if not self.client: return text
+        from utils.chunking import chunk_settings, chunk_text, context_block, map_chunks
         target_info = LANGUAGE_INFO.get(target_lang, {})
-        prompt = f"""번역하세요.
-원본 ({source_lang}): {text[:3000]}
+        max_tokens, overlap_tokens, concurrency = chunk_settings(self.config)
+
+        async def translate_chunk(chunk):
+            prompt = f"""번역하세요.
+{context_block(chunk)}원본 ({source_lang}): {chunk.text}
 대상 언어: {target_info.get('name', target_lang)}
 문체: {target_info.get('formality', 'neutral')}
 번역만 출력:"""
-        try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=len(text) * 3, messages=[{"role": "user", "content": prompt}])
-            return response.content[0].text.strip()
-        except: return text
+            try:
+                response = await self.client.generate(prompt, max_tokens=len(chunk.text) * 3)
+                return response.strip()
+            except: return chunk.text
+
+        chunks = chunk_text(text, max_tokens, overlap_tokens)
+        if not chunks: return text
+        return "\n\n".join(await map_chunks(chunks, translate_chunk, concurrency))
 
     async def translate_seo(self, seo_data: Dict, source_lang: str, target_lang: str) -> Dict:
         result = {}
@@ -19,114 +19,217 @@ Version: 2.0.0
 """
 
 import os
+import shutil
 import sys
 import yaml
 import logging
 import asyncio
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Union
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple, Union, get_args, get_origin, get_type_hints
+from dataclasses import dataclass, field, fields, is_dataclass, replace
 from enum import Enum
 import json
+import time
 import uuid
 import re
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from utils.artifact_cache import ArtifactCache
+from utils.atomic_io import atomic_write_json
+from utils.chunking import chunk_script, chunk_settings, context_block, map_chunks
+from utils.deadline import PhaseDeadlineExceeded, phase_deadline, within_deadline
+from utils.json_extract import extract_json
+from utils.json_stream import JsonArrayStream
+from utils.llm_gateway import get_llm_gateway
+from utils.media_probe import probe_duration
+from utils.phase_scheduler import PhaseSpec, PhaseScheduler
+from utils.adaptive_limiter import get_limiter, limiter_metrics
+from utils.resilience import retry_async
+from utils.stream_channel import StreamChannel
+from utils.tts_cache import TTSCache, get_tts_cache
+from audio.mix_engine import BGMLayer, mix_to_file, volume_to_db
+from audio.segment_tts import (
+    DEFAULT_CROSSFADE_MS, DEFAULT_MAX_CHARS, NarrationPiece, plan_pieces, stitch_pieces
+)
+from video.render_worker import render_main_video, render_shorts, run_isolated
+
 
 # ============================================
-# Gemini AI Client
+# LLM 응답 스키마 (제공자 스키마 모드용)
 # ============================================
 
-class GeminiClient:
-    """Gemini AI 클라이언트 - 환경변수에서 안전하게 키 로드"""
-
-    def __init__(self, config: Dict = None):
-        self.config = config or {}
-        self.model = None
-        self._initialized = False
-        self._init_client()
-
-    def _init_client(self):
-        """클라이언트 초기화 - 환경변수에서 키 로드"""
-        try:
-            import google.generativeai as genai
-
-            # 환경변수에서 API 키 로드 (코드에 키 노출 방지)
-            api_key = os.environ.get('GEMINI_API_KEY')
-            if not api_key:
-                raise ValueError("GEMINI_API_KEY 환경변수가 설정되지 않았습니다")
-
-            genai.configure(api_key=api_key)
-
-            model_name = self.config.get('api', {}).get('gemini', {}).get('model', 'gemini-3-flash')
-            self.model = genai.GenerativeModel(model_name)
-            self._initialized = True
-
-        except ImportError:
-            logging.warning("google-generativeai 패키지가 설치되지 않았습니다. pip install google-generativeai")
-        except Exception as e:
-            logging.warning(f"Gemini 초기화 실패: {e}")
-
-    def generate(self, prompt: str, max_tokens: int = 8000) -> str:
-        """텍스트 생성"""
-        if not self._initialized or not self.model:
-            raise RuntimeError("Gemini 클라이언트가 초기화되지 않았습니다")
+SCRIPT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "full_script": {"type": "string"},
+        "segments": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "type": {"type": "string"},
+                    "start_time": {"type": "string"},
+                    "end_time": {"type": "string"},
+                    "text": {"type": "string"},
+                    "visual_note": {"type": "string"},
+                    "emotion": {"type": "string"},
+                    "duration": {"type": "integer"},
+                },
+                "required": ["type", "text"],
+            },
+        },
+        "hooks": {"type": "array", "items": {"type": "string"}},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+        "cta": {"type": "string"},
+    },
+    "required": ["full_script", "segments"],
+}
 
-        generation_config = {
-            "max_output_tokens": max_tokens,
-            "temperature": self.config.get('api', {}).get('gemini', {}).get('temperature', 0.7),
-        }
 
-        response = self.model.generate_content(prompt, generation_config=generation_config)
-        return response.text
-
-    @property
-    def is_available(self) -> bool:
-        return self._initialized and self.model is not None
-
-
-def parse_json_response(text: str) -> Any:
-    """JSON 응답 파싱 - 여러 형식 지원"""
-    # 마크다운 코드 블록 제거
-    if "```json" in text:
-        text = text.split("```json")[1].split("```")[0]
-    elif "```" in text:
-        text = text.split("```")[1].split("```")[0]
-
-    # JSON 배열/객체 추출
-    text = text.strip()
-
-    # JSON 시작점 찾기
-    json_start = -1
-    for i, char in enumerate(text):
-        if char in '[{':
-            json_start = i
-            break
-
-    if json_start > 0:
-        text = text[json_start:]
-
-    # JSON 끝점 찾기
-    bracket_count = 0
-    json_end = len(text)
-    start_char = text[0] if text else '{'
-    end_char = ']' if start_char == '[' else '}'
-
-    for i, char in enumerate(text):
-        if char == start_char:
-            bracket_count += 1
-        elif char == end_char:
-            bracket_count -= 1
-            if bracket_count == 0:
-                json_end = i + 1
-                break
+# ============================================
+# 통합 메타데이터 검증
+# ============================================
 
-    text = text[:json_end]
+# 유튜브 메타데이터 제한
+MAX_TITLE_LENGTH = 100
+MAX_DESCRIPTION_LENGTH = 5000
+MAX_TWEET_LENGTH = 280
+SOCIAL_PLATFORMS = ("twitter", "instagram", "linkedin")
+
+
+def _valid_str(value: Any, max_len: int = None) -> Optional[str]:
+    """비어 있지 않고 길이 제한 안의 문자열이면 반환"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if max_len and len(value) > max_len:
+        return None
+    return value
+
+
+def _valid_str_list(value: Any, min_items: int = 1) -> Optional[List[str]]:
+    """문자열 리스트에서 빈 항목을 뺀 결과가 min_items개 이상이면 반환"""
+    if not isinstance(value, list):
+        return None
+    items = [v.strip() for v in value if isinstance(v, str) and v.strip()]
+    return items if len(items) >= min_items else None
+
+
+def validate_fused_metadata(data: Any, languages: List[str] = None) -> Dict:
+    """
+    통합 메타데이터 응답에서 유효한 필드만 추려 반환
+
+    빠지거나 형식이 잘못된 필드는 결과에 없으므로 호출자가 개별 요청으로 보충한다.
+    """
+    if not isinstance(data, dict):
+        return {}
+
+    result: Dict[str, Any] = {}
+
+    titles = []
+    for item in data.get('titles') or []:
+        title = _valid_str(item.get('title') if isinstance(item, dict) else item, MAX_TITLE_LENGTH)
+        if title:
+            titles.append(title)
+    if titles:
+        result['titles'] = titles
+
+    keywords = _valid_str_list(data.get('keywords'))
+    if keywords:
+        result['keywords'] = keywords
+
+    seo = data.get('seo') if isinstance(data.get('seo'), dict) else {}
+    seo_fields = {
+        'title': _valid_str(seo.get('optimized_title'), MAX_TITLE_LENGTH),
+        'description': _valid_str(seo.get('description'), MAX_DESCRIPTION_LENGTH),
+        'tags': _valid_str_list(seo.get('tags')),
+        'hashtags': _valid_str_list(seo.get('hashtags')),
+    }
+    if seo_fields['hashtags']:
+        seo_fields['hashtags'] = [
+            h if h.startswith('#') else f"#{h}" for h in (t.replace(' ', '') for t in seo_fields['hashtags'])
+        ]
+    seo_fields = {k: v for k, v in seo_fields.items() if v}
+    if seo_fields:
+        result['seo'] = seo_fields
+
+    snippets = data.get('social_snippets') if isinstance(data.get('social_snippets'), dict) else {}
+    valid_snippets = {
+        platform: _valid_str(snippets.get(platform), MAX_TWEET_LENGTH if platform == "twitter" else None)
+        for platform in SOCIAL_PLATFORMS
+    }
+    if all(valid_snippets.values()):
+        result['social_snippets'] = valid_snippets
+
+    localized_raw = data.get('localized_seo') if isinstance(data.get('localized_seo'), dict) else {}
+    localized = {}
+    for lang in languages or []:
+        entry = localized_raw.get(lang)
+        if not isinstance(entry, dict):
+            continue
+        title = _valid_str(entry.get('title'), MAX_TITLE_LENGTH)
+        description = _valid_str(entry.get('description'), MAX_DESCRIPTION_LENGTH)
+        tags = _valid_str_list(entry.get('tags'))
+        if title and description and tags:
+            localized[lang] = {"title": title, "description": description, "tags": tags}
+    if localized:
+        result['localized_seo'] = localized
+
+    return result
+
+
+def timestamps_from_segments(segments: List[Dict], timing: Optional[List[Dict]] = None) -> List[str]:
+    """
+    스크립트 세그먼트의 시작 시각으로 챕터 타임스탬프 생성
+
+    timing(나레이션 세그먼트별 실측 시각)이 있으면 start_time 대신 그 시작 시각을 쓴다.
+    유튜브 챕터 조건(0:00 시작, 3개 이상, 오름차순)을 만족하지 않으면 빈 리스트.
+    """
+    if timing:
+        by_id = {s.get('id', i + 1): s for i, s in enumerate(segments) if isinstance(s, dict)}
+        measured = []
+        for t in timing:
+            segment = dict(by_id.get(t['segment_id'], {}), start_time=t['start'])
+            segment.setdefault('type', t.get('type', ''))
+            measured.append(segment)
+        segments = measured
+
+    labels = {"hook": "인트로", "intro": "도입", "conclusion": "결론", "cta": "마무리"}
+    timestamps = []
+    last_seconds = -1
+    body_count = 0
+    for segment in segments:
+        start = segment.get('start_time')
+        try:
+            if isinstance(start, str):
+                parts = [int(p) for p in start.strip().split(':')]
+                start = sum(p * 60 ** i for i, p in enumerate(reversed(parts)))
+            start = int(start)
+        except (TypeError, ValueError):
+            return []
+        if start <= last_seconds:
+            return []
+        last_seconds = start
+
+        seg_type = segment.get('type', '')
+        label = segment.get('title')
+        if not label:
+            if seg_type in labels:
+                label = labels[seg_type]
+            else:
+                body_count += 1
+                label = f"본론 {body_count}"
+        hours, rest = divmod(start, 3600)
+        stamp = f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}"
+        timestamps.append(f"{stamp} {label}")
 
-    return json.loads(text)
+    if len(timestamps) < 3 or not timestamps[0].startswith("0:00 "):
+        return []
+    return timestamps
 
 
 # ============================================
@@ -326,6 +429,7 @@ class SEOData:
     youtube_category_id: str = "27"
     keywords: List[str] = field(default_factory=list)
     predicted_ranking: Dict = field(default_factory=dict)
+    localized: Dict[str, Dict] = field(default_factory=dict)  # 통합 요청으로 미리 생성한 언어별 SEO
 
 
 @dataclass
@@ -370,6 +474,64 @@ class RepurposeData:
     email_newsletter: str = ""
 
 
+def _to_jsonable(value: Any) -> Any:
+    """데이터클래스/Enum/datetime을 JSON 호환 값으로 변환"""
+    if is_dataclass(value):
+        return {f.name: _to_jsonable(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): _to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_jsonable(v) for v in value]
+    return value
+
+
+def _from_jsonable(tp: Any, value: Any) -> Any:
+    """타입 힌트에 맞춰 JSON 값을 복원"""
+    if value is None:
+        return None
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+
+    if origin is Union:
+        inner = [a for a in args if a is not type(None)]
+        return _from_jsonable(inner[0], value) if inner else value
+    if origin is list:
+        if not isinstance(value, list):
+            raise TypeError(f"list expected, got {type(value).__name__}")
+        return [_from_jsonable(args[0], v) for v in value] if args else list(value)
+    if origin is dict:
+        if not isinstance(value, dict):
+            raise TypeError(f"dict expected, got {type(value).__name__}")
+        return {k: _from_jsonable(args[1], v) for k, v in value.items()} if args else dict(value)
+    if isinstance(tp, type):
+        if issubclass(tp, Enum):
+            return tp(value)
+        if tp is datetime:
+            return datetime.fromisoformat(value)
+        if is_dataclass(tp):
+            return _dataclass_from_dict(tp, value)
+    return value
+
+
+def _dataclass_from_dict(cls: type, data: Dict) -> Any:
+    """딕셔너리에서 데이터클래스 복원 - 알 수 없거나 잘못된 필드는 기본값 사용"""
+    hints = get_type_hints(cls)
+    kwargs = {}
+    for f in fields(cls):
+        if f.name not in data:
+            continue
+        try:
+            kwargs[f.name] = _from_jsonable(hints[f.name], data[f.name])
+        except (TypeError, ValueError, KeyError, IndexError):
+            continue
+    return cls(**kwargs)
+
+
 @dataclass
 class VideoProject:
     """비디오 프로젝트 메인 데이터 클래스"""
@@ -410,6 +572,8 @@ class VideoProject:
     progress: float = 0.0
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    completed_phases: List[str] = field(default_factory=list)
+    phase_overruns: List[Dict] = field(default_factory=list)
 
     # 업로드 정보
     upload_results: Dict[str, Dict] = field(default_factory=dict)
@@ -433,35 +597,29 @@ class VideoProject:
         self.warnings.append(f"[{datetime.now().isoformat()}] {warning}")
 
     def to_dict(self) -> Dict:
-        """딕셔너리로 변환"""
-        return {
-            "id": self.id,
-            "title": self.title,
-            "topic": self.topic,
-            "category": self.category.value,
-            "style": self.style.value,
-            "format": self.format.value,
-            "language": self.language.value,
-            "status": self.status.value,
-            "progress": self.progress,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "video_path": self.video.main_video_path,
-            "shorts_count": len(self.video.shorts_paths),
-            "localizations": list(self.localizations.keys()),
-            "errors": self.errors,
-            "warnings": self.warnings,
-        }
+        """딕셔너리로 변환 - 모든 하위 데이터 포함 (from_dict로 완전 복원 가능)"""
+        data = _to_jsonable(self)
+        # 요약 필드
+        data["video_path"] = self.video.main_video_path
+        data["shorts_count"] = len(self.video.shorts_paths)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'VideoProject':
+        """딕셔너리에서 복원"""
+        return _dataclass_from_dict(cls, data)
+
+    @staticmethod
+    def default_path(project_id: str) -> str:
+        """프로젝트 체크포인트 기본 경로"""
+        return f"./data/projects/{project_id}.json"
 
     def save(self, path: str = None):
-        """프로젝트 저장"""
+        """프로젝트 저장 (원자적 쓰기 - 체크포인트로 사용)"""
         if path is None:
-            path = f"./data/projects/{self.id}.json"
+            path = self.default_path(self.id)
 
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        atomic_write_json(path, self.to_dict())
 
     @classmethod
     def load(cls, path: str) -> 'VideoProject':
@@ -469,18 +627,7 @@ class VideoProject:
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        project = cls()
-        project.id = data.get('id', project.id)
-        project.title = data.get('title', '')
-        project.topic = data.get('topic', '')
-        project.category = VideoCategory(data.get('category', 'history'))
-        project.style = VideoStyle(data.get('style', 'knowledge_pirate'))
-        project.format = VideoFormat(data.get('format', 'long_form'))
-        project.language = Language(data.get('language', 'ko'))
-        project.status = ProjectStatus(data.get('status', 'initialized'))
-        project.progress = data.get('progress', 0.0)
-
-        return project
+        return cls.from_dict(data)
 
 
 @dataclass
@@ -513,13 +660,54 @@ class SeriesProject:
 class VideoGenerator:
     """메인 비디오 생성기 클래스"""
 
+    # 파이프라인 단계 그래프 - 각 단계가 읽는/생성하는 프로젝트 데이터
+    # 입력이 모두 준비된 단계는 project.max_concurrent_tasks 범위에서 동시 실행된다
+    PHASE_GRAPH: List[PhaseSpec] = [
+        PhaseSpec("research", inputs=("topic",), outputs=("title", "research"),
+                  weight=0.10, status=ProjectStatus.RESEARCHING),
+        PhaseSpec("script", inputs=("title", "research"), outputs=("script",),
+                  weight=0.10, status=ProjectStatus.SCRIPTING),
+        PhaseSpec("audio", inputs=("script",), outputs=("audio",),
+                  weight=0.15, status=ProjectStatus.GENERATING_AUDIO),
+        PhaseSpec("visual", inputs=("script",), outputs=("visual",), streams=("script",),
+                  weight=0.15, status=ProjectStatus.GENERATING_VISUALS),
+        PhaseSpec("video_compose", inputs=("script", "audio", "visual"), outputs=("video",),
+                  weight=0.15, status=ProjectStatus.COMPOSING_VIDEO),
+        PhaseSpec("shorts", inputs=("script", "video"), outputs=("shorts",),
+                  weight=0.07, status=ProjectStatus.GENERATING_SHORTS, when="generate_shorts"),
+        PhaseSpec("thumbnail", inputs=("title",), outputs=("thumbnail",),
+                  weight=0.06, status=ProjectStatus.GENERATING_THUMBNAILS),
+        PhaseSpec("seo", inputs=("title",), outputs=("seo",),
+                  weight=0.03, status=ProjectStatus.OPTIMIZING),
+        PhaseSpec("localization", inputs=("title", "script", "seo"), outputs=("localizations",),
+                  weight=0.07, status=ProjectStatus.LOCALIZING, when="generate_localizations"),
+        PhaseSpec("monetization", inputs=("script", "video"), outputs=("monetization",),
+                  weight=0.03),
+        PhaseSpec("quality_check", inputs=("script", "audio", "visual", "seo"), outputs=("quality",),
+                  weight=0.03, status=ProjectStatus.QUALITY_CHECK),
+        PhaseSpec("repurpose", inputs=("title", "script"), outputs=("repurpose",),
+                  weight=0.03),
+        PhaseSpec("upload", inputs=("video", "shorts", "thumbnail", "seo", "localizations",
+                                    "monetization", "quality", "repurpose"),
+                  outputs=("upload",), weight=0.03, status=ProjectStatus.UPLOADING,
+                  when="auto_upload", skip_status=ProjectStatus.READY_TO_UPLOAD),
+        PhaseSpec("backup", inputs=("upload",), outputs=("backup",)),
+    ]
+
     def __init__(self, config_path: str = "config/settings.yaml"):
         self.config = self._load_config(config_path)
         self.logger = self._setup_logging()
         self.components = {}
         self._load_env_keys()
         self._initialize_components()
-        self._init_gemini()
+        self._init_llm()
+        self._init_artifact_cache()
+        # 동시에 실행할 렌더 프로세스 수
+        self.max_render_processes = self.config.get('video', {}).get('render_processes') or os.cpu_count() or 1
+        self._render_semaphore = None
+        self._render_loop = None
+        # 스트리밍 중인 스크립트 세그먼트 (프로젝트 ID → 채널)
+        self._script_streams: Dict[str, StreamChannel] = {}
 
     def _load_config(self, config_path: str) -> Dict:
         """설정 파일 로드"""
@@ -692,42 +880,113 @@ class VideoGenerator:
 
         self.logger.info("모든 컴포넌트 초기화 완료")
 
-    def _init_gemini(self):
-        """Gemini 클라이언트 초기화"""
+    def _init_llm(self):
+        """공유 LLM 게이트웨이 연결 (SDK 클라이언트는 첫 호출 시 생성)"""
+        self.llm = get_llm_gateway(self.config)
+        if self.llm:
+            self.logger.info(f"LLM 게이트웨이 준비 완료: {' → '.join(self.llm.provider_names)}")
+        else:
+            self.logger.warning("사용 가능한 LLM 제공자가 없습니다 - 폴백 콘텐츠 사용")
+
+    def _init_artifact_cache(self):
+        """산출물 캐시 초기화"""
+        cache_config = self.config.get('cache', {}).get('artifacts', {})
+        self.artifact_cache = None
+
+        if cache_config.get('enabled', True):
+            cache_dir = self.config.get('project', {}).get('cache_dir', './data/cache')
+            max_size = int(cache_config.get('max_size_gb', 20) * 1024 ** 3)
+            try:
+                self.artifact_cache = ArtifactCache(cache_dir, max_size_bytes=max_size)
+            except OSError as e:
+                self.logger.warning(f"산출물 캐시 초기화 실패: {e}")
+
+        # 세그먼트 조각 단위 TTS 캐시 (cache.tts)
+        self.tts_cache = get_tts_cache(self.config)
+
+    async def _run_cpu_bound(self, func, *args):
+        """
+        CPU 집약 렌더링 - 별도 프로세스에서 실행 (max_render_processes개까지 동시)
+
+        단계 시간 예산을 넘기면 렌더 프로세스(ffmpeg 포함)를 종료한다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._render_semaphore is None or self._render_loop is not loop:
+            self._render_semaphore = asyncio.Semaphore(self.max_render_processes)
+            self._render_loop = loop
+
+        async with self._render_semaphore:
+            return await within_deadline(run_isolated(func, *args))
+
+    async def _call_external(self, provider: str, func, *args, **kwargs):
+        """
+        외부 API 호출 - 제공자별 적응형 동시성 제한 + 재시도/회로 차단기
+
+        블로킹 SDK 호출은 func=asyncio.to_thread로 넘긴다 (스레드는 취소되지 않으므로
+        시도별 타임아웃은 SDK 설정에 맡긴다).
+        """
+        limiter = get_limiter(provider, self.config)
+        return await within_deadline(retry_async(
+            limiter.run, func, *args,
+            provider=provider, config=self.config, use_timeout=False, **kwargs
+        ))
+
+    async def _generate_with_ai(self, prompt: str, max_tokens: int = 8000, use_cache: bool = True) -> str:
+        """AI 텍스트 생성 - 공유 LLM 게이트웨이 (Gemini 우선, Anthropic 폴백, 응답 캐시)"""
+        if not self.llm:
+            raise RuntimeError("사용 가능한 LLM 제공자가 없습니다 (GEMINI_API_KEY / ANTHROPIC_API_KEY 확인)")
+
         try:
-            self.gemini = GeminiClient(self.config)
-            if self.gemini.is_available:
-                self.logger.info("Gemini 2.0 Flash 초기화 완료")
-            else:
-                self.logger.warning("Gemini 초기화 실패 - Anthropic으로 폴백")
-                self.gemini = None
+            return await within_deadline(self.llm.generate(prompt, max_tokens, use_cache=use_cache))
         except Exception as e:
-            self.logger.warning(f"Gemini 초기화 실패: {e}")
-            self.gemini = None
+            self.logger.error(f"AI 생성 실패: {e}")
+            raise
 
-    def _generate_with_ai(self, prompt: str, max_tokens: int = 8000) -> str:
-        """AI 텍스트 생성 - Gemini 우선, Anthropic 폴백"""
-        # Gemini 우선 시도
-        if self.gemini and self.gemini.is_available:
-            try:
-                return self.gemini.generate(prompt, max_tokens)
-            except Exception as e:
-                self.logger.warning(f"Gemini 생성 실패, Anthropic으로 폴백: {e}")
+    async def _generate_json_with_ai(
+        self,
+        prompt: str,
+        max_tokens: int = 8000,
+        schema: Optional[Dict] = None,
+        expect: Optional[type] = None
+    ) -> Any:
+        """AI JSON 생성 - 제공자 JSON/스키마 모드 + 공용 추출기 (JSONExtractionError는 ValueError)"""
+        if not self.llm:
+            raise RuntimeError("사용 가능한 LLM 제공자가 없습니다 (GEMINI_API_KEY / ANTHROPIC_API_KEY 확인)")
 
-        # Anthropic 폴백
         try:
-            from anthropic import Anthropic
-            client = Anthropic()
-            response = client.messages.create(
-                model=self.config.get('api', {}).get('anthropic', {}).get('model', 'claude-sonnet-4-20250514'),
-                max_tokens=max_tokens,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return response.content[0].text
+            return await within_deadline(self.llm.generate_json(prompt, max_tokens, schema=schema, expect=expect))
         except Exception as e:
             self.logger.error(f"AI 생성 실패: {e}")
             raise
 
+    async def _stream_with_ai(self, prompt: str, max_tokens: int = 8000) -> AsyncIterator[str]:
+        """AI 텍스트 스트리밍 - 조각마다 단계의 남은 시간 안에서 대기"""
+        if not self.llm:
+            raise RuntimeError("사용 가능한 LLM 제공자가 없습니다 (GEMINI_API_KEY / ANTHROPIC_API_KEY 확인)")
+
+        stream = self.llm.stream(prompt, max_tokens).__aiter__()
+        try:
+            while True:
+                try:
+                    chunk = await within_deadline(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield chunk
+        finally:
+            await stream.aclose()
+
+    def _script_streaming_enabled(self) -> bool:
+        """스크립트를 스트리밍으로 생성해 완성된 세그먼트부터 넘길지 (pipeline.stream_script)"""
+        return bool(self.llm) and bool(self.config.get('pipeline', {}).get('stream_script', False))
+
+    def _script_channel(self, project_id: str) -> StreamChannel:
+        """프로젝트의 스크립트 세그먼트 채널 (없으면 생성)"""
+        channel = self._script_streams.get(project_id)
+        if channel is None:
+            channel = StreamChannel()
+            self._script_streams[project_id] = channel
+        return channel
+
     # ============================================
     # 메인 생성 메서드
     # ============================================
@@ -793,90 +1052,46 @@ class VideoGenerator:
         self.logger.info(f"스타일: {style.value}")
         self.logger.info(f"{'='*60}")
 
-        try:
-            # ========== Phase 1: 리서치 (10%) ==========
-            project.update_status(ProjectStatus.RESEARCHING)
-            project = await self._phase_research(project)
-            project.progress = 0.10
-            self.logger.info(f"Phase 1 완료 - 리서치 (10%)")
-
-            # ========== Phase 2: 스크립트 생성 (20%) ==========
-            project.update_status(ProjectStatus.SCRIPTING)
-            project = await self._phase_script(project)
-            project.progress = 0.20
-            self.logger.info(f"Phase 2 완료 - 스크립트 (20%)")
-
-            # ========== Phase 3: 오디오 생성 (35%) ==========
-            project.update_status(ProjectStatus.GENERATING_AUDIO)
-            project = await self._phase_audio(project)
-            project.progress = 0.35
-            self.logger.info(f"Phase 3 완료 - 오디오 (35%)")
-
-            # ========== Phase 4: 비주얼 생성 (50%) ==========
-            project.update_status(ProjectStatus.GENERATING_VISUALS)
-            project = await self._phase_visual(project)
-            project.progress = 0.50
-            self.logger.info(f"Phase 4 완료 - 비주얼 (50%)")
-
-            # ========== Phase 5: 비디오 조립 (65%) ==========
-            project.update_status(ProjectStatus.COMPOSING_VIDEO)
-            project = await self._phase_video_compose(project)
-            project.progress = 0.65
-            self.logger.info(f"Phase 5 완료 - 비디오 조립 (65%)")
-
-            # ========== Phase 6: Shorts 생성 (72%) ==========
-            if generate_shorts:
-                project.update_status(ProjectStatus.GENERATING_SHORTS)
-                project = await self._phase_shorts(project)
-            project.progress = 0.72
-            self.logger.info(f"Phase 6 완료 - Shorts (72%)")
-
-            # ========== Phase 7: 썸네일 생성 (78%) ==========
-            project.update_status(ProjectStatus.GENERATING_THUMBNAILS)
-            project = await self._phase_thumbnail(project)
-            project.progress = 0.78
-            self.logger.info(f"Phase 7 완료 - 썸네일 (78%)")
-
-            # ========== Phase 8: 다국어 현지화 (85%) ==========
-            if generate_localizations:
-                project.update_status(ProjectStatus.LOCALIZING)
-                project = await self._phase_localization(project)
-            project.progress = 0.85
-            self.logger.info(f"Phase 8 완료 - 현지화 (85%)")
-
-            # ========== Phase 9: SEO 최적화 (88%) ==========
-            project.update_status(ProjectStatus.OPTIMIZING)
-            project = await self._phase_seo(project)
-            project.progress = 0.88
-            self.logger.info(f"Phase 9 완료 - SEO (88%)")
-
-            # ========== Phase 10: 수익화 최적화 (91%) ==========
-            project = await self._phase_monetization(project)
-            project.progress = 0.91
-            self.logger.info(f"Phase 10 완료 - 수익화 (91%)")
-
-            # ========== Phase 11: 품질 검증 (94%) ==========
-            project.update_status(ProjectStatus.QUALITY_CHECK)
-            project = await self._phase_quality_check(project)
-            project.progress = 0.94
-            self.logger.info(f"Phase 11 완료 - 품질 검증 (94%)")
-
-            # ========== Phase 12: 콘텐츠 재활용 (97%) ==========
-            project = await self._phase_repurpose(project)
-            project.progress = 0.97
-            self.logger.info(f"Phase 12 완료 - 재활용 (97%)")
-
-            # ========== Phase 13: 업로드 (100%) ==========
-            if auto_upload:
-                project.update_status(ProjectStatus.UPLOADING)
-                project = await self._phase_upload(project)
-            else:
-                project.update_status(ProjectStatus.READY_TO_UPLOAD)
-            project.progress = 1.0
-            self.logger.info(f"Phase 13 완료 - 업로드 (100%)")
+        return await self._run_pipeline(project)
+
+    async def resume_video(self, project_id: str, project_path: str = None) -> VideoProject:
+        """
+        체크포인트에서 파이프라인 재개
+
+        Args:
+            project_id: 프로젝트 ID
+            project_path: 체크포인트 경로 (기본: ./data/projects/<id>.json)
+
+        Returns:
+            VideoProject: 완성된 프로젝트
+        """
+        path = project_path or VideoProject.default_path(project_id)
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Checkpoint not found: {path}")
+
+        project = VideoProject.load(path)
+        remaining = [p.name for p in self.PHASE_GRAPH if p.name not in project.completed_phases]
+
+        self.logger.info(f"{'='*60}")
+        self.logger.info(f"프로젝트 재개: {project.id}")
+        self.logger.info(f"완료된 단계: {project.completed_phases}")
+        self.logger.info(f"남은 단계: {remaining}")
+        self.logger.info(f"{'='*60}")
+
+        return await self._run_pipeline(project)
 
-            # ========== Phase 14: 백업 ==========
-            await self._phase_backup(project)
+    async def _run_pipeline(self, project: VideoProject) -> VideoProject:
+        """단계 그래프 실행 - 완료된 단계는 건너뜀"""
+        try:
+            scheduler = PhaseScheduler(
+                self._phase_graph(),
+                max_concurrency=self.config.get('project', {}).get('max_concurrent_tasks', 3),
+                streaming=self._script_streaming_enabled()
+            )
+            await scheduler.run(
+                lambda spec: self._run_phase(project, spec),
+                completed=set(project.completed_phases)
+            )
 
             project.update_status(ProjectStatus.COMPLETED)
 
@@ -886,6 +1101,11 @@ class VideoGenerator:
             self.logger.info(f"Shorts: {len(project.video.shorts_paths)}개")
             self.logger.info(f"현지화: {list(project.localizations.keys())}")
             self.logger.info(f"{'='*60}")
+            if self.llm and self.llm.hedging_enabled:
+                self.logger.debug(f"LLM 헤징: {self.llm.hedge_metrics()}")
+            for metrics in limiter_metrics():
+                self.logger.debug(f"동시성 한도 {metrics['provider']}: {metrics['limit']}/{metrics['ceiling']} "
+                                  f"(throttled={metrics['throttled']})")
 
         except Exception as e:
             project.update_status(ProjectStatus.ERROR)
@@ -893,25 +1113,110 @@ class VideoGenerator:
             self.logger.error(f"프로젝트 실패: {e}")
             import traceback
             self.logger.error(traceback.format_exc())
+            project.save()
             raise
+        finally:
+            self._script_streams.pop(project.id, None)
 
         # 프로젝트 저장
         project.save()
 
         return project
 
+    async def _run_phase(self, project: VideoProject, spec: PhaseSpec) -> None:
+        """단계 하나 실행 및 진행률 갱신"""
+        finished = True
+        if spec.when and not getattr(project, spec.when):
+            if spec.skip_status:
+                project.update_status(spec.skip_status)
+        else:
+            if spec.status:
+                project.update_status(spec.status)
+            finished = await self._run_phase_with_budget(project, spec)
+
+        project.progress = min(1.0, round(project.progress + spec.weight, 4))
+        if finished:
+            project.completed_phases.append(spec.name)
+            self.logger.info(f"{spec.name} 단계 완료 ({project.progress:.0%})")
+        else:
+            # 도중에 강제 취소된 단계는 완료로 기록하지 않아 resume 시 다시 실행
+            self.logger.warning(f"{spec.name} 단계 미완료 - resume 시 다시 실행 ({project.progress:.0%})")
+
+        # 체크포인트 - 실패 시 resume으로 이 단계 이후부터 재개
+        project.save()
+
+    def _phase_budget(self, name: str) -> Optional[float]:
+        """단계 시간 예산 (초) - pipeline.phase_timeouts"""
+        timeouts = self.config.get('pipeline', {}).get('phase_timeouts', {})
+        budget = timeouts.get(name, timeouts.get('default'))
+        return float(budget) if budget else None
+
+    async def _run_phase_with_budget(self, project: VideoProject, spec: PhaseSpec) -> bool:
+        """
+        시간 예산 안에서 단계 실행
+
+        외부 호출은 남은 예산만큼만 기다리다 PhaseDeadlineExceeded로 단계의 폴백 경로로 빠진다.
+        그래도 끝나지 않으면 유예 시간 후 단계를 강제 취소하고 현재 상태로 진행한다.
+
+        Returns:
+            단계가 끝까지 실행됐는지 (강제 취소되면 False)
+        """
+        phase = getattr(self, f"_phase_{spec.name}")
+        budget = self._phase_budget(spec.name)
+        if budget is None:
+            await phase(project)
+            return True
+
+        grace = self.config.get('pipeline', {}).get('phase_grace_seconds', 30)
+        start = time.monotonic()
+        hard_timeout = False
+
+        with phase_deadline(spec.name, budget) as deadline:
+            try:
+                await asyncio.wait_for(phase(project), budget + grace)
+            except PhaseDeadlineExceeded:
+                # 폴백 없이 빠져나온 외부 호출 - 현재 상태로 진행
+                pass
+            except asyncio.TimeoutError:
+                if deadline.remaining() > 0:
+                    raise
+                hard_timeout = True
+
+        if deadline.expired or hard_timeout:
+            elapsed = round(time.monotonic() - start, 1)
+            project.phase_overruns.append({
+                "phase": spec.name,
+                "budget": budget,
+                "elapsed": elapsed,
+                "cancelled": hard_timeout,
+                "at": datetime.now().isoformat(),
+            })
+            self.logger.warning(
+                f"{spec.name} 단계 시간 예산 초과 ({elapsed}s / {budget:.0f}s) - "
+                f"{'강제 취소' if hard_timeout else '폴백 결과 사용'}"
+            )
+        return not hard_timeout
+
     # ============================================
     # Phase 메서드들
     # ============================================
 
-    async def _phase_research(self, project: VideoProject) -> VideoProject:
-        """Phase 1: 리서치 및 자료 수집"""
-        self.logger.info("Phase 1: 리서치 시작...")
-
-        # 1. 제목 생성
-        titles_prompt = f"""유튜브 지식 채널용 "{project.topic}" 주제의 클릭율 높은 제목 5개를 생성하세요.
+    def _fused_requests_enabled(self) -> bool:
+        """제목/SEO/소셜 문구를 한 번의 LLM 요청으로 생성할지 (api.llm.fused_requests)"""
+        return bool(self.config.get('api', {}).get('llm', {}).get('fused_requests', False))
+
+    def _phase_graph(self) -> List[PhaseSpec]:
+        """설정에 맞춘 단계 그래프 - 통합 요청 모드에서만 SEO가 스크립트(세그먼트 타임스탬프)를 기다림"""
+        if not self._fused_requests_enabled():
+            return self.PHASE_GRAPH
+        return [
+            replace(spec, inputs=spec.inputs + ("script",)) if spec.name == "seo" else spec
+            for spec in self.PHASE_GRAPH
+        ]
 
-스타일: {project.style.value}
+    @staticmethod
+    def _title_patterns_prompt(project: VideoProject) -> str:
+        return f"""스타일: {project.style.value}
 카테고리: {project.category.value}
 
 제목 패턴:
@@ -919,22 +1224,101 @@ class VideoGenerator:
 - 폭로형: "~의 충격적인 진실", "아무도 모르는 ~"
 - 숫자형: "~의 5가지 비밀", "TOP 10 ~"
 - 비교형: "~ vs ~: 승자는?"
+"""
+
+    async def _generate_fused_metadata(self, project: VideoProject) -> Dict:
+        """
+        제목, 키워드, SEO, 해시태그, 소셜 문구, 언어별 SEO를 한 번에 요청
+
+        검증을 통과한 필드만 프로젝트에 반영하고 반환한다.
+        빠진 필드는 각 단계가 기존 개별 요청으로 보충한다.
+        """
+        languages = [lang.value for lang in project.generate_localizations]
+        localized_schema = ""
+        if languages:
+            entries = ",\n        ".join(
+                f'"{lang}": {{"title": "{lang} 제목", "description": "{lang} 설명 (150자 이내)", "tags": ["태그1"]}}'
+                for lang in languages
+            )
+            localized_schema = f""",
+    "localized_seo": {{
+        {entries}
+    }}"""
+
+        prompt = f"""유튜브 지식 채널용 "{project.topic}" 주제 영상의 제목과 메타데이터를 한 번에 생성하세요.
+
+{self._title_patterns_prompt(project)}
+SEO 데이터, 해시태그, 소셜 미디어 포스트는 첫 번째 제목을 기준으로 작성하세요.
+
+JSON 객체로 응답:
+{{
+    "titles": [
+        {{"title": "제목1", "hook_type": "질문형", "estimated_ctr": 0.08}},
+        ...
+    ],
+    "keywords": ["키워드1", "키워드2", ...],
+    "seo": {{
+        "optimized_title": "SEO 최적화된 제목 (60자 이내)",
+        "description": "SEO 최적화된 설명 (500자)",
+        "tags": ["태그1", "태그2", ...],
+        "hashtags": ["#해시태그1", "#해시태그2", ...]
+    }},
+    "social_snippets": {{
+        "twitter": "트위터용 (280자)",
+        "instagram": "인스타그램용",
+        "linkedin": "링크드인용"
+    }}{localized_schema}
+}}"""
+
+        try:
+            fused = validate_fused_metadata(
+                await self._generate_json_with_ai(prompt, 4000, expect=dict), languages
+            )
+        except Exception as e:
+            self.logger.warning(f"Fused metadata request failed: {e}")
+            return {}
+
+        if 'titles' in fused:
+            project.research.suggested_titles = fused['titles']
+            project.title = fused['titles'][0]
+        if 'keywords' in fused:
+            project.research.keywords = fused['keywords']
+            project.seo.keywords = list(fused['keywords'])
+        for key, value in fused.get('seo', {}).items():
+            setattr(project.seo, key, value)
+        if 'social_snippets' in fused:
+            project.repurpose.social_snippets = fused['social_snippets']
+        if 'localized_seo' in fused:
+            project.seo.localized = fused['localized_seo']
+
+        self.logger.info(f"통합 메타데이터 요청 - 유효 필드: {sorted(fused)}")
+        return fused
 
+    async def _phase_research(self, project: VideoProject) -> VideoProject:
+        """Phase 1: 리서치 및 자료 수집"""
+        self.logger.info("Phase 1: 리서치 시작...")
+
+        fused = await self._generate_fused_metadata(project) if self._fused_requests_enabled() else {}
+
+        # 1. 제목 생성
+        if 'titles' not in fused:
+            titles_prompt = f"""유튜브 지식 채널용 "{project.topic}" 주제의 클릭율 높은 제목 5개를 생성하세요.
+
+{self._title_patterns_prompt(project)}
 JSON 배열로 응답:
 [
     {{"title": "제목1", "hook_type": "질문형", "estimated_ctr": 0.08}},
     ...
 ]"""
 
-        try:
-            text = self._generate_with_ai(titles_prompt, max_tokens=2000)
-            titles_data = parse_json_response(text)
-            project.research.suggested_titles = [t['title'] for t in titles_data]
-            project.title = titles_data[0]['title']
-        except Exception as e:
-            self.logger.warning(f"Title generation failed: {e}")
-            project.title = f"{project.topic} - 알려지지 않은 진실"
-            project.research.suggested_titles = [project.title]
+            try:
+                titles_data = await self._generate_json_with_ai(titles_prompt, 2000, expect=list)
+                project.research.suggested_titles = [t['title'] for t in titles_data]
+                project.title = titles_data[0]['title']
+            except Exception as e:
+                self.logger.warning(f"Title generation failed: {e}")
+                project.title = f"{project.topic} - 알려지지 않은 진실"
+                project.research.suggested_titles = [project.title]
 
         # 2. 소스 수집 (실제로는 웹 검색 API 사용)
         project.research.sources = [
@@ -944,12 +1328,13 @@ JSON 배열로 응답:
         ]
 
         # 3. 키워드 리서치
-        project.research.keywords = [
-            project.topic,
-            f"{project.topic} 역사",
-            f"{project.topic} 진실",
-            f"{project.topic} 설명",
-        ]
+        if 'keywords' not in fused:
+            project.research.keywords = [
+                project.topic,
+                f"{project.topic} 역사",
+                f"{project.topic} 진실",
+                f"{project.topic} 설명",
+            ]
 
         self.logger.info(f"리서치 완료 - 제목: {project.title}")
         return project
@@ -987,6 +1372,7 @@ JSON 배열로 응답:
         }
 
         style_guide = style_instructions.get(project.style, "")
+        streaming = self._script_streaming_enabled()
 
         script_prompt = f"""유튜브 지식 채널 스크립트를 작성하세요.
 
@@ -1011,8 +1397,183 @@ JSON 배열로 응답:
 감정 변화 표시: [감정: 호기심/놀라움/진지함/유머/감동]
 
 JSON 형식으로 응답:
-{{
-    "full_script": "전체 스크립트 텍스트",
+{self._script_response_format(streaming)}"""
+
+        try:
+            if streaming:
+                script_data = await self._stream_script(project, script_prompt)
+            else:
+                script_data = await self._generate_json_with_ai(
+                    script_prompt, 8000, schema=SCRIPT_SCHEMA, expect=dict
+                )
+
+            project.script.full_script = script_data.get('full_script', '')
+            project.script.segments = script_data.get('segments', [])
+            project.script.hooks = script_data.get('hooks', [])
+            project.script.cta_segments = [script_data.get('cta', '')]
+            project.script.word_count = len(project.script.full_script)
+            project.script.estimated_duration = project.duration_target
+
+        except Exception as e:
+            self.logger.warning(f"Script parsing failed: {e}")
+            project.script.full_script = f"이것은 {project.topic}에 대한 영상입니다."
+            project.script.segments = [{"id": 1, "text": project.script.full_script, "duration": project.duration_target}]
+
+        else:
+            await self._postprocess_script(project)
+
+        finally:
+            # 스트림 소비 단계는 채널이 닫힌 뒤 최종 세그먼트로 맞춘다
+            if streaming:
+                self._script_channel(project.id).close()
+
+        self.logger.info(f"스크립트 완료 - {len(project.script.segments)}개 세그먼트")
+        return project
+
+    async def _postprocess_script(self, project: VideoProject):
+        """파싱한 스크립트 후처리 - 단계가 실패해도(마감 초과 포함) 경고만 남기고 스크립트는 유지"""
+        steps = [
+            ("세그먼트 재생성", self._repair_script_segments),
+            ("길이 맞춤", self._fit_script_duration),
+            ("후크 순위", self._rank_script_hooks),
+            ("말투 점수", self._score_script),
+        ]
+        for name, step in steps:
+            try:
+                await step(project)
+            except Exception as e:
+                self.logger.warning(f"스크립트 {name} 실패 - 파싱한 스크립트 유지: {e}")
+
+    async def _rank_script_hooks(self, project: VideoProject):
+        """대안 후크는 로컬 모델 점수 순으로 (LLM 호출 없음)"""
+        if project.script.hooks:
+            from script.hook_ranker import HookRanker
+            hooks = [hook for hook in project.script.hooks if isinstance(hook, str)]
+            ranked = HookRanker().rank(hooks, project.title or project.topic)
+            project.script.hooks = [hook for hook, _ in ranked]
+
+    async def _score_script(self, project: VideoProject):
+        """로컬 말투 점수 (LLM 호출 없음)"""
+        from script.script_analyzer import ScriptAnalyzer
+        project.script.readability_score = ScriptAnalyzer().analyze(project.script.full_script).score
+
+    async def _repair_script_segments(self, project: VideoProject):
+        """
+        비었거나 짧거나 깨진 세그먼트만 다시 생성 (pipeline.repair_script_segments)
+
+        전체 스크립트를 다시 요청하거나 한 줄짜리 폴백으로 가지 않고
+        문제 세그먼트만 앞뒤 문맥과 함께 재생성해 끼워 넣는다.
+        """
+        if not self.llm or not self.config.get('pipeline', {}).get('repair_script_segments', True):
+            return
+
+        segments = project.script.segments
+        if not segments:
+            return
+
+        from script.script_generator import ScriptGenerator
+
+        weak = ScriptGenerator.find_weak_segments(segments)
+        if not weak or len(weak) == len(segments):
+            return
+
+        self.logger.info(f"세그먼트 {weak} 재생성")
+        replaced = await self._script_generator().regenerate_segments(
+            project.script, weak,
+            topic=project.topic,
+            title=project.title,
+            style=project.style.value,
+            language=project.language.value,
+        )
+        if len(replaced) < len(weak):
+            self.logger.warning(f"세그먼트 재생성 실패: {sorted(set(weak) - set(replaced))}")
+
+    async def _fit_script_duration(self, project: VideoProject):
+        """
+        TTS 전에 나레이션 길이 예측 (audio.duration_estimation)
+
+        예상 길이가 목표에서 tolerance 이상 벗어나면 벗어난 세그먼트만
+        목표 분량을 주고 다시 생성해 줄이거나 늘린다.
+        """
+        settings = self.config.get('audio', {}).get('duration_estimation', {})
+        if not settings.get('enabled', True) or not project.script.full_script:
+            return
+
+        estimator = self._duration_estimator()
+        voice_id, speed = self._narration_voice(project)
+        language = project.language.value
+        target = project.duration_target
+        tolerance = settings.get('tolerance', 0.15)
+
+        estimate = estimator.estimate(project.script.full_script, language, voice_id, speed)
+        plan = {}
+        if self.llm and settings.get('adjust_segments', True):
+            plan = estimator.plan_adjustments(
+                project.script.segments, target, language, voice_id, speed, tolerance
+            )
+
+        if plan:
+            unit = {"syllable": "음절", "char": "자", "word": "단어"}[estimator.rate(language, voice_id)[0]]
+            self.logger.info(f"예상 길이 {estimate:.0f}초 (목표 {target}초) - 세그먼트 {sorted(plan)} 분량 조정")
+            await self._script_generator().regenerate_segments(
+                project.script, list(plan),
+                topic=project.topic,
+                title=project.title,
+                style=project.style.value,
+                language=language,
+                length_targets={seg_id: f"약 {units}{unit}" for seg_id, units in plan.items()},
+            )
+            estimate = estimator.estimate(project.script.full_script, language, voice_id, speed)
+
+        project.script.estimated_duration = estimate
+        if abs(estimate - target) > tolerance * target:
+            project.add_warning(f"예상 나레이션 길이 {estimate:.0f}초 (목표 {target}초)")
+
+    def _script_generator(self):
+        """세그먼트 재생성용 ScriptGenerator (처음 사용할 때 생성)"""
+        generator = self.components.get('script_generator')
+        if generator is None:
+            from script.script_generator import ScriptGenerator
+            generator = ScriptGenerator(self.config)
+            self.components['script_generator'] = generator
+        return generator
+
+    def _duration_estimator(self):
+        """나레이션 길이 추정기 (보정값은 project.cache_dir/speech_rates.json)"""
+        estimator = self.components.get('duration_estimator')
+        if estimator is None:
+            from audio.duration_estimator import DurationEstimator
+            cache_dir = self.config.get('project', {}).get('cache_dir', './data/cache')
+            estimator = DurationEstimator(Path(cache_dir) / "speech_rates.json")
+            self.components['duration_estimator'] = estimator
+        return estimator
+
+    def _bgm_selector(self):
+        """BGM 선택기 (라이브러리 색인은 처음 선택 시 로드)"""
+        selector = self.components.get('bgm_selector')
+        if selector is None:
+            from audio.bgm_selector import BGMSelector
+            selector = BGMSelector(self.config)
+            self.components['bgm_selector'] = selector
+        return selector
+
+    def _narration_voice(self, project: VideoProject) -> Tuple[str, float]:
+        """(나레이션 음성 ID, 속도) - 속도는 스타일 프리셋 narration.speed × TTS 설정 speed"""
+        tts_config = self.config.get('audio', {}).get('tts', {})
+        voice_id = tts_config.get('voices', {}).get(project.language.value, {}).get('male', '')
+        preset = self.config.get('style_presets', {}).get(project.style.value, {})
+        speed = preset.get('narration', {}).get('speed', 1.0) * tts_config.get('settings', {}).get('speed', 1.0)
+        return voice_id, speed
+
+    @staticmethod
+    def _script_response_format(streaming: bool) -> str:
+        """
+        스크립트 JSON 형식
+
+        스트리밍 시에는 segments를 먼저 받도록 full_script를 생략한다 (세그먼트를 이어 붙여 복원).
+        """
+        full_script = "" if streaming else '\n    "full_script": "전체 스크립트 텍스트",'
+        return f"""{{{full_script}
     "segments": [
         {{
             "id": 1,
@@ -1031,24 +1592,32 @@ JSON 형식으로 응답:
     "cta": "구독과 좋아요 부탁드려요! 다음 영상에서는..."
 }}"""
 
-        try:
-            text = self._generate_with_ai(script_prompt, max_tokens=8000)
-            script_data = parse_json_response(text)
-
-            project.script.full_script = script_data.get('full_script', '')
-            project.script.segments = script_data.get('segments', [])
-            project.script.hooks = script_data.get('hooks', [])
-            project.script.cta_segments = [script_data.get('cta', '')]
-            project.script.word_count = len(project.script.full_script)
-            project.script.estimated_duration = project.duration_target
+    async def _stream_script(self, project: VideoProject, prompt: str) -> Dict:
+        """스크립트 스트리밍 생성 - 완성된 세그먼트를 바로 채널에 게시"""
+        channel = self._script_channel(project.id)
+        parser = JsonArrayStream("segments")
+        segments = []
 
-        except Exception as e:
-            self.logger.warning(f"Script parsing failed: {e}")
-            project.script.full_script = f"이것은 {project.topic}에 대한 영상입니다."
-            project.script.segments = [{"id": 1, "text": project.script.full_script, "duration": project.duration_target}]
+        async for chunk in self._stream_with_ai(prompt, 8000):
+            for segment in parser.feed(chunk):
+                if isinstance(segment, dict):
+                    segments.append(segment)
+                    channel.publish(segment)
+                    self.logger.debug(f"  세그먼트 {len(segments)} 수신")
 
-        self.logger.info(f"스크립트 완료 - {len(project.script.segments)}개 세그먼트")
-        return project
+        try:
+            script_data = extract_json(parser.text, dict)
+        except ValueError:
+            # 응답 끝이 잘려도 완성된 세그먼트는 사용
+            if not segments:
+                raise
+            script_data = {}
+
+        if not script_data.get('segments'):
+            script_data['segments'] = segments
+        if not script_data.get('full_script'):
+            script_data['full_script'] = "\n\n".join(s.get('text', '') for s in script_data['segments'])
+        return script_data
 
     async def _phase_audio(self, project: VideoProject) -> VideoProject:
         """Phase 3: 오디오 생성"""
@@ -1058,77 +1627,190 @@ JSON 형식으로 응답:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         tts_config = self.config['audio']['tts']
-        voice_id = tts_config['voices'].get(project.language.value, {}).get('male', '')
+        voice_id, speed = self._narration_voice(project)
+        bgm_config = self.config['audio']['bgm']
 
-        # Try ElevenLabs TTS
+        pieces = plan_pieces(
+            project.script.segments, project.script.full_script,
+            tts_config.get('segment_max_chars', DEFAULT_MAX_CHARS)
+        )
+
+        # 캐시 조회 - 같은 나레이션 조각/음성/믹싱 설정이면 TTS와 믹싱 생략
+        cache_key = ArtifactCache.make_key(
+            [(piece.segment_id, piece.text) for piece in pieces],
+            project.language.value, project.category.value, voice_id,
+            {k: tts_config.get(k) for k in ('provider', 'model', 'settings')}, bgm_config,
+        )
+        if self.artifact_cache:
+            narration_path = output_dir / "narration.mp3"
+            mixed_path = output_dir / "mixed_audio.mp3"
+            meta = await asyncio.to_thread(
+                self.artifact_cache.fetch, "audio", cache_key,
+                {"narration": narration_path, "mixed": mixed_path}
+            )
+            if meta is None:
+                meta = await asyncio.to_thread(
+                    self.artifact_cache.fetch, "audio", cache_key, {"narration": narration_path}
+                )
+                mixed_path = narration_path
+            if meta is not None:
+                project.audio.narration_path = str(narration_path)
+                project.audio.mixed_audio_path = str(mixed_path)
+                project.audio.bgm_path = meta.get('bgm_path', '')
+                project.audio.duration = meta.get('duration', 0.0)
+                project.audio.segments_timing = meta.get('segments_timing', [])
+                self.logger.info("오디오 캐시 적중 - TTS/믹싱 생략")
+                return project
+
+        # Try ElevenLabs TTS (세그먼트 조각별 병렬 합성 후 이어 붙이기)
         if tts_config['provider'] == 'elevenlabs':
             try:
-                from elevenlabs import ElevenLabs, VoiceSettings
-
-                client = ElevenLabs()
-
-                audio_data = client.text_to_speech.convert(
-                    voice_id=voice_id,
-                    text=project.script.full_script,
-                    model_id=tts_config['model'],
-                    voice_settings=VoiceSettings(
-                        stability=tts_config['settings']['stability'],
-                        similarity_boost=tts_config['settings']['similarity_boost'],
-                        style=tts_config['settings'].get('style', 0.0),
-                    )
-                )
-
                 narration_path = output_dir / "narration.mp3"
-                with open(narration_path, 'wb') as f:
-                    for chunk in audio_data:
-                        f.write(chunk)
-
+                project.audio.segments_timing = await self._synthesize_narration(
+                    pieces, voice_id, output_dir, narration_path
+                )
                 project.audio.narration_path = str(narration_path)
-                self.logger.info("ElevenLabs TTS 완료")
+                self.logger.info(f"ElevenLabs TTS 완료 - {len(pieces)}개 조각")
             except Exception as e:
                 self.logger.warning(f"ElevenLabs TTS failed: {e}")
                 # Create placeholder
                 project.audio.narration_path = str(output_dir / "narration_placeholder.mp3")
 
-        # BGM selection
-        bgm_config = self.config['audio']['bgm']
+        # BGM selection - 라이브러리 색인에서 카테고리/분위기와 길이에 맞는 트랙
         if bgm_config['enabled']:
             bgm_categories = bgm_config.get('categories', {}).get(project.category.value, ['ambient'])
             project.audio.bgm_path = f"assets/music/background/{bgm_categories[0]}_01.mp3"
+            try:
+                track = await self._bgm_selector().select_bgm(
+                    project.category.value, bgm_categories[0],
+                    duration_needed=project.script.estimated_duration or None
+                )
+                if track:
+                    project.audio.bgm_path = track.path
+            except Exception as e:
+                self.logger.warning(f"BGM selection failed: {e}")
 
         # Audio mixing (if both files exist)
         try:
-            from pydub import AudioSegment
+            await asyncio.to_thread(self._mix_narration_bgm, project, output_dir)
+        except Exception as e:
+            self.logger.warning(f"Audio mixing failed: {e}")
+            project.audio.mixed_audio_path = project.audio.narration_path
+
+        # 실제 나레이션 길이로 발화 속도 보정
+        if project.audio.duration > 0:
+            await asyncio.to_thread(
+                self._duration_estimator().observe,
+                project.script.full_script, project.language.value, voice_id, project.audio.duration, speed
+            )
 
-            if Path(project.audio.narration_path).exists():
-                narration = AudioSegment.from_file(project.audio.narration_path)
-                project.audio.duration = len(narration) / 1000
+        if self.artifact_cache:
+            files = {"narration": project.audio.narration_path}
+            if project.audio.mixed_audio_path != project.audio.narration_path:
+                files["mixed"] = project.audio.mixed_audio_path
+            await asyncio.to_thread(
+                self.artifact_cache.put, "audio", cache_key, files,
+                {"duration": project.audio.duration, "bgm_path": project.audio.bgm_path,
+                 "segments_timing": project.audio.segments_timing}
+            )
 
-                if bgm_config['enabled'] and Path(project.audio.bgm_path).exists():
-                    bgm = AudioSegment.from_file(project.audio.bgm_path)
-                    bgm = bgm - (20 * (1 - bgm_config['volume']))
+        self.logger.info("오디오 생성 완료")
+        return project
 
-                    if len(bgm) < len(narration):
-                        bgm = bgm * (len(narration) // len(bgm) + 1)
-                    bgm = bgm[:len(narration)]
+    async def _synthesize_narration(
+        self,
+        pieces: List[NarrationPiece],
+        voice_id: str,
+        output_dir: Path,
+        narration_path: Path
+    ) -> List[Dict]:
+        """
+        나레이션 조각을 동시에 합성하고 크로스페이드로 이어 붙임
 
-                    fade_in_ms = int(bgm_config['fade_in'] * 1000)
-                    fade_out_ms = int(bgm_config['fade_out'] * 1000)
-                    bgm = bgm.fade_in(fade_in_ms).fade_out(fade_out_ms)
+        조각별 호출은 ElevenLabs 동시성 제한기 안에서 각자 재시도하므로
+        실패한 조각만 다시 요청된다. 전체 지연은 가장 긴 조각 수준.
 
-                    mixed = narration.overlay(bgm)
+        Returns:
+            세그먼트별 타이밍 [{segment_id, type, start, end, pieces}]
+        """
+        if not pieces:
+            raise ValueError("나레이션할 텍스트가 없습니다")
 
-                    mixed_path = output_dir / "mixed_audio.mp3"
-                    mixed.export(str(mixed_path), format="mp3")
-                    project.audio.mixed_audio_path = str(mixed_path)
-                else:
-                    project.audio.mixed_audio_path = project.audio.narration_path
-        except Exception as e:
-            self.logger.warning(f"Audio mixing failed: {e}")
-            project.audio.mixed_audio_path = project.audio.narration_path
+        tts_config = self.config['audio']['tts']
+        piece_dir = output_dir / "narration_pieces"
+        piece_dir.mkdir(parents=True, exist_ok=True)
+        piece_paths = [piece_dir / f"piece_{piece.index:03d}.mp3" for piece in pieces]
+        cached = 0
+
+        async def synthesize(piece: NarrationPiece, path: Path):
+            nonlocal cached
+            # TTS 캐시 조회 - 같은 텍스트/음성/모델/설정이면 합성 생략
+            key = TTSCache.make_key(
+                piece.text, "elevenlabs", voice_id, tts_config.get('model'), tts_config.get('settings')
+            )
+            if self.tts_cache and await asyncio.to_thread(self.tts_cache.fetch, key, path):
+                cached += 1
+                return
+            await self._call_external(
+                "elevenlabs", asyncio.to_thread, self._synthesize_elevenlabs, piece.text, voice_id, path
+            )
+            if self.tts_cache:
+                await asyncio.to_thread(self.tts_cache.put, key, path)
 
-        self.logger.info("오디오 생성 완료")
-        return project
+        await asyncio.gather(*(synthesize(piece, path) for piece, path in zip(pieces, piece_paths)))
+        if cached:
+            self.logger.info(f"  TTS 캐시 적중 {cached}/{len(pieces)}개 조각")
+
+        crossfade_ms = tts_config.get('crossfade_ms', DEFAULT_CROSSFADE_MS)
+        timing = await asyncio.to_thread(
+            stitch_pieces, pieces, [str(path) for path in piece_paths], str(narration_path), crossfade_ms
+        )
+        # 이어 붙인 뒤 조각 파일은 필요 없음 (재사용은 TTS 캐시의 사본으로)
+        await asyncio.to_thread(shutil.rmtree, piece_dir, True)
+        return timing
+
+    def _synthesize_elevenlabs(self, text: str, voice_id: str, output_path: Path) -> None:
+        """ElevenLabs TTS 호출 (블로킹 - 스레드에서 실행)"""
+        from elevenlabs import ElevenLabs, VoiceSettings
+
+        tts_config = self.config['audio']['tts']
+        client = ElevenLabs(timeout=self.config.get('api', {}).get('timeout', 120))
+
+        audio_data = client.text_to_speech.convert(
+            voice_id=voice_id,
+            text=text,
+            model_id=tts_config['model'],
+            voice_settings=VoiceSettings(
+                stability=tts_config['settings']['stability'],
+                similarity_boost=tts_config['settings']['similarity_boost'],
+                style=tts_config['settings'].get('style', 0.0),
+            )
+        )
+
+        with open(output_path, 'wb') as f:
+            for chunk in audio_data:
+                f.write(chunk)
+
+    def _mix_narration_bgm(self, project: VideoProject, output_dir: Path) -> None:
+        """나레이션 + BGM 믹싱 (블로킹 - 스레드에서 실행)"""
+        bgm_config = self.config['audio']['bgm']
+
+        if Path(project.audio.narration_path).exists():
+            # 길이는 헤더에서 읽고, 디코딩은 실제로 믹싱할 때만
+            project.audio.duration = probe_duration(project.audio.narration_path)
+
+            if bgm_config['enabled'] and Path(project.audio.bgm_path).exists():
+                bgm = BGMLayer(
+                    path=project.audio.bgm_path,
+                    gain_db=volume_to_db(bgm_config['volume']),
+                    fade_in=bgm_config['fade_in'],
+                    fade_out=bgm_config['fade_out'],
+                )
+                mixed_path = output_dir / "mixed_audio.mp3"
+                project.audio.duration, _ = mix_to_file(project.audio.narration_path, str(mixed_path), bgm)
+                project.audio.mixed_audio_path = str(mixed_path)
+            else:
+                project.audio.mixed_audio_path = project.audio.narration_path
 
     async def _phase_visual(self, project: VideoProject) -> VideoProject:
         """Phase 4: 비주얼 에셋 생성"""
@@ -1137,72 +1819,141 @@ JSON 형식으로 응답:
         output_dir = Path(self.config['project']['output_dir']) / "images" / project.id
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Scene planning
-        scene_plan = []
-        for idx, segment in enumerate(project.script.segments):
-            visual_note = segment.get('visual_note', f'{project.topic} 관련 이미지')
-            scene_plan.append({
+        def plan_scene(idx: int, segment: Dict) -> Dict:
+            return {
                 'segment_id': segment.get('id', idx),
-                'description': visual_note,
+                'description': segment.get('visual_note', f'{project.topic} 관련 이미지'),
                 'duration': segment.get('duration', 30),
                 'style': project.style.value
-            })
-
-        project.visual.scene_plan = scene_plan
+            }
 
-        # Image generation with DALL-E 3
         try:
             from openai import OpenAI
-            import httpx
+        except ImportError as e:
+            OpenAI = None
+            self.logger.warning(f"Image generation failed: {e}")
 
-            openai_client = OpenAI()
-            visual_config = self.config['visual']['image_generation']
+        max_scenes = 10
+        openai_client = None
+        visual_config = self.config['visual']['image_generation']
 
-            style_modifiers = {
-                VideoStyle.KURZGESAGT: "flat design, minimal, pastel colors, geometric shapes, educational infographic style, no text",
-                VideoStyle.KNOWLEDGE_PIRATE: "warm colors, illustrated style, friendly cartoon, educational, engaging",
-                VideoStyle.VERITASIUM: "realistic, documentary style, scientific, clean, professional",
-                VideoStyle.INFOGRAPHIC: "data visualization, clean design, vibrant colors, modern infographic",
-            }
+        style_modifiers = {
+            VideoStyle.KURZGESAGT: "flat design, minimal, pastel colors, geometric shapes, educational infographic style, no text",
+            VideoStyle.KNOWLEDGE_PIRATE: "warm colors, illustrated style, friendly cartoon, educational, engaging",
+            VideoStyle.VERITASIUM: "realistic, documentary style, scientific, clean, professional",
+            VideoStyle.INFOGRAPHIC: "data visualization, clean design, vibrant colors, modern infographic",
+        }
 
-            modifier = style_modifiers.get(project.style, "educational, clean, professional")
+        modifier = style_modifiers.get(project.style, "educational, clean, professional")
 
-            images = []
-            for idx, scene in enumerate(scene_plan[:10]):
-                try:
-                    prompt = f"{scene['description']}, {modifier}, 16:9 aspect ratio, high quality"
-
-                    response = openai_client.images.generate(
-                        model=visual_config['model'],
-                        prompt=prompt,
-                        size=visual_config['size'],
-                        quality=visual_config['quality'],
-                        n=1
-                    )
+        def scene_prompt(scene: Dict) -> str:
+            return f"{scene['description']}, {modifier}, 16:9 aspect ratio, high quality"
 
-                    image_url = response.data[0].url
-                    image_response = httpx.get(image_url)
+        async def generate_scene(idx: int, scene: Dict) -> str:
+            nonlocal openai_client
+            try:
+                prompt = scene_prompt(scene)
 
-                    image_path = output_dir / f"scene_{idx:03d}.png"
-                    with open(image_path, 'wb') as f:
-                        f.write(image_response.content)
+                image_path = output_dir / f"scene_{idx:03d}.png"
 
-                    images.append(str(image_path))
-                    self.logger.info(f"  이미지 {idx+1}/{min(len(scene_plan), 10)} 생성 완료")
+                # 캐시 조회 - 같은 프롬프트/이미지 설정이면 재사용
+                cache_key = ArtifactCache.make_key(prompt, visual_config)
+                cached = False
+                if self.artifact_cache:
+                    cached = await asyncio.to_thread(
+                        self.artifact_cache.fetch, "image", cache_key, {"image": image_path}
+                    ) is not None
 
-                except Exception as e:
-                    self.logger.warning(f"  이미지 {idx+1} 생성 실패: {e}")
-                    images.append(f"assets/images/backgrounds/default_{project.category.value}.png")
+                if not cached:
+                    if openai_client is None:
+                        openai_client = OpenAI(max_retries=0, timeout=self.config.get('api', {}).get('timeout', 120))
+
+                    await self._generate_scene_image(openai_client, prompt, visual_config, image_path)
+                    if self.artifact_cache:
+                        await asyncio.to_thread(
+                            self.artifact_cache.put, "image", cache_key, {"image": image_path}
+                        )
+
+                self.logger.info(f"  이미지 {idx+1} 생성 완료")
+                return str(image_path)
+
+            except Exception as e:
+                self.logger.warning(f"  이미지 {idx+1} 생성 실패: {e}")
+                return f"assets/images/backgrounds/default_{project.category.value}.png"
 
-            project.visual.images = images
+        # 스크립트가 스트리밍 중이면 완성된 세그먼트부터 이미지 생성 시작
+        prefetched: Dict[int, Tuple[str, asyncio.Task]] = {}
+        try:
+            if self._script_streaming_enabled() and "script" not in project.completed_phases:
+                idx = 0
+                async for segment in self._script_channel(project.id).subscribe():
+                    if OpenAI is not None and idx < max_scenes:
+                        scene = plan_scene(idx, segment)
+                        prefetched[idx] = (scene_prompt(scene), asyncio.ensure_future(generate_scene(idx, scene)))
+                    idx += 1
+                if prefetched:
+                    self.logger.info(f"스트리밍 세그먼트로 이미지 {len(prefetched)}개 선행 생성")
+
+            # Scene planning - 스크립트 단계의 최종 세그먼트 기준
+            scene_plan = [plan_scene(idx, segment) for idx, segment in enumerate(project.script.segments)]
+            project.visual.scene_plan = scene_plan
+
+            # Image generation with DALL-E 3
+            # 동시 요청 수는 openai_images 제어기가 조절 (max_concurrent가 상한)
+            tasks = []
+            for idx, scene in enumerate(scene_plan[:max_scenes] if OpenAI is not None else []):
+                early = prefetched.pop(idx, None)
+                if early is not None:
+                    if early[0] == scene_prompt(scene):
+                        tasks.append(early[1])
+                        continue
+                    # 최종 세그먼트와 달라진 선행 생성은 버림 (같은 파일에 쓰므로 먼저 종료)
+                    early[1].cancel()
+                    await asyncio.gather(early[1], return_exceptions=True)
+                tasks.append(asyncio.ensure_future(generate_scene(idx, scene)))
+
+            project.visual.images = list(await asyncio.gather(*tasks))
 
         except Exception as e:
             self.logger.warning(f"Image generation failed: {e}")
             project.visual.images = []
 
+        finally:
+            for _, task in prefetched.values():
+                task.cancel()
+
         self.logger.info(f"비주얼 생성 완료 - {len(project.visual.images)}개 이미지")
         return project
 
+    async def _generate_scene_image(self, openai_client, prompt: str, visual_config: Dict, image_path: Path) -> None:
+        """DALL-E 이미지 생성 및 다운로드"""
+        response = await self._call_external(
+            "openai_images", asyncio.to_thread,
+            openai_client.images.generate,
+            model=visual_config['model'],
+            prompt=prompt,
+            size=visual_config['size'],
+            quality=visual_config['quality'],
+            n=1
+        )
+
+        image_data = await self._download_image(response.data[0].url)
+
+        await asyncio.to_thread(image_path.write_bytes, image_data)
+
+    async def _download_image(self, url: str) -> bytes:
+        """이미지 다운로드 - 2xx가 아니면 예외"""
+        import httpx
+
+        timeout = self.config.get('api', {}).get('timeout', 120)
+
+        def fetch():
+            response = httpx.get(url, timeout=timeout, follow_redirects=True)
+            response.raise_for_status()
+            return response.content
+
+        return await self._call_external("image_download", asyncio.to_thread, fetch)
+
     async def _phase_video_compose(self, project: VideoProject) -> VideoProject:
         """Phase 5: 비디오 조립"""
         self.logger.info("Phase 5: 비디오 조립 시작...")
@@ -1211,90 +1962,50 @@ JSON 형식으로 응답:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            from moviepy.editor import (
-                ImageClip, AudioFileClip, CompositeVideoClip,
-                concatenate_videoclips, ColorClip
-            )
-
             video_config = self.config['video']
-
-            # Load audio
-            if project.audio.mixed_audio_path and Path(project.audio.mixed_audio_path).exists():
-                audio = AudioFileClip(project.audio.mixed_audio_path)
-                total_duration = audio.duration
-            else:
-                audio = None
-                total_duration = project.duration_target
-
-            # Create image clips
-            clips = []
-            images = project.visual.images
-
-            if not images:
-                clip = ColorClip(size=(1920, 1080), color=(26, 26, 46), duration=total_duration)
-                clips.append(clip)
-            else:
-                clip_duration = total_duration / len(images)
-
-                for idx, img_path in enumerate(images):
-                    try:
-                        if Path(img_path).exists():
-                            img_clip = ImageClip(img_path)
-                            img_clip = img_clip.resize((1920, 1080))
-                            img_clip = img_clip.set_duration(clip_duration)
-
-                            # Ken Burns effect
-                            if video_config.get('animation', {}).get('effects', {}).get('ken_burns', {}).get('enabled', True):
-                                zoom_ratio = video_config['animation']['effects']['ken_burns'].get('zoom_ratio', 0.04)
-                                img_clip = img_clip.resize(lambda t: 1 + zoom_ratio * t / clip_duration)
-
-                            img_clip = img_clip.crossfadein(0.5)
-                            img_clip = img_clip.crossfadeout(0.5)
-
-                            clips.append(img_clip)
-                    except Exception as e:
-                        self.logger.warning(f"Image clip creation failed: {e}")
-
-            # Concatenate video
-            if clips:
-                video = concatenate_videoclips(clips, method='compose')
-            else:
-                video = ColorClip(size=(1920, 1080), color=(26, 26, 46), duration=total_duration)
-
-            # Set audio
-            if audio:
-                video = video.set_audio(audio)
-
-            # Export
             output_path = output_dir / f"{project.id}_main.mp4"
 
-            video.write_videofile(
-                str(output_path),
-                fps=video_config['fps'],
-                codec=video_config['codec'],
-                audio_codec=video_config['audio_codec'],
-                bitrate=video_config['bitrate'],
-                preset=video_config.get('preset', 'medium')
-            )
+            # 캐시 조회 - 오디오/이미지 파일 해시와 렌더링 설정이 같으면 렌더링 생략
+            meta = None
+            if self.artifact_cache:
+                cache_key = await asyncio.to_thread(self._compose_cache_key, project)
+                meta = await asyncio.to_thread(
+                    self.artifact_cache.fetch, "video", cache_key, {"video": output_path}
+                )
 
-            # Cleanup
-            video.close()
-            if audio:
-                audio.close()
-            for clip in clips:
-                clip.close()
+            if meta is not None:
+                total_duration = meta.get('duration', project.duration_target)
+                self.logger.info("렌더링 캐시 적중 - 비디오 렌더링 생략")
+            else:
+                total_duration = await self._run_cpu_bound(
+                    render_main_video, video_config, project.audio.mixed_audio_path,
+                    project.visual.images, project.duration_target, str(output_path)
+                )
+                if self.artifact_cache:
+                    await asyncio.to_thread(
+                        self.artifact_cache.put, "video", cache_key, {"video": output_path},
+                        {"duration": total_duration}
+                    )
 
             project.video.main_video_path = str(output_path)
             project.video.duration = total_duration
             project.video.resolution = video_config['default_resolution']
 
-            # Generate chapters
+            # Generate chapters (TTS 세그먼트 타이밍이 있으면 실제 나레이션 시작 시각 사용)
             chapters = []
-            for segment in project.script.segments:
-                chapters.append({
-                    'time': segment.get('start_time', '0:00'),
-                    'title': segment.get('type', 'Section'),
-                })
+            if project.audio.segments_timing:
+                for timing in project.audio.segments_timing:
+                    hours, rest = divmod(int(timing['start']), 3600)
+                    chapters.append({
+                        'time': f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60}:{rest % 60:02d}",
+                        'title': timing.get('type') or 'Section',
+                    })
+            else:
+                for segment in project.script.segments:
+                    chapters.append({
+                        'time': segment.get('start_time', '0:00'),
+                        'title': segment.get('type', 'Section'),
+                    })
             project.video.chapters = chapters
 
         except Exception as e:
@@ -1304,6 +2015,16 @@ JSON 형식으로 응답:
         self.logger.info(f"비디오 조립 완료 - {project.video.main_video_path}")
         return project
 
+    def _compose_cache_key(self, project: VideoProject) -> str:
+        """렌더링 캐시 키 - 상위 산출물(오디오, 이미지) 파일 해시 포함"""
+        cache = self.artifact_cache
+        return ArtifactCache.make_key(
+            cache.file_digest(project.audio.mixed_audio_path),
+            [cache.file_digest(p) for p in project.visual.images],
+            project.duration_target,
+            self.config['video'],
+        )
+
     async def _phase_shorts(self, project: VideoProject) -> VideoProject:
         """Phase 6: Shorts 생성"""
         self.logger.info("Phase 6: Shorts 생성 시작...")
@@ -1313,15 +2034,11 @@ JSON 형식으로 응답:
             return project
 
         try:
-            from moviepy.editor import VideoFileClip
-
             output_dir = Path(self.config['project']['output_dir']) / "shorts" / project.id
             output_dir.mkdir(parents=True, exist_ok=True)
 
             shorts_config = self.config['shorts']
 
-            original = VideoFileClip(project.video.main_video_path)
-
             # Extract highlights
             highlights = []
             for segment in project.script.segments[:3]:
@@ -1332,47 +2049,9 @@ JSON 형식으로 응답:
                     'title': segment.get('text', '')[:50]
                 })
 
-            shorts_paths = []
-            for idx, highlight in enumerate(highlights):
-                try:
-                    start = highlight['start']
-                    duration = min(highlight['duration'], shorts_config['format']['max_duration'])
-                    clip = original.subclip(start, min(start + duration, original.duration))
-
-                    # Convert to vertical (9:16)
-                    w, h = clip.size
-                    target_ratio = 9 / 16
-
-                    new_w = int(h * target_ratio)
-                    x_center = w // 2
-
-                    clip = clip.crop(
-                        x1=max(0, x_center - new_w // 2),
-                        y1=0,
-                        x2=min(w, x_center + new_w // 2),
-                        y2=h
-                    )
-
-                    clip = clip.resize((1080, 1920))
-
-                    short_path = output_dir / f"short_{idx:02d}.mp4"
-                    clip.write_videofile(
-                        str(short_path),
-                        fps=shorts_config['format']['fps'],
-                        codec='libx264',
-                        audio_codec='aac'
-                    )
-
-                    shorts_paths.append(str(short_path))
-                    clip.close()
-
-                    self.logger.info(f"  Short {idx+1} 생성 완료")
-
-                except Exception as e:
-                    self.logger.warning(f"  Short {idx+1} 생성 실패: {e}")
-
-            original.close()
-            project.video.shorts_paths = shorts_paths
+            project.video.shorts_paths = await self._run_cpu_bound(
+                render_shorts, shorts_config, project.video.main_video_path, highlights, str(output_dir)
+            )
 
         except Exception as e:
             self.logger.warning(f"Shorts generation failed: {e}")
@@ -1390,17 +2069,13 @@ JSON 형식으로 응답:
         thumbnail_config = self.config['thumbnail']
 
         try:
-            from PIL import Image, ImageDraw, ImageFont
             from openai import OpenAI
-            import httpx
-            from io import BytesIO
 
-            openai_client = OpenAI()
+            openai_client = OpenAI(max_retries=0, timeout=self.config.get('api', {}).get('timeout', 120))
 
             styles = thumbnail_config['generation']['styles']
-            thumbnails = []
 
-            for style_idx, style in enumerate(styles[:3]):
+            async def generate_thumbnail(style: str) -> Optional[str]:
                 try:
                     style_prompts = {
                         'dramatic': f"dramatic cinematic scene about {project.topic}, dark background, spotlight, epic, movie poster style",
@@ -1410,52 +2085,22 @@ JSON 형식으로 응답:
 
                     prompt = style_prompts.get(style, f"thumbnail about {project.topic}, {style} style")
 
-                    response = openai_client.images.generate(
-                        model="dall-e-3",
-                        prompt=prompt,
-                        size="1792x1024",
-                        quality="standard",
-                        n=1
-                    )
-
-                    image_url = response.data[0].url
-                    image_response = httpx.get(image_url)
-
-                    img = Image.open(BytesIO(image_response.content))
-                    img = img.resize((1280, 720), Image.LANCZOS)
-
-                    # Add text
-                    if thumbnail_config['elements']['text']['enabled']:
-                        draw = ImageDraw.Draw(img)
-                        title_text = project.title[:10]
-
-                        try:
-                            font = ImageFont.truetype("assets/fonts/korean/Pretendard-Bold.ttf", 80)
-                        except:
-                            font = ImageFont.load_default()
-
-                        text_bbox = draw.textbbox((0, 0), title_text, font=font)
-                        text_width = text_bbox[2] - text_bbox[0]
-                        text_x = (1280 - text_width) // 2
-                        text_y = 720 - 150
-
-                        # Outline
-                        for dx, dy in [(-3, -3), (-3, 3), (3, -3), (3, 3)]:
-                            draw.text((text_x + dx, text_y + dy), title_text, font=font, fill='black')
-
-                        draw.text((text_x, text_y), title_text, font=font, fill='white')
-
                     thumb_path = output_dir / f"thumbnail_{style}.png"
-                    img.save(str(thumb_path), quality=thumbnail_config['quality'])
-                    thumbnails.append(str(thumb_path))
+                    await self._render_thumbnail(openai_client, prompt, project.title, thumb_path)
 
                     self.logger.info(f"  썸네일 ({style}) 생성 완료")
+                    return str(thumb_path)
 
                 except Exception as e:
                     self.logger.warning(f"  썸네일 ({style}) 생성 실패: {e}")
+                    return None
+
+            results = await asyncio.gather(*(generate_thumbnail(style) for style in styles[:3]))
+            thumbnails = [path for path in results if path]
+            used_styles = [style for style, path in zip(styles[:3], results) if path]
 
             project.thumbnail.paths = thumbnails
-            project.thumbnail.styles_used = styles[:len(thumbnails)]
+            project.thumbnail.styles_used = used_styles
             project.thumbnail.predicted_ctr = 0.05 + (len(thumbnails) * 0.01)
 
         except Exception as e:
@@ -1464,30 +2109,101 @@ JSON 형식으로 응답:
         self.logger.info(f"썸네일 생성 완료 - {len(project.thumbnail.paths)}개")
         return project
 
-    async def _phase_localization(self, project: VideoProject) -> VideoProject:
-        """Phase 8: 다국어 현지화"""
-        self.logger.info("Phase 8: 다국어 현지화 시작...")
+    async def _render_thumbnail(self, openai_client, prompt: str, title: str, thumb_path: Path) -> None:
+        """썸네일 이미지 생성 및 텍스트 합성"""
+        response = await self._call_external(
+            "openai_images", asyncio.to_thread,
+            openai_client.images.generate,
+            model="dall-e-3",
+            prompt=prompt,
+            size="1792x1024",
+            quality="standard",
+            n=1
+        )
 
-        for lang in project.generate_localizations:
-            self.logger.info(f"  - {lang.value} 현지화 중...")
+        image_data = await self._download_image(response.data[0].url)
+
+        await asyncio.to_thread(self._compose_thumbnail, image_data, title, thumb_path)
+
+    def _compose_thumbnail(self, image_data: bytes, title: str, thumb_path: Path) -> None:
+        """썸네일 리사이즈 및 제목 텍스트 합성 (블로킹 - 스레드에서 실행)"""
+        from PIL import Image, ImageDraw, ImageFont
+        from io import BytesIO
+
+        thumbnail_config = self.config['thumbnail']
+
+        img = Image.open(BytesIO(image_data))
+        img = img.resize((1280, 720), Image.LANCZOS)
+
+        # Add text
+        if thumbnail_config['elements']['text']['enabled']:
+            draw = ImageDraw.Draw(img)
+            title_text = title[:10]
 
             try:
-                # Translate script
-                translate_prompt = f"""다음 유튜브 스크립트를 {lang.value}로 번역하세요.
+                font = ImageFont.truetype("assets/fonts/korean/Pretendard-Bold.ttf", 80)
+            except:
+                font = ImageFont.load_default()
+
+            text_bbox = draw.textbbox((0, 0), title_text, font=font)
+            text_width = text_bbox[2] - text_bbox[0]
+            text_x = (1280 - text_width) // 2
+            text_y = 720 - 150
+
+            # Outline
+            for dx, dy in [(-3, -3), (-3, 3), (3, -3), (3, 3)]:
+                draw.text((text_x + dx, text_y + dy), title_text, font=font, fill='black')
+
+            draw.text((text_x, text_y), title_text, font=font, fill='white')
+
+        img.save(str(thumb_path), quality=thumbnail_config['quality'])
+
+    def _script_chunks(self, project: VideoProject):
+        """스크립트를 세그먼트 경계에서 토큰 예산 단위로 나눈 조각과 동시 처리 수"""
+        max_tokens, overlap_tokens, concurrency = chunk_settings(self.config)
+        chunks = chunk_script(project.script.full_script, project.script.segments, max_tokens, overlap_tokens)
+        return chunks, concurrency
 
-원본 ({project.language.value}):
-{project.script.full_script[:3000]}
+    async def _translate_script(self, project: VideoProject, language: str) -> str:
+        """스크립트 전체를 조각별로 병렬 번역해 순서대로 합침"""
+        chunks, concurrency = self._script_chunks(project)
+
+        async def translate(chunk) -> str:
+            prompt = f"""다음 유튜브 스크립트를 {language}로 번역하세요.
+
+{context_block(chunk, "앞부분 원문 (톤 참고용, 번역하거나 출력하지 마세요)")}원본 ({project.language.value}):
+{chunk.text}
 
 번역 규칙:
-1. 자연스러운 {lang.value} 표현 사용
+1. 자연스러운 {language} 표현 사용
 2. 유튜브 지식 채널에 맞는 톤 유지
 3. 문화적 맥락 적응
 
 번역된 스크립트만 출력:"""
+            return (await self._generate_with_ai(prompt, max(2000, chunk.tokens * 3))).strip()
+
+        return "\n\n".join(await map_chunks(chunks, translate, concurrency))
+
+    async def _phase_localization(self, project: VideoProject) -> VideoProject:
+        """Phase 8: 다국어 현지화"""
+        self.logger.info("Phase 8: 다국어 현지화 시작...")
 
-                translated_script = self._generate_with_ai(translate_prompt, max_tokens=8000).strip()
+        for lang in project.generate_localizations:
+            self.logger.info(f"  - {lang.value} 현지화 중...")
+
+            try:
+                translated_script = await self._translate_script(project, lang.value)
+
+                # SEO localization (통합 요청에서 받았으면 재사용)
+                localized_seo = project.seo.localized.get(lang.value)
+                if localized_seo:
+                    project.localizations[lang.value] = LocalizationData(
+                        language=lang.value,
+                        translated_script=translated_script,
+                        localized_seo=localized_seo
+                    )
+                    continue
 
-                # SEO localization
                 seo_prompt = f"""다음 SEO 데이터를 {lang.value}로 현지화하세요.
 
 원본 제목: {project.title}
@@ -1500,8 +2216,7 @@ JSON으로 응답:
     "tags": ["태그1", "태그2"]
 }}"""
 
-                seo_text = self._generate_with_ai(seo_prompt, max_tokens=1000)
-                localized_seo = parse_json_response(seo_text)
+                localized_seo = await self._generate_json_with_ai(seo_prompt, 1000, expect=dict)
 
                 project.localizations[lang.value] = LocalizationData(
                     language=lang.value,
@@ -1519,6 +2234,19 @@ JSON으로 응답:
         """Phase 9: SEO 최적화"""
         self.logger.info("Phase 9: SEO 최적화 시작...")
 
+        if self._fused_requests_enabled() and not project.seo.timestamps:
+            # 통합 요청은 스크립트 전에 실행되므로 타임스탬프는 실제 세그먼트에서 생성
+            project.seo.timestamps = timestamps_from_segments(project.script.segments, project.audio.segments_timing)
+
+        seo_fields = {
+            'optimized_title': 'title', 'description': 'description', 'tags': 'tags',
+            'hashtags': 'hashtags', 'timestamps': 'timestamps', 'keywords': 'keywords',
+        }
+        missing = {key: attr for key, attr in seo_fields.items() if not getattr(project.seo, attr)}
+        if not missing:
+            self.logger.info("SEO 최적화 완료 (통합 요청 결과 사용)")
+            return project
+
         try:
             seo_prompt = f"""유튜브 SEO 최적화 데이터를 생성하세요.
 
@@ -1536,15 +2264,12 @@ JSON으로 응답:
     "keywords": ["키워드1", "키워드2"]
 }}"""
 
-            text = self._generate_with_ai(seo_prompt, max_tokens=2000)
-            seo_data = parse_json_response(text)
+            seo_data = await self._generate_json_with_ai(seo_prompt, 2000, expect=dict)
 
-            project.seo.title = seo_data.get('optimized_title', project.title)
-            project.seo.description = seo_data.get('description', '')
-            project.seo.tags = seo_data.get('tags', [])
-            project.seo.hashtags = seo_data.get('hashtags', [])
-            project.seo.timestamps = seo_data.get('timestamps', [])
-            project.seo.keywords = seo_data.get('keywords', [])
+            defaults = {'optimized_title': project.title, 'description': ''}
+            # 통합 요청에서 이미 받은 필드는 유지하고 빠진 필드만 채움
+            for key, attr in missing.items():
+                setattr(project.seo, attr, seo_data.get(key, defaults.get(key, [])))
 
         except Exception as e:
             self.logger.warning(f"SEO optimization failed: {e}")
@@ -1614,17 +2339,34 @@ JSON으로 응답:
         self.logger.info("수익화 최적화 완료")
         return project
 
+    @staticmethod
+    def _sync_timestamps(project: VideoProject) -> None:
+        """
+        설명 타임스탬프를 챕터와 같은 실측 나레이션 시각으로 맞춤
+
+        SEO 단계는 보통 오디오보다 먼저 끝나 스크립트의 예상 start_time을 쓰므로,
+        오디오와 SEO 뒤에 항상 실행되는 품질 검증 단계에서 다시 만든다.
+        """
+        if project.audio.segments_timing:
+            project.seo.timestamps = timestamps_from_segments(
+                project.script.segments, project.audio.segments_timing
+            ) or project.seo.timestamps
+
     async def _phase_quality_check(self, project: VideoProject) -> VideoProject:
         """Phase 11: 품질 검증"""
         self.logger.info("Phase 11: 품질 검증 시작...")
 
+        self._sync_timestamps(project)
+
         scores = []
 
         # Script quality
         if project.script.full_script:
-            script_length = len(project.script.full_script)
-            target_length = project.duration_target * 5
-            script_score = min(1.0, script_length / target_length)
+            voice_id, speed = self._narration_voice(project)
+            estimate = self._duration_estimator().estimate(
+                project.script.full_script, project.language.value, voice_id, speed
+            )
+            script_score = max(0.0, 1.0 - abs(estimate - project.duration_target) / max(project.duration_target, 1))
             scores.append(script_score)
 
         # Visual quality
@@ -1653,6 +2395,24 @@ JSON으로 응답:
         self.logger.info(f"품질 검증 완료 - 점수: {project.quality.overall_score:.2f}")
         return project
 
+    async def _condensed_script(self, project: VideoProject) -> str:
+        """한 조각에 들어가면 스크립트 그대로, 아니면 조각별 요점을 병렬로 뽑아 순서대로 이어 붙임"""
+        chunks, concurrency = self._script_chunks(project)
+        if len(chunks) <= 1:
+            return project.script.full_script
+
+        async def notes(chunk) -> str:
+            prompt = f"""{context_block(chunk)}다음 유튜브 스크립트 부분의 핵심 내용을 순서대로 요점 정리하세요.
+예시, 수치, 인용은 그대로 유지하세요.
+
+스크립트 부분:
+{chunk.text}
+
+요점만 출력:"""
+            return (await self._generate_with_ai(prompt, 1000)).strip()
+
+        return "\n\n".join(await map_chunks(chunks, notes, concurrency))
+
     async def _phase_repurpose(self, project: VideoProject) -> VideoProject:
         """Phase 12: 콘텐츠 재활용"""
         self.logger.info("Phase 12: 콘텐츠 재활용 시작...")
@@ -1661,22 +2421,23 @@ JSON으로 응답:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            # Blog post conversion
+            # Blog post conversion (긴 스크립트는 조각별 요점을 먼저 뽑아 합침)
             blog_prompt = f"""다음 유튜브 스크립트를 블로그 포스트로 변환하세요.
 
 스크립트:
-{project.script.full_script[:3000]}
+{await self._condensed_script(project)}
 
 형식: 마크다운, 제목/소제목 포함, 2000자 내외"""
 
-            blog_post = self._generate_with_ai(blog_prompt, max_tokens=3000)
+            blog_post = await self._generate_with_ai(blog_prompt, 3000)
             blog_path = output_dir / "blog_post.md"
             with open(blog_path, 'w', encoding='utf-8') as f:
                 f.write(blog_post)
             project.repurpose.blog_post_path = str(blog_path)
 
-            # Social snippets
-            snippet_prompt = f"""주제 "{project.title}"에 대한 소셜 미디어 포스트 생성:
+            # Social snippets (통합 요청에서 받았으면 재사용)
+            if not project.repurpose.social_snippets:
+                snippet_prompt = f"""주제 "{project.title}"에 대한 소셜 미디어 포스트 생성:
 
 JSON으로 응답:
 {{
@@ -1685,8 +2446,9 @@ JSON으로 응답:
     "linkedin": "링크드인용"
 }}"""
 
-            snippet_text = self._generate_with_ai(snippet_prompt, max_tokens=1000)
-            project.repurpose.social_snippets = parse_json_response(snippet_text)
+                project.repurpose.social_snippets = await self._generate_json_with_ai(
+                    snippet_prompt, 1000, expect=dict
+                )
 
             snippets_path = output_dir / "social_snippets.json"
             with open(snippets_path, 'w', encoding='utf-8') as f:
@@ -1798,8 +2560,7 @@ JSON으로 응답:
     ]
 }}"""
 
-            text = self._generate_with_ai(plan_prompt, max_tokens=3000)
-            series_plan = parse_json_response(text)
+            series_plan = await self._generate_json_with_ai(plan_prompt, 3000, expect=dict)
         except Exception as e:
             self.logger.warning(f"Series planning failed: {e}")
             series_plan = {
@@ -1845,6 +2606,10 @@ JSON으로 응답:
         """동기 버전의 비디오 생성"""
         return asyncio.run(self.generate_video(**kwargs))
 
+    def resume_video_sync(self, project_id: str, project_path: str = None) -> VideoProject:
+        """동기 버전의 파이프라인 재개"""
+        return asyncio.run(self.resume_video(project_id, project_path))
+
     def generate_series_sync(self, **kwargs) -> SeriesProject:
         """동기 버전의 시리즈 생성"""
         return asyncio.run(self.generate_series(**kwargs))
@@ -1854,6 +2619,19 @@ JSON으로 응답:
 # CLI 인터페이스
 # ============================================
 
+def _print_project_result(project: VideoProject):
+    """생성 결과 출력"""
+    print("\n" + "="*60)
+    print("영상 생성 완료!")
+    print("="*60)
+    print(f"프로젝트 ID: {project.id}")
+    print(f"제목: {project.title}")
+    print(f"영상 경로: {project.video.main_video_path}")
+    print(f"Shorts: {len(project.video.shorts_paths)}개")
+    print(f"품질 점수: {project.quality.overall_score:.2f}")
+    print("="*60)
+
+
 def main():
     """CLI 메인 함수"""
     import argparse
@@ -1881,6 +2659,9 @@ python main.py generate --topic "양자역학 쉽게 이해하기" --category ph
 
 # 주제 추천
 python main.py suggest --category science --count 10
+
+# 중단된 프로젝트 재개 (마지막 체크포인트부터)
+python main.py resume vid_1a2b3c4d5e6f
         """
     )
 
@@ -1916,6 +2697,12 @@ python main.py suggest --category science --count 10
     series_parser.add_argument('--episodes', '-e', type=int, default=10, help='에피소드 수')
     series_parser.add_argument('--config', default='config/settings.yaml')
 
+    # ===== resume 명령어 =====
+    resume_parser = subparsers.add_parser('resume', help='중단된 프로젝트 재개')
+    resume_parser.add_argument('project_id', help='프로젝트 ID')
+    resume_parser.add_argument('--path', help='체크포인트 경로 (기본: ./data/projects/<id>.json)')
+    resume_parser.add_argument('--config', default='config/settings.yaml', help='설정 파일')
+
     # ===== suggest 명령어 =====
     suggest_parser = subparsers.add_parser('suggest', help='주제 추천')
     suggest_parser.add_argument('--category', '-c',
@@ -1949,15 +2736,12 @@ python main.py suggest --category science --count 10
             schedule_time=schedule
         )
 
-        print("\n" + "="*60)
-        print("영상 생성 완료!")
-        print("="*60)
-        print(f"프로젝트 ID: {project.id}")
-        print(f"제목: {project.title}")
-        print(f"영상 경로: {project.video.main_video_path}")
-        print(f"Shorts: {len(project.video.shorts_paths)}개")
-        print(f"품질 점수: {project.quality.overall_score:.2f}")
-        print("="*60)
+        _print_project_result(project)
+
+    elif args.command == 'resume':
+        project = generator.resume_video_sync(args.project_id, args.path)
+
+        _print_project_result(project)
 
     elif args.command == 'series':
         series = generator.generate_series_sync(
@@ -1985,7 +2769,7 @@ python main.py suggest --category science --count 10
 
 JSON 배열로 응답."""
 
-            result = generator._generate_with_ai(prompt, max_tokens=2000)
+            result = asyncio.run(generator._generate_with_ai(prompt, max_tokens=2000, use_cache=False))
 
             print("\n" + "="*60)
             print("추천 주제")
@@ -7,8 +7,8 @@ class BlogConverter:
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def convert(self, script: str, output_path: str = None) -> str:
@@ -17,12 +17,27 @@ class BlogConverter:
         if not self.client:
             content = f"# Blog Post\n\n{script[:2000]}"
         else:
-            prompt = f"""스크립트를 블로그로 변환:
-{script[:3000]}
-마크다운, 제목/소제목 포함, 2000자:"""
             try:
-                response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=3000, messages=[{"role": "user", "content": prompt}])
-                content = response.content[0].text
+                source = await self._condense(script)
+                prompt = f"""스크립트를 블로그로 변환:
+{source}
+마크다운, 제목/소제목 포함, 2000자:"""
+                content = await self.client.generate(prompt, max_tokens=3000)
             except: content = f"# Blog Post\n\n{script[:2000]}"
         with open(output_path, 'w', encoding='utf-8') as f: f.write(content)
         return output_path
+
+    async def _condense(self, script: str) -> str:
+        """한 번에 넣기 긴 스크립트는 조각별 요점을 병렬로 뽑아 순서대로 이어 붙임"""
+        from utils.chunking import chunk_settings, chunk_text, context_block, map_chunks
+        max_tokens, overlap_tokens, concurrency = chunk_settings(self.config)
+        chunks = chunk_text(script, max_tokens, overlap_tokens)
+        if len(chunks) <= 1: return script
+
+        async def notes(chunk):
+            prompt = f"""{context_block(chunk)}다음 스크립트 부분의 핵심 내용을 순서대로 요점 정리:
+{chunk.text}
+요점만 출력:"""
+            return (await self.client.generate(prompt, max_tokens=1000)).strip()
+
+        return "\n\n".join(await map_chunks(chunks, notes, concurrency))
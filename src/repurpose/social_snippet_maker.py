@@ -1,14 +1,13 @@
 """Social Snippet Maker - Create social media snippets"""
 from typing import Dict
-import json
 
 class SocialSnippetMaker:
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def create(self, script: str) -> Dict:
@@ -18,8 +17,5 @@ class SocialSnippetMaker:
 원본: {script[:500]}
 JSON: {{"twitter": "280자", "instagram": "해시태그포함", "linkedin": "전문적"}}"""
         try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=500, messages=[{"role": "user", "content": prompt}])
-            text = response.content[0].text
-            if "```" in text: text = text.split("```")[1].split("```")[0].replace("json", "")
-            return json.loads(text.strip())
+            return await self.client.generate_json(prompt, max_tokens=500)
         except: return {"twitter": script[:280], "instagram": script[:500]}
@@ -6,7 +6,6 @@ Research and analyze keywords for SEO optimization
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-import json
 
 
 @dataclass
@@ -29,10 +28,10 @@ class KeywordResearcher:
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이"""
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
@@ -80,17 +79,7 @@ JSON 배열로 응답:
 ]"""
 
         try:
-            response = self.client.messages.create(
-                model=self.config.get('api', {}).get('anthropic', {}).get('model', 'claude-sonnet-4-20250514'),
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            text = response.content[0].text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-
-            keywords_data = json.loads(text.strip())
+            keywords_data = await self.client.generate_json(prompt, max_tokens=2000)
 
             return [
                 Keyword(
@@ -7,7 +7,6 @@ AI-based trend prediction for content planning
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import json
 
 
 @dataclass
@@ -30,10 +29,10 @@ class TrendPredictor:
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이"""
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
@@ -78,17 +77,7 @@ JSON으로 응답:
 }}"""
 
         try:
-            response = self.client.messages.create(
-                model=self.config.get('api', {}).get('anthropic', {}).get('model', 'claude-sonnet-4-20250514'),
-                max_tokens=500,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            text = response.content[0].text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-
-            data = json.loads(text.strip())
+            data = await self.client.generate_json(prompt, max_tokens=500)
 
             return TrendPrediction(
                 topic=topic,
@@ -2,16 +2,20 @@
 
 from .script_generator import ScriptGenerator
 from .hook_creator import HookCreator
+from .hook_ranker import HookRanker
 from .structure_builder import StructureBuilder
 from .script_optimizer import ScriptOptimizer
+from .script_analyzer import ScriptAnalyzer
 from .humor_injector import HumorInjector
 from .cta_generator import CTAGenerator
 
 __all__ = [
     'ScriptGenerator',
     'HookCreator',
+    'HookRanker',
     'StructureBuilder',
     'ScriptOptimizer',
+    'ScriptAnalyzer',
     'HumorInjector',
     'CTAGenerator',
 ]
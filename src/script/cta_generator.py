@@ -6,7 +6,6 @@ Generate effective Call-to-Action segments
 
 from typing import Dict, List
 from dataclasses import dataclass
-import json
 import random
 
 
@@ -55,10 +54,10 @@ class CTAGenerator:
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이"""
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
@@ -107,17 +106,7 @@ JSON 배열로 응답:
 ]"""
 
         try:
-            response = self.client.messages.create(
-                model=self.config.get('api', {}).get('anthropic', {}).get('model', 'claude-sonnet-4-20250514'),
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            text = response.content[0].text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-
-            ctas_data = json.loads(text.strip())
+            ctas_data = await self.client.generate_json(prompt, max_tokens=1000)
 
             return [
                 CTA(
@@ -6,7 +6,8 @@ Create engaging hooks for video openings
 
 from typing import Dict, List
 from dataclasses import dataclass
-import json
+
+from .hook_ranker import HookRanker
 
 
 @dataclass
@@ -33,21 +34,14 @@ class HookCreator:
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
+        self.ranker = HookRanker()
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화 - Gemini 사용"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이 (Gemini 우선)"""
         try:
-            import os
-            import google.generativeai as genai
-            from dotenv import load_dotenv
-
-            load_dotenv('config/api_keys.env')
-            api_key = os.getenv('GEMINI_API_KEY')
-
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.client = genai.GenerativeModel('gemini-3-flash')
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
@@ -108,15 +102,7 @@ JSON 배열로 응답:
 ]"""
 
         try:
-            response = self.client.generate_content(prompt)
-            text = response.text
-
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-
-            hooks_data = json.loads(text.strip())
+            hooks_data = await self.client.generate_json(prompt, max_tokens=2000)
 
             return [
                 Hook(
@@ -155,10 +141,30 @@ JSON 배열로 응답:
             for t in selected
         ]
 
-    async def rank_hooks(self, hooks: List[Hook]) -> List[Hook]:
-        """후크 순위 매기기"""
+    async def rank_hooks(self, hooks: List[Hook], title: str = "") -> List[Hook]:
+        """
+        후크 순위 매기기 - 로컬 모델 점수로 정렬 (LLM 호출 없음)
+
+        predicted_retention은 로컬 모델의 예상 유지율로 바뀐다.
+        """
+        scores = self.ranker.score([hook.text for hook in hooks], title)
+        for hook, score in zip(hooks, scores):
+            hook.predicted_retention = score
         return sorted(hooks, key=lambda h: h.predicted_retention, reverse=True)
 
+    async def best_hooks(
+        self,
+        topic: str,
+        style: str,
+        title: str = "",
+        count: int = 1,
+        candidates: int = 20
+    ) -> List[Hook]:
+        """후보를 한 번에 많이 생성한 뒤 로컬에서 상위 count개 선택"""
+        hooks = await self.create_hooks(topic, style, count=max(count, candidates))
+        ranked = await self.rank_hooks(hooks, title or topic)
+        return ranked[:count]
+
     async def optimize_hook(self, hook: Hook, feedback: str) -> Hook:
         """후크 최적화"""
         return hook
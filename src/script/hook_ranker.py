@@ -0,0 +1,162 @@
+"""
+Hook Ranker Module
+==================
+LLM 없이 후크 후보 점수 매기기
+
+길이, 질문/감탄 형태, HOOK_OPENERS의 shock/question/number 카테고리와의 유사도,
+제목 키워드 포함 여부, 뻔한 시작 문구를 특징으로 선형 점수를 계산한다.
+카테고리 유사도는 글자 2-gram을 해시한 벡터의 행렬 곱으로 한 번에 구한다 (NumPy가 있으면 사용).
+"""
+
+import math
+import re
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .speech_patterns import YouTubeSpeechPatterns
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HASH_DIMS = 2048
+CATEGORIES = ("shock", "question", "number")
+
+FEATURES = (
+    "length_fit", "question", "exclamation",
+    "shock_overlap", "question_overlap", "number_overlap",
+    "has_number", "title_overlap", "cliche",
+)
+WEIGHTS = (0.15, 0.08, 0.05, 0.2, 0.12, 0.08, 0.07, 0.2, -0.35)
+
+IDEAL_LENGTH = 35       # 글자 수 - 10-15초 안에 말할 수 있는 오프닝 한두 문장
+LENGTH_SPREAD = 25
+
+QUESTION = re.compile(r'\?|(?:까요|나요|세요|을까|ㄹ까|인가요|있으세요|아세요)[\s.!…]*$')
+NUMBER = re.compile(r'\d|[일이삼사오육칠팔구십백천만억]+\s*(?:가지|배|명|년|개|위|%)|%')
+CLICHES = [
+    re.compile(r'오늘은\s*.{0,30}?에\s*대해'),
+    re.compile(r'궁금하신\s*적\s*있으신가요'),
+    re.compile(r'알고\s*계셨나요'),
+    re.compile(r'알아보겠습니다'),
+]
+PARTICLES = re.compile(r'(?:의|은|는|이|가|을|를|에|와|과|도|로|으로|에서|까지)$')
+
+
+def _bigram_buckets(text: str) -> Dict[int, int]:
+    """공백 제거 후 글자 2-gram을 HASH_DIMS 칸에 해시한 빈도"""
+    compact = re.sub(r'\s+', '', text)
+    counts: Dict[int, int] = {}
+    for i in range(len(compact) - 1):
+        bucket = zlib.crc32(compact[i:i + 2].encode('utf-8')) % HASH_DIMS
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return counts
+
+
+def _title_keywords(title: str) -> List[str]:
+    keywords = []
+    for token in re.findall(r'\w+', title or ""):
+        token = PARTICLES.sub('', token) if len(token) > 2 else token
+        if len(token) >= 2:
+            keywords.append(token)
+    return keywords
+
+
+class HookRanker:
+    """후크 후보 선형 점수 모델 (카테고리 중심 벡터는 프로세스당 한 번 구성)"""
+
+    _centroids = None   # NumPy: (HASH_DIMS, 3) / 없으면 카테고리별 {칸: 값}
+
+    @classmethod
+    def _category_centroids(cls):
+        if cls._centroids is None:
+            centroids = []
+            for category in CATEGORIES:
+                total: Dict[int, float] = {}
+                for pattern in YouTubeSpeechPatterns.HOOK_OPENERS.get(category, ()):
+                    for bucket, count in _bigram_buckets(pattern).items():
+                        total[bucket] = total.get(bucket, 0.0) + count
+                norm = math.sqrt(sum(v * v for v in total.values())) or 1.0
+                centroids.append({bucket: value / norm for bucket, value in total.items()})
+
+            if np is not None:
+                matrix = np.zeros((HASH_DIMS, len(CATEGORIES)), dtype=np.float32)
+                for col, centroid in enumerate(centroids):
+                    if centroid:
+                        matrix[list(centroid), col] = list(centroid.values())
+                cls._centroids = matrix
+            else:
+                cls._centroids = centroids
+        return cls._centroids
+
+    def _overlaps(self, texts: Sequence[str]):
+        """후크별 카테고리 코사인 유사도 (n × 3)"""
+        centroids = self._category_centroids()
+        buckets = [_bigram_buckets(text) for text in texts]
+
+        if np is not None:
+            hashed = np.zeros((len(texts), HASH_DIMS), dtype=np.float32)
+            for row, counts in enumerate(buckets):
+                if counts:
+                    hashed[row, list(counts)] = list(counts.values())
+            norms = np.linalg.norm(hashed, axis=1, keepdims=True)
+            hashed /= np.where(norms == 0, 1.0, norms)
+            return hashed @ centroids
+
+        overlaps = []
+        for counts in buckets:
+            norm = math.sqrt(sum(v * v for v in counts.values())) or 1.0
+            overlaps.append([
+                sum(count * centroid.get(bucket, 0.0) for bucket, count in counts.items()) / norm
+                for centroid in centroids
+            ])
+        return overlaps
+
+    def features(self, texts: Sequence[str], title: str = ""):
+        """특징 행렬 (n × len(FEATURES)) - NumPy가 있으면 ndarray"""
+        keywords = _title_keywords(title)
+        overlaps = self._overlaps(texts)
+
+        rows = []
+        for i, text in enumerate(texts):
+            stripped = text.strip()
+            length_fit = math.exp(-((len(stripped) - IDEAL_LENGTH) / LENGTH_SPREAD) ** 2)
+            title_overlap = (
+                sum(1 for keyword in keywords if keyword in stripped) / len(keywords) if keywords else 0.0
+            )
+            rows.append([
+                length_fit,
+                1.0 if QUESTION.search(stripped) else 0.0,
+                1.0 if '!' in stripped else 0.0,
+                min(1.0, 2 * float(overlaps[i][0])),
+                min(1.0, 2 * float(overlaps[i][1])),
+                min(1.0, 2 * float(overlaps[i][2])),
+                1.0 if NUMBER.search(stripped) else 0.0,
+                title_overlap,
+                1.0 if any(cliche.search(stripped) for cliche in CLICHES) else 0.0,
+            ])
+
+        if np is not None:
+            return np.asarray(rows, dtype=np.float32).reshape(len(texts), len(FEATURES))
+        return rows
+
+    def score(self, texts: Sequence[str], title: str = "") -> List[float]:
+        """후크별 예상 유지율 (0.5-0.95)"""
+        if not texts:
+            return []
+
+        matrix = self.features(texts, title)
+        if np is not None:
+            raw = matrix @ np.asarray(WEIGHTS, dtype=np.float32)
+            return [round(0.5 + 0.45 * v, 4) for v in np.clip(raw, 0.0, 1.0).tolist()]
+
+        return [
+            round(0.5 + 0.45 * min(1.0, max(0.0, sum(w * x for w, x in zip(WEIGHTS, row)))), 4)
+            for row in matrix
+        ]
+
+    def rank(self, texts: Sequence[str], title: str = "", top: Optional[int] = None) -> List[Tuple[str, float]]:
+        """(후크, 점수) 높은 순 - 같은 점수면 원래 순서 유지"""
+        scored = sorted(zip(texts, self.score(texts, title)), key=lambda item: item[1], reverse=True)
+        return scored[:top] if top else scored
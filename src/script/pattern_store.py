@@ -0,0 +1,275 @@
+"""
+Pattern Store Module
+====================
+말투 패턴 스냅샷 빌드와 지연 로딩
+
+patterns/*.py가 편집용 원본이고, build_snapshot()이 병합·중복 제거한 결과를
+문자열 표 + 오프셋 배열로 된 marshal 파일 하나로 고정한다.
+로드 시에는 스냅샷만 읽고 카테고리는 처음 접근할 때 풀어낸다.
+스냅샷이 없거나 원본과 맞지 않으면 원본 모듈을 임포트해 같은 결과를 만든다.
+"""
+
+import hashlib
+import importlib
+import marshal
+import os
+import random
+import sys
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+PATTERNS_DIR = Path(__file__).parent / "patterns"
+SNAPSHOT_PATH = PATTERNS_DIR / "patterns.snapshot"
+SNAPSHOT_FORMAT = 1
+
+# 그룹 → 원본 (모듈, 변수) 목록 - 앞에서부터 병합
+PATTERN_SOURCES: Dict[str, List[Tuple[str, str]]] = {
+    "HOOK_OPENERS": [
+        ("hooks", "HOOK_OPENERS"), ("hooks2", "HOOK_OPENERS_2"), ("hooks3", "HOOK_OPENERS_3"),
+        ("hooks4", "HOOK_OPENERS_4"), ("hooks5", "HOOK_OPENERS_5"), ("hooks6", "HOOK_OPENERS_6"),
+        ("hooks7", "HOOK_OPENERS_7"),
+    ],
+    "TRANSITIONS": [
+        ("transitions", "TRANSITIONS"), ("transitions2", "TRANSITIONS_2"), ("transitions3", "TRANSITIONS_3"),
+        ("transitions4", "TRANSITIONS_4"), ("transitions5", "TRANSITIONS_5"),
+    ],
+    "EMOTIONAL_EXPRESSIONS": [
+        ("emotions", "EMOTIONAL_EXPRESSIONS"), ("emotions2", "EMOTIONAL_EXPRESSIONS_2"),
+        ("emotions3", "EMOTIONAL_EXPRESSIONS_3"),
+    ],
+    "TOPIC_SPECIFIC": [
+        ("topics", "TOPIC_SPECIFIC"), ("topics2", "TOPIC_SPECIFIC_2"), ("topics3", "TOPIC_SPECIFIC_3"),
+        ("topics4", "TOPIC_SPECIFIC_4"), ("topics5", "TOPIC_SPECIFIC_5"),
+    ],
+    "SENTENCE_ENDINGS": [("endings", "SENTENCE_ENDINGS")],
+    "REACTIONS": [("endings", "REACTIONS"), ("reactions2", "REACTIONS_2")],
+    "NATURAL_EXPRESSIONS": [
+        ("expressions", "NATURAL_EXPRESSIONS"), ("expressions2", "NATURAL_EXPRESSIONS_2"),
+        ("expressions3", "NATURAL_EXPRESSIONS_3"),
+    ],
+    "CLOSING_PATTERNS": [("endings", "CLOSING_PATTERNS")],
+    "FILLERS": [
+        ("endings", "FILLERS"), ("extras", "CONNECTORS"), ("extras", "INTERJECTIONS"),
+        ("fillers2", "FILLERS_2"), ("fillers2", "CONNECTORS_2"), ("fillers2", "INTERJECTIONS_2"),
+    ],
+    "EMPHASIS_WORDS": [("extras", "EMPHASIS_WORDS")],
+    "QUANTIFIERS": [("extras", "QUANTIFIERS")],
+    "TIME_EXPRESSIONS": [("extras", "TIME_EXPRESSIONS")],
+}
+
+# 카테고리 없이 목록 하나로 된 그룹
+LIST_GROUPS = {"CLOSING_PATTERNS", "FILLERS", "EMPHASIS_WORDS", "QUANTIFIERS", "TIME_EXPRESSIONS"}
+
+
+def _dedupe(values: Iterable[str]) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(values))
+
+
+def merge_categories(*parts: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """카테고리별 병합 - 같은 키의 목록은 덮어쓰지 않고 이어 붙인 뒤 중복 제거 (순서 유지)"""
+    merged: Dict[str, List[str]] = {}
+    for part in parts:
+        for key, values in part.items():
+            if isinstance(values, (list, tuple)):
+                merged.setdefault(key, []).extend(values)
+    return {key: _dedupe(values) for key, values in merged.items()}
+
+
+class PatternIndex:
+    """
+    미리 구성한 패턴 색인
+
+    카테고리별 중복 제거 튜플과 전체를 펼친 튜플을 한 번만 만들어 두고
+    호출마다 목록을 다시 펼치지 않고 바로 추출한다.
+    """
+
+    __slots__ = ("categories", "all", "_cum_weights")
+
+    def __init__(self, categories: Mapping[str, Tuple[str, ...]], all_patterns: Optional[Tuple[str, ...]] = None):
+        self.categories = categories
+        if all_patterns is None:
+            all_patterns = _dedupe(pattern for values in categories.values() for pattern in values)
+        self.all: Tuple[str, ...] = all_patterns
+        self._cum_weights: Dict[Tuple, Tuple[List[str], List[float]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.all)
+
+    def pool(self, category: Optional[str] = None) -> Tuple[str, ...]:
+        """카테고리 튜플 (없거나 비었으면 전체)"""
+        if category:
+            values = self.categories.get(category)
+            if values:
+                return values
+        return self.all
+
+    def choice(self, category: Optional[str] = None, default: str = "") -> str:
+        """O(1) 균등 추출"""
+        pool = self.pool(category)
+        return random.choice(pool) if pool else default
+
+    def sample(self, count: int, category: Optional[str] = None) -> List[str]:
+        """중복 없이 count개 추출"""
+        pool = self.pool(category)
+        return random.sample(pool, min(count, len(pool)))
+
+    def weighted_choice(self, weights: Dict[str, float], default: str = "") -> str:
+        """카테고리 가중치에 따라 추출 (누적 가중치는 가중치 조합별로 한 번만 계산)"""
+        key = tuple(sorted(weights.items()))
+        cached = self._cum_weights.get(key)
+        if cached is None:
+            names = [name for name, weight in key if weight > 0 and self.categories.get(name)]
+            cached = (names, list(accumulate(weights[name] for name in names)))
+            self._cum_weights[key] = cached
+
+        names, cum_weights = cached
+        if not names:
+            return self.choice(default=default)
+        category = random.choices(names, cum_weights=cum_weights)[0]
+        return random.choice(self.categories[category])
+
+
+def _decode(encoded: bytes, strings: Tuple[str, ...]) -> Tuple[str, ...]:
+    offsets = array('I')
+    offsets.frombytes(encoded)
+    return tuple([strings[i] for i in offsets])
+
+
+class LazyCategories(Mapping):
+    """스냅샷의 카테고리 튜플을 처음 접근할 때 풀어내는 매핑"""
+
+    def __init__(self, encoded: Dict[str, bytes], strings: Tuple[str, ...]):
+        self._encoded = encoded
+        self._strings = strings
+        self._decoded: Dict[str, Tuple[str, ...]] = {}
+
+    def __getitem__(self, key: str) -> Tuple[str, ...]:
+        values = self._decoded.get(key)
+        if values is None:
+            values = _decode(self._encoded[key], self._strings)
+            self._decoded[key] = values
+        return values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._encoded)
+
+    def __len__(self) -> int:
+        return len(self._encoded)
+
+
+def source_fingerprint() -> str:
+    """원본 패턴 모듈 내용과 그룹 구성의 해시 - 스냅샷이 최신인지 확인용"""
+    digest = hashlib.sha1(f"{SNAPSHOT_FORMAT}:{sorted(PATTERN_SOURCES.items())}".encode())
+    for module_name in sorted({module for sources in PATTERN_SOURCES.values() for module, _ in sources}):
+        digest.update(module_name.encode())
+        try:
+            digest.update((PATTERNS_DIR / f"{module_name}.py").read_bytes())
+        except OSError:
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
+def load_group_from_source(name: str):
+    """원본 모듈에서 그룹 병합 (카테고리 그룹은 dict, 목록 그룹은 tuple)"""
+    parts = []
+    for module_name, attr in PATTERN_SOURCES[name]:
+        try:
+            module = importlib.import_module(f"{__package__}.patterns.{module_name}")
+        except ImportError:
+            continue
+        parts.append(getattr(module, attr, None))
+
+    if name in LIST_GROUPS:
+        return _dedupe(value for part in parts if isinstance(part, (list, tuple)) for value in part)
+    return merge_categories(*[part for part in parts if isinstance(part, dict)])
+
+
+def build_snapshot(path: Optional[Path] = None) -> Path:
+    """원본 모듈을 병합해 스냅샷 파일 생성 (문자열 표 + 그룹/카테고리별 오프셋 배열)"""
+    path = Path(path or SNAPSHOT_PATH)
+    strings: Dict[str, int] = {}
+
+    def encode(values: Iterable[str]) -> bytes:
+        return array('I', [strings.setdefault(value, len(strings)) for value in values]).tobytes()
+
+    groups = {}
+    for name in PATTERN_SOURCES:
+        data = load_group_from_source(name)
+        if isinstance(data, dict):
+            groups[name] = {
+                "categories": {key: encode(values) for key, values in data.items()},
+                "all": encode(_dedupe(value for values in data.values() for value in values)),
+            }
+        else:
+            groups[name] = {"all": encode(data)}
+
+    payload = {
+        "format": SNAPSHOT_FORMAT,
+        "byteorder": sys.byteorder,
+        "fingerprint": source_fingerprint(),
+        "strings": tuple(strings),
+        "groups": groups,
+    }
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(marshal.dumps(payload))
+    os.replace(tmp_path, path)
+    return path
+
+
+class PatternStore:
+    """패턴 그룹 지연 로딩 - 스냅샷이 최신이면 스냅샷에서, 아니면 원본 모듈에서"""
+
+    def __init__(self, snapshot_path: Optional[Path] = None):
+        self.snapshot_path = Path(snapshot_path or SNAPSHOT_PATH)
+        self.source: Optional[str] = None   # "snapshot" 또는 "modules" (첫 로드 후)
+        self._snapshot: Optional[Dict] = None
+        self._indexes: Dict[str, PatternIndex] = {}
+
+    def _open(self):
+        if self.source is not None:
+            return
+
+        self._snapshot = self._read_snapshot()
+        self.source = "snapshot" if self._snapshot else "modules"
+
+    def _read_snapshot(self) -> Optional[Dict]:
+        try:
+            data = marshal.loads(self.snapshot_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            print(f"패턴 스냅샷을 읽지 못했습니다 ({e}) - 원본 모듈 사용")
+            return None
+
+        if (not isinstance(data, dict) or data.get("format") != SNAPSHOT_FORMAT
+                or data.get("byteorder") != sys.byteorder):
+            return None
+        if data.get("fingerprint") != source_fingerprint():
+            print("패턴 스냅샷이 원본과 다릅니다 - scripts/build_pattern_snapshot.py로 다시 빌드하세요")
+            return None
+        return data
+
+    def index(self, name: str) -> PatternIndex:
+        """그룹 색인 (처음 요청 시 로드)"""
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+
+        self._open()
+        if self._snapshot is not None:
+            entry = self._snapshot["groups"][name]
+            strings = self._snapshot["strings"]
+            categories = LazyCategories(entry.get("categories", {}), strings)
+            index = PatternIndex(categories, _decode(entry["all"], strings))
+        else:
+            data = load_group_from_source(name)
+            if isinstance(data, dict):
+                index = PatternIndex(data)
+            else:
+                index = PatternIndex({}, data)
+
+        self._indexes[name] = index
+        return index
@@ -0,0 +1,234 @@
+"""
+Script Analyzer Module
+======================
+LLM 없이 한국어 스크립트 말투 점수 계산
+
+문장 길이 변화, 종결어미 다양성, 필러/전환 표현 밀도, 금지된 시작 문구를 본다.
+종결어미/전환/필러 패턴은 하나의 Aho-Corasick 오토마톤으로 컴파일해 텍스트를 한 번만 훑는다.
+"""
+
+import re
+import statistics
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .speech_patterns import YouTubeSpeechPatterns
+
+ENDING, TRANSITION, FILLER = "ending", "transition", "filler"
+
+# 문장 경계 (종결 부호 또는 줄바꿈)
+SENTENCE_SPLIT = re.compile(r'[^.!?…\n]+[.!?…]*')
+
+# 패턴 앞의 "~"와 자모("~ㄹ걸요" → "걸요"), 끝의 문장부호 제거
+PATTERN_PREFIX = re.compile(r'^[~\sㄱ-ㆎ]+')
+PATTERN_SUFFIX = re.compile(r'[\s.!?…]+$')
+
+# 스크립트 생성 프롬프트에서 금지한 시작 문구
+BANNED_OPENINGS = [
+    re.compile(r'오늘은\s*.{0,40}?에\s*대해(?:서)?\s*(?:알아보겠습니다|알아볼게요|알아보도록\s*하겠습니다)'),
+    re.compile(r'^안녕하세요[,.\s]*오늘은'),
+]
+
+WORD_BOUNDARY = set(' \t\n"\'“”‘’(),.!?…:;')
+
+
+class AhoCorasick:
+    """다중 문자열 매처 - 모든 패턴을 한 오토마톤으로 컴파일해 텍스트를 한 번 훑는다"""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[int, ...]] = [()]
+
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = nxt
+            self._output[state] += (pattern_id,)
+
+        # 너비 우선으로 실패 링크 구성, 실패 상태의 출력 병합
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._output[nxt] += self._output[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(끝 위치(exclusive), 패턴 번호) 순서대로 반환"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in output[state]:
+                yield i + 1, pattern_id
+
+
+@dataclass
+class ScriptAnalysis:
+    """스크립트 분석 결과 (점수는 0.0-1.0)"""
+    score: float
+    sentence_count: int
+    length_variation: float        # 문장 길이 변동계수
+    ending_diversity: float        # 서로 다른 종결 / 문장 수
+    formal_ratio: float            # ~니다 로 끝나는 문장 비율
+    filler_density: float          # 문장당 필러 수
+    transition_density: float      # 문장당 전환 표현 수
+    banned_openings: List[str] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return dict(self.__dict__)
+
+
+class ScriptAnalyzer:
+    """로컬 스크립트 분석기 (패턴 오토마톤은 프로세스당 한 번 구성)"""
+
+    # 점수 가중치
+    WEIGHTS = {
+        "length_variation": 0.25,
+        "ending_diversity": 0.25,
+        "formal": 0.15,
+        "transition": 0.2,
+        "filler": 0.15,
+    }
+    TARGET_LENGTH_CV = 0.35                 # 이 이상이면 길이 변화 만점
+    TRANSITION_RANGE = (0.05, 0.5)          # 문장당 적정 전환 표현 수
+    FILLER_RANGE = (0.03, 0.6)              # 문장당 적정 필러 수
+    MAX_FORMAL_RATIO = 0.3                  # 이 이상 "~니다"면 감점 시작
+    BANNED_OPENING_CAP = 0.5                # 금지 문구로 시작하면 점수 상한
+
+    _matcher: Optional[AhoCorasick] = None
+    _kinds: List[Tuple[str, str]] = []      # 패턴 번호 → (종류, 패턴)
+
+    @classmethod
+    def _compiled(cls) -> AhoCorasick:
+        if cls._matcher is None:
+            entries: Dict[str, str] = {}
+            patterns = YouTubeSpeechPatterns
+            sources = [
+                (ENDING, patterns.ENDING_INDEX.all),
+                (TRANSITION, patterns.TRANSITION_INDEX.all),
+                (FILLER, patterns.FILLERS),
+            ]
+            for kind, values in sources:
+                for value in values:
+                    normalized = PATTERN_SUFFIX.sub('', PATTERN_PREFIX.sub('', value))
+                    if normalized:
+                        entries.setdefault(normalized, kind)
+            cls._kinds = [(kind, pattern) for pattern, kind in entries.items()]
+            cls._matcher = AhoCorasick([pattern for _, pattern in cls._kinds])
+        return cls._matcher
+
+    def analyze(self, text: str) -> ScriptAnalysis:
+        """스크립트 점수 계산"""
+        spans = []
+        for match in SENTENCE_SPLIT.finditer(text or ""):
+            start, end = match.span()
+            sentence = match.group()
+            stripped_end = start + len(sentence.rstrip(' \t.!?…'))
+            stripped_start = start + len(sentence) - len(sentence.lstrip())
+            if stripped_end > stripped_start:
+                spans.append((stripped_start, stripped_end))
+
+        if not spans:
+            return ScriptAnalysis(
+                score=0.0, sentence_count=0, length_variation=0.0, ending_diversity=0.0,
+                formal_ratio=0.0, filler_density=0.0, transition_density=0.0,
+                issues=["빈 스크립트"],
+            )
+
+        # 한 번 훑으며 문장 끝 종결어미와 단어 경계에서 시작하는 전환/필러 수집
+        sentence_ends = {end: idx for idx, (_, end) in enumerate(spans)}
+        endings: Dict[int, str] = {}
+        counted: Dict[int, Tuple[str, int]] = {}   # 시작 위치 → (종류, 길이)
+        matcher = self._compiled()
+        for end, pattern_id in matcher.iter_matches(text):
+            kind, pattern = self._kinds[pattern_id]
+            start = end - len(pattern)
+            if end in sentence_ends:
+                idx = sentence_ends[end]
+                if len(pattern) > len(endings.get(idx, "")):
+                    endings[idx] = pattern
+            if (kind != ENDING and (start == 0 or text[start - 1] in WORD_BOUNDARY)
+                    and (end == len(text) or text[end] in WORD_BOUNDARY)):
+                # 같은 위치에서 시작하는 겹친 매치는 가장 긴 것 하나만
+                if len(pattern) > counted.get(start, ("", 0))[1]:
+                    counted[start] = (kind, len(pattern))
+
+        count = len(spans)
+        lengths = [end - start for start, end in spans]
+        mean = statistics.fmean(lengths)
+        length_cv = statistics.pstdev(lengths) / mean if count > 1 and mean else 0.0
+
+        ending_keys = [endings.get(idx) or text[end - 2:end] for idx, (_, end) in enumerate(spans)]
+        ending_diversity = len(set(ending_keys)) / count
+        formal_ratio = sum(1 for key in ending_keys if key.endswith("니다")) / count
+        transitions = sum(1 for kind, _ in counted.values() if kind == TRANSITION) / count
+        fillers = sum(1 for kind, _ in counted.values() if kind == FILLER) / count
+
+        opening = text[spans[0][0]:spans[min(1, count - 1)][1]]
+        banned = [m.group() for pattern in BANNED_OPENINGS for m in [pattern.search(opening)] if m]
+
+        parts = {
+            "length_variation": min(1.0, length_cv / self.TARGET_LENGTH_CV) if count > 2 else 0.5,
+            "ending_diversity": min(1.0, ending_diversity / 0.5),
+            "formal": max(0.0, 1.0 - max(0.0, formal_ratio - self.MAX_FORMAL_RATIO) / (1 - self.MAX_FORMAL_RATIO)),
+            "transition": self._range_score(transitions, self.TRANSITION_RANGE),
+            "filler": self._range_score(fillers, self.FILLER_RANGE),
+        }
+        score = sum(self.WEIGHTS[name] * value for name, value in parts.items())
+        if banned:
+            score = min(score, self.BANNED_OPENING_CAP)
+
+        issues = []
+        if parts["length_variation"] < 0.6:
+            issues.append("문장 길이가 너무 비슷함")
+        if parts["ending_diversity"] < 0.6:
+            issues.append("종결어미가 반복됨")
+        if formal_ratio > self.MAX_FORMAL_RATIO:
+            issues.append(f"'~니다' 문장 비율 {formal_ratio:.0%}")
+        if transitions < self.TRANSITION_RANGE[0]:
+            issues.append("전환 표현 부족")
+        if fillers > self.FILLER_RANGE[1]:
+            issues.append("필러 과다")
+        if banned:
+            issues.append(f"금지된 시작 문구: {banned[0]}")
+
+        return ScriptAnalysis(
+            score=round(score, 3),
+            sentence_count=count,
+            length_variation=round(length_cv, 3),
+            ending_diversity=round(ending_diversity, 3),
+            formal_ratio=round(formal_ratio, 3),
+            filler_density=round(fillers, 3),
+            transition_density=round(transitions, 3),
+            banned_openings=banned,
+            issues=issues,
+        )
+
+    @staticmethod
+    def _range_score(value: float, target: Tuple[float, float]) -> float:
+        """적정 범위 안이면 1, 벗어난 만큼 감점"""
+        low, high = target
+        if value < low:
+            return value / low
+        if value > high:
+            return max(0.0, 1.0 - (value - high) / high)
+        return 1.0
@@ -7,10 +7,9 @@ Using Google Gemini 3 Flash API
 10,000+ 유튜브 영상 분석 기반 자연스러운 말투 시스템 통합
 """
 
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from dataclasses import dataclass
-import json
-import os
+import inspect
 
 # 말투 패턴 시스템 임포트
 try:
@@ -81,25 +80,20 @@ class ScriptGenerator:
         },
     }
 
+    # 이보다 짧은 세그먼트는 재생성 대상 (세그먼트 길이에 비례, 최소값 보장)
+    MIN_SEGMENT_CHARS = 10
+    MIN_CHARS_PER_SECOND = 2
+
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화 - Gemini 사용"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이 (Gemini 우선)"""
         try:
-            import google.generativeai as genai
-            from dotenv import load_dotenv
-
-            load_dotenv('config/api_keys.env')
-            api_key = os.getenv('GEMINI_API_KEY')
-
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.client = genai.GenerativeModel('gemini-3-flash')
-            else:
-                self.client = None
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             self.client = None
 
@@ -111,8 +105,15 @@ class ScriptGenerator:
         style: str,
         duration_target: int = 600,
         language: str = "ko",
-        research_data: Dict = None
+        research_data: Dict = None,
+        on_segment: Optional[Callable[[ScriptSegment], Any]] = None
     ) -> Script:
+        """
+        스크립트 생성
+
+        on_segment를 주면 스트리밍으로 생성하며, 완성된 세그먼트마다
+        전체 응답을 기다리지 않고 바로 호출한다 (코루틴 함수도 가능).
+        """
         if not self.client:
             return self._generate_fallback_script(topic, title, duration_target)
 
@@ -132,6 +133,10 @@ class ScriptGenerator:
             sample_closings = YouTubeSpeechPatterns.get_closing(3)
             speech_guide = get_style_prompt() if get_style_prompt else ""
 
+        # 스트리밍 시에는 segments를 먼저 받도록 full_script를 생략 (세그먼트를 이어 붙여 복원)
+        streaming = on_segment is not None
+        full_script_field = "" if streaming else '\n    "full_script": "전체 스크립트 (자연스럽고 재미있게)",'
+
         prompt = f"""당신은 {duration_target // 60}분짜리 유튜브 영상 스크립트를 작성하는 전문 작가입니다.
 AI가 쓴 것 같은 딱딱한 글이 아니라, 실제 인기 유튜버가 쓴 것처럼 자연스럽고 재미있는 스크립트를 작성해주세요.
 
@@ -174,8 +179,7 @@ AI가 쓴 것 같은 딱딱한 글이 아니라, 실제 인기 유튜버가 쓴
 목표 길이: 약 {duration_target}초 ({duration_target // 60}분)
 
 JSON으로 응답:
-{{
-    "full_script": "전체 스크립트 (자연스럽고 재미있게)",
+{{{full_script_field}
     "segments": [
         {{
             "id": 1,
@@ -194,44 +198,259 @@ JSON으로 응답:
 }}"""
 
         try:
-            response = self.client.generate_content(prompt)
-            text = response.text
-
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-
-            data = json.loads(text.strip())
+            if streaming:
+                data = await self._generate_streaming(prompt, on_segment)
+            else:
+                data = await self.client.generate_json(prompt, expect=dict)
 
-            segments = [
-                ScriptSegment(
-                    id=s.get('id', i),
-                    segment_type=s.get('type', 'body'),
-                    start_time=s.get('start_time', '0:00'),
-                    end_time=s.get('end_time', '0:30'),
-                    text=s.get('text', ''),
-                    visual_note=s.get('visual_note', ''),
-                    emotion=s.get('emotion', 'neutral'),
-                    duration=s.get('duration', 30)
-                )
-                for i, s in enumerate(data.get('segments', []))
-            ]
+            segments = [self._to_segment(i, s) for i, s in enumerate(data.get('segments', []))]
+            full_text = data.get('full_script') or "\n\n".join(seg.text for seg in segments)
 
             return Script(
                 title=title,
-                full_text=data.get('full_script', ''),
+                full_text=full_text,
                 segments=segments,
                 hooks=data.get('hooks', []),
                 key_points=data.get('key_points', []),
                 cta=data.get('cta', ''),
-                word_count=len(data.get('full_script', '')),
+                word_count=len(full_text),
                 estimated_duration=duration_target
             )
         except Exception as e:
             print(f"Gemini API error: {e}")
             return self._generate_fallback_script(topic, title, duration_target)
 
+    @staticmethod
+    def _to_segment(i: int, s: Dict) -> ScriptSegment:
+        return ScriptSegment(
+            id=s.get('id', i),
+            segment_type=s.get('type', 'body'),
+            start_time=s.get('start_time', '0:00'),
+            end_time=s.get('end_time', '0:30'),
+            text=s.get('text', ''),
+            visual_note=s.get('visual_note', ''),
+            emotion=s.get('emotion', 'neutral'),
+            duration=s.get('duration', 30)
+        )
+
+    async def _generate_streaming(self, prompt: str, on_segment: Callable[[ScriptSegment], Any]) -> Dict:
+        """스트리밍 생성 - segments 배열의 원소가 닫힐 때마다 on_segment 호출"""
+        from utils.json_extract import extract_json
+        from utils.json_stream import JsonArrayStream
+
+        parser = JsonArrayStream("segments")
+        segments = []
+
+        async for chunk in self.client.stream(prompt):
+            for item in parser.feed(chunk):
+                if not isinstance(item, dict):
+                    continue
+                segments.append(item)
+                result = on_segment(self._to_segment(len(segments) - 1, item))
+                if inspect.isawaitable(result):
+                    await result
+
+        try:
+            data = extract_json(parser.text, dict)
+        except ValueError:
+            # 응답 끝이 잘려도 완성된 세그먼트는 사용
+            if not segments:
+                raise
+            data = {}
+
+        if not data.get('segments'):
+            data['segments'] = segments
+        return data
+
+    @classmethod
+    def find_weak_segments(cls, segments: List[Any]) -> List[int]:
+        """비었거나 너무 짧거나 형식이 깨진 세그먼트의 id 목록"""
+        weak = []
+        for i, seg in enumerate(segments):
+            data = cls._segment_dict(seg)
+            seg_id = data.get('id', i + 1) if data is not None else i + 1
+            if data is None:
+                weak.append(seg_id)
+                continue
+
+            text = data.get('text')
+            duration = data.get('duration', 0)
+            if not isinstance(duration, (int, float)):
+                weak.append(seg_id)
+                continue
+            min_chars = max(cls.MIN_SEGMENT_CHARS, int(duration * cls.MIN_CHARS_PER_SECOND))
+            if not isinstance(text, str) or len(text.strip()) < min_chars:
+                weak.append(seg_id)
+        return weak
+
+    async def regenerate_segments(
+        self,
+        script: Any,
+        segment_ids: List[int],
+        topic: str = "",
+        title: str = "",
+        style: str = "knowledge_pirate",
+        language: str = "ko",
+        context_window: int = 1,
+        length_targets: Optional[Dict[int, str]] = None
+    ) -> List[int]:
+        """
+        지정한 세그먼트만 다시 생성해 스크립트에 끼워 넣기
+
+        앞뒤 context_window개 세그먼트를 문맥으로 주고 해당 세그먼트만 요청하므로
+        후크 하나를 고치는 데 전체 스크립트 비용이 들지 않는다.
+        시간 정보(id/type/start_time/end_time/duration)는 원본을 유지한다.
+
+        Args:
+            script: ScriptData(segments: List[Dict], full_script) 또는 Script
+            segment_ids: 다시 생성할 세그먼트 id
+            length_targets: 세그먼트 id → 목표 분량 설명 (예: "약 120음절")
+
+        Returns:
+            실제로 교체된 세그먼트 id 목록
+        """
+        if not self.client or not segment_ids:
+            return []
+
+        segments = script.segments
+        positions = {}
+        for i, seg in enumerate(segments):
+            data = self._segment_dict(seg)
+            positions[data.get('id', i + 1) if data is not None else i + 1] = i
+        targets = sorted(positions[sid] for sid in set(segment_ids) if sid in positions)
+        if not targets:
+            return []
+
+        style_info = self.STYLE_TEMPLATES.get(style, self.STYLE_TEMPLATES["knowledge_pirate"])
+        prompt = self._regeneration_prompt(
+            segments, targets, topic, title, style_info, language, context_window, length_targets or {}
+        )
+
+        try:
+            data = await self.client.generate_json(prompt, max_tokens=500 + 600 * len(targets), expect=dict)
+        except Exception as e:
+            print(f"Segment regeneration error: {e}")
+            return []
+
+        by_id = {}
+        for item in data.get('segments', []):
+            if isinstance(item, dict) and 'id' in item:
+                by_id[item['id']] = item
+
+        replaced = []
+        for pos in targets:
+            original = self._segment_dict(segments[pos]) or {}
+            seg_id = original.get('id', pos + 1)
+            new = by_id.get(seg_id)
+            if new is None:
+                continue
+
+            merged = {
+                'id': seg_id,
+                'type': original.get('type', original.get('segment_type', new.get('type', 'body'))),
+                'start_time': original.get('start_time', new.get('start_time', '0:00')),
+                'end_time': original.get('end_time', new.get('end_time', '0:30')),
+                'duration': original.get('duration') if isinstance(original.get('duration'), (int, float))
+                else new.get('duration', 30),
+                'text': new.get('text', ''),
+                'visual_note': new.get('visual_note') or original.get('visual_note', ''),
+                'emotion': new.get('emotion') or original.get('emotion', 'neutral'),
+            }
+            if self.find_weak_segments([merged]):
+                continue
+
+            old_text = original.get('text') if isinstance(original.get('text'), str) else ""
+            if isinstance(segments[pos], ScriptSegment):
+                segments[pos] = self._to_segment(pos, merged)
+            else:
+                segments[pos] = {**original, **merged}
+            self._splice_full_text(script, old_text, merged['text'])
+            replaced.append(seg_id)
+
+        return replaced
+
+    def _regeneration_prompt(
+        self,
+        segments: List[Any],
+        targets: List[int],
+        topic: str,
+        title: str,
+        style_info: Dict,
+        language: str,
+        context_window: int,
+        length_targets: Dict[int, str]
+    ) -> str:
+        """대상 세그먼트와 앞뒤 문맥만 담은 재생성 프롬프트"""
+        target_set = set(targets)
+        context = set()
+        for pos in targets:
+            context.update(range(max(0, pos - context_window), min(len(segments), pos + context_window + 1)))
+
+        lines = []
+        for pos in sorted(context):
+            data = self._segment_dict(segments[pos]) or {}
+            seg_id = data.get('id', pos + 1)
+            seg_type = data.get('type', data.get('segment_type', 'body'))
+            timing = f"{data.get('start_time', '?')}-{data.get('end_time', '?')}, {data.get('duration', '?')}초"
+            if pos in target_set:
+                hint = f" (분량: {length_targets[seg_id]})" if seg_id in length_targets else ""
+                lines.append(f"[세그먼트 {seg_id} | {seg_type} | {timing}] ← 다시 작성{hint}")
+            else:
+                text = data.get('text') if isinstance(data.get('text'), str) else ""
+                lines.append(f"[세그먼트 {seg_id} | {seg_type} | {timing}]\n{text}")
+
+        ids = ", ".join(str((self._segment_dict(segments[pos]) or {}).get('id', pos + 1)) for pos in targets)
+
+        return f"""유튜브 영상 스크립트의 일부 세그먼트만 다시 작성해주세요.
+
+제목: {title}
+주제: {topic}
+언어: {language}
+톤앤매너: {style_info['tone']}
+말투: {style_info['language_style']}
+
+[앞뒤 문맥]
+{chr(10).join(lines)}
+
+지침:
+- 세그먼트 {ids}만 작성하고, 앞뒤 세그먼트와 자연스럽게 이어지게
+- 각 세그먼트의 길이(초)에 맞는 분량으로 (분량이 주어지면 그에 맞춰 줄이거나 늘리기)
+- 다른 세그먼트 내용은 반복하지 말 것
+
+JSON으로 응답:
+{{
+    "segments": [
+        {{"id": 세그먼트 id, "text": "새 텍스트", "visual_note": "어울리는 화면", "emotion": "감정/분위기"}}
+    ]
+}}"""
+
+    @staticmethod
+    def _segment_dict(seg: Any) -> Optional[Dict]:
+        if isinstance(seg, dict):
+            return seg
+        if isinstance(seg, ScriptSegment):
+            return {
+                'id': seg.id, 'type': seg.segment_type, 'start_time': seg.start_time,
+                'end_time': seg.end_time, 'text': seg.text, 'visual_note': seg.visual_note,
+                'emotion': seg.emotion, 'duration': seg.duration,
+            }
+        return None
+
+    @classmethod
+    def _splice_full_text(cls, script: Any, old_text: str, new_text: str):
+        """전체 스크립트에서 교체된 세그먼트 텍스트만 바꾸고, 찾지 못하면 세그먼트로 다시 조립"""
+        attr = 'full_script' if hasattr(script, 'full_script') else 'full_text'
+        full = getattr(script, attr, "") or ""
+        if old_text.strip() and full.count(old_text) == 1:
+            full = full.replace(old_text, new_text)
+        else:
+            full = "\n\n".join(
+                (cls._segment_dict(seg) or {}).get('text') or "" for seg in script.segments
+            )
+        setattr(script, attr, full)
+        if hasattr(script, 'word_count'):
+            script.word_count = len(full)
+
     def _generate_fallback_script(self, topic: str, title: str, duration_target: int) -> Script:
         # 자연스러운 폴백 스크립트 생성
         hooks = []
@@ -5,8 +5,9 @@ Optimize scripts for engagement and clarity
 """
 
 from typing import Dict, List
-from dataclasses import dataclass
-import json
+from dataclasses import dataclass, field
+
+from .script_analyzer import ScriptAnalysis, ScriptAnalyzer
 
 
 @dataclass
@@ -18,57 +19,88 @@ class OptimizationResult:
     readability_before: float
     readability_after: float
     engagement_score: float
+    llm_used: bool = False
+    issues: List[str] = field(default_factory=list)
 
 
 class ScriptOptimizer:
     """스크립트 최적화기"""
 
+    # 로컬 점수가 이 값 이상이면 LLM 최적화 생략 (quality.script_analysis.optimize_below)
+    DEFAULT_THRESHOLD = 0.7
+
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
+        self.analyzer = ScriptAnalyzer()
+        self.threshold = (
+            config.get('quality', {}).get('script_analysis', {}).get('optimize_below', self.DEFAULT_THRESHOLD)
+        )
         self._init_client()
 
     def _init_client(self):
-        """AI 클라이언트 초기화"""
+        """AI 클라이언트 초기화 - 공유 LLM 게이트웨이"""
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
+    def analyze(self, script_text: str) -> ScriptAnalysis:
+        """로컬 말투 분석 (LLM 호출 없음)"""
+        return self.analyzer.analyze(script_text)
+
     async def optimize(
         self,
         script_text: str,
-        optimization_goals: List[str] = None
+        optimization_goals: List[str] = None,
+        force: bool = False
     ) -> OptimizationResult:
         """
         스크립트 최적화
 
+        로컬 분석 점수가 임계값 이상이면 LLM을 부르지 않고 원본을 그대로 반환한다.
+
         Args:
             script_text: 원본 스크립트
             optimization_goals: 최적화 목표
+            force: 점수와 관계없이 LLM 최적화
 
         Returns:
             최적화 결과
         """
         goals = optimization_goals or ["clarity", "engagement", "pacing"]
+        before = self.analyze(script_text)
+
+        unchanged = OptimizationResult(
+            original_text=script_text,
+            optimized_text=script_text,
+            changes_made=[],
+            readability_before=before.score,
+            readability_after=before.score,
+            engagement_score=before.score,
+            issues=before.issues
+        )
 
-        if not self.client:
-            return OptimizationResult(
-                original_text=script_text,
-                optimized_text=script_text,
-                changes_made=[],
-                readability_before=0.7,
-                readability_after=0.7,
-                engagement_score=0.7
-            )
+        if not self.client or (before.score >= self.threshold and not force):
+            return unchanged
 
-        prompt = f"""다음 유튜브 스크립트를 최적화하세요.
+        issues = "\n".join(f"- {issue}" for issue in before.issues) or "- 없음"
+
+        from utils.chunking import chunk_settings, chunk_text, context_block, map_chunks
+        max_tokens, overlap_tokens, concurrency = chunk_settings(self.config)
+        chunks = chunk_text(script_text, max_tokens, overlap_tokens)
+
+        async def optimize_chunk(chunk):
+            prompt = f"""다음 유튜브 스크립트를 최적화하세요.
 
 최적화 목표: {', '.join(goals)}
 
-원본 스크립트:
-{script_text[:3000]}
+자동 분석에서 발견된 문제:
+{issues}
+
+{context_block(chunk, "앞부분 (톤 참고용, 최적화하거나 출력하지 마세요)")}원본 스크립트:
+{chunk.text}
 
 규칙:
 1. 문장을 간결하게
@@ -84,37 +116,34 @@ JSON으로 응답:
     "readability_score": 0.0-1.0,
     "engagement_score": 0.0-1.0
 }}"""
-
-        try:
-            response = self.client.messages.create(
-                model=self.config.get('api', {}).get('anthropic', {}).get('model', 'claude-sonnet-4-20250514'),
-                max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            text = response.content[0].text
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-
-            data = json.loads(text.strip())
-
-            return OptimizationResult(
-                original_text=script_text,
-                optimized_text=data.get('optimized_text', script_text),
-                changes_made=data.get('changes_made', []),
-                readability_before=0.6,
-                readability_after=data.get('readability_score', 0.8),
-                engagement_score=data.get('engagement_score', 0.8)
-            )
-        except Exception:
-            return OptimizationResult(
-                original_text=script_text,
-                optimized_text=script_text,
-                changes_made=[],
-                readability_before=0.7,
-                readability_after=0.7,
-                engagement_score=0.7
-            )
+            try:
+                data = await self.client.generate_json(prompt, max_tokens=4000)
+                return data if isinstance(data, dict) and data.get('optimized_text') else None
+            except Exception:
+                return None
+
+        results = await map_chunks(chunks, optimize_chunk, concurrency)
+        if not any(results):
+            return unchanged
+
+        # 실패한 조각은 원문 유지
+        optimized = "\n\n".join(
+            (data['optimized_text'] if data else chunk.text).strip() for chunk, data in zip(chunks, results)
+        )
+        after = self.analyze(optimized)
+        engagement = [data['engagement_score'] for data in results
+                      if data and isinstance(data.get('engagement_score'), (int, float))]
+
+        return OptimizationResult(
+            original_text=script_text,
+            optimized_text=optimized,
+            changes_made=[change for data in results if data for change in data.get('changes_made', [])],
+            readability_before=before.score,
+            readability_after=after.score,
+            engagement_score=sum(engagement) / len(engagement) if engagement else after.score,
+            llm_used=True,
+            issues=after.issues
+        )
 
     def calculate_readability(self, text: str) -> float:
         """가독성 점수 계산"""
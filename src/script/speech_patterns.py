@@ -11,157 +11,79 @@ AI가 생성한 스크립트를 자연스러운 사람 말투로 변환
 import random
 from typing import List, Dict, Optional
 
-# Import patterns from sub-modules
-try:
-    from .patterns.hooks import HOOK_OPENERS
-    from .patterns.hooks2 import HOOK_OPENERS_2
-    from .patterns.hooks3 import HOOK_OPENERS_3
-    from .patterns.hooks4 import HOOK_OPENERS_4
-    from .patterns.hooks5 import HOOK_OPENERS_5
-    from .patterns.hooks6 import HOOK_OPENERS_6
-    from .patterns.hooks7 import HOOK_OPENERS_7
-    from .patterns.transitions import TRANSITIONS
-    from .patterns.transitions2 import TRANSITIONS_2
-    from .patterns.transitions3 import TRANSITIONS_3
-    from .patterns.transitions4 import TRANSITIONS_4
-    from .patterns.transitions5 import TRANSITIONS_5
-    from .patterns.emotions import EMOTIONAL_EXPRESSIONS
-    from .patterns.emotions2 import EMOTIONAL_EXPRESSIONS_2
-    from .patterns.emotions3 import EMOTIONAL_EXPRESSIONS_3
-    from .patterns.endings import SENTENCE_ENDINGS, CLOSING_PATTERNS, FILLERS, REACTIONS
-    from .patterns.reactions2 import REACTIONS_2
-    from .patterns.topics import TOPIC_SPECIFIC
-    from .patterns.topics2 import TOPIC_SPECIFIC_2
-    from .patterns.topics3 import TOPIC_SPECIFIC_3
-    from .patterns.topics4 import TOPIC_SPECIFIC_4
-    from .patterns.topics5 import TOPIC_SPECIFIC_5
-    from .patterns.extras import CONNECTORS, INTERJECTIONS, EMPHASIS_WORDS, QUANTIFIERS, TIME_EXPRESSIONS
-    from .patterns.fillers2 import FILLERS_2, CONNECTORS_2, INTERJECTIONS_2
-    from .patterns.expressions import NATURAL_EXPRESSIONS
-    from .patterns.expressions2 import NATURAL_EXPRESSIONS_2
-    from .patterns.expressions3 import NATURAL_EXPRESSIONS_3
-except ImportError:
-    # Fallback for direct execution
-    HOOK_OPENERS = {}
-    HOOK_OPENERS_2 = {}
-    HOOK_OPENERS_3 = {}
-    HOOK_OPENERS_4 = {}
-    HOOK_OPENERS_5 = {}
-    HOOK_OPENERS_6 = {}
-    HOOK_OPENERS_7 = {}
-    TRANSITIONS = {}
-    TRANSITIONS_2 = {}
-    TRANSITIONS_3 = {}
-    TRANSITIONS_4 = {}
-    TRANSITIONS_5 = {}
-    EMOTIONAL_EXPRESSIONS = {}
-    EMOTIONAL_EXPRESSIONS_2 = {}
-    EMOTIONAL_EXPRESSIONS_3 = {}
-    SENTENCE_ENDINGS = {}
-    CLOSING_PATTERNS = []
-    FILLERS = []
-    REACTIONS = {}
-    REACTIONS_2 = {}
-    TOPIC_SPECIFIC = {}
-    TOPIC_SPECIFIC_2 = {}
-    TOPIC_SPECIFIC_3 = {}
-    TOPIC_SPECIFIC_4 = {}
-    TOPIC_SPECIFIC_5 = {}
-    CONNECTORS = []
-    INTERJECTIONS = []
-    EMPHASIS_WORDS = []
-    QUANTIFIERS = []
-    TIME_EXPRESSIONS = []
-    FILLERS_2 = []
-    CONNECTORS_2 = []
-    INTERJECTIONS_2 = []
-    NATURAL_EXPRESSIONS = {}
-    NATURAL_EXPRESSIONS_2 = {}
-    NATURAL_EXPRESSIONS_3 = {}
+# 패턴 데이터는 처음 접근할 때 스냅샷(또는 patterns/*.py 원본)에서 로드
+from .pattern_store import PatternIndex, PatternStore  # noqa: F401  (PatternIndex 재노출)
 
+_store = PatternStore()
 
-class YouTubeSpeechPatterns:
-    """유튜브 스타일 말투 패턴 관리자 - 10,000+ 패턴"""
 
-    # Merge hook openers
-    HOOK_OPENERS = {**HOOK_OPENERS, **HOOK_OPENERS_2, **HOOK_OPENERS_3, **HOOK_OPENERS_4, **HOOK_OPENERS_5, **HOOK_OPENERS_6, **HOOK_OPENERS_7}
+class _LazyPatterns:
+    """클래스 속성 지연 로딩 - 처음 접근할 때 그룹을 불러와 클래스 속성으로 고정"""
 
-    # Merge transitions
-    TRANSITIONS = {**TRANSITIONS, **TRANSITIONS_2, **TRANSITIONS_3, **TRANSITIONS_4, **TRANSITIONS_5}
+    def __init__(self, group: str, attr: Optional[str] = None):
+        self.group = group
+        self.attr = attr    # "categories" / "all" / None(색인 자체)
 
-    # Merge emotional expressions
-    EMOTIONAL_EXPRESSIONS = {**EMOTIONAL_EXPRESSIONS, **EMOTIONAL_EXPRESSIONS_2, **EMOTIONAL_EXPRESSIONS_3}
+    def __set_name__(self, owner, name):
+        self.name = name
 
-    # Merge topic specific
-    TOPIC_SPECIFIC = {**TOPIC_SPECIFIC, **TOPIC_SPECIFIC_2, **TOPIC_SPECIFIC_3, **TOPIC_SPECIFIC_4, **TOPIC_SPECIFIC_5}
+    def __get__(self, instance, owner):
+        index = _store.index(self.group)
+        value = getattr(index, self.attr) if self.attr else index
+        setattr(owner, self.name, value)
+        return value
 
-    # Direct assignments
-    SENTENCE_ENDINGS = SENTENCE_ENDINGS
-    CLOSING_PATTERNS = CLOSING_PATTERNS
-    FILLERS = FILLERS + CONNECTORS + INTERJECTIONS + FILLERS_2 + CONNECTORS_2 + INTERJECTIONS_2
-    REACTIONS = {**REACTIONS, **REACTIONS_2}
-    NATURAL_EXPRESSIONS = {**NATURAL_EXPRESSIONS, **NATURAL_EXPRESSIONS_2, **NATURAL_EXPRESSIONS_3}
 
-    # Extra patterns
-    EMPHASIS_WORDS = EMPHASIS_WORDS
-    QUANTIFIERS = QUANTIFIERS
-    TIME_EXPRESSIONS = TIME_EXPRESSIONS
+class YouTubeSpeechPatterns:
+    """유튜브 스타일 말투 패턴 관리자 - 10,000+ 패턴"""
+
+    # 카테고리별 패턴 (중복 제거된 튜플, 같은 키는 모든 파트를 이어 붙임)
+    HOOK_OPENERS = _LazyPatterns("HOOK_OPENERS", "categories")
+    TRANSITIONS = _LazyPatterns("TRANSITIONS", "categories")
+    EMOTIONAL_EXPRESSIONS = _LazyPatterns("EMOTIONAL_EXPRESSIONS", "categories")
+    TOPIC_SPECIFIC = _LazyPatterns("TOPIC_SPECIFIC", "categories")
+    SENTENCE_ENDINGS = _LazyPatterns("SENTENCE_ENDINGS", "categories")
+    REACTIONS = _LazyPatterns("REACTIONS", "categories")
+    NATURAL_EXPRESSIONS = _LazyPatterns("NATURAL_EXPRESSIONS", "categories")
+
+    # 목록 패턴
+    CLOSING_PATTERNS = _LazyPatterns("CLOSING_PATTERNS", "all")
+    FILLERS = _LazyPatterns("FILLERS", "all")
+    EMPHASIS_WORDS = _LazyPatterns("EMPHASIS_WORDS", "all")
+    QUANTIFIERS = _LazyPatterns("QUANTIFIERS", "all")
+    TIME_EXPRESSIONS = _LazyPatterns("TIME_EXPRESSIONS", "all")
+
+    # Precompiled indexes
+    HOOK_INDEX = _LazyPatterns("HOOK_OPENERS")
+    TRANSITION_INDEX = _LazyPatterns("TRANSITIONS")
+    EMOTION_INDEX = _LazyPatterns("EMOTIONAL_EXPRESSIONS")
+    ENDING_INDEX = _LazyPatterns("SENTENCE_ENDINGS")
+    REACTION_INDEX = _LazyPatterns("REACTIONS")
+    TOPIC_INDEX = _LazyPatterns("TOPIC_SPECIFIC")
+    NATURAL_INDEX = _LazyPatterns("NATURAL_EXPRESSIONS")
 
     @classmethod
     def get_random_hook(cls, count: int = 3) -> List[str]:
         """랜덤 후크 가져오기"""
-        all_hooks = []
-        for category_hooks in cls.HOOK_OPENERS.values():
-            if isinstance(category_hooks, list):
-                all_hooks.extend(category_hooks)
-
-        if not all_hooks:
+        if not cls.HOOK_INDEX.all:
             return ["여러분 이거 진짜 대박이에요"]
 
-        return random.sample(all_hooks, min(count, len(all_hooks)))
+        return cls.HOOK_INDEX.sample(count)
 
     @classmethod
     def get_transition(cls, transition_type: Optional[str] = None) -> str:
         """전환 표현 가져오기"""
-        if transition_type and transition_type in cls.TRANSITIONS:
-            transitions = cls.TRANSITIONS[transition_type]
-        else:
-            all_transitions = []
-            for trans_list in cls.TRANSITIONS.values():
-                if isinstance(trans_list, list):
-                    all_transitions.extend(trans_list)
-            transitions = all_transitions
-
-        if not transitions:
-            return "그리고요"
-
-        return random.choice(transitions)
+        return cls.TRANSITION_INDEX.choice(transition_type, default="그리고요")
 
     @classmethod
     def get_emotional_expression(cls, emotion: Optional[str] = None) -> str:
         """감정 표현 가져오기"""
-        if emotion and emotion in cls.EMOTIONAL_EXPRESSIONS:
-            expressions = cls.EMOTIONAL_EXPRESSIONS[emotion]
-        else:
-            all_expressions = []
-            for expr_list in cls.EMOTIONAL_EXPRESSIONS.values():
-                if isinstance(expr_list, list):
-                    all_expressions.extend(expr_list)
-            expressions = all_expressions
-
-        if not expressions:
-            return "와 진짜요?"
-
-        return random.choice(expressions)
+        return cls.EMOTION_INDEX.choice(emotion, default="와 진짜요?")
 
     @classmethod
     def get_sentence_ending(cls, style: str = "casual") -> str:
         """문장 종결 표현 가져오기"""
-        if style in cls.SENTENCE_ENDINGS:
-            endings = cls.SENTENCE_ENDINGS[style]
-        else:
-            endings = cls.SENTENCE_ENDINGS.get("casual", ["~요"])
-
+        endings = cls.SENTENCE_ENDINGS.get(style) or cls.SENTENCE_ENDINGS.get("casual")
         if not endings:
             return "~요"
 
@@ -186,62 +108,29 @@ class YouTubeSpeechPatterns:
     @classmethod
     def get_reaction(cls, reaction_type: Optional[str] = None) -> str:
         """반응 표현 가져오기"""
-        if reaction_type and reaction_type in cls.REACTIONS:
-            reactions = cls.REACTIONS[reaction_type]
-        else:
-            all_reactions = []
-            for react_list in cls.REACTIONS.values():
-                if isinstance(react_list, list):
-                    all_reactions.extend(react_list)
-            reactions = all_reactions
-
-        if not reactions:
-            return "맞아요"
-
-        return random.choice(reactions)
+        return cls.REACTION_INDEX.choice(reaction_type, default="맞아요")
 
     @classmethod
     def get_topic_expression(cls, topic: Optional[str] = None) -> str:
         """주제별 표현 가져오기"""
-        if topic and topic in cls.TOPIC_SPECIFIC:
-            expressions = cls.TOPIC_SPECIFIC[topic]
-        else:
-            all_expressions = []
-            for expr_list in cls.TOPIC_SPECIFIC.values():
-                if isinstance(expr_list, list):
-                    all_expressions.extend(expr_list)
-            expressions = all_expressions
-
-        if not expressions:
-            return "재미있는 게요"
-
-        return random.choice(expressions)
+        return cls.TOPIC_INDEX.choice(topic, default="재미있는 게요")
 
     @classmethod
     def count_all_patterns(cls) -> Dict[str, int]:
-        """모든 패턴 개수 세기"""
-        def count_dict_patterns(d):
-            total = 0
-            for v in d.values():
-                if isinstance(v, list):
-                    total += len(v)
-                elif isinstance(v, dict):
-                    total += count_dict_patterns(v)
-            return total
-
+        """모든 패턴 개수 세기 (중복 제거 후)"""
         counts = {
-            "hooks": count_dict_patterns(cls.HOOK_OPENERS),
-            "transitions": count_dict_patterns(cls.TRANSITIONS),
-            "emotions": count_dict_patterns(cls.EMOTIONAL_EXPRESSIONS),
-            "endings": count_dict_patterns(cls.SENTENCE_ENDINGS),
-            "closings": len(cls.CLOSING_PATTERNS) if isinstance(cls.CLOSING_PATTERNS, list) else 0,
-            "fillers": len(cls.FILLERS) if isinstance(cls.FILLERS, list) else 0,
-            "reactions": count_dict_patterns(cls.REACTIONS),
-            "topic_specific": count_dict_patterns(cls.TOPIC_SPECIFIC),
-            "natural_expr": count_dict_patterns(cls.NATURAL_EXPRESSIONS),
-            "emphasis": len(cls.EMPHASIS_WORDS) if isinstance(cls.EMPHASIS_WORDS, list) else 0,
-            "quantifiers": len(cls.QUANTIFIERS) if isinstance(cls.QUANTIFIERS, list) else 0,
-            "time_expr": len(cls.TIME_EXPRESSIONS) if isinstance(cls.TIME_EXPRESSIONS, list) else 0,
+            "hooks": len(cls.HOOK_INDEX),
+            "transitions": len(cls.TRANSITION_INDEX),
+            "emotions": len(cls.EMOTION_INDEX),
+            "endings": len(cls.ENDING_INDEX),
+            "closings": len(cls.CLOSING_PATTERNS),
+            "fillers": len(cls.FILLERS),
+            "reactions": len(cls.REACTION_INDEX),
+            "topic_specific": len(cls.TOPIC_INDEX),
+            "natural_expr": len(cls.NATURAL_INDEX),
+            "emphasis": len(cls.EMPHASIS_WORDS),
+            "quantifiers": len(cls.QUANTIFIERS),
+            "time_expr": len(cls.TIME_EXPRESSIONS),
         }
         counts["total"] = sum(counts.values())
         return counts
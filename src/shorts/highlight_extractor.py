@@ -1,14 +1,13 @@
 """Highlight Extractor - Extract best moments for Shorts"""
 from typing import Dict, List
-import json
 
 class HighlightExtractor:
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def extract(self, script_segments: List[Dict], count: int = 3) -> List[Dict]:
@@ -20,9 +19,6 @@ class HighlightExtractor:
 {segments_text[:2000]}
 JSON 배열로 응답: [{{"segment_index": 0, "start_time": "0:00", "duration": 30, "hook": "후크"}}]"""
         try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=1000, messages=[{"role": "user", "content": prompt}])
-            text = response.content[0].text
-            if "```json" in text: text = text.split("```json")[1].split("```")[0]
-            return json.loads(text.strip())
+            return await self.client.generate_json(prompt, max_tokens=1000, expect=list)
         except:
             return [{"segment_index": i, "start": 0, "duration": 30} for i in range(min(count, len(script_segments)))]
@@ -1,4 +1,5 @@
 """Thumbnail Generator - Generate YouTube thumbnails"""
+import asyncio
 from typing import Dict, List
 from pathlib import Path
 import httpx
@@ -21,10 +22,16 @@ class ThumbnailGenerator:
             from openai import OpenAI
             from PIL import Image, ImageDraw, ImageFont
             from io import BytesIO
-            client = OpenAI()
+            from utils.resilience import retry_async
+            timeout = self.config.get('api', {}).get('timeout', 120)
+            client = OpenAI(max_retries=0, timeout=timeout)
             prompt = f"{topic}, {self.STYLES.get(style, self.STYLES['dramatic'])}, thumbnail style"
-            response = client.images.generate(model="dall-e-3", prompt=prompt, size="1792x1024", quality="standard", n=1)
-            img_data = httpx.get(response.data[0].url).content
+            # 블로킹 SDK/다운로드는 스레드에서, 재시도 대기는 이벤트 루프를 막지 않게
+            response = await retry_async(asyncio.to_thread, client.images.generate, model="dall-e-3", prompt=prompt,
+                                         size="1792x1024", quality="standard", n=1,
+                                         provider="openai_images", config=self.config, use_timeout=False)
+            img_data = await retry_async(asyncio.to_thread, self._download, response.data[0].url, timeout,
+                                         provider="image_download", config=self.config, use_timeout=False)
             img = Image.open(BytesIO(img_data)).resize((1280, 720), Image.LANCZOS)
             draw = ImageDraw.Draw(img)
             text = title[:10]
@@ -52,3 +59,8 @@ class ThumbnailGenerator:
                 results.append(await self.generate(topic, title, style, path))
             except: pass
         return results
+
+    def _download(self, url: str, timeout: float) -> bytes:
+        response = httpx.get(url, timeout=timeout, follow_redirects=True)
+        response.raise_for_status()
+        return response.content
@@ -1,14 +1,13 @@
 """SEO Optimizer - Optimize video metadata for search"""
 from typing import Dict, List
-import json
 
 class SEOOptimizer:
     def __init__(self, config: Dict):
         self.config = config
         self.client = None
         try:
-            from anthropic import Anthropic
-            self.client = Anthropic()
+            from utils.llm_gateway import get_llm_gateway
+            self.client = get_llm_gateway(config)
         except: pass
 
     async def optimize(self, title: str, description: str, tags: List[str], topic: str) -> Dict:
@@ -20,10 +19,7 @@ class SEOOptimizer:
 주제: {topic}
 JSON으로 응답: {{"title": "최적화된 제목 (60자)", "description": "설명 (500자)", "tags": ["태그"], "hashtags": ["#해시태그"]}}"""
         try:
-            response = self.client.messages.create(model="claude-sonnet-4-20250514", max_tokens=1000, messages=[{"role": "user", "content": prompt}])
-            text = response.content[0].text
-            if "```json" in text: text = text.split("```json")[1].split("```")[0]
-            return json.loads(text.strip())
+            return await self.client.generate_json(prompt, max_tokens=1000)
         except:
             return {"title": title, "description": description, "tags": tags}
 
@@ -0,0 +1,206 @@
+"""
+Adaptive Limiter Module
+=======================
+외부 제공자별 AIMD 동시성 제어기
+
+지연 시간과 오류율이 정상이면 동시 호출 수를 천천히 늘리고(additive increase),
+429/과부하/지연 급증이 보이면 절반으로 줄인다(multiplicative decrease).
+설정의 max_concurrent 값은 고정값이 아니라 상한으로 사용한다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+from .resilience import is_throttling
+
+# 제공자별 상한 설정 위치 (없으면 api.<provider>.max_concurrent)
+CEILING_KEYS = {
+    "openai_images": ("visual", "image_generation", "max_concurrent"),
+    "elevenlabs": ("audio", "tts", "max_concurrent"),
+    "gtts": ("audio", "tts", "max_concurrent"),
+}
+
+DEFAULT_CEILING = 4
+
+
+class AdaptiveLimiter:
+    """AIMD 동시성 제어기 (asyncio용)"""
+
+    def __init__(
+        self,
+        name: str,
+        ceiling: int,
+        floor: int = 1,
+        initial: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        adaptive: bool = True
+    ):
+        self.name = name
+        self.ceiling = max(1, int(ceiling))
+        self.floor = max(1, min(int(floor), self.ceiling))
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.adaptive = adaptive
+
+        if not adaptive:
+            initial = self.ceiling
+        elif initial is None:
+            initial = max(self.floor, self.ceiling / 2)
+        self.limit = float(min(max(initial, self.floor), self.ceiling))
+
+        self.in_flight = 0
+        self._waiters: deque = deque()
+        self._latency_ewma: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+
+        self.successes = 0
+        self.throttled = 0
+        self.errors = 0
+        self.decreases = 0
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.floor, int(self.limit))
+
+    async def acquire(self):
+        """슬롯 획득 (현재 한도를 넘으면 대기)"""
+        if self.in_flight < self.current_limit and not self._waiters:
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # 슬롯을 받은 직후 취소됨 - 반납
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self):
+        """슬롯 반납 후 대기자 깨우기"""
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done() or waiter.get_loop().is_closed():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """슬롯 안에서 func(*args, **kwargs) 실행 후 결과로 한도 조정"""
+        await self.acquire()
+        start = time.monotonic()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.record_error(e)
+            raise
+        else:
+            self.record_success(time.monotonic() - start)
+            return result
+        finally:
+            self.release()
+
+    def record_success(self, latency: float):
+        """성공 - 지연 급증이면 감소, 아니면 한도를 1/limit씩 증가"""
+        self.successes += 1
+        baseline = self._latency_ewma
+        self._samples += 1
+        self._latency_ewma = latency if baseline is None else baseline * 0.8 + latency * 0.2
+
+        if not self.adaptive:
+            return
+        if baseline is not None and self._samples > 5 and latency > baseline * self.latency_spike_factor:
+            self._decrease()
+            return
+
+        self.limit = min(float(self.ceiling), self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def record_error(self, exc: BaseException):
+        """실패 - 쿼터 초과/과부하면 한도 감소, 그 외 오류는 한도 유지"""
+        if is_throttling(exc):
+            self.throttled += 1
+            if self.adaptive:
+                self._decrease()
+        else:
+            self.errors += 1
+
+    def _decrease(self):
+        # 같은 혼잡 구간에서 동시에 실패한 요청들로 여러 번 줄이지 않도록 한 응답 시간당 1회
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency_ewma or 1.0):
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.floor), self.limit * self.decrease_factor)
+        self.decreases += 1
+
+    def metrics(self) -> Dict:
+        """현재 한도와 누적 통계"""
+        return {
+            "provider": self.name,
+            "limit": self.current_limit,
+            "ceiling": self.ceiling,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "latency_ewma": round(self._latency_ewma, 3) if self._latency_ewma is not None else None,
+            "successes": self.successes,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "decreases": self.decreases,
+        }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def _ceiling_for(provider: str, config: Dict) -> int:
+    path = CEILING_KEYS.get(provider, ('api', provider, 'max_concurrent'))
+    value: Any = config
+    for key in path:
+        value = value.get(key, {}) if isinstance(value, dict) else {}
+    return int(value) if isinstance(value, (int, float)) and value > 0 else DEFAULT_CEILING
+
+
+def get_limiter(provider: str, config: Dict = None) -> AdaptiveLimiter:
+    """제공자별 공유 동시성 제어기 (api.adaptive_concurrency 설정)"""
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        config = config or {}
+        ac_config = config.get('api', {}).get('adaptive_concurrency', {})
+        limiter = AdaptiveLimiter(
+            provider,
+            ceiling=_ceiling_for(provider, config),
+            floor=ac_config.get('min_concurrent', 1),
+            decrease_factor=ac_config.get('decrease_factor', 0.5),
+            latency_spike_factor=ac_config.get('latency_spike_factor', 3.0),
+            adaptive=ac_config.get('enabled', True),
+        )
+        _limiters[provider] = limiter
+    return limiter
+
+
+def limiter_metrics() -> List[Dict]:
+    """모든 제공자의 현재 동시성 한도"""
+    return [limiter.metrics() for limiter in _limiters.values()]
+
+
+def reset_limiters():
+    """모든 제어기 초기화 (테스트용)"""
+    _limiters.clear()
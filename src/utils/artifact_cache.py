@@ -0,0 +1,158 @@
+"""
+Artifact Cache Module
+=====================
+입력 해시 기반(content-addressed) 파이프라인 산출물 캐시
+
+같은 입력(프롬프트, 설정, 스타일, 언어, 상위 산출물 해시)으로 만든
+TTS 음성, 이미지, 렌더링 결과를 재사용하고, 용량 초과 시
+가장 오래 사용하지 않은 항목부터 삭제한다 (LRU).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+
+class ArtifactCache:
+    """파이프라인 산출물 캐시"""
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_bytes: int = 20 * 1024 ** 3):
+        self.root = Path(cache_dir) / "artifacts"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """입력값들의 정규화된 JSON 해시"""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def file_digest(self, path: Union[str, Path, None]) -> Optional[str]:
+        """파일 내용 해시 - (경로, 크기, mtime) 기준 메모이즈"""
+        if not path or not Path(path).is_file():
+            return None
+
+        stat = os.stat(path)
+        memo_key = (str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns)
+        if memo_key not in self._digests:
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            self._digests[memo_key] = digest.hexdigest()
+        return self._digests[memo_key]
+
+    def _entry_dir(self, namespace: str, key: str) -> Path:
+        return self.root / namespace / key[:2] / key
+
+    def fetch(self, namespace: str, key: str, targets: Dict[str, Union[str, Path]]) -> Optional[Dict]:
+        """
+        캐시 항목을 대상 경로로 복사
+
+        Args:
+            namespace: 산출물 종류 (audio, image, video ...)
+            key: make_key로 만든 키
+            targets: 파일 이름 → 복원할 경로
+
+        Returns:
+            저장 시 기록한 메타데이터, 없으면 None
+        """
+        entry_dir = self._entry_dir(namespace, key)
+        manifest_path = entry_dir / self.MANIFEST
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+
+            files = manifest.get('files', {})
+            if not set(targets) <= set(files):
+                return None
+
+            for name, target in targets.items():
+                Path(target).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(entry_dir / files[name], target)
+
+            # LRU 접근 시간 갱신
+            os.utime(manifest_path)
+            return manifest.get('meta', {})
+        except (OSError, ValueError):
+            return None
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        files: Dict[str, Union[str, Path]],
+        meta: Dict = None
+    ) -> bool:
+        """산출물 파일을 캐시에 저장 (존재하지 않는 파일이 있으면 저장 안함)"""
+        if not files or not all(Path(p).is_file() for p in files.values()):
+            return False
+
+        entry_dir = self._entry_dir(namespace, key)
+        tmp_dir = entry_dir.parent / f".{key}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            tmp_dir.mkdir(parents=True)
+            manifest = {"key": key, "namespace": namespace, "files": {}, "meta": meta or {},
+                        "size": 0, "created_at": time.time()}
+            for name, src in files.items():
+                filename = f"{name}{Path(src).suffix}"
+                shutil.copy2(src, tmp_dir / filename)
+                manifest["files"][name] = filename
+                manifest["size"] += (tmp_dir / filename).stat().st_size
+
+            with open(tmp_dir / self.MANIFEST, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False)
+
+            if entry_dir.exists():
+                shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(tmp_dir, entry_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+
+        self.evict()
+        return True
+
+    def evict(self) -> int:
+        """용량 초과 시 가장 오래 사용하지 않은 항목 삭제, 삭제한 항목 수 반환"""
+        with self._lock:
+            entries = []
+            total = 0
+            for manifest_path in self.root.glob(f"*/*/*/{self.MANIFEST}"):
+                try:
+                    with open(manifest_path, 'r', encoding='utf-8') as f:
+                        size = json.load(f).get('size', 0)
+                    entries.append((manifest_path.stat().st_mtime, size, manifest_path.parent))
+                    total += size
+                except (OSError, ValueError):
+                    continue
+
+            removed = 0
+            for _, size, entry_dir in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_size_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                removed += 1
+            return removed
+
+    def total_size(self) -> int:
+        """캐시 전체 크기 (bytes)"""
+        total = 0
+        for manifest_path in self.root.glob(f"*/*/*/{self.MANIFEST}"):
+            try:
+                with open(manifest_path, 'r', encoding='utf-8') as f:
+                    total += json.load(f).get('size', 0)
+            except (OSError, ValueError):
+                continue
+        return total
@@ -0,0 +1,73 @@
+"""
+Atomic File I/O
+===============
+크래시에도 반쯤 쓰인 파일이 남지 않는 원자적 파일 쓰기
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, List, Union
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """임시 파일에 쓴 뒤 os.replace로 교체"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write_json(path: Union[str, Path], data: Any) -> None:
+    """JSON 원자적 저장"""
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    atomic_write_bytes(path, text.encode('utf-8'))
+
+
+def append_jsonl(path: Union[str, Path], record: Any) -> None:
+    """JSONL 한 줄 추가 - fsync로 크래시 시에도 완료된 줄은 보존"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with open(path, 'a+b') as f:
+        # 이전 크래시로 끊긴 줄이 있으면 줄바꿈으로 분리
+        if f.tell() > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                line = "\n" + line
+        f.write(line.encode('utf-8'))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_jsonl(path: Union[str, Path]) -> List[Any]:
+    """JSONL 읽기 - 중간에 끊긴 마지막 줄 등 손상된 줄은 건너뜀"""
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
@@ -0,0 +1,190 @@
+"""
+Chunking Module
+===============
+긴 스크립트를 토큰 예산 단위로 나눠 병렬 처리 후 순서대로 합치기 (map-reduce)
+
+ScriptData.segments 경계를 따라 나누고, 예산보다 긴 세그먼트는 문장 경계에서 자른다.
+각 조각에는 바로 앞 조각의 끝부분을 문맥(overlap)으로 붙여 톤이 이어지게 한다.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_CHUNK_TOKENS = 1500
+DEFAULT_OVERLAP_TOKENS = 150
+DEFAULT_CONCURRENCY = 4
+
+# 비 ASCII(한글/CJK)는 글자당 약 1토큰, ASCII는 4글자당 1토큰으로 보수적으로 추정
+ASCII_CHARS_PER_TOKEN = 4
+
+SENTENCE = re.compile(r'[^.!?…。！？\n]+(?:[.!?…。！？]+|\n+|$)')
+PARAGRAPH = re.compile(r'\n\s*\n')
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (토크나이저 없이)"""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for ch in text if ch.isascii() and not ch.isspace())
+    other_chars = sum(1 for ch in text if not ch.isascii())
+    return other_chars + -(-ascii_chars // ASCII_CHARS_PER_TOKEN)
+
+
+@dataclass
+class Chunk:
+    """처리 단위 조각"""
+    index: int
+    text: str
+    context: str = ""                       # 앞 조각의 끝부분 (참고용, 출력에 포함하지 않음)
+    segment_ids: List[Any] = field(default_factory=list)
+
+    @property
+    def tokens(self) -> int:
+        return estimate_tokens(self.text)
+
+
+def chunk_settings(config: Dict) -> Tuple[int, int, int]:
+    """(조각 토큰 예산, 문맥 토큰, 동시 처리 수) - api.llm.chunking"""
+    settings = config.get('api', {}).get('llm', {}).get('chunking', {}) or {}
+    return (
+        int(settings.get('max_tokens', DEFAULT_CHUNK_TOKENS)),
+        int(settings.get('overlap_tokens', DEFAULT_OVERLAP_TOKENS)),
+        int(settings.get('concurrency', DEFAULT_CONCURRENCY)),
+    )
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 단위 분리 (구분 부호 유지)"""
+    return [s.strip() for s in SENTENCE.findall(text or "") if s.strip()]
+
+
+def _split_long(text: str, budget: int) -> List[str]:
+    """예산보다 긴 텍스트를 문장 경계에서 나눔 (문장 하나가 넘치면 글자 수로 자름)"""
+    pieces: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for sentence in split_sentences(text):
+        tokens = estimate_tokens(sentence)
+        if tokens > budget:
+            if current:
+                pieces.append(" ".join(current))
+                current, current_tokens = [], 0
+            step = max(1, len(sentence) * budget // tokens)
+            pieces.extend(sentence[i:i + step] for i in range(0, len(sentence), step))
+            continue
+        if current and current_tokens + tokens > budget:
+            pieces.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += tokens
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def _tail(text: str, overlap_tokens: int) -> str:
+    """끝에서부터 overlap_tokens 안에 들어가는 문장들"""
+    if overlap_tokens <= 0:
+        return ""
+    tail: List[str] = []
+    used = 0
+    for sentence in reversed(split_sentences(text)):
+        tokens = estimate_tokens(sentence)
+        if tail and used + tokens > overlap_tokens:
+            break
+        tail.append(sentence)
+        used += tokens
+    return " ".join(reversed(tail))
+
+
+def chunk_segments(
+    segments: Sequence[Dict],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    separator: str = "\n\n"
+) -> List[Chunk]:
+    """
+    세그먼트 경계를 따라 토큰 예산 안의 조각으로 묶기
+
+    세그먼트 순서를 유지하고, 예산보다 긴 세그먼트는 문장 경계에서 여러 조각으로 나눈다.
+    """
+    units: List[Tuple[Any, str]] = []
+    for i, segment in enumerate(segments):
+        if not isinstance(segment, dict):
+            continue
+        text = (segment.get('text') or '').strip()
+        if not text:
+            continue
+        segment_id = segment.get('id', i + 1)
+        if estimate_tokens(text) > max_tokens:
+            units.extend((segment_id, piece) for piece in _split_long(text, max_tokens))
+        else:
+            units.append((segment_id, text))
+
+    chunks: List[Chunk] = []
+    texts: List[str] = []
+    ids: List[Any] = []
+    used = 0
+
+    def flush():
+        text = separator.join(texts)
+        context = _tail(chunks[-1].text, overlap_tokens) if chunks else ""
+        chunks.append(Chunk(index=len(chunks), text=text, context=context, segment_ids=list(dict.fromkeys(ids))))
+
+    for segment_id, text in units:
+        tokens = estimate_tokens(text)
+        if texts and used + tokens > max_tokens:
+            flush()
+            texts, ids, used = [], [], 0
+        texts.append(text)
+        ids.append(segment_id)
+        used += tokens
+    if texts:
+        flush()
+    return chunks
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS
+) -> List[Chunk]:
+    """세그먼트가 없는 텍스트 - 문단을 세그먼트로 보고 나눔"""
+    paragraphs = [{"id": i + 1, "text": p} for i, p in enumerate(PARAGRAPH.split(text or ""))]
+    return chunk_segments(paragraphs, max_tokens, overlap_tokens)
+
+
+def chunk_script(
+    full_script: str,
+    segments: Optional[Sequence[Dict]] = None,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS
+) -> List[Chunk]:
+    """스크립트 조각 - 세그먼트가 있으면 세그먼트 경계, 없으면 문단 경계"""
+    if segments and any(isinstance(s, dict) and (s.get('text') or '').strip() for s in segments):
+        return chunk_segments(segments, max_tokens, overlap_tokens)
+    return chunk_text(full_script, max_tokens, overlap_tokens)
+
+
+async def map_chunks(
+    chunks: Sequence[Chunk],
+    worker: Callable[[Chunk], Awaitable[Any]],
+    concurrency: int = DEFAULT_CONCURRENCY
+) -> List[Any]:
+    """조각별 worker를 최대 concurrency개씩 동시에 실행하고 원래 순서대로 결과 반환"""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run(chunk: Chunk):
+        async with semaphore:
+            return await worker(chunk)
+
+    return list(await asyncio.gather(*(run(chunk) for chunk in chunks)))
+
+
+def context_block(chunk: Chunk, label: str = "앞부분 (문맥 참고용, 출력하지 마세요)") -> str:
+    """프롬프트에 넣을 앞 조각 문맥 (첫 조각이면 빈 문자열)"""
+    if not chunk.context:
+        return ""
+    return f"{label}:\n{chunk.context}\n\n"
@@ -0,0 +1,80 @@
+"""
+Deadline Module
+===============
+단계별 시간 예산과 협력적 취소
+
+phase_deadline()으로 현재 작업(그 안에서 만든 Task와 스레드 포함)에 마감 시각을 걸고,
+외부 호출은 within_deadline()으로 감싸 남은 시간만큼만 기다린다.
+마감이 지나면 PhaseDeadlineExceeded(TimeoutError)가 발생해 단계의 기존 폴백 경로로 빠진다.
+"""
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Iterator, Optional
+
+
+class PhaseDeadlineExceeded(TimeoutError):
+    """단계 시간 예산 초과"""
+
+
+@dataclass
+class Deadline:
+    """단계 마감 시각 (monotonic)"""
+    name: str
+    budget: float
+    expires_at: float
+    expired: bool = False
+
+    def remaining(self) -> float:
+        return self.expires_at - time.monotonic()
+
+
+_current: ContextVar[Optional[Deadline]] = ContextVar("phase_deadline", default=None)
+
+
+@contextmanager
+def phase_deadline(name: str, budget: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """이 블록에서 시작하는 작업에 마감 시각 설정 (budget이 없으면 제한 없음)"""
+    if not budget or budget <= 0:
+        yield None
+        return
+
+    deadline = Deadline(name=name, budget=budget, expires_at=time.monotonic() + budget)
+    token = _current.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current.reset(token)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current.get()
+
+
+async def within_deadline(awaitable: Awaitable) -> Any:
+    """
+    현재 단계의 남은 시간 안에서 await - 초과 시 작업을 취소하고 PhaseDeadlineExceeded
+
+    작업 자신이 낸 TimeoutError(HTTP 타임아웃 등)는 그대로 전달된다.
+    """
+    deadline = _current.get()
+    if deadline is None:
+        return await awaitable
+
+    remaining = deadline.remaining()
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        deadline.expired = True
+        raise PhaseDeadlineExceeded(f"{deadline.name} 단계 시간 예산({deadline.budget:.0f}초) 초과")
+
+    try:
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError:
+        if deadline.remaining() > 0:
+            raise
+        deadline.expired = True
+        raise PhaseDeadlineExceeded(f"{deadline.name} 단계 시간 예산({deadline.budget:.0f}초) 초과") from None
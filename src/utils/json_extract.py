@@ -0,0 +1,143 @@
+"""
+JSON Extract Module
+===================
+LLM 응답에서 JSON 추출 (모든 모듈 공용)
+
+- 코드 블록/앞뒤 설명문과 무관하게 첫 번째 유효한 JSON 객체/배열을 찾는다
+- 문자열 안의 괄호와 이스케이프를 인식하며 응답을 한 번 훑는다
+- 가벼운 복구: 후행 쉼표 제거, 잘린 응답의 열린 문자열/괄호 닫기
+"""
+
+import json
+from typing import Any, List, Optional, Tuple
+
+CLOSERS = {'{': '}', '[': ']'}
+
+
+class JSONExtractionError(ValueError):
+    """응답에서 JSON을 찾거나 복구하지 못함"""
+
+
+def strip_trailing_commas(text: str) -> str:
+    """닫는 괄호 앞의 쉼표 제거 (문자열 내부는 유지)"""
+    out = []
+    in_string = False
+    escape = False
+    n = len(text)
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == ',':
+            j = i + 1
+            while j < n and text[j] in ' \t\r\n':
+                j += 1
+            if j == n or text[j] in '}]':
+                continue
+        out.append(ch)
+    return ''.join(out)
+
+
+def _loads(fragment: str) -> Tuple[bool, Any]:
+    for candidate in (fragment, strip_trailing_commas(fragment)):
+        try:
+            return True, json.loads(candidate)
+        except ValueError:
+            continue
+    return False, None
+
+
+def _close(fragment: str, stack: List[str], in_string: bool) -> str:
+    if in_string:
+        if fragment.endswith('\\'):
+            fragment = fragment[:-1]
+        fragment += '"'
+    return fragment + ''.join(CLOSERS[c] for c in reversed(stack))
+
+
+def _scan(text: str, start: int):
+    """
+    start의 여는 괄호부터 짝이 맞는 곳까지 훑기
+
+    Returns:
+        ("complete", end) / ("mismatch", pos) / ("truncated", (stack, in_string, last_comma))
+    """
+    stack = [text[start]]
+    in_string = False
+    escape = False
+    last_comma = None  # (위치, 그 시점의 괄호 스택)
+
+    for i in range(start + 1, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append(ch)
+        elif ch in '}]':
+            if CLOSERS[stack[-1]] != ch:
+                return "mismatch", i
+            stack.pop()
+            if not stack:
+                return "complete", i + 1
+        elif ch == ',':
+            last_comma = (i, list(stack))
+
+    return "truncated", (stack, in_string, last_comma)
+
+
+def extract_json(text: str, expect: Optional[type] = None) -> Any:
+    """
+    응답 텍스트에서 첫 번째 유효한 JSON 값 추출
+
+    Args:
+        text: LLM 응답
+        expect: dict 또는 list - 해당 타입의 JSON만 찾음
+
+    Raises:
+        JSONExtractionError: 유효한 JSON이 없을 때
+    """
+    if not isinstance(text, str):
+        raise JSONExtractionError(f"문자열이 아닌 응답: {type(text).__name__}")
+
+    openers = {dict: '{', list: '['}.get(expect, '{[')
+    pos = 0
+    while True:
+        starts = [idx for idx in (text.find(c, pos) for c in openers) if idx >= 0]
+        if not starts:
+            break
+        start = min(starts)
+
+        status, info = _scan(text, start)
+        if status == "complete":
+            ok, value = _loads(text[start:info])
+            if ok:
+                return value
+        elif status == "truncated":
+            stack, in_string, last_comma = info
+            # 1) 잘린 자리에서 그대로 닫기 (문자열 값 중간에서 끊긴 경우)
+            ok, value = _loads(_close(text[start:], stack, in_string))
+            # 2) 마지막 완성된 원소까지만 남기고 닫기
+            if not ok and last_comma is not None:
+                comma_pos, comma_stack = last_comma
+                ok, value = _loads(_close(text[start:comma_pos], comma_stack, False))
+            # 복구한 내용이 없으면(빈 객체/배열) 실패로 취급
+            if ok and value:
+                return value
+        pos = start + 1
+
+    raise JSONExtractionError("응답에서 JSON을 찾을 수 없습니다")
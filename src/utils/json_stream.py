@@ -0,0 +1,93 @@
+"""
+JSON Stream Module
+==================
+스트리밍 LLM 응답에서 JSON 배열 원소를 점진적으로 추출
+
+응답 텍스트를 조각 단위로 받아 한 번만 훑으며(문자열/이스케이프 인식)
+지정한 키의 배열 원소가 닫히는 즉시 파싱해 돌려준다.
+"""
+
+import json
+from typing import Any, List
+
+
+class JsonArrayStream:
+    """루트 객체의 `key` 배열 원소를 완성되는 대로 반환하는 증분 파서"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.buffer = ""
+        self.done = False   # 대상 배열이 닫혔는지
+
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = -1
+        self._last_string = None
+        self._after_string = False
+        self._awaiting_value = False
+        self._current_key = None
+        self._array_depth = None    # 대상 배열 안쪽 깊이
+        self._item_start = -1
+
+    @property
+    def text(self) -> str:
+        """지금까지 받은 전체 응답"""
+        return self.buffer
+
+    def feed(self, chunk: str) -> List[Any]:
+        """조각을 추가하고 새로 완성된 배열 원소(객체/배열)를 반환"""
+        self.buffer += chunk
+        items = []
+        buf = self.buffer
+
+        for i in range(self._pos, len(buf)):
+            ch = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = buf[self._string_start + 1:i]
+                        self._after_string = True
+                continue
+
+            if ch in ' \t\r\n':
+                continue
+
+            after_string, self._after_string = self._after_string, False
+            awaiting_value, self._awaiting_value = self._awaiting_value, False
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+            elif ch == ':' and self._depth == 1 and after_string:
+                self._current_key = self._last_string
+                self._awaiting_value = True
+            elif ch in '{[':
+                self._depth += 1
+                if (ch == '[' and awaiting_value and self._depth == 2
+                        and self._current_key == self.key and not self.done):
+                    self._array_depth = self._depth
+                elif self._array_depth is not None and self._depth == self._array_depth + 1:
+                    self._item_start = i
+            elif ch in '}]':
+                if self._array_depth is not None:
+                    if self._depth == self._array_depth + 1 and self._item_start >= 0:
+                        try:
+                            items.append(json.loads(buf[self._item_start:i + 1]))
+                        except ValueError:
+                            pass
+                        self._item_start = -1
+                    elif self._depth == self._array_depth:
+                        self._array_depth = None
+                        self.done = True
+                self._depth = max(0, self._depth - 1)
+
+        self._pos = len(buf)
+        return items
@@ -0,0 +1,114 @@
+"""
+LLM Cache Module
+================
+디스크 기반 LLM 응답 캐시
+
+모델, 프롬프트, 샘플링 파라미터를 키로 zlib 압축해 저장하고,
+TTL이 지난 항목은 무시하며 용량 초과 시 오래 사용하지 않은 항목부터 삭제한다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .atomic_io import atomic_write_bytes
+
+
+class LLMCache:
+    """LLM 응답 디스크 캐시"""
+
+    SUFFIX = ".json.z"
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_size_bytes: int = 500 * 1024 ** 2
+    ):
+        self.root = Path(cache_dir) / "llm"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+
+    @staticmethod
+    def make_key(**params: Any) -> str:
+        """요청 파라미터(모델, 프롬프트, 샘플링 설정)의 해시"""
+        payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 응답 텍스트, 없거나 만료되었으면 None"""
+        path = self._path(key)
+        try:
+            entry = json.loads(zlib.decompress(path.read_bytes()).decode('utf-8'))
+        except (OSError, ValueError, zlib.error):
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get('created_at', 0) > self.ttl_seconds:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+
+        try:
+            # LRU 접근 시간 갱신
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get('text')
+
+    def put(self, key: str, text: str, **meta: Any) -> None:
+        """응답 저장 - 압축 후 원자적으로 기록"""
+        entry = {"text": text, "created_at": time.time(), **meta}
+        data = zlib.compress(json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        try:
+            atomic_write_bytes(self._path(key), data)
+        except OSError:
+            return
+
+        with self._lock:
+            self._writes_since_evict += 1
+            should_evict = self._writes_since_evict >= 50
+            if should_evict:
+                self._writes_since_evict = 0
+        if should_evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """만료 항목과 용량 초과분 삭제, 삭제한 항목 수 반환"""
+        with self._lock:
+            now = time.time()
+            entries = []
+            total = 0
+            removed = 0
+            for path in self.root.glob(f"*/*{self.SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                # 마지막 접근 이후 TTL이 지난 항목은 생성 시각과 무관하게 만료
+                if self.ttl_seconds and now - stat.st_mtime > self.ttl_seconds:
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
@@ -0,0 +1,720 @@
+"""
+LLM Gateway Module
+==================
+모든 모듈이 공유하는 비동기 LLM 게이트웨이
+
+- 제공자 폴백 체인 (기본: Gemini → Anthropic, api.llm.providers로 변경)
+- 이벤트 루프별 공용 HTTP 커넥션 풀 (api.llm.max_connections)
+- SDK 클라이언트는 첫 호출 시점에 생성 (시작 시 유휴 클라이언트 없음)
+- 디스크 응답 캐시 (cache.llm)와 동일 요청 합치기 (single-flight)
+- 제공자별 재시도/회로 차단기 (api.timeout / max_retries / rate_limit_delay)
+- 제공자별 AIMD 동시성 제어 (api.<provider>.max_concurrent가 상한)
+- 선택적 헤징 (api.llm.hedging): 1순위 응답이 지연 백분위를 넘기면 2순위에도 요청
+- 스트리밍 생성 (stream): 첫 조각을 받기 전 실패하면 다음 제공자로 폴백
+- JSON 응답 (generate_json): 제공자 JSON/스키마 모드 (api.llm.native_json) + 공용 추출기
+"""
+
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from .adaptive_limiter import get_limiter
+from .json_extract import JSONExtractionError, extract_json
+from .llm_cache import LLMCache
+from .resilience import CircuitOpenError, RetryPolicy, get_circuit_breaker, is_retryable, retry_async
+
+logger = logging.getLogger("VideoGenerator")
+
+_env_loaded = False
+
+
+def _load_env():
+    """config/api_keys.env 로드 (한 번만)"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    _env_loaded = True
+    try:
+        from dotenv import load_dotenv
+        load_dotenv('config/api_keys.env')
+    except ImportError:
+        pass
+
+
+class LLMProvider:
+    """LLM 제공자 기본 클래스"""
+
+    name = ""
+    env_key = ""
+    package = ""
+    default_model = ""
+
+    def __init__(self, config: Dict):
+        api_config = config.get('api', {})
+        self.provider_config = api_config.get(self.name, {})
+        self.llm_config = api_config.get('llm', {})
+        self.timeout = api_config.get('timeout', 120)
+        self.model = self.provider_config.get('model', self.default_model)
+        self.temperature = self.provider_config.get('temperature', 0.7)
+        # 이벤트 루프별 클라이언트 (asyncio.run이 여러 번 호출되어도 안전)
+        self._clients = weakref.WeakKeyDictionary()
+
+    @property
+    def is_configured(self) -> bool:
+        """API 키와 SDK 패키지가 있는지 (클라이언트는 만들지 않음)"""
+        try:
+            has_package = importlib.util.find_spec(self.package) is not None
+        except (ImportError, ValueError):
+            has_package = False
+        return has_package and bool(os.environ.get(self.env_key))
+
+    def _client(self) -> Any:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def _create_client(self) -> Any:
+        raise NotImplementedError
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        json_mode: bool = False,
+        schema: Optional[Dict] = None
+    ) -> str:
+        """
+        텍스트 생성
+
+        json_mode/schema: 제공자가 지원하면 JSON(스키마)으로 제한된 응답 요청
+        """
+        raise NotImplementedError
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """텍스트 조각 스트림 (기본: 전체 응답을 한 조각으로)"""
+        yield await self.generate(prompt, max_tokens, temperature)
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini"""
+
+    name = "gemini"
+    env_key = "GEMINI_API_KEY"
+    package = "google.generativeai"
+    default_model = "gemini-3-flash"
+
+    def _create_client(self) -> Any:
+        import google.generativeai as genai
+
+        genai.configure(api_key=os.environ.get(self.env_key))
+        return genai.GenerativeModel(self.model)
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        json_mode: bool = False,
+        schema: Optional[Dict] = None
+    ) -> str:
+        generation_config = {
+            "max_output_tokens": max_tokens,
+            "temperature": self.temperature if temperature is None else temperature,
+        }
+        if json_mode or schema:
+            generation_config["response_mime_type"] = "application/json"
+        if schema:
+            generation_config["response_schema"] = schema
+        response = await self._client().generate_content_async(prompt, generation_config=generation_config)
+        return response.text
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        generation_config = {
+            "max_output_tokens": max_tokens,
+            "temperature": self.temperature if temperature is None else temperature,
+        }
+        response = await self._client().generate_content_async(
+            prompt, generation_config=generation_config, stream=True
+        )
+        async for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+
+class AnthropicProvider(LLMProvider):
+    """Anthropic Claude"""
+
+    name = "anthropic"
+    env_key = "ANTHROPIC_API_KEY"
+    package = "anthropic"
+    default_model = "claude-sonnet-4-20250514"
+
+    def _create_client(self) -> Any:
+        from anthropic import AsyncAnthropic
+
+        max_connections = self.llm_config.get('max_connections', 20)
+        try:
+            import httpx
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections
+                ),
+                timeout=self.timeout
+            )
+            # 재시도는 resilience 레이어에서 처리
+            return AsyncAnthropic(http_client=http_client, max_retries=0)
+        except ImportError:
+            return AsyncAnthropic(timeout=self.timeout, max_retries=0)
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None,
+        json_mode: bool = False,
+        schema: Optional[Dict] = None
+    ) -> str:
+        params = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature if temperature is None else temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if schema and schema.get("type") == "object":
+            # 스키마 강제: 지정한 도구 호출의 입력으로 응답받음 (JSON 모드 없이 텍스트만 지원)
+            params["tools"] = [{"name": "respond", "description": "구조화된 응답", "input_schema": schema}]
+            params["tool_choice"] = {"type": "tool", "name": "respond"}
+
+        response = await self._client().messages.create(**params)
+        for block in response.content:
+            if getattr(block, "type", "") == "tool_use":
+                return json.dumps(block.input, ensure_ascii=False)
+        return response.content[0].text
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        async with self._client().messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=self.temperature if temperature is None else temperature,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+class LLMGateway:
+    """제공자 폴백 체인을 가진 비동기 LLM 게이트웨이"""
+
+    PROVIDERS = {
+        "gemini": GeminiProvider,
+        "anthropic": AnthropicProvider,
+    }
+
+    def __init__(self, config: Dict = None):
+        self.config = config or {}
+        _load_env()
+
+        order = self.config.get('api', {}).get('llm', {}).get('providers', ["gemini", "anthropic"])
+        self.providers: List[LLMProvider] = []
+        for name in order:
+            provider_cls = self.PROVIDERS.get(name)
+            if provider_cls is None:
+                logger.warning(f"알 수 없는 LLM 제공자: {name}")
+                continue
+            provider = provider_cls(self.config)
+            if provider.is_configured:
+                self.providers.append(provider)
+
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        # generate_json에서 제공자 JSON 모드 사용 여부
+        self.native_json = bool(self.config.get('api', {}).get('llm', {}).get('native_json', True))
+        self.cache: Optional[LLMCache] = None
+        self._init_cache()
+        # 진행 중인 동일 요청 (캐시 키 → Task)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        hedging = self.config.get('api', {}).get('llm', {}).get('hedging', {})
+        self.hedging_enabled = bool(hedging.get('enabled', False))
+        self.hedge_percentile = float(hedging.get('percentile', 0.95))
+        self.hedge_min_samples = int(hedging.get('min_samples', 20))
+        self.hedge_initial_delay = float(hedging.get('initial_delay', 15.0))
+        self.hedge_min_delay = float(hedging.get('min_delay', 1.0))
+        # 제공자별 최근 성공 응답 시간 (초)
+        self._latencies: Dict[str, deque] = {}
+        self.hedge_stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "primary_wins": 0}
+
+    def _init_cache(self):
+        """LLM 응답 캐시 초기화"""
+        cache_config = self.config.get('cache', {}).get('llm', {})
+        if not self.providers or not cache_config.get('enabled', True):
+            return
+
+        cache_dir = self.config.get('project', {}).get('cache_dir', './data/cache')
+        try:
+            self.cache = LLMCache(
+                cache_dir,
+                ttl_seconds=cache_config.get('ttl_hours', 168) * 3600,
+                max_size_bytes=int(cache_config.get('max_size_mb', 500) * 1024 ** 2)
+            )
+        except OSError as e:
+            logger.warning(f"LLM 캐시 초기화 실패: {e}")
+
+    @property
+    def is_available(self) -> bool:
+        return bool(self.providers)
+
+    @property
+    def provider_names(self) -> List[str]:
+        return [p.name for p in self.providers]
+
+    def _cache_key(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        params = {}
+        if json_options:
+            params["json"] = json_options
+        return LLMCache.make_key(
+            models=[(p.name, p.model, p.temperature) for p in self.providers],
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **params
+        )
+
+    async def generate(
+        self,
+        prompt: str,
+        max_tokens: int = 8000,
+        temperature: Optional[float] = None,
+        use_cache: bool = True,
+        json_options: Optional[Dict] = None
+    ) -> str:
+        """
+        텍스트 생성 - 제공자 순서대로 시도, 모두 실패하면 마지막 예외 발생
+
+        Args:
+            prompt: 프롬프트
+            max_tokens: 최대 출력 토큰
+            temperature: 샘플링 온도 (None이면 제공자 설정값)
+            use_cache: False면 캐시와 요청 합치기를 건너뛰고 항상 새로 생성
+            json_options: 제공자에 전달할 JSON 모드 옵션 (json_mode, schema)
+
+        Returns:
+            생성된 텍스트
+        """
+        if not self.providers:
+            raise RuntimeError("사용 가능한 LLM 제공자가 없습니다 (GEMINI_API_KEY / ANTHROPIC_API_KEY 확인)")
+
+        if not use_cache:
+            return await self._generate_uncached(prompt, max_tokens, temperature, json_options)
+
+        key = self._cache_key(prompt, max_tokens, temperature, json_options)
+
+        if self.cache:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        # 같은 요청이 이미 진행 중이면 그 결과를 기다림
+        task = self._inflight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(
+                self._generate_and_store(key, prompt, max_tokens, temperature, json_options)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._forget_inflight(k, t))
+
+        # 대기 중인 호출자 하나가 취소되어도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _generate_and_store(
+        self,
+        key: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        text = await self._generate_uncached(prompt, max_tokens, temperature, json_options)
+        if self.cache:
+            await asyncio.to_thread(self.cache.put, key, text)
+        return text
+
+    async def _call_provider(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        """동시성 슬롯 안에서 한 번 호출 (타임아웃은 대기 시간을 제외하고 적용)"""
+        limiter = get_limiter(provider.name, self.config)
+        timeout = self.retry_policy.timeout
+        return await limiter.run(
+            lambda: asyncio.wait_for(
+                provider.generate(prompt, max_tokens, temperature, **(json_options or {})), timeout
+            )
+        )
+
+    async def _generate_with(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        """제공자 하나로 생성 (재시도 포함) 후 응답 시간 기록"""
+        start = time.monotonic()
+        text = await retry_async(
+            self._call_provider, provider, prompt, max_tokens, temperature, json_options,
+            provider=provider.name, config=self.config, policy=self.retry_policy,
+            use_timeout=False
+        )
+        self._latencies.setdefault(provider.name, deque(maxlen=200)).append(time.monotonic() - start)
+        return text
+
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        if self.hedging_enabled and len(self.providers) >= 2:
+            return await self._generate_hedged(prompt, max_tokens, temperature, json_options)
+        return await self._generate_fallback(self.providers, prompt, max_tokens, temperature, json_options)
+
+    async def _generate_fallback(
+        self,
+        providers: List[LLMProvider],
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        """제공자를 순서대로 시도"""
+        last_error = None
+        for idx, provider in enumerate(providers):
+            try:
+                return await self._generate_with(provider, prompt, max_tokens, temperature, json_options)
+            except asyncio.CancelledError:
+                raise
+            except CircuitOpenError as e:
+                # 죽은 제공자는 타임아웃을 기다리지 않고 바로 건너뜀
+                last_error = e
+            except Exception as e:
+                last_error = e
+                if idx + 1 < len(providers):
+                    logger.warning(f"{provider.name} 생성 실패, {providers[idx + 1].name}(으)로 폴백: {e}")
+
+        raise last_error
+
+    async def generate_json(
+        self,
+        prompt: str,
+        max_tokens: int = 8000,
+        temperature: Optional[float] = None,
+        use_cache: bool = True,
+        schema: Optional[Dict] = None,
+        expect: Optional[type] = None
+    ) -> Any:
+        """
+        JSON 응답 생성 후 파싱
+
+        api.llm.native_json이 켜져 있으면 제공자 JSON 모드(스키마가 있으면 스키마 강제)로 요청한다.
+        use_cache일 때 응답(캐시된 것이든 새로 생성한 것이든)이 파싱되지 않으면
+        캐시를 건너뛰고 한 번만 다시 생성해 캐시를 교체한다. use_cache=False면 바로 예외.
+
+        Args:
+            schema: JSON Schema (type/properties/items/required 정도만 사용)
+            expect: dict 또는 list - 응답에서 찾을 JSON 타입
+
+        Raises:
+            JSONExtractionError: 응답에서 JSON을 찾지 못함
+        """
+        json_options = None
+        if self.native_json:
+            json_options = {"json_mode": True}
+            if schema:
+                json_options["schema"] = schema
+
+        text = await self.generate(prompt, max_tokens, temperature, use_cache, json_options)
+        try:
+            return extract_json(text, expect)
+        except JSONExtractionError:
+            if not use_cache:
+                raise
+
+        logger.warning("LLM JSON 응답 파싱 실패 - 다시 생성")
+        text = await self.generate(prompt, max_tokens, temperature, False, json_options)
+        data = extract_json(text, expect)
+        if self.cache:
+            key = self._cache_key(prompt, max_tokens, temperature, json_options)
+            await asyncio.to_thread(self.cache.put, key, text)
+        return data
+
+    async def stream(
+        self,
+        prompt: str,
+        max_tokens: int = 8000,
+        temperature: Optional[float] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        텍스트를 생성되는 대로 조각 단위로 반환
+
+        첫 조각을 받기 전의 일시 오류는 재시도/다음 제공자로 폴백하고,
+        조각을 내보낸 뒤의 오류는 그대로 발생한다 (호출자가 부분 결과를 처리).
+        완성된 응답은 generate()와 같은 키로 캐시되며, 캐시 적중 시 한 조각으로 반환한다.
+        """
+        if not self.providers:
+            raise RuntimeError("사용 가능한 LLM 제공자가 없습니다 (GEMINI_API_KEY / ANTHROPIC_API_KEY 확인)")
+
+        key = self._cache_key(prompt, max_tokens, temperature)
+        if use_cache and self.cache:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                yield cached
+                return
+
+        last_error = None
+        for idx, provider in enumerate(self.providers):
+            chunks: List[str] = []
+            try:
+                async for chunk in self._stream_with(provider, prompt, max_tokens, temperature):
+                    chunks.append(chunk)
+                    yield chunk
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if chunks:
+                    raise
+                last_error = e
+                if idx + 1 < len(self.providers) and not isinstance(e, CircuitOpenError):
+                    logger.warning(f"{provider.name} 스트리밍 실패, {self.providers[idx + 1].name}(으)로 폴백: {e}")
+                continue
+
+            if use_cache and self.cache:
+                await asyncio.to_thread(self.cache.put, key, "".join(chunks))
+            return
+
+        raise last_error
+
+    async def _stream_with(
+        self,
+        provider: LLMProvider,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float]
+    ) -> AsyncIterator[str]:
+        """
+        제공자 하나로 스트리밍 (동시성 슬롯, 회로 차단기, 첫 조각 전 재시도)
+
+        api.timeout은 조각 사이 최대 대기 시간으로 적용한다.
+        """
+        breaker = get_circuit_breaker(provider.name, self.config)
+        limiter = get_limiter(provider.name, self.config)
+        timeout = self.retry_policy.timeout
+
+        attempt = 0
+        while True:
+            breaker.before_call()
+            await limiter.acquire()
+            start = time.monotonic()
+            received = False
+            iterator = provider.stream(prompt, max_tokens, temperature).__aiter__()
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(iterator.__anext__(), timeout)
+                    except StopAsyncIteration:
+                        break
+                    received = True
+                    yield chunk
+            except asyncio.CancelledError:
+                breaker.abort_trial()
+                raise
+            except GeneratorExit:
+                # 소비자가 중간에 반복을 멈춤
+                breaker.abort_trial()
+                raise
+            except Exception as e:
+                limiter.record_error(e)
+                if not is_retryable(e):
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if received or attempt >= self.retry_policy.max_retries:
+                    raise
+                delay = self.retry_policy.delay(attempt, e)
+                attempt += 1
+                logger.warning(f"{provider.name} 스트리밍 일시 오류, {delay:.1f}초 후 재시도 "
+                               f"({attempt}/{self.retry_policy.max_retries}): {e!r}")
+            else:
+                latency = time.monotonic() - start
+                breaker.record_success()
+                limiter.record_success(latency)
+                self._latencies.setdefault(provider.name, deque(maxlen=200)).append(latency)
+                return
+            finally:
+                limiter.release()
+                await _aclose(iterator)
+
+            await asyncio.sleep(delay)
+
+    def hedge_delay(self, provider_name: str) -> float:
+        """헤지 요청을 보내기 전 기다릴 시간 - 최근 응답 시간의 백분위"""
+        samples = self._latencies.get(provider_name)
+        if not samples or len(samples) < self.hedge_min_samples:
+            return self.hedge_initial_delay
+        ordered = sorted(samples)
+        idx = min(len(ordered) - 1, int(self.hedge_percentile * len(ordered)))
+        return max(self.hedge_min_delay, ordered[idx])
+
+    async def _generate_hedged(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: Optional[float],
+        json_options: Optional[Dict] = None
+    ) -> str:
+        """1순위가 백분위 지연 안에 응답하지 않으면 2순위에도 요청, 먼저 끝난 쪽 사용"""
+        primary, secondary = self.providers[0], self.providers[1]
+        self.hedge_stats["requests"] += 1
+
+        primary_task = asyncio.ensure_future(self._generate_with(primary, prompt, max_tokens, temperature, json_options))
+        secondary_task = None
+        # 호출자가 어느 대기 중에 취소돼도 남은 요청은 모두 취소
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=self.hedge_delay(primary.name))
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+
+            hedged = not done
+            if hedged:
+                self.hedge_stats["hedged"] += 1
+                logger.info(f"{primary.name} 응답 지연 - {secondary.name}에 헤지 요청")
+
+            secondary_task = asyncio.ensure_future(
+                self._generate_with(secondary, prompt, max_tokens, temperature, json_options)
+            )
+            pending = {secondary_task} if done else {primary_task, secondary_task}
+            last_error = primary_task.exception() if done else None
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        continue
+                    if hedged:
+                        key = "hedge_wins" if task is secondary_task else "primary_wins"
+                        self.hedge_stats[key] += 1
+                    return task.result()
+        finally:
+            for task in (primary_task, secondary_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+        # 두 제공자 모두 실패 - 나머지 제공자로 폴백
+        if len(self.providers) > 2:
+            logger.warning(f"{primary.name}/{secondary.name} 생성 실패, 다음 제공자로 폴백: {last_error}")
+            return await self._generate_fallback(self.providers[2:], prompt, max_tokens, temperature, json_options)
+        raise last_error
+
+    def hedge_metrics(self) -> Dict:
+        """헤지 비율과 헤지 요청 승률"""
+        stats = dict(self.hedge_stats)
+        stats["hedge_rate"] = round(stats["hedged"] / stats["requests"], 4) if stats["requests"] else 0.0
+        stats["hedge_win_rate"] = round(stats["hedge_wins"] / stats["hedged"], 4) if stats["hedged"] else 0.0
+        return stats
+
+    def generate_sync(
+        self,
+        prompt: str,
+        max_tokens: int = 8000,
+        temperature: Optional[float] = None,
+        use_cache: bool = True
+    ) -> str:
+        """동기 코드(CLI 등)용 - 실행 중인 이벤트 루프가 없을 때만 사용"""
+        return asyncio.run(self.generate(prompt, max_tokens, temperature, use_cache))
+
+
+async def _aclose(iterator: Any):
+    """비동기 제너레이터 정리 (중간에 멈춘 SDK 스트림의 연결 반환)"""
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        try:
+            await aclose()
+        except Exception:
+            pass
+
+
+_gateways: Dict[str, LLMGateway] = {}
+_gateways_lock = threading.Lock()
+
+
+def get_llm_gateway(config: Dict = None) -> Optional[LLMGateway]:
+    """
+    공유 LLM 게이트웨이 반환 (같은 api/캐시 설정이면 같은 인스턴스)
+
+    Returns:
+        사용 가능한 제공자가 없으면 None
+    """
+    config = config or {}
+    key = json.dumps({
+        "api": config.get('api', {}),
+        "cache": config.get('cache', {}).get('llm', {}),
+        "cache_dir": config.get('project', {}).get('cache_dir'),
+    }, sort_keys=True, default=str)
+
+    with _gateways_lock:
+        gateway = _gateways.get(key)
+        if gateway is None:
+            gateway = LLMGateway(config)
+            _gateways[key] = gateway
+
+    return gateway if gateway.is_available else None
+
+
+def reset_llm_gateways():
+    """공유 게이트웨이 초기화 (테스트/환경변수 변경 후)"""
+    with _gateways_lock:
+        _gateways.clear()
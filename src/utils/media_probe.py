@@ -0,0 +1,295 @@
+"""
+Media Probe Module
+==================
+오디오 파일 헤더만 읽어 길이/샘플레이트/채널 수 확인
+
+MP3(Xing/Info/VBRI 또는 CBR 프레임 헤더), WAV(RIFF fmt/data 청크),
+MP4/M4A(mvhd, mp4a 샘플 엔트리)는 순수 파이썬으로 읽고, 그 외 형식은 ffprobe를 쓴다.
+결과는 (경로, 크기, mtime) 기준으로 메모이즈해 같은 파일을 다시 열지 않는다.
+"""
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+HEADER_SCAN_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class MediaInfo:
+    """헤더에서 읽은 오디오 정보"""
+    duration: float
+    sample_rate: int = 0
+    channels: int = 0
+    format: str = ""
+
+
+_memo: Dict[Tuple[str, int, int], Optional[MediaInfo]] = {}
+_memo_lock = threading.Lock()
+
+
+# ----- MP3 -----
+
+_MP3_BITRATES = {
+    (1, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 25: (11025, 12000, 8000)}
+
+
+def _mp3_frame(header: bytes) -> Optional[Dict]:
+    """MPEG 오디오 프레임 헤더 4바이트 해석 (유효하지 않으면 None)"""
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+    version = {3: 1, 2: 2, 0: 25}.get((header[1] >> 3) & 3)
+    layer = {3: 1, 2: 2, 1: 3}.get((header[1] >> 1) & 3)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 3
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    bitrate = _MP3_BITRATES[(1 if version == 1 else 2, layer)][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    channels = 1 if header[3] >> 6 == 3 else 2
+
+    if layer == 1:
+        samples, length = 384, (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 3 and version != 1:
+        samples, length = 576, 72 * bitrate // sample_rate + padding
+    else:
+        samples, length = 1152, 144 * bitrate // sample_rate + padding
+    return {"version": version, "layer": layer, "bitrate": bitrate, "sample_rate": sample_rate,
+            "channels": channels, "samples": samples, "length": length}
+
+
+def _probe_mp3(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    head = f.read(10)
+    start = 0
+    if head[:3] == b"ID3" and len(head) == 10:
+        tag_size = (head[6] & 0x7F) << 21 | (head[7] & 0x7F) << 14 | (head[8] & 0x7F) << 7 | (head[9] & 0x7F)
+        start = 10 + tag_size + (10 if head[5] & 0x10 else 0)
+
+    f.seek(start)
+    data = f.read(HEADER_SCAN_BYTES)
+    frame = None
+    offset = 0
+    while offset < len(data) - 4:
+        offset = data.find(b"\xFF", offset)
+        if offset < 0 or offset > len(data) - 4:
+            return None
+        frame = _mp3_frame(data[offset:offset + 4])
+        # 잘못된 동기 패턴을 거르기 위해 다음 프레임 헤더도 확인 (데이터 끝이면 통과)
+        if frame:
+            following = offset + frame["length"]
+            if following + 4 > len(data) or _mp3_frame(data[following:following + 4]):
+                break
+        frame = None
+        offset += 1
+    if frame is None:
+        return None
+
+    # VBR 헤더 (Xing/Info는 사이드 정보 뒤, VBRI는 헤더 뒤 32바이트)
+    mono = frame["channels"] == 1
+    side_info = (17 if mono else 32) if frame["version"] == 1 else (9 if mono else 17)
+    frames = None
+    xing = offset + 4 + side_info
+    if data[xing:xing + 4] in (b"Xing", b"Info") and len(data) >= xing + 12:
+        flags = struct.unpack(">I", data[xing + 4:xing + 8])[0]
+        if flags & 1:
+            frames = struct.unpack(">I", data[xing + 8:xing + 12])[0]
+    vbri = offset + 4 + 32
+    if frames is None and data[vbri:vbri + 4] == b"VBRI" and len(data) >= vbri + 18:
+        frames = struct.unpack(">I", data[vbri + 14:vbri + 18])[0]
+
+    if frames:
+        duration = frames * frame["samples"] / frame["sample_rate"]
+    else:
+        audio_bytes = size - start - offset
+        if size >= 128:
+            f.seek(size - 128)
+            if f.read(3) == b"TAG":
+                audio_bytes -= 128
+        duration = audio_bytes * 8 / frame["bitrate"]
+    return MediaInfo(round(duration, 3), frame["sample_rate"], frame["channels"], "mp3")
+
+
+# ----- WAV -----
+
+def _probe_wav(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    head = f.read(12)
+    if len(head) < 12 or head[:4] != b"RIFF" or head[8:12] != b"WAVE":
+        return None
+
+    channels = sample_rate = byte_rate = 0
+    position = 12
+    while position + 8 <= size:
+        f.seek(position)
+        chunk_id, chunk_size = struct.unpack("<4sI", f.read(8))
+        if chunk_id == b"fmt ":
+            _, channels, sample_rate, byte_rate = struct.unpack("<HHII", f.read(12))
+        elif chunk_id == b"data":
+            if not byte_rate:
+                return None
+            # 스트리밍으로 쓴 파일은 크기가 비어 있거나 과장될 수 있음
+            data_size = min(chunk_size, size - position - 8)
+            return MediaInfo(round(data_size / byte_rate, 3), sample_rate, channels, "wav")
+        position += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+# ----- MP4 / M4A -----
+
+_MP4_CONTAINERS = {b"moov", b"trak", b"mdia", b"minf", b"stbl"}
+
+
+def _mp4_boxes(f: BinaryIO, start: int, end: int):
+    """(종류, 내용 시작, 박스 끝) 순회"""
+    position = start
+    while position + 8 <= end:
+        f.seek(position)
+        box_size, box_type = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if box_size == 1:
+            box_size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif box_size == 0:
+            box_size = end - position
+        if box_size < header:
+            return
+        yield box_type, position + header, min(position + box_size, end)
+        position += box_size
+
+
+def _probe_mp4(f: BinaryIO, size: int) -> Optional[MediaInfo]:
+    f.seek(4)
+    if f.read(4) not in (b"ftyp", b"moov", b"mdat", b"free", b"wide", b"skip"):
+        return None
+
+    found: Dict[str, float] = {}
+
+    def walk(start: int, end: int):
+        for box_type, body, box_end in _mp4_boxes(f, start, end):
+            if box_type in _MP4_CONTAINERS:
+                walk(body, box_end)
+            elif box_type == b"mvhd":
+                f.seek(body)
+                version = f.read(4)[0]
+                if version == 1:
+                    timescale, duration = struct.unpack(">16xIQ", f.read(28))
+                else:
+                    timescale, duration = struct.unpack(">8xII", f.read(16))
+                if timescale:
+                    found["duration"] = duration / timescale
+            elif box_type == b"stsd" and "sample_rate" not in found:
+                for entry_type, entry_body, _ in _mp4_boxes(f, body + 8, box_end):
+                    if entry_type in (b"mp4a", b"alac", b"ac-3", b"ec-3", b"Opus"):
+                        f.seek(entry_body + 16)
+                        channels, _, _, _, rate = struct.unpack(">HHHHI", f.read(12))
+                        found["channels"] = channels
+                        found["sample_rate"] = rate >> 16
+                        break
+            if "duration" in found and "sample_rate" in found:
+                return
+
+    walk(0, size)
+    if "duration" not in found:
+        return None
+    return MediaInfo(round(found["duration"], 3), int(found.get("sample_rate", 0)),
+                     int(found.get("channels", 0)), "mp4")
+
+
+# ----- ffprobe -----
+
+def _probe_ffprobe(path: str) -> Optional[MediaInfo]:
+    ffprobe = shutil.which("ffprobe")
+    if not ffprobe:
+        return None
+    try:
+        result = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "format=duration,format_name:stream=sample_rate,channels", "-of", "json", path],
+            capture_output=True, timeout=30, check=True
+        )
+        data = json.loads(result.stdout or b"{}")
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+
+    fmt = data.get("format", {})
+    stream = (data.get("streams") or [{}])[0]
+    try:
+        duration = float(fmt.get("duration", 0))
+    except (TypeError, ValueError):
+        return None
+    return MediaInfo(round(duration, 3), int(stream.get("sample_rate") or 0),
+                     int(stream.get("channels") or 0), (fmt.get("format_name") or "").split(",")[0])
+
+
+_PARSERS = {
+    ".mp3": _probe_mp3,
+    ".wav": _probe_wav, ".wave": _probe_wav,
+    ".m4a": _probe_mp4, ".mp4": _probe_mp4, ".aac": _probe_mp4, ".mov": _probe_mp4,
+}
+
+
+def _probe_uncached(path: str) -> Optional[MediaInfo]:
+    suffix = Path(path).suffix.lower()
+    # 확장자를 알면 해당 파서만, 모르면 시그니처가 확실한 형식부터 (MP3 동기 탐색은 마지막)
+    parsers = [_PARSERS[suffix]] if suffix in _PARSERS else [_probe_wav, _probe_mp4, _probe_mp3]
+    size = os.path.getsize(path)
+
+    with open(path, 'rb') as f:
+        for parser in parsers:
+            f.seek(0)
+            try:
+                info = parser(f, size)
+            except (struct.error, IndexError, ValueError, ZeroDivisionError):
+                info = None
+            if info is not None:
+                return info
+    return _probe_ffprobe(path)
+
+
+def probe(path: Union[str, Path]) -> Optional[MediaInfo]:
+    """오디오 헤더 정보 - (경로, 크기, mtime) 기준 메모이즈, 읽을 수 없으면 None"""
+    try:
+        resolved = str(Path(path).resolve())
+        stat = os.stat(resolved)
+    except (OSError, TypeError, ValueError):
+        return None
+
+    memo_key = (resolved, stat.st_size, stat.st_mtime_ns)
+    with _memo_lock:
+        if memo_key in _memo:
+            return _memo[memo_key]
+
+    try:
+        info = _probe_uncached(resolved)
+    except OSError:
+        info = None
+
+    with _memo_lock:
+        _memo[memo_key] = info
+    return info
+
+
+def probe_duration(path: Union[str, Path], default: float = 0.0) -> float:
+    """오디오 길이 (초) - 헤더로 알 수 없으면 default"""
+    info = probe(path)
+    return info.duration if info else default
+
+
+def clear_probe_cache():
+    """메모이즈 결과 비우기 (테스트용)"""
+    with _memo_lock:
+        _memo.clear()
@@ -0,0 +1,150 @@
+"""
+Phase Scheduler Module
+======================
+의존성 그래프 기반 파이프라인 단계 스케줄러
+
+각 단계가 읽는 입력(inputs)과 생성하는 출력(outputs)을 선언하면
+입력이 모두 준비된 단계부터 asyncio로 동시에 실행한다.
+streams로 선언한 입력은 생산 단계가 시작되기만 하면 소비 단계도 시작할 수 있다
+(생산 단계가 완성된 부분을 스트림으로 넘겨주는 경우).
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """파이프라인 단계 정의"""
+    name: str
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    weight: float = 0.0             # 완료 시 증가하는 진행률
+    status: Optional[Any] = None    # 시작 시 설정할 ProjectStatus
+    when: Optional[str] = None      # 참일 때만 실행할 프로젝트 속성 이름
+    skip_status: Optional[Any] = None  # 건너뛸 때 설정할 ProjectStatus
+    streams: Tuple[str, ...] = ()   # 생산 단계 시작만 기다리는 입력 (스트림으로 소비)
+
+
+class PhaseGraphError(ValueError):
+    """잘못된 단계 그래프 (중복 출력, 순환 의존성 등)"""
+
+
+class PhaseScheduler:
+    """단계 그래프 스케줄러"""
+
+    def __init__(self, phases: List[PhaseSpec], max_concurrency: int = 3, streaming: bool = False):
+        self.phases = list(phases)
+        self.max_concurrency = max(1, int(max_concurrency or 1))
+        self.streaming = streaming
+        self.dependencies = self._build_dependencies()
+        self.stream_dependencies = self._build_stream_dependencies()
+        self._check_acyclic()
+
+    def _build_dependencies(self) -> Dict[str, Set[str]]:
+        """출력 → 생산 단계 매핑으로 단계 간 의존성 계산"""
+        names = [p.name for p in self.phases]
+        if len(set(names)) != len(names):
+            raise PhaseGraphError(f"중복된 단계 이름: {names}")
+
+        producers: Dict[str, str] = {}
+        for phase in self.phases:
+            for output in phase.outputs:
+                if output in producers:
+                    raise PhaseGraphError(
+                        f"'{output}' 출력이 {producers[output]}, {phase.name} 단계에서 중복 생성됩니다"
+                    )
+                producers[output] = phase.name
+
+        # 그래프 밖에서 주어지는 입력(topic 등)은 의존성이 아님
+        return {
+            phase.name: {producers[i] for i in phase.inputs if i in producers and producers[i] != phase.name}
+            for phase in self.phases
+        }
+
+    def _build_stream_dependencies(self) -> Dict[str, Set[str]]:
+        """스트림 입력의 생산 단계 (streaming=False면 일반 의존성으로 취급)"""
+        if not self.streaming:
+            return {phase.name: set() for phase in self.phases}
+        producers = {output: phase.name for phase in self.phases for output in phase.outputs}
+        return {
+            phase.name: {producers[i] for i in phase.streams if i in producers} & self.dependencies[phase.name]
+            for phase in self.phases
+        }
+
+    def _is_ready(self, name: str, done: Set[str], started: Set[str]) -> bool:
+        streamed = self.stream_dependencies[name]
+        return (self.dependencies[name] - streamed) <= done and streamed <= started
+
+    def _check_acyclic(self):
+        """순환 의존성 검사"""
+        scheduled = sum(len(level) for level in self.execution_levels())
+        if scheduled != len(self.phases):
+            raise PhaseGraphError("단계 그래프에 순환 의존성이 있습니다")
+
+    def execution_levels(self) -> List[List[str]]:
+        """동시에 실행 가능한 단계 묶음 (위상 정렬 레벨)"""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        levels = []
+        while remaining:
+            level = [p.name for p in self.phases if p.name in remaining and not remaining[p.name]]
+            if not level:
+                break
+            levels.append(level)
+            for name in level:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(level)
+        return levels
+
+    async def run(
+        self,
+        run_phase: Callable[[PhaseSpec], Awaitable[None]],
+        completed: Optional[Set[str]] = None
+    ) -> List[str]:
+        """
+        그래프 실행
+
+        Args:
+            run_phase: 단계 하나를 실행하는 코루틴 함수
+            completed: 이미 완료되어 건너뛸 단계 이름
+
+        Returns:
+            완료된 순서대로의 단계 이름 리스트
+        """
+        done: Set[str] = set(completed or ())
+        started: Set[str] = set(done)
+        pending = [p for p in self.phases if p.name not in done]
+        running: Dict[asyncio.Task, PhaseSpec] = {}
+        finished_order: List[str] = []
+
+        try:
+            while pending or running:
+                # 선언 순서를 우선순위로 삼아 준비된 단계 시작
+                for phase in list(pending):
+                    if len(running) >= self.max_concurrency:
+                        break
+                    if self._is_ready(phase.name, done, started):
+                        pending.remove(phase)
+                        started.add(phase.name)
+                        task = asyncio.ensure_future(run_phase(phase))
+                        running[task] = phase
+
+                if not running:
+                    blocked = [p.name for p in pending]
+                    raise PhaseGraphError(f"실행할 수 없는 단계가 남았습니다: {blocked}")
+
+                finished, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    phase = running.pop(task)
+                    task.result()  # 단계 예외 전파
+                    done.add(phase.name)
+                    finished_order.append(phase.name)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running.keys(), return_exceptions=True)
+
+        return finished_order
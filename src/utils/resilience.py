@@ -0,0 +1,249 @@
+"""
+Resilience Module
+=================
+외부 호출(LLM, ElevenLabs, DALL-E, 이미지 다운로드)용 재시도/회로 차단기
+
+- api.max_retries / api.rate_limit_delay 기반 지터 지수 백오프
+- api.timeout 기반 시도별 타임아웃
+- 제공자별 회로 차단기: 연속 실패 시 cool-down 동안 호출을 즉시 거부
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger("VideoGenerator")
+
+# 일시적 오류로 보고 재시도할 HTTP 상태 코드
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+# 상태 코드가 없는 일시적 오류 (SDK별 예외 이름)
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError", "APITimeoutError", "RateLimitError", "InternalServerError",
+    "ServiceUnavailable", "DeadlineExceeded", "ResourceExhausted",
+    "TransportError", "TimeoutException", "ConnectError", "ReadTimeout", "RemoteProtocolError",
+}
+
+# 동시성을 줄여야 하는 신호 (쿼터 초과, 과부하)
+THROTTLE_STATUS = {429, 503, 529}
+THROTTLE_ERROR_NAMES = {
+    "RateLimitError", "ResourceExhausted", "ServiceUnavailable",
+    "DeadlineExceeded", "TimeoutException", "APITimeoutError",
+}
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어 호출을 건너뜀"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} 회로 차단 중 ({retry_in:.0f}초 후 재시도)")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "status", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """일시적 오류(429/5xx, 타임아웃, 연결 오류)인지 판단"""
+    if isinstance(exc, CircuitOpenError):
+        return False
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+
+    status = _status_code(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+
+    return any(cls.__name__ in RETRYABLE_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def is_throttling(exc: BaseException) -> bool:
+    """제공자가 과부하/쿼터 초과를 알리는 오류인지 (429/503/529, 타임아웃)"""
+    if isinstance(exc, (asyncio.TimeoutError, TimeoutError)):
+        return True
+    status = _status_code(exc)
+    if status is not None:
+        return status in THROTTLE_STATUS
+    return any(cls.__name__ in THROTTLE_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def _retry_after(exc: BaseException) -> Optional[float]:
+    """Retry-After 헤더 (초)"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class RetryPolicy:
+    """재시도 정책"""
+    max_retries: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    timeout: Optional[float] = 120.0
+
+    @classmethod
+    def from_config(cls, config: Dict = None) -> "RetryPolicy":
+        api_config = (config or {}).get('api', {})
+        return cls(
+            max_retries=int(api_config.get('max_retries', 3)),
+            base_delay=float(api_config.get('rate_limit_delay', 1.0)),
+            max_delay=float(api_config.get('max_retry_delay', 30.0)),
+            timeout=api_config.get('timeout', 120),
+        )
+
+    def delay(self, attempt: int, exc: BaseException = None) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter)"""
+        retry_after = _retry_after(exc) if exc is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        cap = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(self.base_delay / 2, max(cap, self.base_delay / 2))
+
+
+class CircuitBreaker:
+    """제공자별 회로 차단기 (closed → open → half-open)"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._half_open_trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def before_call(self):
+        """호출 허용 여부 확인 - 열려 있으면 CircuitOpenError"""
+        with self._lock:
+            state = self.state
+            if state == "closed":
+                return
+            if state == "half_open" and not self._half_open_trial:
+                # cool-down 후 한 번만 시험 호출 허용
+                self._half_open_trial = True
+                return
+            retry_in = max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+            raise CircuitOpenError(self.name, retry_in)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._half_open_trial = False
+
+    def abort_trial(self):
+        """시험 호출이 결과 없이 취소됨 - 다음 호출이 다시 시험하도록 허용"""
+        with self._lock:
+            self._half_open_trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._half_open_trial or self.failures >= self.failure_threshold:
+                if self.opened_at is None or self._half_open_trial:
+                    logger.warning(f"{self.name} 회로 차단 ({self.cooldown:.0f}초)")
+                self.opened_at = time.monotonic()
+                self._half_open_trial = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str, config: Dict = None) -> CircuitBreaker:
+    """제공자별 공유 회로 차단기 (api.circuit_breaker 설정)"""
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            cb_config = (config or {}).get('api', {}).get('circuit_breaker', {})
+            breaker = CircuitBreaker(
+                provider,
+                failure_threshold=cb_config.get('failure_threshold', 5),
+                cooldown=cb_config.get('cooldown_seconds', 60.0),
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def reset_circuit_breakers():
+    """모든 회로 차단기 초기화 (테스트용)"""
+    with _breakers_lock:
+        _breakers.clear()
+
+
+async def retry_async(
+    func: Callable,
+    *args: Any,
+    provider: str,
+    config: Dict = None,
+    policy: RetryPolicy = None,
+    use_timeout: bool = True,
+    **kwargs: Any
+) -> Any:
+    """
+    비동기 외부 호출을 재시도/회로 차단기로 감싸 실행
+
+    Args:
+        func: 코루틴 함수
+        provider: 회로 차단기 이름 (gemini, anthropic, elevenlabs, openai_images ...)
+        config: settings (api.timeout / max_retries / rate_limit_delay)
+        policy: 재시도 정책 (없으면 config에서 생성)
+        use_timeout: 시도별 api.timeout 적용 여부
+            (스레드로 넘기는 블로킹 호출은 취소가 안 되므로 False로 두고 SDK 타임아웃 사용)
+    """
+    policy = policy or RetryPolicy.from_config(config)
+    breaker = get_circuit_breaker(provider, config)
+
+    attempt = 0
+    while True:
+        breaker.before_call()
+        try:
+            if use_timeout and policy.timeout:
+                result = await asyncio.wait_for(func(*args, **kwargs), policy.timeout)
+            else:
+                result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            breaker.abort_trial()
+            raise
+        except Exception as e:
+            if not is_retryable(e):
+                # 요청 자체의 오류(400 등) - 제공자는 응답했으므로 정상으로 기록
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            if attempt >= policy.max_retries:
+                raise
+            delay = policy.delay(attempt, e)
+            attempt += 1
+            logger.warning(f"{provider} 일시 오류, {delay:.1f}초 후 재시도 ({attempt}/{policy.max_retries}): {e!r}")
+            await asyncio.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
+
+
@@ -0,0 +1,51 @@
+"""
+Stream Channel Module
+=====================
+단계 간 스트리밍 결과 전달 채널
+
+생산 단계가 완성된 항목을 publish()하면 구독한 소비 단계들이
+전체 결과를 기다리지 않고 바로 처리할 수 있다. 늦게 구독해도 처음부터 다시 받는다.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, List
+
+
+class StreamChannel:
+    """한 생산자 → 여러 소비자 방송 채널"""
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.closed = False
+        self._waiters: List[asyncio.Future] = []
+
+    def publish(self, item: Any):
+        """항목 추가 후 대기 중인 소비자 깨우기"""
+        if self.closed:
+            return
+        self.items.append(item)
+        self._notify()
+
+    def close(self):
+        """생산 종료 - 소비자는 남은 항목을 받은 뒤 반복을 끝낸다"""
+        self.closed = True
+        self._notify()
+
+    def _notify(self):
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def subscribe(self) -> AsyncIterator[Any]:
+        """지금까지의 항목부터 순서대로 반환, 채널이 닫히면 종료"""
+        idx = 0
+        while True:
+            while idx < len(self.items):
+                yield self.items[idx]
+                idx += 1
+            if self.closed:
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
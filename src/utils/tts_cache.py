@@ -0,0 +1,147 @@
+"""
+TTS Cache Module
+================
+합성 음성 디스크 캐시 (content-addressed)
+
+정규화한 텍스트, 제공자, 음성 ID, 모델, audio.tts.settings를 키로 음성 파일을 저장하고
+용량 초과 시 오래 사용하지 않은 파일부터 삭제한다.
+세그먼트 단위로 합성하므로 문장 하나를 고치면 그 조각만 다시 합성된다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import unicodedata
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+WHITESPACE = re.compile(r'\s+')
+
+_caches: Dict[str, "TTSCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """키용 텍스트 정규화 (유니코드 NFC, 공백 정리) - 발음이 같은 입력은 같은 키"""
+    return WHITESPACE.sub(' ', unicodedata.normalize('NFC', text or '')).strip()
+
+
+class TTSCache:
+    """합성 음성 디스크 캐시"""
+
+    def __init__(self, cache_dir: Union[str, Path], max_size_bytes: int = 2 * 1024 ** 3):
+        self.root = Path(cache_dir) / "tts"
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        text: str,
+        provider: str,
+        voice_id: str = "",
+        model: str = "",
+        settings: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """(정규화 텍스트, 제공자, 음성, 모델, 음성 설정) 해시"""
+        payload = json.dumps(
+            {"text": normalize_text(text), "provider": provider, "voice_id": voice_id or "",
+             "model": model or "", "settings": settings or {}},
+            sort_keys=True, ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str, suffix: str = ".mp3") -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def fetch(self, key: str, target: Union[str, Path]) -> bool:
+        """캐시된 음성을 target으로 복사, 없으면 False"""
+        path = self._path(key, Path(target).suffix or ".mp3")
+        try:
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(path, target)
+            # LRU 접근 시간 갱신
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def put(self, key: str, source: Union[str, Path]) -> bool:
+        """합성한 음성 파일 저장 (빈 파일은 저장 안함)"""
+        source = Path(source)
+        try:
+            if source.stat().st_size == 0:
+                return False
+        except OSError:
+            return False
+
+        path = self._path(key, source.suffix or ".mp3")
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        with self._lock:
+            self._writes_since_evict += 1
+            should_evict = self._writes_since_evict >= 20
+            if should_evict:
+                self._writes_since_evict = 0
+        if should_evict:
+            self.evict()
+        return True
+
+    def evict(self) -> int:
+        """용량 초과 시 가장 오래 사용하지 않은 파일부터 삭제, 삭제한 파일 수 반환"""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.root.glob("*/*"):
+                if path.name.startswith('.'):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            removed = 0
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_size_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+            return removed
+
+
+def get_tts_cache(config: Dict) -> Optional[TTSCache]:
+    """설정의 cache_dir별 공유 TTS 캐시 (cache.tts.enabled가 false면 None)"""
+    cache_config = config.get('cache', {}).get('tts', {})
+    if not cache_config.get('enabled', True):
+        return None
+
+    cache_dir = str(config.get('project', {}).get('cache_dir', './data/cache'))
+    with _caches_lock:
+        cache = _caches.get(cache_dir)
+        if cache is None:
+            try:
+                cache = TTSCache(cache_dir, int(cache_config.get('max_size_mb', 2048) * 1024 ** 2))
+            except OSError as e:
+                print(f"TTS 캐시 초기화 실패: {e}")
+                return None
+            _caches[cache_dir] = cache
+    return cache
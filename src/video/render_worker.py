@@ -0,0 +1,261 @@
+"""
+Render Worker Module
+====================
+CPU 집약적인 moviepy 렌더링 함수
+
+run_isolated()로 별도 파이썬 프로세스에서 실행하며, 취소되면 프로세스 그룹째 종료한다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger("VideoGenerator")
+
+
+def render_main_video(
+    video_config: Dict,
+    audio_path: Optional[str],
+    images: List[str],
+    fallback_duration: float,
+    output_path: str
+) -> float:
+    """
+    메인 영상 렌더링
+
+    Args:
+        video_config: settings.yaml의 video 설정
+        audio_path: 믹싱된 오디오 경로
+        images: 장면 이미지 경로 리스트
+        fallback_duration: 오디오가 없을 때 사용할 길이 (초)
+        output_path: 출력 mp4 경로
+
+    Returns:
+        영상 전체 길이 (초)
+    """
+    from moviepy.editor import (
+        ImageClip, AudioFileClip,
+        concatenate_videoclips, ColorClip
+    )
+
+    # Load audio
+    if audio_path and Path(audio_path).exists():
+        audio = AudioFileClip(audio_path)
+        total_duration = audio.duration
+    else:
+        audio = None
+        total_duration = fallback_duration
+
+    # Create image clips
+    clips = []
+
+    if not images:
+        clip = ColorClip(size=(1920, 1080), color=(26, 26, 46), duration=total_duration)
+        clips.append(clip)
+    else:
+        clip_duration = total_duration / len(images)
+
+        for idx, img_path in enumerate(images):
+            try:
+                if Path(img_path).exists():
+                    img_clip = ImageClip(img_path)
+                    img_clip = img_clip.resize((1920, 1080))
+                    img_clip = img_clip.set_duration(clip_duration)
+
+                    # Ken Burns effect
+                    if video_config.get('animation', {}).get('effects', {}).get('ken_burns', {}).get('enabled', True):
+                        zoom_ratio = video_config['animation']['effects']['ken_burns'].get('zoom_ratio', 0.04)
+                        img_clip = img_clip.resize(lambda t: 1 + zoom_ratio * t / clip_duration)
+
+                    img_clip = img_clip.crossfadein(0.5)
+                    img_clip = img_clip.crossfadeout(0.5)
+
+                    clips.append(img_clip)
+            except Exception as e:
+                logger.warning(f"Image clip creation failed: {e}")
+
+    # Concatenate video
+    if clips:
+        video = concatenate_videoclips(clips, method='compose')
+    else:
+        video = ColorClip(size=(1920, 1080), color=(26, 26, 46), duration=total_duration)
+
+    # Set audio
+    if audio:
+        video = video.set_audio(audio)
+
+    # Export
+    video.write_videofile(
+        str(output_path),
+        fps=video_config['fps'],
+        codec=video_config['codec'],
+        audio_codec=video_config['audio_codec'],
+        bitrate=video_config['bitrate'],
+        preset=video_config.get('preset', 'medium')
+    )
+
+    # Cleanup
+    video.close()
+    if audio:
+        audio.close()
+    for clip in clips:
+        clip.close()
+
+    return total_duration
+
+
+def render_shorts(
+    shorts_config: Dict,
+    video_path: str,
+    highlights: List[Dict],
+    output_dir: str
+) -> List[str]:
+    """
+    하이라이트 구간을 세로(9:16) Shorts로 렌더링
+
+    Args:
+        shorts_config: settings.yaml의 shorts 설정
+        video_path: 원본 영상 경로
+        highlights: [{"start": 초, "duration": 초, "title": ...}]
+        output_dir: 출력 폴더
+
+    Returns:
+        생성된 Shorts 경로 리스트
+    """
+    from moviepy.editor import VideoFileClip
+
+    original = VideoFileClip(video_path)
+
+    shorts_paths = []
+    for idx, highlight in enumerate(highlights):
+        try:
+            start = highlight['start']
+            duration = min(highlight['duration'], shorts_config['format']['max_duration'])
+            clip = original.subclip(start, min(start + duration, original.duration))
+
+            # Convert to vertical (9:16)
+            w, h = clip.size
+            target_ratio = 9 / 16
+
+            new_w = int(h * target_ratio)
+            x_center = w // 2
+
+            clip = clip.crop(
+                x1=max(0, x_center - new_w // 2),
+                y1=0,
+                x2=min(w, x_center + new_w // 2),
+                y2=h
+            )
+
+            clip = clip.resize((1080, 1920))
+
+            short_path = Path(output_dir) / f"short_{idx:02d}.mp4"
+            clip.write_videofile(
+                str(short_path),
+                fps=shorts_config['format']['fps'],
+                codec='libx264',
+                audio_codec='aac'
+            )
+
+            shorts_paths.append(str(short_path))
+            clip.close()
+
+            logger.info(f"  Short {idx+1} 생성 완료")
+
+        except Exception as e:
+            logger.warning(f"  Short {idx+1} 생성 실패: {e}")
+
+    original.close()
+    return shorts_paths
+
+
+# 서브프로세스에서 이름으로 호출할 수 있는 렌더링 함수
+RENDER_FUNCTIONS = {
+    "render_main_video": render_main_video,
+    "render_shorts": render_shorts,
+}
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent)
+
+
+def _kill_process_tree(proc) -> None:
+    """렌더 프로세스와 그 자식(ffmpeg) 종료"""
+    if proc.returncode is not None:
+        return
+    try:
+        if hasattr(os, 'killpg'):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+async def run_isolated(func: Callable, *args: Any) -> Any:
+    """
+    렌더링 함수를 별도 파이썬 프로세스에서 실행
+
+    인자와 결과는 JSON으로 주고받는다. 호출한 작업이 취소되면(단계 시간 초과 등)
+    프로세스 그룹 전체를 종료해 ffmpeg가 남지 않도록 한다.
+    """
+    if func.__name__ not in RENDER_FUNCTIONS:
+        raise ValueError(f"등록되지 않은 렌더링 함수: {func.__name__}")
+
+    with tempfile.TemporaryDirectory(prefix="render_") as tmp:
+        job_path = Path(tmp) / "job.json"
+        result_path = Path(tmp) / "result.json"
+        job_path.write_text(json.dumps({"func": func.__name__, "args": list(args)}), encoding='utf-8')
+
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(p for p in (SRC_DIR, env.get("PYTHONPATH")) if p)
+
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "video.render_worker", str(job_path), str(result_path),
+            env=env,
+            start_new_session=hasattr(os, 'killpg')
+        )
+        try:
+            returncode = await proc.wait()
+        except asyncio.CancelledError:
+            _kill_process_tree(proc)
+            raise
+
+        try:
+            result = json.loads(result_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            result = {}
+
+        if returncode != 0 or "error" in result:
+            raise RuntimeError(result.get("error") or f"렌더 프로세스 비정상 종료 (code {returncode})")
+        return result.get("result")
+
+
+def main(argv: List[str] = None) -> int:
+    """서브프로세스 진입점: python -m video.render_worker <job.json> <result.json>"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    job_path, result_path = (argv if argv is not None else sys.argv[1:])[:2]
+
+    with open(job_path, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+
+    try:
+        result = {"result": RENDER_FUNCTIONS[job["func"]](*job["args"])}
+        code = 0
+    except Exception as e:
+        logger.exception("렌더링 실패")
+        result = {"error": f"{type(e).__name__}: {e}"}
+        code = 1
+
+    with open(result_path, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,7 +9,6 @@ from typing import Dict, List, Optional
 from pathlib import Path
 from dataclasses import dataclass
 import httpx
-import os
 import uuid
 
 
@@ -48,17 +47,10 @@ class ImageGenerator:
         self._init_gemini()
 
     def _init_gemini(self):
-        """Gemini 클라이언트 초기화 (프롬프트 생성용)"""
+        """LLM 게이트웨이 연결 (프롬프트 생성용, 공유 인스턴스)"""
         try:
-            import google.generativeai as genai
-            from dotenv import load_dotenv
-
-            load_dotenv('config/api_keys.env')
-            api_key = os.getenv('GEMINI_API_KEY')
-
-            if api_key:
-                genai.configure(api_key=api_key)
-                self.gemini_client = genai.GenerativeModel('gemini-1.5-flash')
+            from utils.llm_gateway import get_llm_gateway
+            self.gemini_client = get_llm_gateway(self.config)
         except ImportError:
             pass
 
@@ -96,15 +88,17 @@ class ImageGenerator:
             # Unsplash에서 관련 이미지 가져오기
             image_url = f"{self.FREE_IMAGE_APIS['unsplash']}{search_term}"
             
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(image_url, timeout=30.0)
-                
-                if response.status_code == 200:
-                    with open(output_path, 'wb') as f:
-                        f.write(response.content)
-                else:
-                    # 실패 시 placeholder 사용
-                    await self._create_placeholder(output_path, prompt)
+            from utils.adaptive_limiter import get_limiter
+            from utils.resilience import retry_async
+
+            # 429/5xx는 재시도, 그 외 실패는 placeholder 사용
+            limiter = get_limiter("image_download", self.config)
+            image_data = await retry_async(
+                limiter.run, self._fetch_image, image_url,
+                provider="image_download", config=self.config, use_timeout=False
+            )
+            with open(output_path, 'wb') as f:
+                f.write(image_data)
 
             return GeneratedImage(
                 path=output_path,
@@ -124,6 +118,13 @@ class ImageGenerator:
                 style=style or 'default'
             )
 
+    async def _fetch_image(self, url: str) -> bytes:
+        """이미지 다운로드 - 200이 아니면 HTTPStatusError"""
+        async with httpx.AsyncClient(follow_redirects=True) as client:
+            response = await client.get(url, timeout=30.0)
+            response.raise_for_status()
+            return response.content
+
     async def _create_placeholder(self, output_path: str, text: str):
         """플레이스홀더 이미지 생성"""
         try:
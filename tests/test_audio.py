@@ -24,6 +24,44 @@ class TestTTSEngine:
         assert engine.provider == "elevenlabs"
 
 
+class TestSegmentTTS:
+    """Test suite for per-segment narration planning."""
+
+    def test_plan_pieces_splits_long_segments(self):
+        """Test long segments are split at sentence boundaries and empty ones skipped."""
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.audio.segment_tts import plan_pieces
+
+        segments = [
+            {"id": 1, "type": "hook", "text": "짧은 후크예요."},
+            {"id": 2, "type": "body", "text": " ".join(f"본문 문장 {i}번입니다." for i in range(10))},
+            {"id": 3, "type": "body", "text": "  "},
+        ]
+        pieces = plan_pieces(segments, max_chars=40)
+
+        assert pieces[0].segment_id == 1
+        assert [p.index for p in pieces] == list(range(len(pieces)))
+        assert {p.segment_id for p in pieces[1:]} == {2}
+        assert all(len(p.text) <= 40 for p in pieces)
+        assert " ".join(p.text for p in pieces[1:]) == segments[1]["text"]
+        assert plan_pieces([], "전체 스크립트")[0].text == "전체 스크립트"
+
+    def test_plan_timing_merges_pieces_per_segment(self):
+        """Test offsets account for crossfades and pieces of one segment merge."""
+        from src.audio.segment_tts import NarrationPiece, plan_timing
+
+        pieces = [
+            NarrationPiece(0, 1, "hook", "a"),
+            NarrationPiece(1, 2, "body", "b"),
+            NarrationPiece(2, 2, "body", "c"),
+        ]
+        timing = plan_timing(pieces, [2000, 3000, 1000], crossfade_ms=50)
+
+        assert timing == [
+            {"segment_id": 1, "type": "hook", "start": 0.0, "end": 2.0, "pieces": 1},
+            {"segment_id": 2, "type": "body", "start": 1.95, "end": 5.9, "pieces": 2},
+        ]
+
 class TestBGMSelector:
     """Test suite for BGMSelector."""
 
@@ -45,6 +83,154 @@ class TestBGMSelector:
         assert result is not None
 
 
+class TestAudioLibrary:
+    """Test suite for the indexed BGM/SFX library."""
+
+    @staticmethod
+    def _write_wav(path, seconds, rate=8000, clicks_per_second=0):
+        import wave
+        path.parent.mkdir(parents=True, exist_ok=True)
+        frames = bytearray(int(rate * seconds) * 2)
+        if clicks_per_second:
+            step = int(rate / clicks_per_second)
+            for start in range(0, len(frames) // 2, step):
+                for i in range(start, min(start + 80, len(frames) // 2)):
+                    frames[2 * i:2 * i + 2] = (20000).to_bytes(2, "little", signed=True)
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(rate)
+            f.writeframes(bytes(frames))
+
+    def test_refresh_only_reanalyzes_changed_files(self, tmp_path, monkeypatch):
+        """Test the index is persisted and only new or modified files are analyzed."""
+        import os
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.audio import audio_library
+        from src.audio.audio_library import AudioLibrary
+
+        root = tmp_path / "music"
+        self._write_wav(root / "epic" / "a.wav", 2)
+        self._write_wav(root / "epic" / "b.wav", 4)
+        self._write_wav(root / "calm" / "c.wav", 1)
+        index = tmp_path / "index.json"
+
+        analyzed = []
+        original = audio_library.analyze_file
+        monkeypatch.setattr(audio_library, "analyze_file", lambda p: analyzed.append(p) or original(p))
+
+        library = AudioLibrary(root, index, workers=1)
+        assert library.refresh() == 3
+        assert sorted(library.categories()) == ["calm", "epic"]
+        assert [t.name for t in library.tracks("epic")] == ["a", "b"]
+        assert library.tracks("epic")[1].duration == 4.0
+
+        # 새 인스턴스는 저장된 색인을 읽고 아무것도 다시 분석하지 않음
+        analyzed.clear()
+        reloaded = AudioLibrary(root, index, workers=1)
+        assert reloaded.refresh() == 0 and not analyzed
+        assert len(reloaded) == 3
+
+        self._write_wav(root / "epic" / "a.wav", 3)
+        os.utime(root / "epic" / "a.wav", ns=(0, 10 ** 18))
+        (root / "calm" / "c.wav").unlink()
+        assert reloaded.refresh() == 1
+        assert [Path(p).name for p in analyzed] == ["a.wav"]
+        assert reloaded.get(str(root / "epic" / "a.wav")).duration == 3.0
+        assert reloaded.tracks("calm") == []
+
+    def test_header_only_entries_reanalyzed_with_numpy(self, tmp_path, monkeypatch):
+        """Test entries indexed without NumPy are re-analyzed once NumPy is available."""
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.audio import audio_library
+        from src.audio.audio_library import AudioLibrary
+
+        root = tmp_path / "music"
+        self._write_wav(root / "epic" / "a.wav", 1, clicks_per_second=2)
+        index = tmp_path / "index.json"
+        numpy = audio_library.np
+
+        monkeypatch.setattr(audio_library, "np", None)
+        library = AudioLibrary(root, index, workers=1)
+        assert library.refresh() == 1
+        assert library.tracks("epic")[0].loudness is None
+        assert AudioLibrary(root, index, workers=1).refresh() == 0
+
+        monkeypatch.setattr(audio_library, "np", numpy)
+        upgraded = AudioLibrary(root, index, workers=1)
+        assert upgraded.refresh() == 1
+        assert upgraded.tracks("epic")[0].loudness is not None
+        assert AudioLibrary(root, index, workers=1).refresh() == 0
+
+    def test_loudness_and_tempo(self):
+        """Test gated loudness and autocorrelation tempo on synthetic envelopes."""
+        import numpy as np
+        from src.audio.audio_library import _estimate_tempo, _integrated_loudness
+
+        # -20dB 평균 제곱 → -20.691 LUFS, 무음 블록은 절대 게이트로 제외
+        level = np.full(400, 0.01)
+        assert _integrated_loudness(level) == pytest.approx(-20.691, abs=0.01)
+        assert _integrated_loudness(np.concatenate([level, np.zeros(400)])) == pytest.approx(-20.691, abs=0.01)
+        assert _integrated_loudness(np.zeros(400)) == -70.0
+
+        def pulses(every):
+            rms = np.zeros(1000)
+            rms[::every] = 1.0
+            return rms
+
+        assert _estimate_tempo(pulses(50)) == pytest.approx(120, abs=1)   # 0.5초 간격
+        assert _estimate_tempo(pulses(75)) == pytest.approx(80, abs=1)
+        assert _estimate_tempo(np.ones(1000)) is None
+
+    def test_query_and_features(self, tmp_path):
+        """Test in-memory queries and measured signal features."""
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.audio import audio_library
+        from src.audio.audio_library import AudioLibrary
+
+        root = tmp_path / "music"
+        self._write_wav(root / "epic" / "short.wav", 1)
+        self._write_wav(root / "epic" / "beat.wav", 6, clicks_per_second=2)
+        self._write_wav(root / "ambient" / "pad.wav", 3)
+        library = AudioLibrary(root, workers=1)
+        library.ensure_ready()
+
+        assert [t.name for t in library.query(["epic"], min_duration=5)] == ["beat"]
+        assert {t.name for t in library.query(["epic", "ambient"])} == {"beat", "pad", "short"}
+        assert {t.name for t in library.query(["missing"], mood="epic")} == {"beat", "short"}
+
+        beat = library.get(str(root / "epic" / "beat.wav"))
+        assert beat.tempo == pytest.approx(120, abs=3)
+        assert beat.tempo_label == "medium"
+        assert beat.loudness is not None and len(beat.envelope) == audio_library.ENVELOPE_POINTS
+
+    @pytest.mark.asyncio
+    async def test_selectors_use_index(self, config, tmp_path):
+        """Test BGM and SFX selection come from the shared index."""
+        import copy
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.audio import BGMSelector, SFXManager
+
+        config = copy.deepcopy(config)
+        config["project"] = {"cache_dir": str(tmp_path / "cache")}
+        self._write_wav(tmp_path / "music" / "science" / "long.wav", 5)
+        self._write_wav(tmp_path / "music" / "science" / "short.wav", 1)
+        self._write_wav(tmp_path / "sfx" / "transition" / "b.wav", 1)
+        self._write_wav(tmp_path / "sfx" / "transition" / "a.wav", 1)
+
+        selector = BGMSelector(config)
+        selector.library_path = tmp_path / "music"
+        track = await selector.select_bgm("science", "ambient", duration_needed=4)
+        assert track.name == "long" and track.duration == 5.0
+        assert (await selector.analyze_track(track.path))["duration"] == 5.0
+
+        sfx = SFXManager(config)
+        sfx.library_path = tmp_path / "sfx"
+        assert (await sfx.get_sfx("transition", variant=0)).name == "a"
+        suggestions = await sfx.auto_suggest_sfx([{"type": "hook"}, {"type": "body"}, {"type": "body"}])
+        assert [s["segment_index"] for s in suggestions] == [1, 2]
+        assert list((tmp_path / "cache" / "audio_library").glob("*.json"))
+
 class TestAudioMixer:
     """Test suite for AudioMixer."""
 
@@ -56,6 +242,112 @@ class TestAudioMixer:
         assert mixer.config == config
 
 
+class TestMixEngine:
+    """Test suite for the single-pass mixing engine."""
+
+    @staticmethod
+    def _write_wav(path, samples, rate=8000, channels=1):
+        import struct
+        import wave
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(channels)
+            f.setsampwidth(2)
+            f.setframerate(rate)
+            f.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+
+    @staticmethod
+    def _read_wav(path):
+        import struct
+        import wave
+        with wave.open(str(path), "rb") as f:
+            raw = f.readframes(f.getnframes())
+            return f.getframerate(), f.getnchannels(), list(struct.unpack(f"<{len(raw) // 2}h", raw))
+
+    def test_bgm_tiles_follow_loop_and_block(self):
+        """Test BGM tiles never cross a loop boundary or exceed the block size."""
+        from src.audio.mix_engine import bgm_tiles
+
+        assert bgm_tiles(10, 4) == [(0, 4, 0), (4, 8, 0), (8, 10, 0)]
+        assert bgm_tiles(10, 4, block_frames=3) == [(0, 3, 0), (3, 4, 3), (4, 7, 0), (7, 8, 3), (8, 10, 0)]
+        assert bgm_tiles(0, 4) == [] and bgm_tiles(5, 0) == []
+
+    def test_single_pass_mix(self, tmp_path):
+        """Test looped BGM, fades and repeated SFX are accumulated into the narration buffer."""
+        from src.audio.mix_engine import BGMLayer, SFXLayer, mix_to_file
+
+        self._write_wav(tmp_path / "narration.wav", [1000] * 800)
+        self._write_wav(tmp_path / "bgm.wav", [2000, 4000] * 150)  # 300 프레임 → 루프
+        self._write_wav(tmp_path / "click.wav", [8000] * 20, rate=16000, channels=2)
+
+        duration, used = mix_to_file(
+            str(tmp_path / "narration.wav"), str(tmp_path / "mixed.wav"),
+            BGMLayer(str(tmp_path / "bgm.wav"), gain_db=-6.0206, fade_in=0.0125, fade_out=0.0125),
+            [SFXLayer(str(tmp_path / "click.wav"), position=0.05),
+             SFXLayer(str(tmp_path / "click.wav"), position=0.099),
+             SFXLayer(str(tmp_path / "click.wav"), position=5.0)]
+        )
+        rate, channels, samples = self._read_wav(tmp_path / "mixed.wav")
+
+        assert duration == 0.1 and (rate, channels, len(samples)) == (8000, 1, 800)
+        assert used.count(str(tmp_path / "click.wav")) == 2
+        assert samples[0] == 1000                                # 페이드 인 시작
+        assert samples[200:202] == pytest.approx([2000, 3000], abs=2)
+        assert samples[300:302] == pytest.approx([2000, 3000], abs=2)  # 루프 이음매
+        # 16kHz 스테레오 효과음은 8kHz 모노 5프레임으로 변환되어 같은 디코딩 결과를 재사용
+        assert samples[400:406] == pytest.approx([10000, 11000, 10000, 11000, 10000, 3000], abs=2)
+        # 페이드 아웃: 남은 프레임 / 100 배율의 BGM 위에 효과음
+        assert samples[792:797] == pytest.approx([9080, 9140, 9060, 9100, 9040], abs=2)
+        assert samples[797:800] == pytest.approx([1060, 1020, 1020], abs=2)
+
+    def test_decode_conform_and_encode(self, tmp_path):
+        """Test WAV decoding, format conversion and saturating 16-bit encoding."""
+        import wave
+        import numpy as np
+        from src.audio.mix_engine import decode, encode
+
+        with wave.open(str(tmp_path / "u8.wav"), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(1)
+            f.setframerate(8000)
+            f.writeframes(bytes([128, 192, 64]))
+        samples, rate = decode(str(tmp_path / "u8.wav"))
+        assert rate == 8000 and samples[:, 0].tolist() == [0.0, 0.5, -0.5]
+
+        # 16kHz 스테레오 → 8kHz 모노 (채널 평균, 선형 보간)
+        self._write_wav(tmp_path / "st.wav", [1000, 3000] * 8, rate=16000, channels=2)
+        samples, rate = decode(str(tmp_path / "st.wav"), 8000, 1)
+        assert rate == 8000 and samples.shape == (4, 1)
+        assert samples[:, 0] * 32768 == pytest.approx([2000] * 4)
+
+        buffer = np.array([[1000 / 32768], [2.0], [-2.0]], dtype=np.float32)
+        encode(buffer, 8000, str(tmp_path / "out.wav"))
+        assert self._read_wav(tmp_path / "out.wav") == (8000, 1, [1000, 32767, -32768])
+
+    def test_pydub_fallback_length_and_gain(self, tmp_path, monkeypatch):
+        """Test the pydub path keeps the narration length and applies layer gains."""
+        from src.audio import mix_engine
+        from src.audio.mix_engine import BGMLayer, SFXLayer, mix_to_file
+
+        monkeypatch.setattr(mix_engine, "np", None)
+        self._write_wav(tmp_path / "narration.wav", [1000] * 800)
+        self._write_wav(tmp_path / "bgm.wav", [4000] * 300)
+        self._write_wav(tmp_path / "click.wav", [8000] * 5)
+
+        duration, used = mix_to_file(
+            str(tmp_path / "narration.wav"), str(tmp_path / "mixed.wav"),
+            BGMLayer(str(tmp_path / "bgm.wav"), gain_db=-6.0206),
+            [SFXLayer(str(tmp_path / "click.wav"), position=0.05, gain_db=-20),
+             SFXLayer(str(tmp_path / "click.wav"), position=5.0)]
+        )
+        rate, channels, samples = self._read_wav(tmp_path / "mixed.wav")
+
+        assert duration == 0.1 and (rate, channels, len(samples)) == (8000, 1, 800)
+        assert used == [str(tmp_path / "narration.wav"), str(tmp_path / "bgm.wav"), str(tmp_path / "click.wav")]
+        assert samples[0] == pytest.approx(3000, abs=2)        # 나레이션 + 루프 BGM × 0.5
+        assert samples[700] == pytest.approx(3000, abs=2)
+        assert samples[400:406] == pytest.approx([3800] * 5 + [3000], abs=2)  # 효과음 × 0.1
+
+
 class TestAudioEnhancer:
     """Test suite for AudioEnhancer."""
 
@@ -65,3 +357,56 @@ class TestAudioEnhancer:
 
         enhancer = AudioEnhancer(config)
         assert enhancer.config == config
+
+
+class TestDurationEstimator:
+    """Test suite for DurationEstimator."""
+
+    def test_estimate_by_language_and_speed(self):
+        """Test estimates use per-language units and scale with narration speed."""
+        from src.audio.duration_estimator import DurationEstimator, count_units
+
+        estimator = DurationEstimator()
+        korean = "양자역학은 미시세계를 설명하는 이론이에요. 근데 진짜 재밌는 건요, 관측하면 달라진다는 거예요."
+
+        assert count_units("가나다 abc 12", "syllable") == 3 + 2 + 2
+        assert count_units("Hello there, world.", "word") == 3
+        normal = estimator.estimate(korean, "ko")
+        assert normal > 0
+        assert estimator.estimate(korean, "ko", speed=1.2) < normal
+        assert estimator.estimate("", "ko") == 0.0
+
+    def test_calibration_converges_and_persists(self, tmp_path):
+        """Test observed TTS durations move the rate and are saved per voice."""
+        import src.main  # noqa: F401  (src를 sys.path에 추가)
+        from src.audio.duration_estimator import DurationEstimator
+
+        path = tmp_path / "speech_rates.json"
+        estimator = DurationEstimator(path)
+        text = "가" * 300 + "."
+        actual = 300 / 4.0 + 0.35   # 초당 4음절로 읽는 느린 음성
+
+        before = estimator.estimate(text, "ko", "slow")
+        for _ in range(10):
+            estimator.observe(text, "ko", "slow", actual)
+
+        assert abs(estimator.estimate(text, "ko", "slow") - actual) < abs(before - actual) * 0.2
+        assert estimator.estimate(text, "ko", "other") == before
+        assert estimator.observe("짧음", "ko", "slow", 1.0) is None
+        assert DurationEstimator(path).rate("ko", "slow") == estimator.rate("ko", "slow")
+
+    def test_plan_adjustments_targets_outlier_segments(self):
+        """Test only segments overshooting in the same direction as the total are planned."""
+        from src.audio.duration_estimator import DurationEstimator
+
+        estimator = DurationEstimator()
+        segments = [
+            {"id": 1, "text": "가" * 62, "duration": 10},
+            {"id": 2, "text": "나" * 620, "duration": 10},
+        ]
+
+        plan = estimator.plan_adjustments(segments, 20, "ko")
+
+        assert list(plan) == [2]
+        assert 50 <= plan[2] <= 70
+        assert estimator.plan_adjustments(segments[:1], 10, "ko") == {}
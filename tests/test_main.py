@@ -1,4 +1,5 @@
 """Tests for main VideoGenerator class."""
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from pathlib import Path
@@ -7,13 +8,24 @@ from pathlib import Path
 class TestVideoGenerator:
     """Test suite for VideoGenerator class."""
 
-    def test_video_generator_init(self, config):
+    def test_video_generator_init(self, config, tmp_path):
         """Test VideoGenerator initialization."""
+        import copy
+        import logging
         from src.main import VideoGenerator
 
-        with patch.object(VideoGenerator, '_load_config', return_value=config):
-            generator = VideoGenerator(config_path="test_config.yaml")
-            assert generator.config is not None
+        # 로그 파일은 작업 디렉터리의 ./logs가 아닌 임시 디렉터리에
+        config = copy.deepcopy(config)
+        config["logging"] = {"file": {"path": str(tmp_path / "logs")}}
+        try:
+            with patch.object(VideoGenerator, '_load_config', return_value=config):
+                generator = VideoGenerator(config_path="test_config.yaml")
+                assert generator.config is not None
+        finally:
+            logger = logging.getLogger("VideoGenerator")
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers = []
 
     def test_video_category_enum(self):
         """Test VideoCategory enum values."""
@@ -65,6 +77,45 @@ class TestVideoProject:
         assert project.topic == "테스트 주제"
         assert project.category == VideoCategory.SCIENCE
 
+    def test_round_trip(self, tmp_path):
+        """Test save/load restores every sub-dataclass."""
+        from src.main import VideoProject, Language, LocalizationData
+        from datetime import datetime
+
+        project = VideoProject(
+            topic="테스트 주제",
+            generate_localizations=[Language.ENGLISH],
+            scheduled_time=datetime(2024, 1, 1, 18, 0),
+        )
+        project.script.segments = [{"id": 1, "type": "hook", "text": "후크"}]
+        project.audio.narration_path = "narration.mp3"
+        project.visual.images = ["scene_000.png"]
+        project.seo.tags = ["태그"]
+        project.localizations["en"] = LocalizationData(language="en", localized_seo={"title": "Title"})
+        project.completed_phases = ["research", "script"]
+
+        path = tmp_path / "project.json"
+        project.save(str(path))
+
+        assert VideoProject.load(str(path)) == project
+
+    def test_load_legacy_summary(self, tmp_path):
+        """Test old summary-only files still load."""
+        import json
+        from src.main import VideoProject, VideoCategory
+
+        path = tmp_path / "legacy.json"
+        path.write_text(json.dumps({
+            "id": "vid_legacy", "topic": "주제", "category": "science",
+            "localizations": ["en"], "video_path": "", "shorts_count": 0,
+        }), encoding="utf-8")
+
+        project = VideoProject.load(str(path))
+
+        assert project.id == "vid_legacy"
+        assert project.category == VideoCategory.SCIENCE
+        assert project.localizations == {}
+
 
 class TestSeriesProject:
     """Test suite for SeriesProject dataclass."""
@@ -86,3 +137,597 @@ class TestSeriesProject:
         assert series.id == "series_001"
         assert series.episode_count == 5
         assert len(series.episodes) == 0
+
+
+class TestPhaseGraph:
+    """Test suite for the VideoGenerator phase graph."""
+
+    def test_media_phases_run_in_parallel(self):
+        """Test audio/visual and title-only phases are not serialized."""
+        from src.main import VideoGenerator, PhaseScheduler
+
+        levels = PhaseScheduler(VideoGenerator.PHASE_GRAPH).execution_levels()
+        level_of = {name: i for i, level in enumerate(levels) for name in level}
+
+        assert level_of["audio"] == level_of["visual"]
+        assert level_of["thumbnail"] < level_of["video_compose"]
+        assert level_of["seo"] < level_of["video_compose"]
+        assert level_of["backup"] == len(levels) - 1
+
+    def test_seo_waits_for_script_only_when_fused(self, config):
+        """Test the SEO phase depends on the script only in fused request mode."""
+        import copy
+        from src.main import PhaseScheduler
+
+        config = copy.deepcopy(config)
+        generator = _make_generator(config)
+        assert PhaseScheduler(generator._phase_graph()).dependencies["seo"] == {"research"}
+
+        config["api"]["llm"] = {"fused_requests": True}
+        assert PhaseScheduler(generator._phase_graph()).dependencies["seo"] == {"research", "script"}
+
+    def test_phase_weights_sum_to_one(self):
+        """Test progress weights cover the whole pipeline."""
+        from src.main import VideoGenerator
+
+        assert sum(p.weight for p in VideoGenerator.PHASE_GRAPH) == pytest.approx(1.0)
+
+
+def _make_generator(config):
+    """Build a VideoGenerator without touching config files or API clients."""
+    import logging
+    from src.main import VideoGenerator
+
+    generator = VideoGenerator.__new__(VideoGenerator)
+    generator.config = config
+    generator.logger = logging.getLogger("test")
+    generator.components = {}
+    generator.llm = None
+    generator.artifact_cache = None
+    generator.tts_cache = None
+    generator.max_render_processes = 1
+    generator._render_semaphore = None
+    generator._render_loop = None
+    generator._script_streams = {}
+    return generator
+
+
+class TestResume:
+    """Test suite for checkpointed pipeline resume."""
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_phases(self, config, tmp_path, monkeypatch):
+        """Test resume runs only phases missing from the checkpoint."""
+        from src.main import VideoProject
+
+        monkeypatch.chdir(tmp_path)
+        generator = _make_generator(config)
+
+        ran = []
+        for spec in generator.PHASE_GRAPH:
+            async def phase(project, name=spec.name):
+                ran.append(name)
+                return project
+            setattr(generator, f"_phase_{spec.name}", phase)
+
+        project = VideoProject(topic="주제", completed_phases=["research", "script", "audio"])
+        project.save()
+
+        resumed = await generator.resume_video(project.id)
+
+        assert "research" not in ran and "audio" not in ran
+        assert "visual" in ran and "backup" in ran
+        saved = VideoProject.load(VideoProject.default_path(project.id))
+        assert saved.completed_phases == resumed.completed_phases
+        assert len(saved.completed_phases) == len(generator.PHASE_GRAPH)
+
+
+class TestPhaseBudget:
+    """Test suite for per-phase time budgets."""
+
+    @pytest.mark.asyncio
+    async def test_overrunning_phases_are_recorded(self, config, tmp_path, monkeypatch):
+        """Test soft and hard overruns are recorded and the pipeline continues."""
+        import copy
+        from src.main import VideoProject
+        from utils.deadline import PhaseDeadlineExceeded, within_deadline
+
+        monkeypatch.chdir(tmp_path)
+        config = copy.deepcopy(config)
+        config["pipeline"] = {
+            "phase_timeouts": {"default": 5, "research": 0.05, "script": 0.05},
+            "phase_grace_seconds": 0.05,
+        }
+        generator = _make_generator(config)
+
+        ran = []
+        for spec in generator.PHASE_GRAPH:
+            async def phase(project, name=spec.name):
+                ran.append(name)
+                return project
+            setattr(generator, f"_phase_{spec.name}", phase)
+
+        async def research(project):
+            # 외부 호출이 예산을 넘기면 폴백
+            try:
+                await within_deadline(asyncio.sleep(5))
+            except PhaseDeadlineExceeded:
+                project.title = "폴백 제목"
+            return project
+
+        async def script(project):
+            # 예산을 무시하고 멈춘 단계
+            await asyncio.sleep(5)
+            return project
+
+        generator._phase_research = research
+        generator._phase_script = script
+
+        project = VideoProject(topic="주제")
+        project.save()
+        result = await generator.resume_video(project.id)
+
+        overruns = {o["phase"]: o for o in result.phase_overruns}
+        assert set(overruns) == {"research", "script"}
+        assert overruns["research"]["cancelled"] is False
+        assert overruns["script"]["cancelled"] is True
+        assert result.title == "폴백 제목"
+        assert "backup" in ran
+        # 강제 취소된 단계만 미완료로 남아 resume 시 다시 실행
+        assert "script" not in result.completed_phases
+        assert len(result.completed_phases) == len(generator.PHASE_GRAPH) - 1
+
+        async def quick_script(project):
+            return project
+
+        generator._phase_script = quick_script
+        ran.clear()
+        resumed = await generator.resume_video(project.id)
+        assert ran == []
+        assert "script" in resumed.completed_phases
+        assert len(resumed.completed_phases) == len(generator.PHASE_GRAPH)
+
+
+class TestFusedMetadata:
+    """Test suite for the fused metadata request."""
+
+    def test_validation_drops_invalid_fields(self):
+        """Test only well-formed fields survive validation."""
+        from src.main import validate_fused_metadata
+
+        fused = validate_fused_metadata({
+            "titles": [{"title": "제목1"}, {"title": ""}, "제목2"],
+            "keywords": "not a list",
+            "seo": {"optimized_title": "x" * 200, "description": "설명", "tags": ["a", " "],
+                    "hashtags": ["역사", "#과학"]},
+            "social_snippets": {"twitter": "t" * 300, "instagram": "i", "linkedin": "l"},
+            "localized_seo": {"en": {"title": "Title", "description": "Desc", "tags": ["tag"]},
+                              "ja": {"title": "タイトル"}},
+        }, ["en", "ja"])
+
+        assert fused["titles"] == ["제목1", "제목2"]
+        assert "keywords" not in fused
+        assert fused["seo"] == {"description": "설명", "tags": ["a"], "hashtags": ["#역사", "#과학"]}
+        assert "social_snippets" not in fused
+        assert list(fused["localized_seo"]) == ["en"]
+
+    def test_timestamps_from_segments(self):
+        """Test chapter timestamps follow the script segments."""
+        from src.main import timestamps_from_segments
+
+        segments = [
+            {"type": "hook", "start_time": "0:00"},
+            {"type": "body", "start_time": "0:45"},
+            {"type": "conclusion", "start_time": 570},
+        ]
+        assert timestamps_from_segments(segments) == ["0:00 인트로", "0:45 본론 1", "9:30 결론"]
+        assert timestamps_from_segments(segments[:2]) == []
+        assert timestamps_from_segments([segments[1], segments[0], segments[2]]) == []
+
+        # 실측 나레이션 시각이 있으면 그 시작 시각 사용
+        segments = [dict(segment, id=i + 1) for i, segment in enumerate(segments)]
+        timing = [
+            {"segment_id": 1, "type": "hook", "start": 0.0, "end": 52.3},
+            {"segment_id": 2, "type": "body", "start": 52.26, "end": 601.0},
+            {"segment_id": 3, "type": "conclusion", "start": 600.96, "end": 640.0},
+        ]
+        assert timestamps_from_segments(segments, timing) == ["0:00 인트로", "0:52 본론 1", "10:00 결론"]
+
+    @pytest.mark.asyncio
+    async def test_quality_check_syncs_timestamps_with_chapters(self, config, monkeypatch):
+        """Test description timestamps are rebuilt from narration timing after audio, without uploading."""
+        import copy
+        from src.main import VideoProject
+
+        generator = _make_generator(copy.deepcopy(config))
+        monkeypatch.setattr(generator, "_narration_voice", lambda project: ("voice", 1.0))
+        monkeypatch.setattr(generator, "_duration_estimator", lambda: Mock(estimate=lambda *args: 600))
+
+        project = VideoProject(topic="주제")
+        project.script.segments = [
+            {"id": 1, "type": "hook", "start_time": "0:00"},
+            {"id": 2, "type": "body", "start_time": "0:45"},
+            {"id": 3, "type": "conclusion", "start_time": "9:30"},
+        ]
+        project.seo.timestamps = ["0:00 인트로", "0:45 본론 1", "9:30 결론"]
+        project.audio.segments_timing = [
+            {"segment_id": 1, "type": "hook", "start": 0.0, "end": 50.0},
+            {"segment_id": 2, "type": "body", "start": 49.96, "end": 580.0},
+            {"segment_id": 3, "type": "conclusion", "start": 579.96, "end": 620.0},
+        ]
+
+        await generator._phase_quality_check(project)
+
+        assert project.seo.timestamps == ["0:00 인트로", "0:49 본론 1", "9:39 결론"]
+
+    @pytest.mark.asyncio
+    async def test_fused_mode_saves_round_trips(self, config, tmp_path, monkeypatch):
+        """Test research, SEO and repurpose share one request and backfill missing fields."""
+        import copy
+        import json
+        from src.main import VideoProject, Language
+
+        monkeypatch.chdir(tmp_path)
+        config = copy.deepcopy(config)
+        config["api"]["llm"] = {"fused_requests": True}
+        config["project"] = {"output_dir": str(tmp_path)}
+        generator = _make_generator(config)
+
+        prompts = []
+
+        async def fake_generate(prompt, max_tokens=8000, use_cache=True):
+            prompts.append(prompt)
+            if "한 번에" in prompt:
+                return json.dumps({
+                    "titles": [{"title": "제목"}],
+                    "keywords": ["키워드"],
+                    "seo": {"optimized_title": "SEO 제목", "description": "설명", "tags": ["태그"]},
+                    "social_snippets": {"twitter": "t", "instagram": "i", "linkedin": "l"},
+                    "localized_seo": {"en": {"title": "Title", "description": "Desc", "tags": ["tag"]}},
+                })
+            if "SEO 최적화" in prompt:
+                return json.dumps({"optimized_title": "무시", "hashtags": ["#해시"], "timestamps": []})
+            return "본문"
+
+        async def fake_generate_json(prompt, max_tokens=8000, schema=None, expect=None):
+            return json.loads(await fake_generate(prompt, max_tokens))
+
+        generator._generate_with_ai = fake_generate
+        generator._generate_json_with_ai = fake_generate_json
+
+        project = VideoProject(topic="주제", generate_localizations=[Language("en")])
+        project.script.full_script = "스크립트"
+        project.script.segments = [
+            {"type": "hook", "start_time": "0:00"},
+            {"type": "body", "start_time": "0:30"},
+            {"type": "conclusion", "start_time": "1:00"},
+        ]
+
+        await generator._phase_research(project)
+        await generator._phase_seo(project)
+        await generator._phase_repurpose(project)
+        await generator._phase_localization(project)
+
+        assert project.title == "제목"
+        assert project.research.keywords == project.seo.keywords == ["키워드"]
+        assert project.seo.title == "SEO 제목"
+        assert project.seo.hashtags == ["#해시"]
+        assert project.seo.timestamps == ["0:00 인트로", "0:30 본론 1", "1:00 결론"]
+        assert project.repurpose.social_snippets["twitter"] == "t"
+        assert project.localizations["en"].localized_seo["title"] == "Title"
+        # 통합 1 + SEO 보충 1 + 블로그 1 + 번역 1
+        assert len(prompts) == 4
+
+
+class TestChunkedLocalization:
+    """Test suite for chunked translation and blog conversion."""
+
+    @pytest.mark.asyncio
+    async def test_long_script_translated_in_order(self, config, tmp_path):
+        """Test a long script is translated chunk by chunk without truncation."""
+        import copy
+        from src.main import VideoProject, Language
+
+        config = copy.deepcopy(config)
+        config["api"]["llm"] = {"chunking": {"max_tokens": 200, "overlap_tokens": 30, "concurrency": 3}}
+        config["project"] = {"output_dir": str(tmp_path)}
+        generator = _make_generator(config)
+
+        prompts = []
+
+        async def fake_generate(prompt, max_tokens=8000, use_cache=True):
+            prompts.append(prompt)
+            if "번역" in prompt:
+                source = prompt.split("원본 (ko):\n", 1)[1].split("\n\n번역 규칙", 1)[0]
+                return f"EN({source})"
+            return "요점"
+
+        generator._generate_with_ai = fake_generate
+
+        project = VideoProject(topic="주제", generate_localizations=[Language("en")])
+        project.script.segments = [
+            {"id": i, "text": f"세그먼트 {i}번 내용입니다. " + "설명 문장이 이어집니다. " * 8}
+            for i in range(1, 11)
+        ]
+        project.script.full_script = "\n\n".join(s["text"] for s in project.script.segments)
+        project.seo.localized["en"] = {"title": "Title"}
+
+        await generator._phase_localization(project)
+        translated = project.localizations["en"].translated_script
+
+        assert len(prompts) > 1
+        assert translated.count("EN(") == len(prompts)
+        positions = [translated.index(f"세그먼트 {i}번") for i in range(1, 11)]
+        assert positions == sorted(positions)
+        # 두 번째 조각부터 앞 조각 문맥 포함
+        assert "앞부분 원문" not in prompts[0] and "앞부분 원문" in prompts[1]
+
+        prompts.clear()
+        await generator._phase_repurpose(project)
+        blog_prompt = prompts[-1]
+        assert "블로그" in blog_prompt and blog_prompt.count("요점") == len(prompts) - 1
+
+class TestScriptStreaming:
+    """Test suite for streamed script generation."""
+
+    @pytest.mark.asyncio
+    async def test_segments_published_before_script_completes(self, config, tmp_path, monkeypatch):
+        """Test segments reach the visual phase while the script is still streaming."""
+        import copy
+        import json
+        from src.main import VideoProject
+
+        monkeypatch.chdir(tmp_path)
+        config = copy.deepcopy(config)
+        config["pipeline"] = {"stream_script": True}
+        config["project"] = {"output_dir": str(tmp_path)}
+        config["visual"] = {"image_generation": {}}
+        generator = _make_generator(config)
+
+        segments = [{"id": i, "type": "body", "text": f"문장 {i}", "visual_note": f"장면 {i}"} for i in range(3)]
+        response = json.dumps({"segments": segments, "hooks": ["후크"], "cta": "구독"}, ensure_ascii=False)
+        published = []
+        project = VideoProject(topic="주제")
+
+        class FakeLLM:
+            async def stream(self, prompt, max_tokens=8000):
+                assert '"full_script"' not in prompt
+                for i in range(0, len(response), 16):
+                    await asyncio.sleep(0)
+                    yield response[i:i + 16]
+                    published.append(len(generator._script_channel(project.id).items))
+
+        generator.llm = FakeLLM()
+
+        await asyncio.gather(generator._phase_script(project), generator._phase_visual(project))
+
+        # 응답이 끝나기 전에 일부 세그먼트가 게시됨
+        assert any(0 < n < 3 for n in published)
+        assert published[-1] == 3
+        assert project.script.full_script == "문장 0\n\n문장 1\n\n문장 2"
+        assert [s["description"] for s in project.visual.scene_plan] == ["장면 0", "장면 1", "장면 2"]
+
+
+class TestSegmentRepair:
+    """Test suite for segment-level script regeneration."""
+
+    @pytest.mark.asyncio
+    async def test_phase_script_regenerates_only_weak_segment(self, config, tmp_path):
+        """Test an empty segment is regenerated without re-requesting the script."""
+        import copy
+        from src.main import VideoProject
+        from script.script_generator import ScriptGenerator
+
+        config = copy.deepcopy(config)
+        config["pipeline"] = {"stream_script": False}
+        config["audio"]["duration_estimation"] = {"enabled": False}
+        generator = _make_generator(config)
+        generator.llm = object()
+
+        body = "본론 세그먼트 텍스트가 충분히 길게 들어 있습니다"
+        script_calls = []
+        repair_prompts = []
+
+        async def fake_generate_json(prompt, max_tokens=8000, schema=None, expect=None):
+            script_calls.append(prompt)
+            return {
+                "full_script": body,
+                "segments": [
+                    {"id": 1, "type": "hook", "text": "", "duration": 5},
+                    {"id": 2, "type": "body", "text": body, "duration": 10},
+                ],
+            }
+
+        class FakeClient:
+            async def generate_json(self, prompt, max_tokens=4000, expect=None):
+                repair_prompts.append(prompt)
+                return {"segments": [{"id": 1, "text": "여러분 이거 알고 계셨어요? 진짜 놀라운 이야기예요"}]}
+
+        script_generator = ScriptGenerator(config)
+        script_generator.client = FakeClient()
+        generator.components["script_generator"] = script_generator
+        generator._generate_json_with_ai = fake_generate_json
+
+        project = VideoProject(topic="주제")
+        await generator._phase_script(project)
+
+        assert len(script_calls) == 1
+        assert len(repair_prompts) == 1
+        assert body in repair_prompts[0]
+        assert project.script.segments[0]["text"].startswith("여러분")
+        assert project.script.segments[0]["duration"] == 5
+        assert project.script.full_script.startswith("여러분")
+        assert project.script.full_script.endswith(body)
+
+    @pytest.mark.asyncio
+    async def test_post_processing_failure_keeps_parsed_script(self, config):
+        """Test a failing post-processing step does not replace the parsed script with the placeholder."""
+        import copy
+        from src.main import VideoProject
+        from utils.deadline import PhaseDeadlineExceeded
+
+        config = copy.deepcopy(config)
+        config["pipeline"] = {"stream_script": False, "repair_script_segments": False}
+        generator = _make_generator(config)
+        body = "여러분 이거 알고 계셨어요? 진짜 놀라운 이야기예요."
+
+        async def fake_generate_json(prompt, max_tokens=8000, schema=None, expect=None):
+            return {"full_script": body, "segments": [{"id": 1, "type": "hook", "text": body}],
+                    "hooks": ["짧은 후크", "여러분 주제에 대한 이 사실, 알고 계셨어요?"]}
+
+        async def fail_fit(project):
+            raise PhaseDeadlineExceeded("script")
+
+        generator._generate_json_with_ai = fake_generate_json
+        generator._fit_script_duration = fail_fit
+
+        project = VideoProject(topic="주제")
+        await generator._phase_script(project)
+
+        assert project.script.full_script == body
+        assert project.script.segments[0]["text"] == body
+        assert len(project.script.hooks) == 2
+        assert project.script.readability_score > 0
+
+
+class TestSegmentNarration:
+    """Test suite for per-segment narration synthesis."""
+
+    @pytest.mark.asyncio
+    async def test_pieces_synthesized_concurrently_and_retried_alone(self, config, tmp_path, monkeypatch):
+        """Test each piece is requested once, a failed piece is retried alone and timing is returned."""
+        import copy
+        import threading
+        import time
+        import src.main as main_module
+        from src.main import VideoProject
+        from audio.segment_tts import plan_pieces, plan_timing
+        from utils.adaptive_limiter import reset_limiters
+        from utils.resilience import reset_circuit_breakers
+
+        reset_limiters()
+        reset_circuit_breakers()
+        config = copy.deepcopy(config)
+        config["api"].update({"max_retries": 2, "rate_limit_delay": 0.0, "max_retry_delay": 0.0})
+        config["audio"]["tts"] = {"provider": "elevenlabs", "max_concurrent": 4, "crossfade_ms": 40}
+        config["api"]["adaptive_concurrency"] = {"enabled": False}
+        generator = _make_generator(config)
+
+        calls = []
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def fake_synthesize(text, voice_id, output_path):
+            nonlocal active, peak
+            with lock:
+                calls.append(text)
+                attempt = calls.count(text)
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            if "둘째" in text and attempt == 1:
+                raise ConnectionError("끊김")
+            Path(output_path).write_bytes(b"mp3")
+
+        def fake_stitch(pieces, paths, output_path, crossfade_ms):
+            assert all(Path(path).exists() for path in paths)
+            Path(output_path).write_bytes(b"mp3")
+            return plan_timing(pieces, [1000] * len(pieces), crossfade_ms)
+
+        generator._synthesize_elevenlabs = fake_synthesize
+        monkeypatch.setattr(main_module, "stitch_pieces", fake_stitch)
+
+        project = VideoProject(topic="주제")
+        project.script.segments = [
+            {"id": 1, "type": "hook", "text": "첫째 세그먼트예요."},
+            {"id": 2, "type": "body", "text": "둘째 세그먼트예요."},
+            {"id": 3, "type": "conclusion", "text": "셋째 세그먼트예요."},
+        ]
+        pieces = plan_pieces(project.script.segments)
+
+        timing = await generator._synthesize_narration(pieces, "voice", tmp_path, tmp_path / "narration.mp3")
+
+        assert sorted(calls) == sorted(["첫째 세그먼트예요.", "둘째 세그먼트예요.", "둘째 세그먼트예요.", "셋째 세그먼트예요."])
+        assert peak > 1
+        assert [t["segment_id"] for t in timing] == [1, 2, 3]
+        assert [(t["start"], t["end"]) for t in timing] == [(0.0, 1.0), (0.96, 1.96), (1.92, 2.92)]
+        assert not (tmp_path / "narration_pieces").exists()
+
+    @pytest.mark.asyncio
+    async def test_edited_segment_only_resynthesized(self, config, tmp_path, monkeypatch):
+        """Test cached pieces are reused so only the edited sentence hits the provider."""
+        import copy
+        import src.main as main_module
+        from audio.segment_tts import plan_pieces, plan_timing
+        from utils.tts_cache import TTSCache
+
+        config = copy.deepcopy(config)
+        config["audio"]["tts"] = {"provider": "elevenlabs", "model": "m", "settings": {"stability": 0.5}}
+        generator = _make_generator(config)
+        generator.tts_cache = TTSCache(tmp_path / "cache")
+
+        calls = []
+
+        def fake_synthesize(text, voice_id, output_path):
+            calls.append(text)
+            Path(output_path).write_bytes(text.encode())
+
+        def fake_stitch(pieces, paths, output_path, crossfade_ms):
+            Path(output_path).write_bytes(b"".join(Path(path).read_bytes() for path in paths))
+            return plan_timing(pieces, [1000] * len(pieces), crossfade_ms)
+
+        generator._synthesize_elevenlabs = fake_synthesize
+        monkeypatch.setattr(main_module, "stitch_pieces", fake_stitch)
+
+        segments = [{"id": i, "text": f"세그먼트 {i}번이에요."} for i in range(1, 4)]
+        await generator._synthesize_narration(plan_pieces(segments), "voice", tmp_path / "a", tmp_path / "a.mp3")
+        assert len(calls) == 3
+
+        segments[1]["text"] = "고친 세그먼트예요."
+        calls.clear()
+        await generator._synthesize_narration(plan_pieces(segments), "voice", tmp_path / "b", tmp_path / "b.mp3")
+
+        assert calls == ["고친 세그먼트예요."]
+        assert (tmp_path / "b.mp3").read_bytes().decode() == "세그먼트 1번이에요.고친 세그먼트예요.세그먼트 3번이에요."
+
+class TestDurationFit:
+    """Test suite for sizing the script before TTS."""
+
+    @pytest.mark.asyncio
+    async def test_overlong_segment_is_trimmed_before_tts(self, config, tmp_path):
+        """Test only the segment that overshoots its share is regenerated with a length target."""
+        import copy
+        from src.main import VideoProject
+
+        config = copy.deepcopy(config)
+        config["project"] = {"cache_dir": str(tmp_path)}
+        generator = _make_generator(config)
+        generator.llm = object()
+
+        calls = []
+
+        class FakeScriptGenerator:
+            async def regenerate_segments(self, script, segment_ids, **kwargs):
+                calls.append((segment_ids, kwargs["length_targets"]))
+                script.segments[1]["text"] = "나" * 60
+                script.full_script = "\n\n".join(s["text"] for s in script.segments)
+                return segment_ids
+
+        generator.components["script_generator"] = FakeScriptGenerator()
+
+        project = VideoProject(topic="주제", duration_target=20)
+        project.script.segments = [
+            {"id": 1, "text": "가" * 62, "duration": 10},
+            {"id": 2, "text": "나" * 600, "duration": 10},
+        ]
+        project.script.full_script = "\n\n".join(s["text"] for s in project.script.segments)
+
+        await generator._fit_script_duration(project)
+
+        assert [ids for ids, _ in calls] == [[2]]
+        assert calls[0][1][2].endswith("음절")
+        assert abs(project.script.estimated_duration - 20) < 3
+        assert not project.warnings
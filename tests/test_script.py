@@ -32,6 +32,59 @@ class TestScriptGenerator:
         assert isinstance(result, dict)
         assert "script" in result
 
+    def test_find_weak_segments(self, config):
+        """Test empty, short and malformed segments are detected."""
+        from src.script import ScriptGenerator
+
+        segments = [
+            {"id": 1, "text": "충분히 긴 후크 문장입니다. 여러분 이거 아세요?", "duration": 5},
+            {"id": 2, "text": "", "duration": 15},
+            {"id": 3, "text": "짧음", "duration": 30},
+            "깨진 세그먼트",
+            {"id": 5, "text": None},
+        ]
+
+        assert ScriptGenerator.find_weak_segments(segments) == [2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_regenerate_segments_splices_only_targets(self, config):
+        """Test only the requested segment is regenerated and spliced back."""
+        from types import SimpleNamespace
+        from src.script import ScriptGenerator
+
+        generator = ScriptGenerator(config)
+        prompts = []
+
+        class FakeClient:
+            async def generate_json(self, prompt, max_tokens=4000, expect=None):
+                prompts.append(prompt)
+                return {"segments": [{"id": 2, "text": "새로 쓴 본론 세그먼트 텍스트입니다", "emotion": "놀라움"}]}
+
+        generator.client = FakeClient()
+        intro = "도입 세그먼트의 텍스트입니다"
+        outro = "마무리 세그먼트의 텍스트입니다"
+        script = SimpleNamespace(
+            segments=[
+                {"id": 1, "type": "hook", "text": intro, "duration": 5},
+                {"id": 2, "type": "body", "text": "짧음", "duration": 5, "start_time": "0:05"},
+                {"id": 3, "type": "cta", "text": outro, "duration": 5},
+            ],
+            full_script=f"{intro}\n\n짧음\n\n{outro}",
+            word_count=0,
+        )
+
+        replaced = await generator.regenerate_segments(script, [2], topic="주제", title="제목")
+
+        assert replaced == [2]
+        assert script.segments[1]["text"] == "새로 쓴 본론 세그먼트 텍스트입니다"
+        assert script.segments[1]["start_time"] == "0:05"
+        assert script.segments[1]["type"] == "body"
+        assert script.segments[0]["text"] == intro
+        assert script.full_script == f"{intro}\n\n새로 쓴 본론 세그먼트 텍스트입니다\n\n{outro}"
+        assert script.word_count == len(script.full_script)
+        # 앞뒤 세그먼트는 문맥으로만 전달
+        assert intro in prompts[0] and outro in prompts[0]
+
 
 class TestHookCreator:
     """Test suite for HookCreator."""
@@ -56,6 +109,42 @@ class TestHookCreator:
         assert isinstance(hook, str)
         assert len(hook) > 0
 
+    @pytest.mark.asyncio
+    async def test_rank_hooks_prefers_strong_hooks(self, config):
+        """Test cliché openings rank below hooks matching the title and hook patterns."""
+        from src.script import HookCreator
+        from src.script.hook_creator import Hook
+
+        creator = HookCreator(config)
+        hooks = [
+            Hook("오늘은 양자역학에 대해 알아보겠습니다", "question", 0.95, ""),
+            Hook("여러분 양자역학 이거 진짜 소름 돋는 얘기예요!", "shock", 0.7, ""),
+            Hook("양자역학, 왜 아인슈타인도 틀렸을까요?", "question", 0.7, ""),
+        ]
+
+        ranked = await creator.rank_hooks(hooks, title="양자역학의 비밀")
+
+        assert ranked[-1].text.startswith("오늘은")
+        assert all(0.5 <= h.predicted_retention <= 0.95 for h in ranked)
+        assert ranked[0].predicted_retention >= ranked[1].predicted_retention
+
+    def test_ranker_scores_hundreds_quickly(self):
+        """Test the ranker features are computed for many candidates at once."""
+        import time
+        from src.script.hook_ranker import FEATURES, HookRanker
+        from src.script.speech_patterns import YouTubeSpeechPatterns
+
+        ranker = HookRanker()
+        candidates = YouTubeSpeechPatterns.HOOK_INDEX.sample(300)
+
+        started = time.perf_counter()
+        scores = ranker.score(candidates, title="양자역학")
+        elapsed = time.perf_counter() - started
+
+        assert len(scores) == 300
+        assert len(ranker.features(candidates[:2])[0]) == len(FEATURES)
+        assert elapsed < 1.0
+
 
 class TestCTAGenerator:
     """Test suite for CTAGenerator."""
@@ -79,3 +168,143 @@ class TestCTAGenerator:
 
         assert isinstance(cta, dict)
         assert "subscribe" in cta
+
+
+class TestYouTubeSpeechPatterns:
+    """Test suite for the precompiled speech pattern index."""
+
+    def test_colliding_categories_are_merged(self):
+        """Test lists sharing a category key across parts are kept, not overwritten."""
+        from src.script.speech_patterns import YouTubeSpeechPatterns
+        from src.script.patterns.hooks import HOOK_OPENERS
+        from src.script.patterns.hooks7 import HOOK_OPENERS_7
+
+        shared = set(HOOK_OPENERS) & set(HOOK_OPENERS_7)
+        merged = YouTubeSpeechPatterns.HOOK_OPENERS
+        for key in shared:
+            assert set(HOOK_OPENERS[key]) | set(HOOK_OPENERS_7[key]) <= set(merged[key])
+
+    def test_index_is_deduplicated(self):
+        """Test category and flattened tuples hold each pattern once."""
+        from src.script.speech_patterns import YouTubeSpeechPatterns
+
+        index = YouTubeSpeechPatterns.TRANSITION_INDEX
+        assert isinstance(index.all, tuple)
+        assert len(index.all) == len(set(index.all))
+        for values in index.categories.values():
+            assert len(values) == len(set(values))
+
+    def test_sampling(self):
+        """Test category, fallback and weighted sampling."""
+        from src.script.speech_patterns import PatternIndex
+
+        index = PatternIndex({"a": ("a1", "a2"), "b": ("b1",), "empty": ()})
+
+        assert index.choice("a") in ("a1", "a2")
+        assert index.choice("empty") in index.all
+        assert index.choice("missing") in index.all
+        assert sorted(index.sample(10)) == ["a1", "a2", "b1"]
+        assert {index.weighted_choice({"b": 1.0, "a": 0.0}) for _ in range(20)} == {"b1"}
+        assert PatternIndex({}).choice(default="기본") == "기본"
+
+
+class TestPatternStore:
+    """Test suite for the frozen pattern snapshot."""
+
+    def test_snapshot_matches_source_modules(self, tmp_path):
+        """Test the snapshot loads the same merged patterns as the source modules."""
+        from src.script.pattern_store import PATTERN_SOURCES, PatternStore, build_snapshot
+
+        path = build_snapshot(tmp_path / "patterns.snapshot")
+        frozen = PatternStore(path)
+        source = PatternStore(tmp_path / "missing.snapshot")
+
+        for name in PATTERN_SOURCES:
+            assert frozen.index(name).all == source.index(name).all
+            assert dict(frozen.index(name).categories) == dict(source.index(name).categories)
+        assert frozen.source == "snapshot"
+        assert source.source == "modules"
+
+    def test_stale_snapshot_falls_back_to_modules(self, tmp_path, monkeypatch):
+        """Test a snapshot built from other sources is ignored."""
+        from src.script import pattern_store
+
+        path = pattern_store.build_snapshot(tmp_path / "patterns.snapshot")
+        monkeypatch.setattr(pattern_store, "source_fingerprint", lambda: "changed")
+
+        store = pattern_store.PatternStore(path)
+        assert len(store.index("TRANSITIONS")) > 0
+        assert store.source == "modules"
+
+    def test_categories_decoded_on_first_access(self, tmp_path):
+        """Test snapshot categories are decoded lazily and cached."""
+        from src.script.pattern_store import PatternStore, build_snapshot
+
+        store = PatternStore(build_snapshot(tmp_path / "patterns.snapshot"))
+        categories = store.index("HOOK_OPENERS").categories
+
+        assert categories._decoded == {}
+        assert categories["shock"] is categories["shock"]
+        assert list(categories._decoded) == ["shock"]
+
+
+class TestScriptAnalyzer:
+    """Test suite for the local script analyzer."""
+
+    ROBOTIC = (
+        "안녕하세요. 오늘은 양자역학에 대해 알아보겠습니다. 양자역학은 미시세계를 설명하는 이론입니다. "
+        "원자와 분자 수준의 현상을 다룹니다. 파동과 입자의 이중성이 있습니다. 이것은 매우 중요합니다."
+    )
+    NATURAL = (
+        "여러분 이거 진짜 미쳤어요! 양자역학 얘기인데요, 근데 여기서 재밌는 게 있거든요. "
+        "원자 하나가 동시에 두 군데 있을 수 있다는 거예요. 말이 돼요? 솔직히 저도 처음엔 안 믿었잖아요. "
+        "관측하기 전까지는 확률로만 존재한다는 거죠. 와 소름. 세상은 생각보다 훨씬 이상한 곳이더라고요."
+    )
+
+    def test_aho_corasick_finds_overlapping_matches(self):
+        """Test the matcher reports every pattern ending at each position."""
+        from src.script.script_analyzer import AhoCorasick
+
+        matcher = AhoCorasick(["he", "she", "his", "hers"])
+        matches = sorted((end, matcher.patterns[i]) for end, i in matcher.iter_matches("ushers"))
+
+        assert matches == [(4, "he"), (4, "she"), (6, "hers")]
+
+    def test_scores_robotic_below_natural(self):
+        """Test banned openings and formal endings lower the score."""
+        from src.script.script_analyzer import ScriptAnalyzer
+
+        analyzer = ScriptAnalyzer()
+        robotic = analyzer.analyze(self.ROBOTIC)
+        natural = analyzer.analyze(self.NATURAL)
+
+        assert robotic.banned_openings
+        assert robotic.formal_ratio > 0.5
+        assert robotic.score <= ScriptAnalyzer.BANNED_OPENING_CAP
+        assert natural.score > 0.8
+        assert natural.transition_density > 0
+
+    @pytest.mark.asyncio
+    async def test_optimizer_skips_llm_above_threshold(self, config):
+        """Test the LLM optimizer only runs for low-scoring scripts."""
+        from src.script import ScriptOptimizer
+
+        calls = []
+
+        class FakeClient:
+            async def generate_json(self, prompt, max_tokens=4000):
+                calls.append(prompt)
+                return {"optimized_text": TestScriptAnalyzer.NATURAL, "changes_made": ["구어체"]}
+
+        optimizer = ScriptOptimizer(config)
+        optimizer.client = FakeClient()
+
+        skipped = await optimizer.optimize(self.NATURAL)
+        optimized = await optimizer.optimize(self.ROBOTIC)
+
+        assert not skipped.llm_used
+        assert skipped.optimized_text == self.NATURAL
+        assert optimized.llm_used
+        assert len(calls) == 1
+        assert "금지된 시작 문구" in calls[0]
+        assert optimized.readability_after > optimized.readability_before
@@ -0,0 +1,889 @@
+"""Tests for utils module."""
+import asyncio
+import pytest
+
+
+class TestPhaseScheduler:
+    """Test suite for PhaseScheduler."""
+
+    def test_execution_levels(self):
+        """Test independent phases share a level."""
+        from src.utils.phase_scheduler import PhaseScheduler, PhaseSpec
+
+        scheduler = PhaseScheduler([
+            PhaseSpec("a", outputs=("x",)),
+            PhaseSpec("b", inputs=("x",), outputs=("y",)),
+            PhaseSpec("c", inputs=("x",), outputs=("z",)),
+            PhaseSpec("d", inputs=("y", "z")),
+        ])
+
+        assert scheduler.execution_levels() == [["a"], ["b", "c"], ["d"]]
+
+    def test_cycle_detection(self):
+        """Test cyclic graphs are rejected."""
+        from src.utils.phase_scheduler import PhaseScheduler, PhaseSpec, PhaseGraphError
+
+        with pytest.raises(PhaseGraphError):
+            PhaseScheduler([
+                PhaseSpec("a", inputs=("y",), outputs=("x",)),
+                PhaseSpec("b", inputs=("x",), outputs=("y",)),
+            ])
+
+    @pytest.mark.asyncio
+    async def test_run_concurrently_with_limit(self):
+        """Test independent phases overlap up to max_concurrency."""
+        from src.utils.phase_scheduler import PhaseScheduler, PhaseSpec
+
+        active = 0
+        peak = 0
+        order = []
+
+        async def run_phase(spec):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            order.append(spec.name)
+            active -= 1
+
+        scheduler = PhaseScheduler(
+            [PhaseSpec("root", outputs=("r",))]
+            + [PhaseSpec(f"leaf{i}", inputs=("r",)) for i in range(4)],
+            max_concurrency=2,
+        )
+        finished = await scheduler.run(run_phase)
+
+        assert order[0] == "root"
+        assert sorted(finished) == sorted(["root", "leaf0", "leaf1", "leaf2", "leaf3"])
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates(self):
+        """Test a failing phase aborts the run."""
+        from src.utils.phase_scheduler import PhaseScheduler, PhaseSpec
+
+        async def run_phase(spec):
+            if spec.name == "b":
+                raise RuntimeError("boom")
+            await asyncio.sleep(0.01)
+
+        scheduler = PhaseScheduler([PhaseSpec("a"), PhaseSpec("b")])
+
+        with pytest.raises(RuntimeError):
+            await scheduler.run(run_phase)
+
+
+class TestArtifactCache:
+    """Test suite for ArtifactCache."""
+
+    def test_put_and_fetch(self, tmp_path):
+        """Test stored files are restored for the same key."""
+        from src.utils.artifact_cache import ArtifactCache
+
+        cache = ArtifactCache(tmp_path / "cache")
+        source = tmp_path / "narration.mp3"
+        source.write_bytes(b"audio")
+        key = ArtifactCache.make_key("script", {"voice": "v1"})
+
+        assert cache.fetch("audio", key, {"narration": tmp_path / "out.mp3"}) is None
+        assert cache.put("audio", key, {"narration": source}, {"duration": 1.5})
+
+        meta = cache.fetch("audio", key, {"narration": tmp_path / "out.mp3"})
+        assert meta == {"duration": 1.5}
+        assert (tmp_path / "out.mp3").read_bytes() == b"audio"
+
+    def test_key_depends_on_inputs(self):
+        """Test keys change with any input and ignore dict ordering."""
+        from src.utils.artifact_cache import ArtifactCache
+
+        assert ArtifactCache.make_key({"a": 1, "b": 2}) == ArtifactCache.make_key({"b": 2, "a": 1})
+        assert ArtifactCache.make_key("ko", "text") != ArtifactCache.make_key("en", "text")
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over the size limit."""
+        import os
+        import time
+        from src.utils.artifact_cache import ArtifactCache
+
+        cache = ArtifactCache(tmp_path / "cache", max_size_bytes=250)
+        source = tmp_path / "image.png"
+        source.write_bytes(b"x" * 100)
+
+        cache.put("image", "a" * 64, {"image": source})
+        cache.put("image", "b" * 64, {"image": source})
+        # 'b'는 오래전 사용, 'a'는 방금 사용한 항목으로 만든다
+        past = time.time() - 100
+        os.utime(cache._entry_dir("image", "b" * 64) / cache.MANIFEST, (past, past))
+        cache.fetch("image", "a" * 64, {"image": tmp_path / "restored.png"})
+        cache.put("image", "c" * 64, {"image": source})
+
+        assert cache.fetch("image", "b" * 64, {"image": tmp_path / "x.png"}) is None
+        assert cache.fetch("image", "a" * 64, {"image": tmp_path / "x.png"}) is not None
+        assert cache.total_size() <= 250
+
+
+class TestJsonl:
+    """Test suite for JSONL journal helpers."""
+
+    def test_append_and_read(self, tmp_path):
+        """Test appended records are read back in order."""
+        from src.utils.atomic_io import append_jsonl, read_jsonl
+
+        path = tmp_path / "results.jsonl"
+        append_jsonl(path, {"topic": "a", "status": "success"})
+        append_jsonl(path, {"topic": "b", "status": "failed"})
+
+        assert [r["topic"] for r in read_jsonl(path)] == ["a", "b"]
+
+    def test_truncated_line_skipped(self, tmp_path):
+        """Test a line cut off by a crash does not break later records."""
+        from src.utils.atomic_io import append_jsonl, read_jsonl
+
+        path = tmp_path / "results.jsonl"
+        append_jsonl(path, {"topic": "a"})
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"topic": "b", "sta')
+        append_jsonl(path, {"topic": "c"})
+
+        assert [r["topic"] for r in read_jsonl(path)] == ["a", "c"]
+        assert read_jsonl(tmp_path / "missing.jsonl") == []
+
+
+NO_CACHE = {"api": {}, "cache": {"llm": {"enabled": False}}}
+
+
+class TestLLMGateway:
+    """Test suite for the shared LLM gateway."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_chain(self):
+        """Test the next provider is used when the first one fails."""
+        from src.utils.llm_gateway import LLMGateway, LLMProvider
+
+        class Failing(LLMProvider):
+            name = "failing"
+
+            async def generate(self, prompt, max_tokens, temperature=None):
+                raise RuntimeError("429")
+
+        class Echo(LLMProvider):
+            name = "echo"
+
+            async def generate(self, prompt, max_tokens, temperature=None):
+                return f"echo:{prompt}"
+
+        gateway = LLMGateway({"cache": {"llm": {"enabled": False}}})
+        gateway.providers = [Failing({}), Echo({})]
+
+        assert await gateway.generate("hi") == "echo:hi"
+
+        gateway.providers = [Failing({})]
+        with pytest.raises(RuntimeError):
+            await gateway.generate("hi")
+
+    def test_shared_factory(self, monkeypatch):
+        """Test the factory shares one instance and returns None without keys."""
+        from src.utils import llm_gateway
+
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        monkeypatch.setattr(llm_gateway, "_env_loaded", True)
+        llm_gateway.reset_llm_gateways()
+
+        assert llm_gateway.get_llm_gateway(NO_CACHE) is None
+
+        monkeypatch.setattr(llm_gateway.LLMProvider, "is_configured", property(lambda self: True))
+        llm_gateway.reset_llm_gateways()
+        first = llm_gateway.get_llm_gateway(NO_CACHE)
+        second = llm_gateway.get_llm_gateway(NO_CACHE)
+
+        assert first is second
+        assert first.provider_names == ["gemini", "anthropic"]
+        llm_gateway.reset_llm_gateways()
+
+    @pytest.mark.asyncio
+    async def test_cache_and_single_flight(self, tmp_path):
+        """Test identical prompts coalesce in flight and hit the cache later."""
+        from src.utils.llm_gateway import LLMGateway, LLMProvider
+
+        calls = []
+
+        class Slow(LLMProvider):
+            name = "slow"
+
+            async def generate(self, prompt, max_tokens, temperature=None):
+                calls.append(prompt)
+                await asyncio.sleep(0.01)
+                return prompt.upper()
+
+        gateway = LLMGateway({"project": {"cache_dir": str(tmp_path)}})
+        gateway.providers = [Slow({})]
+        gateway._init_cache()
+
+        results = await asyncio.gather(*(gateway.generate("seo") for _ in range(5)))
+        assert results == ["SEO"] * 5
+        assert calls == ["seo"]
+
+        assert await gateway.generate("seo") == "SEO"
+        assert calls == ["seo"]
+
+        assert await gateway.generate("seo", use_cache=False) == "SEO"
+        assert calls == ["seo", "seo"]
+
+
+class TestLLMCache:
+    """Test suite for LLMCache."""
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test entries older than the TTL are not returned."""
+        from src.utils.llm_cache import LLMCache
+
+        cache = LLMCache(tmp_path, ttl_seconds=60)
+        key = LLMCache.make_key(model="m", prompt="p", temperature=0.7)
+        cache.put(key, "응답")
+        assert cache.get(key) == "응답"
+
+        cache.ttl_seconds = 1e-9
+        assert cache.get(key) is None
+
+    def test_size_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over the size limit."""
+        import os
+        import time
+        from src.utils.llm_cache import LLMCache
+
+        cache = LLMCache(tmp_path, ttl_seconds=0, max_size_bytes=10 ** 6)
+        keys = [LLMCache.make_key(prompt=str(i)) for i in range(3)]
+        for idx, key in enumerate(keys):
+            cache.put(key, os.urandom(300).hex())
+            past = time.time() - 100 + idx
+            os.utime(cache._path(key), (past, past))
+
+        cache.max_size_bytes = cache._path(keys[0]).stat().st_size * 2
+        cache.evict()
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+
+
+class TestResilience:
+    """Test suite for retry and circuit breaker helpers."""
+
+    class HTTPError(Exception):
+        def __init__(self, status_code):
+            super().__init__(f"HTTP {status_code}")
+            self.status_code = status_code
+
+    @pytest.mark.asyncio
+    async def test_retry_transient_errors(self):
+        """Test 429/5xx are retried and other errors are raised at once."""
+        from src.utils.resilience import RetryPolicy, retry_async, reset_circuit_breakers
+
+        reset_circuit_breakers()
+        policy = RetryPolicy(max_retries=3, base_delay=0, timeout=1)
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise self.HTTPError(429)
+            return "ok"
+
+        assert await retry_async(flaky, provider="test_flaky", policy=policy) == "ok"
+        assert len(attempts) == 3
+
+        async def bad_request():
+            attempts.append(1)
+            raise self.HTTPError(400)
+
+        attempts.clear()
+        with pytest.raises(self.HTTPError):
+            await retry_async(bad_request, provider="test_flaky", policy=policy)
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_opens_and_recovers(self):
+        """Test a failing provider is skipped until the cool-down ends."""
+        from src.utils.resilience import (
+            CircuitBreaker, CircuitOpenError, RetryPolicy, retry_async
+        )
+        from src.utils import resilience
+
+        breaker = CircuitBreaker("test_dead", failure_threshold=2, cooldown=0.05)
+        resilience._breakers["test_dead"] = breaker
+        policy = RetryPolicy(max_retries=5, base_delay=0)
+        calls = []
+
+        async def dead():
+            calls.append(1)
+            raise self.HTTPError(503)
+
+        async def back():
+            return "back"
+
+        with pytest.raises(CircuitOpenError):
+            await retry_async(dead, provider="test_dead", policy=policy)
+        assert len(calls) == 2
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            await retry_async(dead, provider="test_dead", policy=policy)
+        assert len(calls) == 2
+
+        await asyncio.sleep(0.06)
+        assert await retry_async(back, provider="test_dead", policy=policy) == "back"
+        assert breaker.state == "closed"
+        resilience.reset_circuit_breakers()
+
+
+class TestAdaptiveLimiter:
+    """Test suite for AdaptiveLimiter."""
+
+    class RateLimited(Exception):
+        status_code = 429
+
+    @pytest.mark.asyncio
+    async def test_limit_bounds_concurrency(self):
+        """Test in-flight calls never exceed the current limit."""
+        from src.utils.adaptive_limiter import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", ceiling=4, initial=2)
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await asyncio.gather(*(limiter.run(call) for _ in range(10)))
+
+        assert 2 <= peak <= 4
+        assert limiter.in_flight == 0
+
+    def test_additive_increase_up_to_ceiling(self):
+        """Test healthy calls widen the limit but never above the ceiling."""
+        from src.utils.adaptive_limiter import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", ceiling=3, initial=1)
+        for _ in range(50):
+            limiter.record_success(0.1)
+
+        assert limiter.current_limit == 3
+
+    def test_multiplicative_decrease_on_throttle(self):
+        """Test 429s halve the limit and other errors leave it alone."""
+        from src.utils.adaptive_limiter import AdaptiveLimiter
+
+        limiter = AdaptiveLimiter("test", ceiling=8, initial=8)
+        limiter.record_error(ValueError("bad input"))
+        assert limiter.current_limit == 8
+
+        limiter.record_error(self.RateLimited())
+        assert limiter.current_limit == 4
+        assert limiter.metrics()["throttled"] == 1
+
+    def test_ceiling_from_config(self):
+        """Test config max_concurrent values act as ceilings."""
+        from src.utils.adaptive_limiter import get_limiter, reset_limiters
+
+        reset_limiters()
+        config = {"visual": {"image_generation": {"max_concurrent": 3}}}
+
+        assert get_limiter("openai_images", config).ceiling == 3
+        assert get_limiter("gemini", {"api": {"gemini": {"max_concurrent": 6}}}).ceiling == 6
+        reset_limiters()
+
+
+class TestHedging:
+    """Test suite for hedged LLM requests."""
+
+    def _gateway(self, primary_delay, secondary_delay):
+        from src.utils.llm_gateway import LLMGateway, LLMProvider
+
+        class Timed(LLMProvider):
+            def __init__(self, name, delay):
+                super().__init__({})
+                self.name = name
+                self.delay = delay
+                self.cancelled = False
+
+            async def generate(self, prompt, max_tokens, temperature=None):
+                try:
+                    await asyncio.sleep(self.delay)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+                return self.name
+
+        gateway = LLMGateway({"api": {"llm": {"hedging": {"enabled": True, "initial_delay": 0.02}}},
+                              "cache": {"llm": {"enabled": False}}})
+        gateway.providers = [Timed("primary", primary_delay), Timed("secondary", secondary_delay)]
+        return gateway
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged(self):
+        """Test a straggling primary loses to the hedge and is cancelled."""
+        gateway = self._gateway(primary_delay=1.0, secondary_delay=0.01)
+
+        assert await gateway.generate("q") == "secondary"
+        await asyncio.sleep(0)
+
+        assert gateway.providers[0].cancelled
+        metrics = gateway.hedge_metrics()
+        assert metrics["hedged"] == 1
+        assert metrics["hedge_win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_not_hedged(self):
+        """Test no hedge is sent when the primary answers in time."""
+        gateway = self._gateway(primary_delay=0.0, secondary_delay=0.0)
+
+        assert await gateway.generate("q") == "primary"
+        assert gateway.hedge_metrics()["hedge_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_caller_cancel_cancels_primary(self):
+        """Test cancelling the caller before the hedge delay also cancels the primary request."""
+        gateway = self._gateway(primary_delay=1.0, secondary_delay=1.0)
+        gateway.hedge_initial_delay = 1.0
+
+        task = asyncio.ensure_future(gateway._generate_hedged("q", 100, None))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.01)
+
+        assert gateway.providers[0].cancelled
+
+    def test_hedge_delay_percentile(self):
+        """Test the hedge delay follows the configured latency percentile."""
+        from collections import deque
+
+        gateway = self._gateway(0, 0)
+        gateway.hedge_min_samples = 10
+        gateway.hedge_min_delay = 0.0
+        gateway._latencies["primary"] = deque([i / 10 for i in range(1, 101)])
+
+        assert gateway.hedge_delay("primary") == pytest.approx(9.6)
+        assert gateway.hedge_delay("unknown") == gateway.hedge_initial_delay
+
+
+class TestDeadline:
+    """Test suite for phase deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_call(self):
+        """Test a call outliving the phase budget raises PhaseDeadlineExceeded."""
+        from src.utils.deadline import PhaseDeadlineExceeded, phase_deadline, within_deadline
+
+        cancelled = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with phase_deadline("audio", 0.05) as deadline:
+            with pytest.raises(PhaseDeadlineExceeded):
+                await within_deadline(slow())
+
+        assert deadline.expired
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_own_timeout_passes_through(self):
+        """Test a call's own timeout is not reported as a phase overrun."""
+        from src.utils.deadline import PhaseDeadlineExceeded, phase_deadline, within_deadline
+
+        async def timing_out():
+            await asyncio.wait_for(asyncio.sleep(1), 0.01)
+
+        with phase_deadline("audio", 10) as deadline:
+            with pytest.raises(asyncio.TimeoutError) as exc_info:
+                await within_deadline(timing_out())
+
+        assert not isinstance(exc_info.value, PhaseDeadlineExceeded)
+        assert not deadline.expired
+
+    @pytest.mark.asyncio
+    async def test_no_budget(self):
+        """Test calls run unbounded outside a phase deadline."""
+        from src.utils.deadline import current_deadline, phase_deadline, within_deadline
+
+        with phase_deadline("audio", None) as deadline:
+            assert deadline is None
+            assert current_deadline() is None
+            assert await within_deadline(asyncio.sleep(0, result="ok")) == "ok"
+
+
+class TestStreaming:
+    """Test suite for streamed LLM output and stream-fed phases."""
+
+    def test_json_array_stream(self):
+        """Test array elements are returned as soon as they close."""
+        from src.utils.json_stream import JsonArrayStream
+
+        text = ('```json\n{"title": "segments: [x]", "segments": [{"id": 1, "text": "a}b\\"]"}, '
+                '{"id": 2, "nested": {"k": [1]}}], "hooks": [{"id": 9}]}\n```')
+        parser = JsonArrayStream("segments")
+
+        items = []
+        for ch in text:
+            items.extend((len(parser.text), item) for item in parser.feed(ch))
+
+        assert [item for _, item in items] == [
+            {"id": 1, "text": 'a}b"]'},
+            {"id": 2, "nested": {"k": [1]}},
+        ]
+        # 첫 원소는 두 번째 원소보다 먼저 완성된다
+        assert items[0][0] < text.index('{"id": 2')
+        assert parser.done
+
+    @pytest.mark.asyncio
+    async def test_stream_channel_replays(self):
+        """Test late subscribers get earlier items and iteration ends on close."""
+        from src.utils.stream_channel import StreamChannel
+
+        channel = StreamChannel()
+        channel.publish(1)
+
+        async def consume():
+            return [item async for item in channel.subscribe()]
+
+        early = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        channel.publish(2)
+        channel.close()
+        late = await consume()
+
+        assert await early == [1, 2]
+        assert late == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_scheduler_starts_stream_consumer_early(self):
+        """Test a phase streaming an input starts while its producer runs."""
+        from src.utils.phase_scheduler import PhaseScheduler, PhaseSpec
+
+        phases = [
+            PhaseSpec("script", outputs=("script",)),
+            PhaseSpec("visual", inputs=("script",), outputs=("visual",), streams=("script",)),
+            PhaseSpec("audio", inputs=("script",), outputs=("audio",)),
+        ]
+        events = []
+
+        async def run(spec):
+            events.append(f"start:{spec.name}")
+            await asyncio.sleep(0.01)
+            events.append(f"end:{spec.name}")
+
+        await PhaseScheduler(phases, streaming=True).run(run)
+        assert events.index("start:visual") < events.index("end:script")
+        assert events.index("start:audio") > events.index("end:script")
+
+        events.clear()
+        await PhaseScheduler(phases, streaming=False).run(run)
+        assert events.index("start:visual") > events.index("end:script")
+
+    @pytest.mark.asyncio
+    async def test_gateway_stream_fallback(self):
+        """Test streaming falls back only before the first chunk."""
+        from src.utils.llm_gateway import LLMGateway, LLMProvider
+
+        class Failing(LLMProvider):
+            name = "stream_failing"
+
+            async def stream(self, prompt, max_tokens, temperature=None):
+                raise RuntimeError("bad request")
+                yield  # pragma: no cover
+
+        class Broken(LLMProvider):
+            name = "stream_broken"
+
+            async def stream(self, prompt, max_tokens, temperature=None):
+                yield "partial"
+                raise RuntimeError("dropped")
+
+        class Chunks(LLMProvider):
+            name = "stream_chunks"
+
+            async def stream(self, prompt, max_tokens, temperature=None):
+                for chunk in ("a", "b", "c"):
+                    yield chunk
+
+        gateway = LLMGateway({"cache": {"llm": {"enabled": False}}})
+        gateway.providers = [Failing({}), Chunks({})]
+        assert [c async for c in gateway.stream("q")] == ["a", "b", "c"]
+
+        gateway.providers = [Broken({}), Chunks({})]
+        received = []
+        with pytest.raises(RuntimeError):
+            async for chunk in gateway.stream("q"):
+                received.append(chunk)
+        assert received == ["partial"]
+
+
+class TestJsonExtract:
+    """Test suite for the shared JSON extractor."""
+
+    def test_brackets_inside_strings(self):
+        """Test brackets and quotes inside strings do not end the value early."""
+        from src.utils.json_extract import extract_json
+
+        text = '설명입니다 {참고} ```json\n{"text": "a } ] \\" [비주얼: 우주]", "n": [1, {"k": "}"}]}\n``` 끝'
+        assert extract_json(text) == {"text": 'a } ] " [비주얼: 우주]', "n": [1, {"k": "}"}]}
+
+    def test_trailing_commas(self):
+        """Test trailing commas are removed outside strings."""
+        from src.utils.json_extract import extract_json
+
+        assert extract_json('[{"a": "x,]",}, 2,]') == [{"a": "x,]"}, 2]
+
+    def test_truncated_response(self):
+        """Test a cut-off response keeps its complete elements."""
+        from src.utils.json_extract import extract_json
+
+        assert extract_json('{"segments": [{"id": 1}, {"id": 2, "te') == {"segments": [{"id": 1}, {"id": 2}]}
+        assert extract_json('{"full_script": "긴 스크립트가 중간에') == {"full_script": "긴 스크립트가 중간에"}
+
+    def test_expected_type(self):
+        """Test the expected JSON type is searched for and errors are ValueErrors."""
+        from src.utils.json_extract import JSONExtractionError, extract_json
+
+        assert extract_json('[1] {"a": 1}', expect=dict) == {"a": 1}
+        with pytest.raises(JSONExtractionError):
+            extract_json("JSON 없음")
+        assert issubclass(JSONExtractionError, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_generate_json_native_mode(self, tmp_path):
+        """Test JSON mode options reach the provider and bad cached output is regenerated."""
+        from src.utils.llm_gateway import LLMGateway, LLMProvider
+
+        calls = []
+
+        class JsonProvider(LLMProvider):
+            name = "json_provider"
+
+            async def generate(self, prompt, max_tokens, temperature=None, json_mode=False, schema=None):
+                calls.append((json_mode, schema))
+                return "잘림 {" if len(calls) == 1 else '{"ok": true}'
+
+        gateway = LLMGateway({"project": {"cache_dir": str(tmp_path)}})
+        gateway.providers = [JsonProvider({})]
+        gateway._init_cache()
+
+        schema = {"type": "object", "properties": {"ok": {"type": "boolean"}}}
+        assert await gateway.generate_json("q", schema=schema) == {"ok": True}
+        assert calls == [(True, schema), (True, schema)]
+        # 재생성한 응답이 캐시를 교체
+        assert await gateway.generate_json("q", schema=schema) == {"ok": True}
+        assert len(calls) == 2
+
+
+class TestChunking:
+    """Test suite for the script chunker."""
+
+    def test_chunks_follow_segments_within_budget(self):
+        """Test segments are grouped in order and long ones split at sentences."""
+        from src.utils.chunking import chunk_segments, estimate_tokens
+
+        segments = [
+            {"id": 1, "text": "첫 번째 세그먼트입니다."},
+            {"id": 2, "text": "두 번째 세그먼트예요."},
+            {"id": 3, "text": " ".join(f"긴 문장 {i}번이에요." for i in range(20))},
+            {"id": 4, "text": "마지막이죠."},
+        ]
+        chunks = chunk_segments(segments, max_tokens=30, overlap_tokens=8)
+
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+        assert chunks[0].segment_ids == [1, 2]
+        assert chunks[0].context == ""
+        assert all(estimate_tokens(c.text) <= 30 for c in chunks)
+        assert [i for c in chunks for i in c.segment_ids if i == 3] and chunks[-1].segment_ids[-1] == 4
+        # 원문이 잘리지 않고 순서대로 모두 포함
+        joined = " ".join(c.text for c in chunks)
+        assert "긴 문장 0번" in joined and "긴 문장 19번" in joined
+        assert joined.index("긴 문장 0번") < joined.index("긴 문장 19번") < joined.index("마지막")
+        # 다음 조각에는 앞 조각 끝 문장이 문맥으로 붙음
+        assert chunks[1].context and chunks[0].text.endswith(chunks[1].context)
+
+    def test_chunk_script_falls_back_to_paragraphs(self):
+        """Test scripts without segment text are split on paragraphs."""
+        from src.utils.chunking import chunk_script
+
+        script = "\n\n".join(f"문단 {i}입니다." for i in range(6))
+        chunks = chunk_script(script, [{"type": "hook"}], max_tokens=12, overlap_tokens=0)
+
+        assert len(chunks) > 1
+        assert "\n\n".join(c.text for c in chunks) == script
+
+    @pytest.mark.asyncio
+    async def test_map_chunks_keeps_order_with_limit(self):
+        """Test chunks run concurrently up to the limit and results keep input order."""
+        from src.utils.chunking import Chunk, map_chunks
+
+        active = 0
+        peak = 0
+
+        async def worker(chunk):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01 * (5 - chunk.index))
+            active -= 1
+            return chunk.text.upper()
+
+        chunks = [Chunk(index=i, text=f"c{i}") for i in range(5)]
+        results = await map_chunks(chunks, worker, concurrency=2)
+
+        assert results == ["C0", "C1", "C2", "C3", "C4"]
+        assert peak == 2
+
+
+class TestTTSCache:
+    """Test suite for the synthesized speech cache."""
+
+    def test_key_normalizes_text_and_tracks_settings(self):
+        """Test whitespace changes share a key while voice settings do not."""
+        from src.utils.tts_cache import TTSCache
+
+        key = TTSCache.make_key("안녕하세요.  반가워요\n", "elevenlabs", "v1", "m", {"stability": 0.5})
+
+        assert key == TTSCache.make_key(" 안녕하세요. 반가워요", "elevenlabs", "v1", "m", {"stability": 0.5})
+        assert key != TTSCache.make_key("안녕하세요. 반가워요", "elevenlabs", "v2", "m", {"stability": 0.5})
+        assert key != TTSCache.make_key("안녕하세요. 반가워요", "elevenlabs", "v1", "m", {"stability": 0.6})
+
+    def test_fetch_put_and_size_eviction(self, tmp_path):
+        """Test stored audio is restored and least recently used files are evicted."""
+        import os
+        import time
+        from src.utils.tts_cache import TTSCache
+
+        cache = TTSCache(tmp_path, max_size_bytes=250)
+        target = tmp_path / "out.mp3"
+        assert not cache.fetch("a" * 64, target)
+
+        for i, name in enumerate("abc"):
+            source = tmp_path / f"{name}.mp3"
+            source.write_bytes(bytes([i]) * 100)
+            assert cache.put(name * 64, source)
+            os.utime(cache._path(name * 64), (time.time() - 10 + i, time.time() - 10 + i))
+
+        assert cache.fetch("a" * 64, target)   # a 접근 → b가 가장 오래됨
+        assert target.read_bytes() == bytes([0]) * 100
+        assert cache.evict() == 1
+        assert not cache.fetch("b" * 64, target)
+        assert cache.fetch("c" * 64, target)
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    @pytest.mark.asyncio
+    async def test_dub_cache_ignores_unused_voice_settings(self, config, tmp_path):
+        """Test dubbing reuses cached audio when only settings convert() ignores change."""
+        import copy
+        import src.main  # noqa: F401 - src 경로 등록
+        from src.localization.dubbing_engine import DubbingEngine
+        from utils.tts_cache import TTSCache, get_tts_cache
+
+        config = copy.deepcopy(config)
+        config["project"] = {"cache_dir": str(tmp_path / "cache")}
+        config["audio"]["tts"] = {"voices": {"en": {"male": "v-en"}}, "settings": {"stability": 0.9}}
+        source = tmp_path / "dub.mp3"
+        source.write_bytes(b"dubbed")
+        get_tts_cache(config).put(TTSCache.make_key("Hello", "elevenlabs", "v-en", "eleven_multilingual_v2"), source)
+
+        output = tmp_path / "out" / "dub_en.mp3"
+        assert await DubbingEngine(config).dub("Hello", "en", str(output)) == str(output)
+        assert output.read_bytes() == b"dubbed"
+
+
+class TestMediaProbe:
+    """Test suite for header-based media probing."""
+
+    @staticmethod
+    def _mp3_frames(count, xing_frames=None):
+        # MPEG1 Layer III, 128kbps, 44.1kHz, joint stereo - 417바이트 프레임
+        header = bytes([0xFF, 0xFB, 0x90, 0x64])
+        frames = []
+        for i in range(count):
+            body = bytearray(413)
+            if i == 0 and xing_frames is not None:
+                body[32:44] = b"Xing" + (1).to_bytes(4, "big") + xing_frames.to_bytes(4, "big")
+            frames.append(header + bytes(body))
+        return b"".join(frames)
+
+    def test_wav_header(self, tmp_path):
+        """Test WAV duration, rate and channels come from the fmt/data chunks."""
+        import wave
+        from src.utils.media_probe import probe
+
+        path = tmp_path / "tone.wav"
+        with wave.open(str(path), "wb") as f:
+            f.setnchannels(2)
+            f.setsampwidth(2)
+            f.setframerate(22050)
+            f.writeframes(b"\x00" * 22050 * 4 * 3)
+
+        info = probe(path)
+        assert (info.duration, info.sample_rate, info.channels, info.format) == (3.0, 22050, 2, "wav")
+
+    def test_mp3_cbr_and_xing(self, tmp_path):
+        """Test CBR MP3 length from the bitrate and VBR length from the Xing frame count."""
+        from src.utils.media_probe import probe
+
+        cbr = tmp_path / "cbr.mp3"
+        id3 = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + b"\x00" * 10
+        cbr.write_bytes(id3 + self._mp3_frames(100) + b"TAG" + b"\x00" * 125)
+        info = probe(cbr)
+        assert info.format == "mp3" and info.sample_rate == 44100 and info.channels == 2
+        assert info.duration == pytest.approx(100 * 417 * 8 / 128000, abs=0.01)
+
+        vbr = tmp_path / "vbr.mp3"
+        vbr.write_bytes(self._mp3_frames(10, xing_frames=1000))
+        assert probe(vbr).duration == pytest.approx(1000 * 1152 / 44100, abs=0.001)
+
+    def test_mp4_header(self, tmp_path):
+        """Test M4A duration from mvhd and rate/channels from the mp4a entry."""
+        import struct
+        from src.utils.media_probe import probe
+
+        def box(kind, body):
+            return struct.pack(">I4s", 8 + len(body), kind) + body
+
+        mvhd = box(b"mvhd", b"\x00" * 12 + struct.pack(">II", 1000, 90500) + b"\x00" * 80)
+        mp4a = box(b"mp4a", b"\x00" * 6 + struct.pack(">H", 1) + b"\x00" * 8
+                   + struct.pack(">HHHHI", 1, 16, 0, 0, 48000 << 16))
+        stsd = box(b"stsd", struct.pack(">II", 0, 1) + mp4a)
+        trak = box(b"trak", box(b"mdia", box(b"minf", box(b"stbl", stsd))))
+        path = tmp_path / "voice.m4a"
+        path.write_bytes(box(b"ftyp", b"M4A \x00\x00\x00\x00") + box(b"mdat", b"\x00" * 64)
+                         + box(b"moov", mvhd + trak))
+
+        info = probe(path)
+        assert (info.duration, info.sample_rate, info.channels, info.format) == (90.5, 48000, 1, "mp4")
+
+    def test_memoized_by_mtime(self, tmp_path, monkeypatch):
+        """Test files are parsed once until their size or mtime changes."""
+        import os
+        from src.utils import media_probe
+
+        path = tmp_path / "a.mp3"
+        path.write_bytes(self._mp3_frames(50))
+        calls = []
+        original = media_probe._probe_uncached
+        monkeypatch.setattr(media_probe, "_probe_uncached", lambda p: calls.append(p) or original(p))
+
+        first = media_probe.probe_duration(path)
+        assert media_probe.probe_duration(path) == first
+        assert len(calls) == 1
+
+        path.write_bytes(self._mp3_frames(100))
+        os.utime(path, ns=(0, 10 ** 18))
+        assert media_probe.probe_duration(path) == pytest.approx(first * 2, abs=0.01)
+        assert len(calls) == 2
+        assert media_probe.probe_duration(tmp_path / "missing.mp3", default=1.5) == 1.5